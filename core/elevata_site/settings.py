@@ -47,6 +47,24 @@ ELEVATA_VERSION = "1.8.0"
 
 ELEVATA_PROFILES_PATH = os.getenv("ELEVATA_PROFILES_PATH", str((BASE_DIR.parent / "config" / "elevata_profiles.yaml")))
 
+# Persistent, content-addressed cache for rendered SQL (see metadata/rendering/render_cache.py).
+# Opt-in; a relative directory resolves against BASE_DIR, not the working directory.
+ELEVATA_RENDER_CACHE_ENABLED = env_bool("ELEVATA_RENDER_CACHE", False)
+ELEVATA_RENDER_CACHE_DIR = str(BASE_DIR / env_str("ELEVATA_RENDER_CACHE_DIR", ".elevata/render_cache"))
+ELEVATA_RENDER_CACHE_MAX_ENTRIES = env_int("ELEVATA_RENDER_CACHE_MAX_ENTRIES", 2000)
+
+# Connection pools of dialect execution engines (see metadata/rendering/dialects/connection_pool.py).
+# Target systems can override the size via security["pool_size"].
+ELEVATA_ENGINE_POOL_SIZE = env_int("ELEVATA_ENGINE_POOL_SIZE", 4)
+ELEVATA_ENGINE_POOL_HEALTH_CHECK_SECONDS = env_int("ELEVATA_ENGINE_POOL_HEALTH_CHECK_SECONDS", 30)
+ELEVATA_ENGINE_POOL_MAX_IDLE_SECONDS = env_int("ELEVATA_ENGINE_POOL_MAX_IDLE_SECONDS", 300)
+
+# Process-wide SQLAlchemy engines per secret ref (see metadata/ingestion/connectors.py).
+ELEVATA_SA_POOL_SIZE = env_int("ELEVATA_SA_POOL_SIZE", 5)
+ELEVATA_SA_MAX_OVERFLOW = env_int("ELEVATA_SA_MAX_OVERFLOW", 5)
+ELEVATA_SA_POOL_RECYCLE_SECONDS = env_int("ELEVATA_SA_POOL_RECYCLE_SECONDS", 1800)
+ELEVATA_SECRET_TTL_SECONDS = env_int("ELEVATA_SECRET_TTL_SECONDS", 900)
+
 STATIC_URL = "static/"
 
 STATICFILES_DIRS = [
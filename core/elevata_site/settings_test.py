@@ -44,4 +44,8 @@ engine = str(default_db.get("ENGINE", "")).lower()
 if "sqlite" in engine:
   default_db.setdefault("TEST", {})
   default_db["TEST"]["NAME"] = ":memory:"
-  DATABASES["default"] = default_db
\ No newline at end of file
+  DATABASES["default"] = default_db
+
+# Tests patch renderers and reuse primary keys across in-memory databases:
+# never serve SQL from the persistent render cache.
+ELEVATA_RENDER_CACHE_ENABLED = False
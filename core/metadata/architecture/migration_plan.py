@@ -22,7 +22,7 @@ Contact: <https://github.com/elevata-labs/elevata>.
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
 from typing import Literal
 
 
@@ -113,3 +113,13 @@ class MigrationPlan:
 
   def to_summary_lines(self) -> list[str]:
     return [a.to_summary_line() for a in self.actions]
+
+  def to_dicts(self) -> list[dict[str, str | None]]:
+    """
+    JSON-safe representation (e.g. for queued batches run by other processes).
+    """
+    return [asdict(a) for a in self.actions]
+
+  @classmethod
+  def from_dicts(cls, items) -> "MigrationPlan":
+    return cls(actions=tuple(MigrationAction(**dict(item)) for item in (items or ())))
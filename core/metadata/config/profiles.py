@@ -23,7 +23,7 @@ Contact: <https://github.com/elevata-labs/elevata>.
 from __future__ import annotations
 
 import os
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import List, Dict, Any, Optional
 
@@ -62,6 +62,9 @@ class Profile:
   # Dialect used for SQL generation (unless env override)
   default_dialect: str
 
+  # Ingestion tuning, e.g. {"fetch_size": 10000, "source_systems": {"erp": {"fetch_size": 50000}}}
+  ingestion: Dict[str, Any] = field(default_factory=dict)
+
 
 def _find_profiles_path(explicit_path: str | None = None) -> Path:
   """
@@ -139,6 +142,7 @@ def load_profile(profiles_path: Optional[str] = None) -> Profile:
     overrides=p.get("overrides", {}) or {},
     security=p.get("security", {}) or {},
     default_dialect=p.get("default_dialect", "duckdb"),
+    ingestion=p.get("ingestion", {}) or {},
   )
 
 
@@ -24,6 +24,9 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from typing import Callable
+import heapq
+import queue
+import threading
 import uuid
 
 from django.core.management.base import CommandError
@@ -36,12 +39,16 @@ class ExecutionPolicy:
   # Core policy knobs for v0.8.0
   continue_on_error: bool
   max_retries: int  # 0 means: no retries
+  max_workers: int = 1  # 1 means: strictly sequential execution
 
 @dataclass(frozen=True)
 class ExecutionStep:
   dataset_id: int
   dataset_key: str
   upstream_keys: tuple[str, ...]
+  # Filled by the pre-render phase; runtime placeholders are still unbound.
+  rendered_sql: str | None = None
+  render_ms: float | None = None
 
 @dataclass
 class ExecutionPlan:
@@ -52,10 +59,16 @@ class ExecutionPlan:
 def _dataset_key(td: TargetDataset) -> str:
   return f"{td.target_schema.short_name}.{td.target_dataset_name}"
 
-def build_execution_plan(*, batch_run_id: str, execution_order: list[TargetDataset]) -> ExecutionPlan:
+def build_execution_plan(
+  *,
+  batch_run_id: str,
+  execution_order: list[TargetDataset],
+  graph_index=None,
+) -> ExecutionPlan:
   """
   Keep deterministic order, store upstream_keys for blocked semantics.
   Prefer canonical upstream resolution from metadata.execution.load_graph.
+  With a LoadGraphIndex, upstreams are served from memory (no per-step queries).
   """
   # Canonical upstream resolver (best-effort safe in your codebase)
   try:
@@ -63,6 +76,9 @@ def build_execution_plan(*, batch_run_id: str, execution_order: list[TargetDatas
   except Exception:
     resolve_upstream_datasets = None  # type: ignore[assignment]
 
+  if graph_index is not None:
+    resolve_upstream_datasets = graph_index.upstream_datasets
+
   steps: list[ExecutionStep] = []
   for td in execution_order:
     key = _dataset_key(td)
@@ -95,6 +111,117 @@ def build_execution_plan(*, batch_run_id: str, execution_order: list[TargetDatas
 
   return ExecutionPlan(batch_run_id=batch_run_id, steps=steps)
 
+def _aborted_result(step: ExecutionStep) -> dict[str, object]:
+  # Synthetic "aborted" entry for reporting/visualization.
+  return {
+    "status": "skipped",
+    "kind": "aborted",
+    "dataset": step.dataset_key,
+    "message": "aborted_due_to_fail_fast",
+    "status_reason": "fail_fast_abort",
+    "load_run_id": str(uuid.uuid4()),
+  }
+
+def _missing_dataset_result(step: ExecutionStep) -> dict[str, object]:
+  return {
+    "status": "error",
+    "kind": "exception",
+    "dataset": step.dataset_key,
+    "message": "execution_plan_dataset_missing",
+  }
+
+def _blocked_by(step: ExecutionStep, status_by_key: dict[str, str]) -> str | None:
+  for up_key in step.upstream_keys:
+    if status_by_key.get(up_key) == "error":
+      return up_key
+  return None
+
+def _blocked_result(step: ExecutionStep, blocked_by: str) -> dict[str, object]:
+  return {
+    "status": "skipped",
+    "kind": "blocked",
+    "dataset": step.dataset_key,
+    "message": f"blocked_by_dependency: {blocked_by}",
+    "blocked_by": blocked_by,
+    "status_reason": "blocked_by_dependency",
+    "load_run_id": str(uuid.uuid4()),
+  }
+
+def _run_step(
+  *,
+  step: ExecutionStep,
+  td: TargetDataset,
+  plan: ExecutionPlan,
+  policy: ExecutionPolicy,
+  execute: bool,
+  root_td: TargetDataset,
+  root_load_run_id: str | None,
+  root_load_plan: object | None,
+  run_dataset_fn: Callable[..., dict[str, object]],
+  logger,
+) -> tuple[dict[str, object], bool]:
+  """
+  Run one step including retries and return (result, is_error).
+  """
+  this_load_run_id = root_load_run_id if td is root_td else None
+  this_load_plan = root_load_plan if (td is root_td) else None
+
+  attempt_no = 0
+  last_exc: Exception | None = None
+  result: dict[str, object] | None = None
+
+  while True:
+    attempt_no += 1
+    try:
+      result = run_dataset_fn(
+        target_dataset=td,
+        batch_run_id=plan.batch_run_id,
+        load_run_id=this_load_run_id,
+        load_plan_override=this_load_plan,
+        attempt_no=attempt_no,
+      )
+      last_exc = None
+      break
+
+    except CommandError as exc:
+      # Controlled failure (e.g., preflight blocked). Do not treat as exception noise.
+      last_exc = None
+      result = {
+        "status": "blocked",
+        "kind": "preflight",
+        "dataset": step.dataset_key,
+        "message": str(exc),
+      }
+      break
+
+    except Exception as exc:
+      last_exc = exc
+      should_retry = bool(execute) and attempt_no <= policy.max_retries
+      if not should_retry:
+        break
+
+  if last_exc is not None and result is None:
+    # We are outside the except block here, so use exc_info explicitly.
+    logger.error(
+      "elevata_load dataset failed",
+      extra={
+        "batch_run_id": plan.batch_run_id,
+        "dataset": step.dataset_key,
+        "attempt_no": attempt_no,
+      },
+      exc_info=last_exc,
+    )
+    return {
+      "status": "error",
+      "kind": "exception",
+      "dataset": step.dataset_key,
+      "message": str(last_exc),
+    }, True
+
+  # Normal success / dry_run
+  status = str((result or {}).get("status") or "unknown")
+  return result, status in ("error", "blocked")
+
 def execute_plan(
   *,
   plan: ExecutionPlan,
@@ -106,6 +233,8 @@ def execute_plan(
   root_load_plan: object | None,
   run_dataset_fn: Callable[..., dict[str, object]],
   logger,
+  worker_teardown_fn: Callable[[], None] | None = None,
+  priority_by_key: dict[str, float] | None = None,
 ) -> tuple[list[dict[str, object]], bool]:
   """
   Execute an ExecutionPlan and return (results, had_error).
@@ -114,6 +243,10 @@ def execute_plan(
   - Retry semantics: retries apply only in execute-mode; dry-run failures are surfaced immediately.
   - Attempt counter: attempt_no starts at 1 and is passed to run_dataset_fn.
   - Best-effort: graph resolution errors never block execution.
+  - Parallelism: with policy.max_workers > 1, a step starts as soon as all of its
+    upstream steps have finished. Results are always returned in plan order.
+  - Scheduling: priority_by_key (e.g. critical-path weights) decides which ready
+    step is dispatched first in parallel mode; ties and missing priorities keep plan order.
   """
   # Map dataset_id -> TargetDataset for plan steps
   by_id: dict[int, TargetDataset] = {}
@@ -121,21 +254,28 @@ def execute_plan(
     td_id = int(getattr(td, "id", 0) or 0)
     by_id[td_id] = td
 
+  if int(getattr(policy, "max_workers", 1) or 1) > 1 and len(plan.steps) > 1:
+    return _execute_plan_parallel(
+      plan=plan,
+      by_id=by_id,
+      policy=policy,
+      execute=execute,
+      root_td=root_td,
+      root_load_run_id=root_load_run_id,
+      root_load_plan=root_load_plan,
+      run_dataset_fn=run_dataset_fn,
+      logger=logger,
+      worker_teardown_fn=worker_teardown_fn,
+      priority_by_key=priority_by_key,
+    )
+
   results: list[dict[str, object]] = []
   had_error = False
   status_by_key: dict[str, str] = {}
 
   def _append_aborted_from_index(start_index: int) -> None:
-    # Add synthetic "aborted" entries for remaining steps for reporting/visualization.
     for remaining in plan.steps[start_index:]:
-      results.append({
-        "status": "skipped",
-        "kind": "aborted",
-        "dataset": remaining.dataset_key,
-        "message": "aborted_due_to_fail_fast",
-        "status_reason": "fail_fast_abort",
-        "load_run_id": str(uuid.uuid4()),
-      })
+      results.append(_aborted_result(remaining))
 
   for idx, step in enumerate(plan.steps):
     td = by_id.get(step.dataset_id)
@@ -143,111 +283,202 @@ def execute_plan(
       # Should not happen; treat as error
       had_error = True
       status_by_key[step.dataset_key] = "error"
-      results.append({
-        "status": "error",
-        "kind": "exception",
-        "dataset": step.dataset_key,
-        "message": "execution_plan_dataset_missing",
-      })
+      results.append(_missing_dataset_result(step))
       if not policy.continue_on_error:
         _append_aborted_from_index(idx + 1)
         break
       continue
 
     # Blocked semantics
-    blocked_by = None
-    for up_key in step.upstream_keys:
-      if status_by_key.get(up_key) == "error":
-        blocked_by = up_key
-        break
-
+    blocked_by = _blocked_by(step, status_by_key)
     if blocked_by is not None:
-      results.append({
-        "status": "skipped",
-        "kind": "blocked",
-        "dataset": step.dataset_key,
-        "message": f"blocked_by_dependency: {blocked_by}",
-        "blocked_by": blocked_by,
-        "status_reason": "blocked_by_dependency",
-        "load_run_id": str(uuid.uuid4()),
-      })
+      results.append(_blocked_result(step, blocked_by))
       status_by_key[step.dataset_key] = "skipped"
       continue
 
-    this_load_run_id = root_load_run_id if td is root_td else None
-    this_load_plan = root_load_plan if (td is root_td) else None
-
-    attempt_no = 0
-    last_exc: Exception | None = None
-    result: dict[str, object] | None = None
+    result, is_error = _run_step(
+      step=step,
+      td=td,
+      plan=plan,
+      policy=policy,
+      execute=execute,
+      root_td=root_td,
+      root_load_run_id=root_load_run_id,
+      root_load_plan=root_load_plan,
+      run_dataset_fn=run_dataset_fn,
+      logger=logger,
+    )
+    results.append(result)
+    status_by_key[step.dataset_key] = str((result or {}).get("status") or "unknown")
 
-    while True:
-      attempt_no += 1
-      try:
-        result = run_dataset_fn(
-          target_dataset=td,
-          batch_run_id=plan.batch_run_id,
-          load_run_id=this_load_run_id,
-          load_plan_override=this_load_plan,
-          attempt_no=attempt_no,
-        )
-        last_exc = None
+    if is_error:
+      had_error = True
+      if not policy.continue_on_error:
+        _append_aborted_from_index(idx + 1)
         break
 
-      except CommandError as exc:
-        # Controlled failure (e.g., preflight blocked). Do not treat as exception noise.
-        last_exc = None
-        result = {
-          "status": "blocked",
-          "kind": "preflight",
-          "dataset": step.dataset_key,
-          "message": str(exc),
-        }
-        break
+  return results, had_error
 
-      except Exception as exc:
-        last_exc = exc
-        should_retry = bool(execute) and attempt_no <= policy.max_retries
-        if not should_retry:
-          break
+def _execute_plan_parallel(
+  *,
+  plan: ExecutionPlan,
+  by_id: dict[int, TargetDataset],
+  policy: ExecutionPolicy,
+  execute: bool,
+  root_td: TargetDataset,
+  root_load_run_id: str | None,
+  root_load_plan: object | None,
+  run_dataset_fn: Callable[..., dict[str, object]],
+  logger,
+  worker_teardown_fn: Callable[[], None] | None,
+  priority_by_key: dict[str, float] | None = None,
+) -> tuple[list[dict[str, object]], bool]:
+  """
+  Worker-pool variant of execute_plan().
 
-    if last_exc is not None and result is None:
-      had_error = True
-      status_by_key[step.dataset_key] = "error"
+  The calling thread acts as scheduler: it owns all bookkeeping (status, blocked,
+  fail-fast) and hands ready steps to worker threads. Ready steps are dispatched
+  highest priority first (longest critical path), falling back to plan order.
+  On fail-fast, in-flight steps are allowed to finish; unstarted steps are aborted.
+  """
+  steps = plan.steps
+  max_workers = min(int(policy.max_workers), len(steps))
+  index_by_key = {s.dataset_key: i for i, s in enumerate(steps)}
 
-      results.append({
-        "status": "error",
-        "kind": "exception",
-        "dataset": step.dataset_key,
-        "message": str(last_exc),
-      })
-
-      # We are outside the except block here, so use exc_info explicitly.
-      logger.error(
-        "elevata_load dataset failed",
-        extra={
-          "batch_run_id": plan.batch_run_id,
-          "dataset": step.dataset_key,
-          "attempt_no": attempt_no,
-        },
-        exc_info=last_exc,
-      )
+  # Only upstreams that are part of this plan gate readiness.
+  pending: dict[int, set[str]] = {}
+  downstream: dict[str, list[int]] = {}
+  for i, s in enumerate(steps):
+    ups = {u for u in s.upstream_keys if u in index_by_key and u != s.dataset_key}
+    pending[i] = ups
+    for u in ups:
+      downstream.setdefault(u, []).append(i)
 
-      if not policy.continue_on_error:
-        _append_aborted_from_index(idx + 1)
-        break
+  priorities = priority_by_key or {}
 
-      continue
+  def _ready_entry(i: int) -> tuple[float, int]:
+    return (-float(priorities.get(steps[i].dataset_key, 0.0) or 0.0), i)
 
-    # Normal success / dry_run
-    results.append(result)
-    status = str((result or {}).get("status") or "unknown")
-    status_by_key[step.dataset_key] = status
+  ready: list[tuple[float, int]] = [_ready_entry(i) for i in range(len(steps)) if not pending[i]]
+  heapq.heapify(ready)
 
-    if status in ("error", "blocked"):
-      had_error = True
-      if not policy.continue_on_error:
-        _append_aborted_from_index(idx + 1)
+  results_by_index: dict[int, dict[str, object]] = {}
+  status_by_key: dict[str, str] = {}
+  had_error = False
+  abort = False
+  in_flight = 0
+
+  work_q: queue.Queue = queue.Queue()
+  done_q: queue.Queue = queue.Queue()
+
+  def _worker() -> None:
+    try:
+      while True:
+        item = work_q.get()
+        if item is None:
+          return
+        idx, td = item
+        step = steps[idx]
+        try:
+          outcome = _run_step(
+            step=step,
+            td=td,
+            plan=plan,
+            policy=policy,
+            execute=execute,
+            root_td=root_td,
+            root_load_run_id=root_load_run_id,
+            root_load_plan=root_load_plan,
+            run_dataset_fn=run_dataset_fn,
+            logger=logger,
+          )
+        except BaseException as exc:
+          # Never lose a step: the scheduler waits for exactly one outcome per dispatch.
+          outcome = ({
+            "status": "error",
+            "kind": "exception",
+            "dataset": step.dataset_key,
+            "message": str(exc),
+          }, True)
+        done_q.put((idx, outcome))
+    finally:
+      if worker_teardown_fn is not None:
+        try:
+          worker_teardown_fn()
+        except Exception:
+          # Best-effort: resource cleanup must never break the batch.
+          logger.warning("elevata_load worker teardown failed", exc_info=True)
+
+  def _finish(idx: int, result: dict[str, object]) -> None:
+    results_by_index[idx] = result
+    key = steps[idx].dataset_key
+    status_by_key[key] = str((result or {}).get("status") or "unknown")
+    for child in downstream.get(key, ()):
+      pending[child].discard(key)
+      if not pending[child]:
+        heapq.heappush(ready, _ready_entry(child))
+
+  workers = [
+    threading.Thread(target=_worker, name=f"elevata-load-worker-{n + 1}", daemon=True)
+    for n in range(max_workers)
+  ]
+  for w in workers:
+    w.start()
+
+  try:
+    while True:
+      while ready and not abort and in_flight < max_workers:
+        _, idx = heapq.heappop(ready)
+        step = steps[idx]
+        td = by_id.get(step.dataset_id)
+
+        if td is None:
+          had_error = True
+          _finish(idx, _missing_dataset_result(step))
+          if not policy.continue_on_error:
+            abort = True
+          continue
+
+        blocked_by = _blocked_by(step, status_by_key)
+        if blocked_by is not None:
+          _finish(idx, _blocked_result(step, blocked_by))
+          continue
+
+        work_q.put((idx, td))
+        in_flight += 1
+
+      if in_flight == 0:
         break
 
+      idx, (result, is_error) = done_q.get()
+      in_flight -= 1
+      _finish(idx, result)
+
+      if is_error:
+        had_error = True
+        if not policy.continue_on_error:
+          abort = True
+  finally:
+    for _ in workers:
+      work_q.put(None)
+    for w in workers:
+      w.join()
+
+  results: list[dict[str, object]] = []
+  for idx, step in enumerate(steps):
+    result = results_by_index.get(idx)
+    if result is None:
+      if abort:
+        result = _aborted_result(step)
+      else:
+        # Unreachable step (dependency cycle); surface it instead of dropping it.
+        had_error = True
+        result = {
+          "status": "error",
+          "kind": "exception",
+          "dataset": step.dataset_key,
+          "message": "execution_plan_dependency_unresolved",
+        }
+    results.append(result)
+
   return results, had_error
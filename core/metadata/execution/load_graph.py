@@ -20,14 +20,108 @@ along with elevata. If not, see <https://www.gnu.org/licenses/>.
 Contact: <https://github.com/elevata-labs/elevata>.
 """
 
-from metadata.models import TargetSchema, TargetDataset
+from metadata.models import TargetSchema, TargetDataset, TargetDatasetInput
 
 
-def resolve_execution_order(root: TargetDataset) -> list[TargetDataset]:
-  graph = build_load_graph(root)
+class LoadGraphIndex:
+  """
+  In-memory adjacency index for the whole load graph.
+
+  Built with a fixed number of queries (datasets, active inputs, RAW-for-source
+  links), independent of the number of datasets. Use it for --all planning where
+  per-node resolution would issue several queries per dataset.
+  """
+
+  def __init__(
+    self,
+    *,
+    datasets_by_id: dict[int, TargetDataset],
+    upstream_ids_by_id: dict[int, set[int]],
+  ):
+    self.datasets_by_id = datasets_by_id
+    self.upstream_ids_by_id = upstream_ids_by_id
+
+  def dataset(self, td: TargetDataset) -> TargetDataset:
+    """
+    Return the indexed instance for td (with target_schema loaded), or td itself.
+    """
+    return self.datasets_by_id.get(getattr(td, "pk", None), td)
+
+  def upstream_datasets(self, td: TargetDataset) -> set[TargetDataset]:
+    """
+    Same semantics as resolve_upstream_datasets(), served from memory.
+    """
+    ids = self.upstream_ids_by_id.get(getattr(td, "pk", None)) or set()
+    return {self.datasets_by_id[i] for i in ids if i in self.datasets_by_id}
+
+  def graph(self) -> dict[TargetDataset, set[TargetDataset]]:
+    """
+    Full graph over all indexed datasets (dataset -> immediate upstream datasets).
+    """
+    return {td: self.upstream_datasets(td) for td in self.datasets_by_id.values()}
+
+
+def build_load_graph_index() -> LoadGraphIndex:
+  """
+  Bulk-load the load graph in three queries.
+  """
+  datasets_by_id: dict[int, TargetDataset] = {
+    td.pk: td
+    for td in TargetDataset.objects.select_related("target_schema")
+  }
+
+  # RAW dataset per SourceDataset. Mirrors resolve_raw_dataset_for_source():
+  # first RAW dataset in model ordering (schema, dataset name) wins.
+  raw_id_by_source_id: dict[int, int] = {}
+  raw_links = (
+    TargetDatasetInput.objects
+    .filter(
+      target_dataset__target_schema__short_name="raw",
+      source_dataset__isnull=False,
+    )
+    .values_list("source_dataset_id", "target_dataset_id")
+  )
+  for source_id, raw_id in raw_links:
+    raw_td = datasets_by_id.get(raw_id)
+    if raw_td is None:
+      continue
+    current_id = raw_id_by_source_id.get(source_id)
+    if current_id is not None:
+      current = datasets_by_id[current_id]
+      if (current.target_schema_id, current.target_dataset_name) <= (raw_td.target_schema_id, raw_td.target_dataset_name):
+        continue
+    raw_id_by_source_id[source_id] = raw_id
+
+  upstream_ids_by_id: dict[int, set[int]] = {}
+  links = (
+    TargetDatasetInput.objects
+    .filter(active=True)
+    .values_list("target_dataset_id", "upstream_target_dataset_id", "source_dataset_id")
+  )
+  for td_id, upstream_id, source_id in links:
+    ups = upstream_ids_by_id.setdefault(td_id, set())
+    if upstream_id is not None:
+      ups.add(upstream_id)
+    elif source_id is not None:
+      raw_id = raw_id_by_source_id.get(source_id)
+      if raw_id is not None:
+        ups.add(raw_id)
+      # else: federated / external → no upstream dataset node
+
+  return LoadGraphIndex(
+    datasets_by_id=datasets_by_id,
+    upstream_ids_by_id=upstream_ids_by_id,
+  )
+
+
+def resolve_execution_order(root: TargetDataset, index: LoadGraphIndex | None = None) -> list[TargetDataset]:
+  graph = build_load_graph(root, index=index)
   return topological_sort(graph)
 
-def resolve_execution_order_all(roots: list[TargetDataset]) -> list[TargetDataset]:
+def resolve_execution_order_all(
+  roots: list[TargetDataset],
+  index: LoadGraphIndex | None = None,
+) -> list[TargetDataset]:
   """
   Resolve a deterministic execution order for multiple roots.
 
@@ -35,11 +129,12 @@ def resolve_execution_order_all(roots: list[TargetDataset]) -> list[TargetDatase
   - Roots define the initial scope, but all required upstream dependencies
     are included (even if they live in other schemas).
   - Deterministic ordering is guaranteed via topological_sort() sorting keys.
+  - With an index, the graph is served from memory (no per-node queries).
   """
   graph: dict[TargetDataset, set[TargetDataset]] = {}
   for r in (roots or []):
     try:
-      graph.update(build_load_graph(r))
+      graph.update(build_load_graph(r, index=index))
     except Exception:
       # Best-effort: graph building should never block orchestration.
       # If a root cannot be resolved, we simply skip it here; caller can decide
@@ -76,7 +171,8 @@ def resolve_upstream_datasets(td: TargetDataset) -> set[TargetDataset]:
 
   upstream = set()
 
-  links = td.input_links.select_related(
+  # Inactive inputs are kept for lineage/audit only and do not take part in loads.
+  links = td.input_links.filter(active=True).select_related(
     "upstream_target_dataset",
     "source_dataset",
   )
@@ -97,13 +193,16 @@ def resolve_upstream_datasets(td: TargetDataset) -> set[TargetDataset]:
   return upstream
 
 
-def build_load_graph(root: TargetDataset) -> dict[TargetDataset, set[TargetDataset]]:
+def build_load_graph(
+  root: TargetDataset,
+  index: LoadGraphIndex | None = None,
+) -> dict[TargetDataset, set[TargetDataset]]:
   """
   Build a dependency graph starting from a root TargetDataset.
   Graph direction: dataset -> immediate upstream datasets
   """
   graph: dict[TargetDataset, set[TargetDataset]] = {}
-  stack = [root]
+  stack = [index.dataset(root) if index is not None else root]
 
   while stack:
     td = stack.pop()
@@ -111,7 +210,10 @@ def build_load_graph(root: TargetDataset) -> dict[TargetDataset, set[TargetDatas
     if td in graph:
       continue
 
-    deps = resolve_upstream_datasets(td)
+    if index is not None:
+      deps = index.upstream_datasets(td)
+    else:
+      deps = resolve_upstream_datasets(td)
     graph[td] = deps
     stack.extend(deps)
 
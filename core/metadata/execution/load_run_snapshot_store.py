@@ -35,6 +35,10 @@ from metadata.rendering.expr import ColumnRef, Literal, RawSql
 LOAD_RUN_SNAPSHOT_COLUMNS = list(LOAD_RUN_SNAPSHOT_REGISTRY.keys())
 _DATABRICKS_DUPLICATE_COL_RE = re.compile(r"(FIELD_ALREADY_EXISTS|SQLSTATE:\s*42710)", re.IGNORECASE)
 
+# Root key prefix of ingestion cursor snapshots (see ingestion/rest.py); these
+# share the batch_run_id of the batch they ran in.
+INGESTION_SNAPSHOT_KEY_PREFIX = "ingestion:"
+
 
 def build_load_run_snapshot_row(
   *,
@@ -66,11 +70,32 @@ def ensure_load_run_snapshot_table(engine, dialect, meta_schema: str, auto_provi
   Ensure meta.load_run_snapshot exists and contains all registry columns.
   Best-effort only: never blocks a run. No drops, no alter type.
   """
+  ensure_meta_table_from_registry(
+    engine=engine,
+    dialect=dialect,
+    meta_schema=meta_schema,
+    table_name="load_run_snapshot",
+    registry=LOAD_RUN_SNAPSHOT_REGISTRY,
+    auto_provision=auto_provision,
+  )
+
+
+def ensure_meta_table_from_registry(
+  *,
+  engine,
+  dialect,
+  meta_schema: str,
+  table_name: str,
+  registry: dict[str, dict[str, object]],
+  auto_provision: bool,
+) -> None:
+  """
+  Ensure a registry-defined meta table exists and contains all registry columns.
+  Best-effort only: never blocks a run. No drops, no alter type.
+  """
   if not auto_provision:
     return
 
-  table_name = "load_run_snapshot"
-
   # Reuse the same canonical type mapping strategy used by load_run_log.
   # (Dialects already know how to map string/bool/int/timestamp via this pathway.)
   type_map = getattr(dialect, "LOAD_RUN_LOG_TYPE_MAP", None) or {}
@@ -148,7 +173,7 @@ def ensure_load_run_snapshot_table(engine, dialect, meta_schema: str, auto_provi
   if not table_exists:
     try:
       columns = []
-      for col_name, spec in LOAD_RUN_SNAPSHOT_REGISTRY.items():
+      for col_name, spec in registry.items():
         canonical_type = spec["datatype"]
         if callable(mapper):
           physical_type = mapper(col_name, canonical_type)
@@ -178,7 +203,7 @@ def ensure_load_run_snapshot_table(engine, dialect, meta_schema: str, auto_provi
     table_exists, existing_columns_norm = _introspect()
 
   # 4) Add missing columns
-  for col_name, spec in LOAD_RUN_SNAPSHOT_REGISTRY.items():
+  for col_name, spec in registry.items():
     if str(col_name).strip().lower() in existing_columns_norm:
       continue
     try:
@@ -218,10 +243,36 @@ def render_select_load_run_snapshot_json(
   meta_schema: str,
   batch_run_id: str,
 ) -> str:
-  tbl = dialect.render_table_identifier(meta_schema, "load_run_snapshot")
-  bid = dialect.literal(batch_run_id)
-  # No LIMIT/TOP needed if batch_run_id is unique in practice.
-  return f"SELECT snapshot_json FROM {tbl} WHERE batch_run_id = {bid}"
+  """
+  Select the latest batch snapshot_json for a batch_run_id.
+
+  A resumed batch (elevata_load --resume) appends a new snapshot under the same
+  batch_run_id, so the most recent row wins. Ingestion cursor snapshots written
+  during the batch share its batch_run_id and are excluded.
+  """
+  src = SourceTable(schema=meta_schema, name="load_run_snapshot", alias="s")
+
+  where_expr = RawSql(
+    sql=(
+      "s.batch_run_id = {expr:bid} "
+      "AND (s.root_dataset_key IS NULL OR s.root_dataset_key NOT LIKE {expr:ingestion})"
+    ),
+    is_template=True,
+    expr_bindings={
+      "bid": Literal(batch_run_id),
+      "ingestion": Literal(f"{INGESTION_SNAPSHOT_KEY_PREFIX}%"),
+    },
+  )
+
+  sel = LogicalSelect(
+    from_=src,
+    where=where_expr,
+    order_by=[RawSql(sql="s.created_at DESC")],
+    select_list=[SelectItem(expr=ColumnRef(table_alias="s", column_name="snapshot_json"))],
+  )
+  setattr(sel, "limit", 1)
+
+  return dialect.render_select(sel)
 
 
 def render_select_latest_load_run_snapshot_json_by_root_key(
@@ -0,0 +1,105 @@
+"""
+elevata - Metadata-driven Data Platform Framework
+Copyright © 2026 Ilona Tag
+
+This file is part of elevata.
+
+elevata is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as
+published by the Free Software Foundation, either version 3 of
+the License, or (at your option) any later version.
+
+elevata is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with elevata. If not, see <https://www.gnu.org/licenses/>.
+
+Contact: <https://github.com/elevata-labs/elevata>.
+"""
+
+from __future__ import annotations
+
+from typing import Callable, Hashable
+import threading
+
+from django.db.models import Count, Max
+
+from metadata.models import TargetDataset
+
+
+# Process-local metadata revision counter.
+# Bumped by metadata/signals.py whenever plan-relevant metadata is saved or deleted,
+# so in-process edits are detected without touching the database.
+_metadata_revision = 0
+_metadata_revision_lock = threading.Lock()
+
+
+def bump_metadata_revision() -> int:
+  global _metadata_revision
+  with _metadata_revision_lock:
+    _metadata_revision += 1
+    return _metadata_revision
+
+
+def current_metadata_revision() -> int:
+  return _metadata_revision
+
+
+def plan_guard_token_for_execution_ids(execution_ids: list[int]) -> tuple:
+  """
+  Cheap change token for the planned TargetDatasets: one aggregate query over
+  count and latest updated_at (dataset and schema), plus the in-process revision.
+  """
+  agg = (
+    TargetDataset.objects
+    .filter(pk__in=execution_ids)
+    .aggregate(
+      n=Count("pk"),
+      td_updated_at=Max("updated_at"),
+      schema_updated_at=Max("target_schema__updated_at"),
+    )
+  )
+  return (
+    current_metadata_revision(),
+    agg.get("n"),
+    agg.get("td_updated_at"),
+    agg.get("schema_updated_at"),
+  )
+
+
+class PlanGuard:
+  """
+  Predictability guard for one execution plan.
+
+  The full fingerprint is computed once at plan time. Per step, only the change
+  token is evaluated; the fingerprint is recomputed only when the token moved.
+  Without a token function, the fingerprint is recomputed on every check.
+  Thread-safe: parallel workers may check concurrently.
+  """
+
+  def __init__(
+    self,
+    *,
+    fingerprint_fn: Callable[[], str],
+    token_fn: Callable[[], Hashable] | None = None,
+  ):
+    self._fingerprint_fn = fingerprint_fn
+    self._token_fn = token_fn
+    self._lock = threading.Lock()
+    self._token = token_fn() if token_fn is not None else None
+    self.fingerprint = fingerprint_fn()
+    self._current_fingerprint = self.fingerprint
+
+  def current_fingerprint(self) -> str:
+    with self._lock:
+      if self._token_fn is None:
+        return self._fingerprint_fn()
+
+      token = self._token_fn()
+      if token != self._token:
+        self._current_fingerprint = self._fingerprint_fn()
+        self._token = token
+      return self._current_fingerprint
@@ -0,0 +1,140 @@
+"""
+elevata - Metadata-driven Data Platform Framework
+Copyright © 2026 Ilona Tag
+
+This file is part of elevata.
+
+elevata is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as
+published by the Free Software Foundation, either version 3 of
+the License, or (at your option) any later version.
+
+elevata is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with elevata. If not, see <https://www.gnu.org/licenses/>.
+
+Contact: <https://github.com/elevata-labs/elevata>.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, replace
+from typing import Callable
+import queue
+import threading
+import time
+
+from metadata.execution.executor import ExecutionPlan, _dataset_key
+
+
+# Pre-render phase: render (and validate) SQL for every step of a batch before
+# the first execution, so rendering errors surface up front and rendering work
+# runs concurrently. Rendering is ORM-heavy, so a thread pool is used: database
+# round trips release the GIL and Django connections stay per thread.
+
+@dataclass(frozen=True)
+class PrerenderedSql:
+  dataset_key: str
+  sql: str | None
+  render_ms: float
+  error: str | None = None
+
+
+def prerender_plan(
+  *,
+  plan: ExecutionPlan,
+  execution_order: list,
+  render_fn: Callable[[object], str],
+  should_render_fn: Callable[[object], bool] | None = None,
+  validate_fn: Callable[[object, str], None] | None = None,
+  max_workers: int = 4,
+  worker_teardown_fn: Callable[[], None] | None = None,
+) -> dict[str, PrerenderedSql]:
+  """
+  Render all eligible steps of the plan on up to max_workers threads.
+  Never raises for individual steps: failures are returned as PrerenderedSql.error.
+  """
+  td_by_key = {_dataset_key(td): td for td in execution_order}
+  work: "queue.Queue" = queue.Queue()
+  for step in plan.steps:
+    td = td_by_key.get(step.dataset_key)
+    if td is None:
+      continue
+    if should_render_fn is not None and not should_render_fn(td):
+      continue
+    work.put((step.dataset_key, td))
+
+  results: dict[str, PrerenderedSql] = {}
+  results_lock = threading.Lock()
+
+  def _render_one(dataset_key: str, td) -> PrerenderedSql:
+    start_ts = time.perf_counter()
+    try:
+      sql = render_fn(td)
+      if validate_fn is not None:
+        validate_fn(td, sql)
+    except Exception as exc:
+      return PrerenderedSql(
+        dataset_key=dataset_key,
+        sql=None,
+        render_ms=(time.perf_counter() - start_ts) * 1000.0,
+        error=str(exc) or type(exc).__name__,
+      )
+    return PrerenderedSql(
+      dataset_key=dataset_key,
+      sql=sql,
+      render_ms=(time.perf_counter() - start_ts) * 1000.0,
+    )
+
+  def _worker() -> None:
+    try:
+      while True:
+        try:
+          dataset_key, td = work.get_nowait()
+        except queue.Empty:
+          return
+        res = _render_one(dataset_key, td)
+        with results_lock:
+          results[dataset_key] = res
+    finally:
+      if worker_teardown_fn is not None:
+        try:
+          worker_teardown_fn()
+        except Exception:
+          pass
+
+  n_workers = max(1, min(int(max_workers or 1), work.qsize()))
+  if n_workers <= 1:
+    # Render inline: no thread (and no per-thread DB connection) needed.
+    while not work.empty():
+      dataset_key, td = work.get_nowait()
+      results[dataset_key] = _render_one(dataset_key, td)
+    return results
+
+  threads = [
+    threading.Thread(target=_worker, name=f"elevata-prerender-{i + 1}", daemon=True)
+    for i in range(n_workers)
+  ]
+  for t in threads:
+    t.start()
+  for t in threads:
+    t.join()
+  return results
+
+
+def attach_prerendered_sql(plan: ExecutionPlan, rendered: dict[str, PrerenderedSql]) -> ExecutionPlan:
+  """
+  Materialize successful renders into the plan steps (in place).
+  """
+  steps = []
+  for step in plan.steps:
+    res = rendered.get(step.dataset_key)
+    if res is not None and res.error is None and res.sql is not None:
+      step = replace(step, rendered_sql=res.sql, render_ms=res.render_ms)
+    steps.append(step)
+  plan.steps = steps
+  return plan
@@ -0,0 +1,219 @@
+"""
+elevata - Metadata-driven Data Platform Framework
+Copyright © 2026 Ilona Tag
+
+This file is part of elevata.
+
+elevata is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as
+published by the Free Software Foundation, either version 3 of
+the License, or (at your option) any later version.
+
+elevata is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with elevata. If not, see <https://www.gnu.org/licenses/>.
+
+Contact: <https://github.com/elevata-labs/elevata>.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+import json
+from typing import Any
+
+from metadata.execution.executor import ExecutionPlan, ExecutionStep
+from metadata.execution.load_run_snapshot_store import (
+  fetch_one_value,
+  render_select_load_run_snapshot_json,
+)
+
+
+# Resume support for `elevata_load --resume <batch_run_id>`.
+# The plan and outcomes of the batch come from meta.load_run_snapshot. Successful
+# attempts in meta.load_run_log are merged in, so work finished by an interrupted
+# resume is not repeated.
+
+# Skipped outcomes that count as done: the dataset is up to date.
+_DONE_SKIP_KINDS = ("unchanged",)
+
+
+@dataclass(frozen=True)
+class ResumeState:
+  batch_run_id: str
+  root_dataset_key: str | None
+  plan_fingerprint: str | None
+  resume_no: int
+  steps: tuple[ExecutionStep, ...]
+  results_by_key: dict[str, dict[str, Any]]
+
+
+def parse_resume_state(snapshot: dict[str, Any]) -> ResumeState:
+  """
+  Extract plan and last outcome per dataset from a load run snapshot document.
+  Raises ValueError if the snapshot cannot be resumed.
+  """
+  context = snapshot.get("context") or {}
+  if not bool(context.get("execute")):
+    raise ValueError("snapshot belongs to a dry run; only executed batches can be resumed")
+
+  raw_steps = (snapshot.get("plan") or {}).get("steps") or []
+  if not raw_steps:
+    raise ValueError("snapshot does not contain an execution plan")
+
+  steps = tuple(
+    ExecutionStep(
+      dataset_id=int(s["dataset_id"]),
+      dataset_key=str(s["dataset_key"]),
+      upstream_keys=tuple(str(u) for u in (s.get("upstream_keys") or ())),
+    )
+    for s in raw_steps
+  )
+
+  results_by_key: dict[str, dict[str, Any]] = {}
+  for r in (snapshot.get("outcome") or {}).get("results") or []:
+    key = r.get("dataset")
+    if key:
+      results_by_key[str(key)] = dict(r)
+
+  return ResumeState(
+    batch_run_id=str(snapshot.get("batch_run_id") or ""),
+    root_dataset_key=context.get("root_dataset"),
+    plan_fingerprint=context.get("plan_fingerprint"),
+    resume_no=int(context.get("resume_no") or 0),
+    steps=steps,
+    results_by_key=results_by_key,
+  )
+
+
+def load_resume_state(*, engine, dialect, meta_schema: str, batch_run_id: str) -> ResumeState | None:
+  """
+  Load the latest snapshot of a batch. Returns None if the batch has no snapshot.
+  """
+  sql = render_select_load_run_snapshot_json(
+    dialect=dialect,
+    meta_schema=meta_schema,
+    batch_run_id=str(batch_run_id),
+  )
+  snapshot_json = fetch_one_value(engine, sql)
+  if not snapshot_json:
+    return None
+  return parse_resume_state(json.loads(snapshot_json))
+
+
+def render_select_batch_succeeded_datasets(*, dialect, meta_schema: str, batch_run_id: str) -> str:
+  """
+  Select datasets with a successful (non-orchestration) attempt in a batch.
+  """
+  tbl = dialect.render_table_identifier(meta_schema, "load_run_log")
+  cols = ", ".join(dialect.render_identifier(c) for c in ("target_schema", "target_dataset"))
+  where = [
+    f"{dialect.render_identifier('batch_run_id')} = {dialect.literal(batch_run_id)}",
+    f"{dialect.render_identifier('status')} = {dialect.literal('success')}",
+    f"{dialect.render_identifier('run_kind')} <> {dialect.literal('orchestration')}",
+    # Per-partition ingestion rows are not dataset attempts.
+    f"{dialect.render_identifier('run_kind')} <> {dialect.literal('ingestion_partition')}",
+  ]
+  return f"SELECT DISTINCT {cols} FROM {tbl} WHERE " + " AND ".join(where)
+
+
+def load_batch_succeeded_keys(*, engine, dialect, meta_schema: str, batch_run_id: str) -> set[str]:
+  """
+  Best-effort: returns an empty set if meta.load_run_log is not readable.
+  """
+  fetch_all = getattr(engine, "fetch_all", None)
+  if not callable(fetch_all):
+    return set()
+  try:
+    rows = fetch_all(render_select_batch_succeeded_datasets(
+      dialect=dialect,
+      meta_schema=meta_schema,
+      batch_run_id=batch_run_id,
+    ))
+  except Exception:
+    return set()
+
+  out: set[str] = set()
+  for row in rows or []:
+    if row and len(row) >= 2 and row[0] and row[1]:
+      out.add(f"{row[0]}.{row[1]}")
+  return out
+
+
+def is_step_done(result: dict[str, Any] | None) -> bool:
+  if not result:
+    return False
+  status = str(result.get("status") or "")
+  if status == "success":
+    return True
+  return status == "skipped" and str(result.get("kind") or "") in _DONE_SKIP_KINDS
+
+
+def compute_resume_keys(state: ResumeState, succeeded_keys: set[str] | None = None) -> list[str]:
+  """
+  Datasets to run again, in plan order: every step that did not finish
+  (failed, blocked, aborted or never reached) plus everything downstream of it.
+  """
+  succeeded = set(succeeded_keys or ())
+  plan_keys = [s.dataset_key for s in state.steps]
+
+  rerun = {
+    k for k in plan_keys
+    if k not in succeeded and not is_step_done(state.results_by_key.get(k))
+  }
+
+  downstream: dict[str, list[str]] = {}
+  for s in state.steps:
+    for up in s.upstream_keys:
+      if up != s.dataset_key:
+        downstream.setdefault(up, []).append(s.dataset_key)
+
+  stack = list(rerun)
+  while stack:
+    for child in downstream.get(stack.pop(), ()):
+      if child not in rerun:
+        rerun.add(child)
+        stack.append(child)
+
+  return [k for k in plan_keys if k in rerun]
+
+
+def build_resume_plan(state: ResumeState, resume_keys: list[str]) -> ExecutionPlan:
+  """
+  The original plan restricted to resume_keys, under the original batch_run_id.
+  Upstreams outside the plan have already succeeded and do not gate readiness.
+  """
+  keep = set(resume_keys)
+  return ExecutionPlan(
+    batch_run_id=state.batch_run_id,
+    steps=[s for s in state.steps if s.dataset_key in keep],
+  )
+
+
+def merge_resume_results(
+  state: ResumeState,
+  results: list[dict[str, object]],
+  succeeded_keys: set[str] | None = None,
+) -> list[dict[str, object]]:
+  """
+  Full-plan outcomes for the resumed batch snapshot: new results for re-run steps,
+  the previous outcome for everything else.
+  """
+  succeeded = set(succeeded_keys or ())
+  new_by_key = {str(r.get("dataset")): r for r in results if r.get("dataset")}
+
+  out: list[dict[str, object]] = []
+  for s in state.steps:
+    key = s.dataset_key
+    if key in new_by_key:
+      out.append(new_by_key[key])
+      continue
+    prev = state.results_by_key.get(key)
+    if not is_step_done(prev) and key in succeeded:
+      prev = {"dataset": key, "status": "success", "status_reason": "load_run_log"}
+    out.append(dict(prev or {"dataset": key, "status": "unknown"}))
+  return out
@@ -0,0 +1,207 @@
+"""
+elevata - Metadata-driven Data Platform Framework
+Copyright © 2026 Ilona Tag
+
+This file is part of elevata.
+
+elevata is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as
+published by the Free Software Foundation, either version 3 of
+the License, or (at your option) any later version.
+
+elevata is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with elevata. If not, see <https://www.gnu.org/licenses/>.
+
+Contact: <https://github.com/elevata-labs/elevata>.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+import math
+
+
+# Cost-aware scheduling for parallel execution.
+# Historical runtimes come from meta.load_run_log; without history the executor
+# keeps its deterministic plan order.
+
+@dataclass(frozen=True)
+class RuntimeStats:
+  p50_ms: float
+  p95_ms: float
+  samples: int
+
+
+def _percentile(sorted_values: list[float], pct: float) -> float:
+  """
+  Nearest-rank percentile on an already sorted list.
+  """
+  if not sorted_values:
+    return 0.0
+  rank = max(1, int(math.ceil(pct / 100.0 * len(sorted_values))))
+  return float(sorted_values[min(rank, len(sorted_values)) - 1])
+
+
+def render_select_load_run_durations(
+  *,
+  dialect,
+  meta_schema: str,
+  since: datetime | None = None,
+) -> str:
+  """
+  Select per-attempt runtimes of successful dataset runs from meta.load_run_log.
+  """
+  tbl = dialect.render_table_identifier(meta_schema, "load_run_log")
+  cols = ", ".join(
+    dialect.render_identifier(c)
+    for c in ("target_schema", "target_dataset", "execution_ms", "started_at", "finished_at")
+  )
+  status_col = dialect.render_identifier("status")
+  run_kind_col = dialect.render_identifier("run_kind")
+
+  where = [
+    f"{status_col} = {dialect.literal('success')}",
+    f"{run_kind_col} <> {dialect.literal('orchestration')}",
+    # Per-partition ingestion rows would skew the dataset runtime.
+    f"{run_kind_col} <> {dialect.literal('ingestion_partition')}",
+  ]
+  if since is not None:
+    render_literal = getattr(dialect, "render_literal", None)
+    since_sql = render_literal(since) if callable(render_literal) else dialect.literal(since)
+    where.append(f"{dialect.render_identifier('started_at')} >= {since_sql}")
+
+  return f"SELECT {cols} FROM {tbl} WHERE " + " AND ".join(where)
+
+
+def _row_duration_ms(row) -> float | None:
+  """
+  Prefer execution_ms; fall back to finished_at - started_at for runs that
+  do not measure execution separately (e.g. file/REST landing logs 0 ms).
+  """
+  try:
+    execution_ms = row[2]
+    if execution_ms is not None and float(execution_ms) > 0:
+      return float(execution_ms)
+  except (TypeError, ValueError, IndexError):
+    pass
+
+  try:
+    started_at, finished_at = row[3], row[4]
+  except IndexError:
+    return None
+  if isinstance(started_at, datetime) and isinstance(finished_at, datetime):
+    try:
+      return max(0.0, (finished_at - started_at).total_seconds() * 1000.0)
+    except TypeError:
+      # naive vs. aware timestamps
+      return None
+  return None
+
+
+def summarize_runtime_rows(rows) -> dict[str, RuntimeStats]:
+  """
+  Aggregate raw load_run_log rows into p50/p95 runtimes per dataset_key.
+  """
+  durations: dict[str, list[float]] = {}
+  for row in rows or []:
+    if not row or len(row) < 3:
+      continue
+    schema_short = str(row[0] or "").strip()
+    dataset_name = str(row[1] or "").strip()
+    if not schema_short or not dataset_name:
+      continue
+    ms = _row_duration_ms(row)
+    if ms is None:
+      continue
+    durations.setdefault(f"{schema_short}.{dataset_name}", []).append(ms)
+
+  out: dict[str, RuntimeStats] = {}
+  for key, values in durations.items():
+    values.sort()
+    out[key] = RuntimeStats(
+      p50_ms=_percentile(values, 50),
+      p95_ms=_percentile(values, 95),
+      samples=len(values),
+    )
+  return out
+
+
+def load_runtime_stats(
+  *,
+  engine,
+  dialect,
+  meta_schema: str,
+  lookback_days: int = 30,
+  now_ts: datetime | None = None,
+) -> dict[str, RuntimeStats]:
+  """
+  Load historical runtimes per dataset_key. Best-effort: returns {} on any error
+  (missing log table, engine without fetch_all, ...).
+  """
+  fetch_all = getattr(engine, "fetch_all", None)
+  if not callable(fetch_all):
+    return {}
+
+  since = None
+  if lookback_days and lookback_days > 0:
+    since = (now_ts or datetime.now()) - timedelta(days=int(lookback_days))
+
+  try:
+    sql = render_select_load_run_durations(dialect=dialect, meta_schema=meta_schema, since=since)
+    rows = fetch_all(sql)
+  except Exception:
+    return {}
+
+  return summarize_runtime_rows(rows)
+
+
+def compute_critical_path_weights(
+  *,
+  plan,
+  runtime_stats: dict[str, RuntimeStats],
+  percentile: str = "p50",
+) -> dict[str, float]:
+  """
+  Critical-path weight per step: own expected runtime plus the heaviest chain of
+  downstream steps that depend on it. Steps without history are costed at the
+  median of the known runtimes so they are neither starved nor over-prioritized.
+
+  Returns {} when no step has history (caller keeps plan order).
+  """
+  steps = list(getattr(plan, "steps", None) or [])
+  keys = [s.dataset_key for s in steps]
+
+  def _cost(stats: RuntimeStats) -> float:
+    return float(stats.p95_ms if percentile == "p95" else stats.p50_ms)
+
+  known = sorted(_cost(runtime_stats[k]) for k in keys if k in runtime_stats)
+  if not known:
+    return {}
+  default_cost = _percentile(known, 50)
+
+  cost_by_key = {
+    k: (_cost(runtime_stats[k]) if k in runtime_stats else default_cost)
+    for k in keys
+  }
+
+  in_plan = set(keys)
+  downstream: dict[str, list[str]] = {k: [] for k in keys}
+  for s in steps:
+    for up in s.upstream_keys:
+      if up in in_plan and up != s.dataset_key:
+        downstream[up].append(s.dataset_key)
+
+  # Plan order is topological (upstreams first), so a reverse sweep sees all
+  # children before their parents.
+  weights: dict[str, float] = {}
+  for k in reversed(keys):
+    tail = max((weights.get(c, 0.0) for c in downstream[k]), default=0.0)
+    weights[k] = cost_by_key[k] + tail
+
+  return weights
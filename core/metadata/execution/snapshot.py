@@ -57,6 +57,8 @@ def build_execution_snapshot(
   created_at: datetime,
   results: list[dict[str, object]] | None = None,
   had_error: bool | None = None,
+  plan_fingerprint: str | None = None,
+  resume_no: int = 0,
 ) -> dict[str, Any]:
   """
   Keep snapshot stable and concise. Never include SQL text.
@@ -82,10 +84,14 @@ def build_execution_snapshot(
       "target_system_type": target_system_type,
       "dialect": dialect_name,
       "root_dataset": root_dataset_key,
+      # Required by --resume to verify the metadata did not change since the batch ran.
+      "plan_fingerprint": plan_fingerprint,
+      "resume_no": int(resume_no),
     },
     "policy": {
       "continue_on_error": bool(policy.continue_on_error),
       "max_retries": int(policy.max_retries),
+      "max_workers": int(getattr(policy, "max_workers", 1) or 1),
     },
     "plan": {
       "step_count": len(steps),
@@ -0,0 +1,347 @@
+"""
+elevata - Metadata-driven Data Platform Framework
+Copyright © 2026 Ilona Tag
+
+This file is part of elevata.
+
+elevata is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as
+published by the Free Software Foundation, either version 3 of
+the License, or (at your option) any later version.
+
+elevata is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with elevata. If not, see <https://www.gnu.org/licenses/>.
+
+Contact: <https://github.com/elevata-labs/elevata>.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+import hashlib
+import json
+import threading
+from typing import Callable
+
+from metadata.execution.load_run_snapshot_store import ensure_meta_table_from_registry
+from metadata.materialization.logging import LOAD_WATERMARK_REGISTRY
+
+
+# Data-aware skipping (--skip-unchanged).
+# A dataset's input watermark combines its definition (rendered load SQL) with the
+# last *data-changing* load_run_id of each upstream dataset. Upstream runs that
+# affected zero rows keep the previous load_run_id, so an unchanged subtree keeps
+# its watermarks and is skipped step by step. Zero affected rows only count as
+# "no change" for incremental modes: a full refresh that lands zero rows emptied
+# its table.
+
+LOAD_WATERMARK_TABLE = "load_watermark"
+
+# Above this many names we read the full history instead of rendering a huge IN list.
+_MAX_IN_LIST = 1000
+
+# Load modes that only add or modify rows (see load_planner / native_raw summaries).
+INCREMENTAL_LOAD_MODES = ("incremental", "append", "merge", "historize")
+
+# Successful run statuses in meta.load_run_log (REST ingestion logs "ok").
+_SUCCESS_STATUSES = ("success", "ok")
+
+
+@dataclass(frozen=True)
+class WatermarkCheck:
+  unchanged: bool
+  watermark: str | None
+  definition_fingerprint: str | None = None
+  inputs: dict[str, str] = field(default_factory=dict)
+  reason: str | None = None
+
+
+def compute_definition_fingerprint(sql: str) -> str:
+  """
+  Fingerprint of a dataset definition. Runtime placeholders are still unbound
+  at render time, so the rendered SQL is stable across runs.
+  """
+  return hashlib.sha256((sql or "").encode("utf-8")).hexdigest()
+
+
+def compute_input_watermark(*, definition_fingerprint: str, inputs: dict[str, str]) -> str:
+  payload = json.dumps(
+    {"definition": definition_fingerprint, "inputs": dict(sorted(inputs.items()))},
+    sort_keys=True,
+  )
+  return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _render_in_list(dialect, column: str, values: list[str]) -> str | None:
+  if not values or len(values) > _MAX_IN_LIST:
+    return None
+  items = ", ".join(dialect.literal(v) for v in sorted(set(values)))
+  return f"{dialect.render_identifier(column)} IN ({items})"
+
+
+def _render_since(dialect, column: str, since: datetime) -> str:
+  render_literal = getattr(dialect, "render_literal", None)
+  since_sql = render_literal(since) if callable(render_literal) else dialect.literal(since)
+  return f"{dialect.render_identifier(column)} >= {since_sql}"
+
+
+def _is_unchanged_run(rows_affected, mode) -> bool:
+  if str(mode or "").strip().lower() not in INCREMENTAL_LOAD_MODES:
+    return False
+  try:
+    return rows_affected is not None and int(rows_affected) == 0
+  except (TypeError, ValueError):
+    return False
+
+
+def render_select_last_change_runs(
+  *,
+  dialect,
+  meta_schema: str,
+  dataset_names: list[str] | None = None,
+  since: datetime | None = None,
+) -> str:
+  """
+  Select successful dataset runs that changed data: rows_affected unknown or
+  non-zero, or any run of a non-incremental (full / snapshot) load.
+  """
+  tbl = dialect.render_table_identifier(meta_schema, "load_run_log")
+  cols = ", ".join(
+    dialect.render_identifier(c)
+    for c in ("target_schema", "target_dataset", "load_run_id", "finished_at")
+  )
+  rows_col = dialect.render_identifier("rows_affected")
+  mode_col = dialect.render_identifier("mode")
+  statuses = ", ".join(dialect.literal(s) for s in _SUCCESS_STATUSES)
+  modes = ", ".join(dialect.literal(m) for m in INCREMENTAL_LOAD_MODES)
+
+  where = [
+    f"{dialect.render_identifier('status')} IN ({statuses})",
+    f"{dialect.render_identifier('run_kind')} <> {dialect.literal('orchestration')}",
+    # Per-partition ingestion rows share the dataset's load_run_id but only count a slice.
+    f"{dialect.render_identifier('run_kind')} <> {dialect.literal('ingestion_partition')}",
+    f"({rows_col} IS NULL OR {rows_col} <> 0 OR {mode_col} IS NULL OR {mode_col} NOT IN ({modes}))",
+  ]
+  name_filter = _render_in_list(dialect, "target_dataset", list(dataset_names or []))
+  if name_filter:
+    where.append(name_filter)
+  if since is not None:
+    where.append(_render_since(dialect, "finished_at", since))
+
+  return f"SELECT {cols} FROM {tbl} WHERE " + " AND ".join(where)
+
+
+def render_select_load_watermarks(
+  *,
+  dialect,
+  meta_schema: str,
+  dataset_keys: list[str] | None = None,
+  since: datetime | None = None,
+) -> str:
+  tbl = dialect.render_table_identifier(meta_schema, LOAD_WATERMARK_TABLE)
+  cols = ", ".join(
+    dialect.render_identifier(c)
+    for c in ("dataset_key", "watermark", "created_at")
+  )
+  where = []
+  key_filter = _render_in_list(dialect, "dataset_key", list(dataset_keys or []))
+  if key_filter:
+    where.append(key_filter)
+  if since is not None:
+    where.append(_render_since(dialect, "created_at", since))
+  sql = f"SELECT {cols} FROM {tbl}"
+  if where:
+    sql += " WHERE " + " AND ".join(where)
+  return sql
+
+
+def _latest_by_key(rows, *, key_fn, value_idx: int, ts_idx: int) -> dict[str, str]:
+  """
+  Keep the value of the most recent row per key (rows arrive unordered).
+  """
+  latest: dict[str, tuple[object, str]] = {}
+  for row in rows or []:
+    try:
+      key = key_fn(row)
+      value = row[value_idx]
+      ts = row[ts_idx]
+    except (IndexError, TypeError):
+      continue
+    if not key or value is None:
+      continue
+    prev = latest.get(key)
+    if prev is None:
+      latest[key] = (ts, str(value))
+      continue
+    try:
+      newer = ts is not None and (prev[0] is None or ts > prev[0])
+    except TypeError:
+      newer = str(ts) > str(prev[0])
+    if newer:
+      latest[key] = (ts, str(value))
+  return {k: v for k, (_, v) in latest.items()}
+
+
+def _log_row_key(row) -> str | None:
+  schema_short = str(row[0] or "").strip()
+  dataset_name = str(row[1] or "").strip()
+  if not schema_short or not dataset_name:
+    return None
+  return f"{schema_short}.{dataset_name}"
+
+
+class InputWatermarkTracker:
+  """
+  In-memory view of change markers and stored watermarks for one batch.
+  Thread-safe: parallel workers evaluate and record concurrently.
+  """
+
+  def __init__(self, *, change_run_ids: dict[str, str], watermarks: dict[str, str]):
+    self._change_run_ids = dict(change_run_ids)
+    self._watermarks = dict(watermarks)
+    self._lock = threading.Lock()
+
+  @classmethod
+  def load(
+    cls,
+    *,
+    engine,
+    dialect,
+    meta_schema: str,
+    dataset_keys: list[str],
+    lookback_days: int = 30,
+    now_ts: datetime | None = None,
+  ) -> "InputWatermarkTracker | None":
+    """
+    Read change markers from meta.load_run_log and stored watermarks from
+    meta.load_watermark, limited to the last lookback_days (0 = full history).
+    Older history only costs one extra run of the affected datasets.
+    Best-effort: returns None when history cannot be read, in which case
+    nothing is skipped.
+    """
+    fetch_all = getattr(engine, "fetch_all", None)
+    if not callable(fetch_all):
+      return None
+
+    since = None
+    if lookback_days and lookback_days > 0:
+      since = (now_ts or datetime.now()) - timedelta(days=int(lookback_days))
+
+    names = [k.split(".", 1)[1] for k in dataset_keys if "." in k]
+    try:
+      log_rows = fetch_all(render_select_last_change_runs(
+        dialect=dialect,
+        meta_schema=meta_schema,
+        dataset_names=names,
+        since=since,
+      ))
+    except Exception:
+      return None
+
+    try:
+      wm_rows = fetch_all(render_select_load_watermarks(
+        dialect=dialect,
+        meta_schema=meta_schema,
+        dataset_keys=list(dataset_keys),
+        since=since,
+      ))
+    except Exception:
+      # No watermark table yet: every dataset runs once and records one.
+      wm_rows = []
+
+    return cls(
+      change_run_ids=_latest_by_key(log_rows, key_fn=_log_row_key, value_idx=2, ts_idx=3),
+      watermarks=_latest_by_key(
+        wm_rows,
+        key_fn=lambda r: str(r[0] or "").strip() or None,
+        value_idx=1,
+        ts_idx=2,
+      ),
+    )
+
+  def evaluate(
+    self,
+    *,
+    dataset_key: str,
+    upstream_keys,
+    definition_fingerprint_fn: Callable[[], str],
+  ) -> WatermarkCheck:
+    """
+    Compare the current input watermark with the stored one.
+    Datasets without upstream datasets (RAW, source-fed) read external data and
+    are never considered unchanged; their definition is not even rendered.
+    """
+    ups = sorted({u for u in (upstream_keys or ()) if u and u != dataset_key})
+    if not ups:
+      return WatermarkCheck(unchanged=False, watermark=None, reason="no_upstream_datasets")
+
+    definition_fingerprint = definition_fingerprint_fn()
+
+    with self._lock:
+      # Upstreams without any data-changing run so far map to "" (stable until they change).
+      inputs = {u: self._change_run_ids.get(u, "") for u in ups}
+      stored = self._watermarks.get(dataset_key)
+
+    watermark = compute_input_watermark(definition_fingerprint=definition_fingerprint, inputs=inputs)
+    return WatermarkCheck(
+      unchanged=(stored == watermark),
+      watermark=watermark,
+      definition_fingerprint=definition_fingerprint,
+      inputs=inputs,
+      reason=("inputs_unchanged" if stored == watermark else ("no_watermark" if stored is None else "inputs_changed")),
+    )
+
+  def record_run(self, *, dataset_key: str, rows_affected, load_run_id: str | None, mode: str | None = None) -> None:
+    """
+    Register a successful run of this batch. An incremental run with zero affected
+    rows keeps the previous change marker so downstream watermarks stay stable.
+    """
+    if not load_run_id:
+      return
+    if _is_unchanged_run(rows_affected, mode):
+      return
+    with self._lock:
+      self._change_run_ids[dataset_key] = str(load_run_id)
+
+  def record_watermark(self, *, dataset_key: str, watermark: str) -> None:
+    with self._lock:
+      self._watermarks[dataset_key] = watermark
+
+
+def build_load_watermark_row(
+  *,
+  dataset_key: str,
+  check: WatermarkCheck,
+  batch_run_id: str,
+  load_run_id: str,
+  created_at,
+) -> dict[str, object]:
+  return {
+    "dataset_key": dataset_key,
+    "watermark": check.watermark,
+    "definition_fingerprint": check.definition_fingerprint,
+    "inputs_json": json.dumps(dict(sorted(check.inputs.items()))),
+    "batch_run_id": batch_run_id,
+    "load_run_id": load_run_id,
+    "created_at": created_at,
+  }
+
+
+def ensure_load_watermark_table(engine, dialect, meta_schema: str, auto_provision: bool) -> None:
+  """
+  Ensure meta.load_watermark exists and contains all registry columns (best-effort).
+  """
+  ensure_meta_table_from_registry(
+    engine=engine,
+    dialect=dialect,
+    meta_schema=meta_schema,
+    table_name=LOAD_WATERMARK_TABLE,
+    registry=LOAD_WATERMARK_REGISTRY,
+    auto_provision=auto_provision,
+  )
@@ -0,0 +1,401 @@
+"""
+elevata - Metadata-driven Data Platform Framework
+Copyright © 2026 Ilona Tag
+
+This file is part of elevata.
+
+elevata is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as
+published by the Free Software Foundation, either version 3 of
+the License, or (at your option) any later version.
+
+elevata is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with elevata. If not, see <https://www.gnu.org/licenses/>.
+
+Contact: <https://github.com/elevata-labs/elevata>.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+import json
+import logging
+import threading
+import time
+from typing import Callable
+
+from django.db import connection, connections, transaction
+from django.db.models import F
+from django.utils import timezone
+
+from metadata.execution.executor import (
+  ExecutionPlan,
+  ExecutionPolicy,
+  ExecutionStep,
+  _aborted_result,
+  _blocked_by,
+  _blocked_result,
+  _run_step,
+)
+from metadata.models import LoadQueueBatch, LoadQueueStatus, LoadQueueStep
+
+
+# Distributed execution: a coordinator persists the ExecutionPlan into
+# load_queue_batch / load_queue_step in the metadata database, and any number of
+# `elevata_load --worker` processes claim ready steps from it.
+#
+# Claiming is a compare-and-set UPDATE (pending -> running) guarded by a lease.
+# Backends with SELECT ... FOR UPDATE SKIP LOCKED (Postgres) additionally skip
+# rows another worker is claiming instead of waiting for them. Running steps
+# whose lease expired (worker died or lost its connection) are re-queued.
+# Blocked and fail-fast semantics are the same as in execute_plan().
+
+TERMINAL_STATUSES = (
+  LoadQueueStatus.SUCCESS,
+  LoadQueueStatus.DRY_RUN,
+  LoadQueueStatus.ERROR,
+  LoadQueueStatus.BLOCKED,
+  LoadQueueStatus.SKIPPED,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def _to_json(result: dict[str, object] | None) -> dict[str, object]:
+  # Results carry datetimes (started_at/finished_at); keep them as ISO strings.
+  return json.loads(json.dumps(result or {}, default=lambda o: o.isoformat() if isinstance(o, datetime) else str(o)))
+
+
+def enqueue_plan(
+  *,
+  plan: ExecutionPlan,
+  policy: ExecutionPolicy,
+  execute: bool,
+  options: dict[str, object] | None = None,
+) -> LoadQueueBatch:
+  """
+  Persist an ExecutionPlan as a queue batch. Steps are claimable immediately.
+  """
+  with transaction.atomic():
+    batch = LoadQueueBatch.objects.create(
+      batch_run_id=plan.batch_run_id,
+      execute=bool(execute),
+      continue_on_error=bool(policy.continue_on_error),
+      max_retries=int(policy.max_retries),
+      options=dict(options or {}),
+    )
+    LoadQueueStep.objects.bulk_create([
+      LoadQueueStep(
+        batch=batch,
+        target_dataset_id=int(step.dataset_id),
+        dataset_key=step.dataset_key,
+        seq=seq,
+        upstream_keys=list(step.upstream_keys),
+      )
+      for seq, step in enumerate(plan.steps)
+    ])
+  return batch
+
+
+def requeue_expired_leases(*, now_ts: datetime | None = None) -> int:
+  """
+  Put running steps with an expired lease back to pending. Returns the number of steps.
+  """
+  return (
+    LoadQueueStep.objects
+    .filter(
+      status=LoadQueueStatus.RUNNING,
+      lease_expires_at__lt=now_ts or timezone.now(),
+      batch__finished_at__isnull=True,
+    )
+    .update(status=LoadQueueStatus.PENDING, worker_id=None, lease_expires_at=None)
+  )
+
+
+def _finish_pending(step_id: int, status: str, result: dict[str, object]) -> bool:
+  return bool(
+    LoadQueueStep.objects
+    .filter(pk=step_id, status=LoadQueueStatus.PENDING)
+    .update(status=status, result=_to_json(result), finished_at=timezone.now())
+  )
+
+
+def _scan_ready_steps(*, batch_run_id: str | None = None) -> list[int]:
+  """
+  Return ids of pending steps whose upstream steps have all finished, in claim order.
+  Pending steps behind a failed upstream are marked skipped/blocked on the way.
+  """
+  rows = list(
+    LoadQueueStep.objects
+    .filter(batch__finished_at__isnull=True)
+    .filter(**({"batch__batch_run_id": batch_run_id} if batch_run_id else {}))
+    .order_by("batch_id", "seq")
+    .values_list("id", "batch_id", "dataset_key", "upstream_keys", "status")
+  )
+  status_by_key: dict[int, dict[str, str]] = {}
+  for _, batch_id, key, _, status in rows:
+    status_by_key.setdefault(batch_id, {})[key] = status
+
+  ready: list[int] = []
+  for step_id, batch_id, key, upstream_keys, status in rows:
+    if status != LoadQueueStatus.PENDING:
+      continue
+    statuses = status_by_key[batch_id]
+    ups = [u for u in (upstream_keys or []) if u in statuses and u != key]
+    if any(statuses[u] not in TERMINAL_STATUSES for u in ups):
+      continue
+
+    step = ExecutionStep(dataset_id=0, dataset_key=key, upstream_keys=tuple(ups))
+    blocked_by = _blocked_by(step, statuses)
+    if blocked_by is not None:
+      if _finish_pending(step_id, LoadQueueStatus.SKIPPED, _blocked_result(step, blocked_by)):
+        statuses[key] = LoadQueueStatus.SKIPPED
+      continue
+    ready.append(step_id)
+  return ready
+
+
+def claim_next_step(
+  *,
+  worker_id: str,
+  lease_seconds: int = 60,
+  batch_run_id: str | None = None,
+) -> LoadQueueStep | None:
+  """
+  Claim the first ready step (oldest batch, plan order). Returns None if nothing is ready.
+  """
+  requeue_expired_leases()
+  skip_locked = bool(getattr(connection.features, "has_select_for_update_skip_locked", False))
+
+  for step_id in _scan_ready_steps(batch_run_id=batch_run_id):
+    with transaction.atomic():
+      candidates = LoadQueueStep.objects.filter(pk=step_id, status=LoadQueueStatus.PENDING)
+      if skip_locked and not list(candidates.select_for_update(skip_locked=True).values_list("pk", flat=True)[:1]):
+        # Pending rows locked by another worker are being claimed right now.
+        continue
+      now_ts = timezone.now()
+      won = candidates.update(
+        status=LoadQueueStatus.RUNNING,
+        worker_id=worker_id,
+        claim_no=F("claim_no") + 1,
+        started_at=now_ts,
+        heartbeat_at=now_ts,
+        lease_expires_at=now_ts + timedelta(seconds=int(lease_seconds)),
+      )
+    if won:
+      return LoadQueueStep.objects.select_related("batch").get(pk=step_id)
+  return None
+
+
+def heartbeat(*, step: LoadQueueStep, worker_id: str, lease_seconds: int = 60) -> bool:
+  """
+  Extend the lease of a claimed step. False means the lease was lost.
+  """
+  now_ts = timezone.now()
+  return bool(
+    LoadQueueStep.objects
+    .filter(pk=step.pk, status=LoadQueueStatus.RUNNING, worker_id=worker_id, claim_no=step.claim_no)
+    .update(heartbeat_at=now_ts, lease_expires_at=now_ts + timedelta(seconds=int(lease_seconds)))
+  )
+
+
+def complete_step(
+  *,
+  step: LoadQueueStep,
+  worker_id: str,
+  result: dict[str, object],
+  is_error: bool,
+) -> bool:
+  """
+  Record the outcome of a claimed step. False means the lease was lost and the
+  step was re-queued in the meantime; the result is then discarded.
+  In fail-fast batches an error aborts every step that has not started yet.
+  """
+  status = str((result or {}).get("status") or "")
+  if status not in TERMINAL_STATUSES:
+    # Unknown statuses must still end the step, or its downstream would wait forever.
+    status = LoadQueueStatus.ERROR if is_error else LoadQueueStatus.SKIPPED
+  with transaction.atomic():
+    won = (
+      LoadQueueStep.objects
+      .filter(pk=step.pk, status=LoadQueueStatus.RUNNING, worker_id=worker_id, claim_no=step.claim_no)
+      .update(
+        status=status,
+        is_error=bool(is_error),
+        result=_to_json(result),
+        finished_at=timezone.now(),
+        lease_expires_at=None,
+      )
+    )
+    if won and is_error and not step.batch.continue_on_error:
+      pending = LoadQueueStep.objects.filter(batch_id=step.batch_id, status=LoadQueueStatus.PENDING)
+      for pending_id, key in pending.values_list("id", "dataset_key"):
+        aborted = ExecutionStep(dataset_id=0, dataset_key=key, upstream_keys=())
+        _finish_pending(pending_id, LoadQueueStatus.SKIPPED, _aborted_result(aborted))
+  return bool(won)
+
+
+def collect_batch_results(batch: LoadQueueBatch) -> tuple[list[dict[str, object]], bool]:
+  """
+  (results, had_error) in plan order, shaped like execute_plan() output.
+  """
+  results: list[dict[str, object]] = []
+  had_error = False
+  for step in batch.steps.order_by("seq"):
+    result = dict(step.result or {})
+    result.setdefault("dataset", step.dataset_key)
+    result.setdefault("status", step.status)
+    results.append(result)
+    had_error = had_error or bool(step.is_error)
+  return results, had_error
+
+
+def wait_for_batch(
+  batch: LoadQueueBatch,
+  *,
+  poll_seconds: float = 1.0,
+  timeout_seconds: float | None = None,
+) -> tuple[list[dict[str, object]], bool]:
+  """
+  Coordinator loop: re-queue lost leases and settle blocked steps until every step
+  is terminal, then mark the batch finished and return its results.
+  """
+  started = time.monotonic()
+  while True:
+    requeue_expired_leases()
+    _scan_ready_steps(batch_run_id=batch.batch_run_id)
+    if not batch.steps.exclude(status__in=TERMINAL_STATUSES).exists():
+      break
+    if timeout_seconds is not None and time.monotonic() - started > timeout_seconds:
+      raise TimeoutError(f"load queue batch {batch.batch_run_id} did not finish within {timeout_seconds}s")
+    time.sleep(poll_seconds)
+
+  LoadQueueBatch.objects.filter(pk=batch.pk).update(finished_at=timezone.now())
+  return collect_batch_results(batch)
+
+
+class LeaseHeartbeat:
+  """
+  Background thread that keeps the lease of a running step alive.
+  """
+
+  def __init__(self, *, step: LoadQueueStep, worker_id: str, lease_seconds: int = 60):
+    self.step = step
+    self.worker_id = worker_id
+    self.lease_seconds = int(lease_seconds)
+    self.lost = False
+    self._stop = threading.Event()
+    self._thread = threading.Thread(target=self._run, name=f"elevata-heartbeat-{step.pk}", daemon=True)
+
+  def _run(self) -> None:
+    interval = max(1.0, self.lease_seconds / 3.0)
+    try:
+      while not self._stop.wait(interval):
+        try:
+          if not heartbeat(step=self.step, worker_id=self.worker_id, lease_seconds=self.lease_seconds):
+            self.lost = True
+            return
+        except Exception:
+          # A missed heartbeat is harmless as long as a later one succeeds.
+          logger.warning("elevata_load worker heartbeat failed", exc_info=True)
+    finally:
+      connections.close_all()
+
+  def __enter__(self) -> "LeaseHeartbeat":
+    self._thread.start()
+    return self
+
+  def __exit__(self, *exc) -> None:
+    self._stop.set()
+    self._thread.join()
+
+
+def run_queued_step(
+  step: LoadQueueStep,
+  *,
+  td,
+  run_dataset_fn: Callable[..., dict[str, object]],
+) -> tuple[dict[str, object], bool]:
+  """
+  Run one claimed step with the batch policy (retries, preflight blocks) of execute_plan().
+  """
+  batch = step.batch
+  exec_step = ExecutionStep(
+    dataset_id=int(step.target_dataset_id),
+    dataset_key=step.dataset_key,
+    upstream_keys=tuple(step.upstream_keys or ()),
+  )
+  return _run_step(
+    step=exec_step,
+    td=td,
+    plan=ExecutionPlan(batch_run_id=batch.batch_run_id, steps=[exec_step]),
+    policy=ExecutionPolicy(continue_on_error=batch.continue_on_error, max_retries=batch.max_retries),
+    execute=batch.execute,
+    root_td=None,
+    root_load_run_id=None,
+    root_load_plan=None,
+    run_dataset_fn=run_dataset_fn,
+    logger=logger,
+  )
+
+
+def has_open_work() -> bool:
+  return LoadQueueStep.objects.filter(
+    batch__finished_at__isnull=True,
+    status__in=(LoadQueueStatus.PENDING, LoadQueueStatus.RUNNING),
+  ).exists()
+
+
+def run_worker(
+  *,
+  worker_id: str,
+  run_step_fn: Callable[[LoadQueueStep], tuple[dict[str, object], bool]],
+  lease_seconds: int = 60,
+  poll_seconds: float = 1.0,
+  exit_when_idle: bool = False,
+  max_steps: int | None = None,
+  stop_event: threading.Event | None = None,
+) -> int:
+  """
+  Worker loop: claim, run with heartbeat, complete. Returns the number of steps run.
+  """
+  processed = 0
+  while stop_event is None or not stop_event.is_set():
+    try:
+      step = claim_next_step(worker_id=worker_id, lease_seconds=lease_seconds)
+    except Exception:
+      # e.g. SQLite "database is locked" under contention: try again next poll.
+      logger.warning("elevata_load worker could not claim a step", exc_info=True)
+      step = None
+    if step is None:
+      if exit_when_idle and not has_open_work():
+        break
+      time.sleep(poll_seconds)
+      continue
+
+    with LeaseHeartbeat(step=step, worker_id=worker_id, lease_seconds=lease_seconds) as hb:
+      try:
+        result, is_error = run_step_fn(step)
+      except Exception as exc:
+        result, is_error = {
+          "status": "error",
+          "kind": "exception",
+          "dataset": step.dataset_key,
+          "message": str(exc),
+        }, True
+
+    if not complete_step(step=step, worker_id=worker_id, result=result, is_error=is_error):
+      logger.warning(
+        "elevata_load worker lost its lease; result discarded",
+        extra={"batch_run_id": step.batch.batch_run_id, "dataset": step.dataset_key, "lease_lost": hb.lost},
+      )
+
+    processed += 1
+    if max_steps is not None and processed >= max_steps:
+      break
+  return processed
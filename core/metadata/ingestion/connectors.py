@@ -23,8 +23,10 @@ Contact: <https://github.com/elevata-labs/elevata>.
 from __future__ import annotations
 
 import json
+import threading
+import time
 from dataclasses import dataclass
-from typing import Dict, Optional, Tuple
+from typing import Callable, Dict, Optional, Tuple
 from urllib.parse import parse_qsl, quote_plus, urlencode, urlparse
 
 from sqlalchemy import create_engine
@@ -332,13 +334,150 @@ def rest_config_for_source_system(*, system_type: str, short_name: str) -> dict:
   raise ValueError(f"Unsupported REST secret format for ref={ref}")
 
 
+# -----------------------------------------------------------------------------
+# Engine registry (one pooled SQLAlchemy engine per secret ref and URL)
+# -----------------------------------------------------------------------------
+@dataclass
+class _RegisteredEngine:
+  engine: Engine
+  url: str
+  resolved_at: float
+
+
+class EngineRegistry:
+  """
+  Process-wide cache of SQLAlchemy engines.
+
+  Engines are keyed by secret ref and resolved URL. The secret behind a ref is
+  re-resolved after `secret_ttl_seconds`; if the URL changed (rotated password,
+  moved host), a new engine is built and the old one is disposed. Connections
+  still checked out from the old engine are closed when they are returned.
+  """
+
+  def __init__(
+    self,
+    *,
+    secret_ttl_seconds: float = 900,
+    pool_size: int = 5,
+    max_overflow: int = 5,
+    pool_recycle_seconds: int = 1800,
+    resolve_url_fn: Optional[Callable[[str], str]] = None,
+    create_engine_fn: Optional[Callable[..., Engine]] = None,
+    clock: Callable[[], float] = time.monotonic,
+  ):
+    self.secret_ttl_seconds = float(secret_ttl_seconds)
+    self.pool_size = int(pool_size)
+    self.max_overflow = int(max_overflow)
+    self.pool_recycle_seconds = int(pool_recycle_seconds)
+    self._resolve_url_fn = resolve_url_fn or (lambda ref: _coerce_secret_to_url(_resolve_db_secret(ref)))
+    self._create_engine_fn = create_engine_fn or create_engine
+    self._clock = clock
+    self._lock = threading.Lock()
+    self._ref_locks: Dict[str, threading.Lock] = {}
+    self._entries: Dict[str, _RegisteredEngine] = {}
+
+  def _ref_lock(self, ref: str) -> threading.Lock:
+    with self._lock:
+      lock = self._ref_locks.get(ref)
+      if lock is None:
+        lock = threading.Lock()
+        self._ref_locks[ref] = lock
+      return lock
+
+  def _create_engine(self, url: str) -> Engine:
+    kwargs = {
+      "future": True,
+      "pool_pre_ping": True,
+      "pool_size": self.pool_size,
+      "max_overflow": self.max_overflow,
+      "pool_recycle": self.pool_recycle_seconds,
+    }
+    try:
+      return self._create_engine_fn(url, **kwargs)
+    except TypeError:
+      # Dialects without a QueuePool (e.g. in-memory SQLite) reject sizing arguments.
+      return self._create_engine_fn(url, future=True, pool_pre_ping=True)
+
+  def get(self, ref: str) -> Engine:
+    """
+    Return the pooled engine for a secret ref, resolving the secret only when
+    the cached resolution is older than the TTL.
+    """
+    with self._ref_lock(ref):
+      now = self._clock()
+      entry = self._entries.get(ref)
+      if entry is not None and (now - entry.resolved_at) < self.secret_ttl_seconds:
+        return entry.engine
+
+      url = self._resolve_url_fn(ref)
+      if entry is not None and entry.url == url:
+        entry.resolved_at = now
+        return entry.engine
+
+      engine = self._create_engine(url)
+      with self._lock:
+        self._entries[ref] = _RegisteredEngine(engine=engine, url=url, resolved_at=now)
+
+      if entry is not None:
+        try:
+          entry.engine.dispose()
+        except Exception:
+          pass
+      return engine
+
+  def dispose_all(self) -> None:
+    """
+    Dispose all cached engines (batch end). Later calls build fresh engines.
+    """
+    with self._lock:
+      entries = list(self._entries.values())
+      self._entries.clear()
+    for entry in entries:
+      try:
+        entry.engine.dispose()
+      except Exception:
+        pass
+
+  def __len__(self) -> int:
+    with self._lock:
+      return len(self._entries)
+
+
+_registry: Optional[EngineRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_engine_registry() -> EngineRegistry:
+  """
+  Return the process-wide engine registry, configured from settings.
+  """
+  global _registry
+  with _registry_lock:
+    if _registry is None:
+      _registry = EngineRegistry(
+        secret_ttl_seconds=getattr(settings, "ELEVATA_SECRET_TTL_SECONDS", 900),
+        pool_size=getattr(settings, "ELEVATA_SA_POOL_SIZE", 5),
+        max_overflow=getattr(settings, "ELEVATA_SA_MAX_OVERFLOW", 5),
+        pool_recycle_seconds=getattr(settings, "ELEVATA_SA_POOL_RECYCLE_SECONDS", 1800),
+      )
+    return _registry
+
+
+def dispose_all_engines() -> None:
+  """
+  Dispose all registry engines. Best-effort; safe to call at any batch end.
+  """
+  registry = _registry
+  if registry is not None:
+    registry.dispose_all()
+
+
 def engine_from_secret_ref(ref: str) -> Engine:
   """
   Generic entrypoint: provide a final secret *reference*, get a SQLAlchemy engine back.
+  Engines are shared via the process-wide registry; callers must not dispose them.
   """
-  sec = _resolve_db_secret(ref)
-  url = _coerce_secret_to_url(sec)
-  return create_engine(url, future=True, pool_pre_ping=True)
+  return get_engine_registry().get(ref)
 
 
 def engine_for_source_system(*, system_type: str, short_name: str) -> Engine:
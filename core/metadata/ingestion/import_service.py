@@ -259,12 +259,7 @@ def import_metadata_for_datasets(
     totals["updated"] += updated
     totals["removed"] += removed
 
-  # Dispose engines
-  for eng in engines.values():
-    try:
-      eng.dispose()
-    except Exception:
-      pass
+  # Engines are shared via the connectors registry and stay pooled for the next import.
 
   # skipped summary for UI feedback
   totals["skipped"] = skipped
@@ -24,10 +24,11 @@ from __future__ import annotations
 
 import datetime
 import json
+import re
 from typing import Any
 
 from metadata.ingestion.json_path import extract_json_path
-from metadata.ingestion.normalization import normalize_param_value
+from metadata.ingestion.normalization import normalize_column_name, normalize_param_value
 from metadata.materialization.logging import ensure_load_run_log_table, build_load_run_log_row
 
 
@@ -59,41 +60,102 @@ def render_param_insert_sql(
   )
 
 
-def land_raw_json_records(
+def raw_column_types(td) -> dict[str, dict[str, Any]]:
+  """
+  Canonical type info per TargetColumn name, passed to engine.bulk_load so
+  engines can bind typed parameters. Best-effort: {} if columns are unavailable.
+  """
+  try:
+    tgt_cols = list(td.target_columns.all())
+  except Exception:
+    return {}
+
+  out: dict[str, dict[str, Any]] = {}
+  for c in tgt_cols:
+    name = getattr(c, "target_column_name", None)
+    if not name:
+      continue
+    out[name] = {
+      "datatype": getattr(c, "datatype", None),
+      "max_length": getattr(c, "max_length", None),
+      "decimal_precision": getattr(c, "decimal_precision", None),
+      "decimal_scale": getattr(c, "decimal_scale", None),
+    }
+  return out
+
+
+def insert_raw_rows(
   *,
   target_engine,
   target_dialect,
-  td,
-  records: list[dict[str, Any]],
-  batch_run_id: str,
-  load_run_id: str,
-  target_system,
-  profile,
-  meta_schema: str = "meta",
-  source_system_short_name: str | None = None,
-  source_dataset_name: str | None = None,
-  source_object: str | None = None,
-  ingest_mode: str | None = None,
+  schema_name: str,
+  table_name: str,
+  columns: list[str],
+  rows,
   chunk_size: int = 10_000,
-  source_dataset=None,
-  strict: bool = False,
-  rebuild: bool = True,
-  write_run_log: bool = True,
-) -> dict[str, Any]:
+  column_types: dict[str, dict[str, Any]] | None = None,
+  bulk_session=None,
+) -> int:
   """
-  Land JSON records into a RAW target dataset.
-
-  RAW is treated as a transient landing zone:
-    - ensure schema/table exist
-    - truncate
-    - insert payload rows (+ technical columns)
+  Insert an iterable of parameter tuples into a target table.
+
+  Dialects advertising supports_bulk_load stream all rows through
+  engine.bulk_load (e.g. COPY), together with column_types (see
+  raw_column_types); otherwise rows are sent in chunks of chunk_size via a
+  parameterized INSERT and execute_many().
+  With a BulkLoadSession, bulk rows are appended to the session's single
+  bulk_load instead (chunked callers; loaded on commit).
+  Returns the number of rows inserted (or queued).
   """
-  started_at = _now_utc()
-  loaded_at = started_at
+  bulk_load = getattr(target_engine, "bulk_load", None)
+  if getattr(target_dialect, "supports_bulk_load", False) and callable(bulk_load):
+    if bulk_session is not None:
+      return bulk_session.append(
+        target_engine=target_engine,
+        schema=schema_name,
+        table=table_name,
+        columns=columns,
+        rows=rows,
+        column_types=column_types,
+      )
+    return int(bulk_load(
+      schema=schema_name,
+      table=table_name,
+      columns=columns,
+      rows=rows,
+      column_types=column_types,
+    ) or 0)
 
-  if source_dataset is None:
-    raise ValueError("source_dataset is required for RAW landing.")
+  insert_sql = render_param_insert_sql(
+    dialect=target_dialect,
+    schema_name=schema_name,
+    table_name=table_name,
+    target_columns=columns,
+  )
+
+  size = max(1, int(chunk_size or 1))
+  rows_inserted = 0
+  chunk: list[tuple] = []
+  for row in rows:
+    chunk.append(row)
+    if len(chunk) >= size:
+      target_engine.execute_many(insert_sql, chunk)
+      rows_inserted += len(chunk)
+      chunk = []
+
+  if chunk:
+    target_engine.execute_many(insert_sql, chunk)
+    rows_inserted += len(chunk)
 
+  return rows_inserted
+
+
+def _resolve_raw_landing_columns(*, td, source_dataset, strict: bool = False):
+  """
+  Resolve RAW insert columns: business columns (integrated SourceColumns with a
+  json_path) followed by technical columns (payload, load_run_id, loaded_at).
+  Returns (business_cols, tech_cols, insert_cols, src_by_name).
+  """
   # Determine target columns present on the dataset
   tgt_cols = list(td.target_columns.all()) if hasattr(td, "target_columns") else []
   tgt_names = [getattr(c, "target_column_name", None) for c in tgt_cols]
@@ -149,97 +211,149 @@ def land_raw_json_records(
   insert_cols.extend(business_cols)
   insert_cols.extend([c for c in tech_cols if c not in insert_cols])
 
-  if rebuild:
-    # Ensure log table exists
-    ensure_load_run_log_table(
-      engine=target_engine,
-      dialect=target_dialect,
-      meta_schema=meta_schema,
-      auto_provision=True,
-    )
+  return business_cols, tech_cols, insert_cols, src_by_name
 
-    # Ensure RAW schema/table exist
-    target_engine.execute(
-      target_dialect.render_create_schema_if_not_exists(td.target_schema.schema_name)
-    )
 
-    if hasattr(target_dialect, "render_drop_table_if_exists"):
-      is_raw = (getattr(getattr(td, "target_schema", None), "short_name", None) or "").lower() == "raw"
-      drop_sql = target_dialect.render_drop_table_if_exists(
-        schema=td.target_schema.schema_name,
-        table=td.target_dataset_name,
-        cascade=is_raw,
-      )
-      if drop_sql:
-        target_engine.execute(drop_sql)
+def _rebuild_raw_target(*, target_engine, target_dialect, td, meta_schema: str) -> None:
+  """
+  RAW is a transient landing zone: ensure log table, drop/create and truncate the target.
+  """
+  # Ensure log table exists
+  ensure_load_run_log_table(
+    engine=target_engine,
+    dialect=target_dialect,
+    meta_schema=meta_schema,
+    auto_provision=True,
+  )
 
-    target_engine.execute(target_dialect.render_create_table_if_not_exists(td))
+  # Ensure RAW schema/table exist
+  target_engine.execute(
+    target_dialect.render_create_schema_if_not_exists(td.target_schema.schema_name)
+  )
 
-    target_engine.execute(
-      target_dialect.render_truncate_table(
-        schema=td.target_schema.schema_name,
-        table=td.target_dataset_name,
-      )
+  if hasattr(target_dialect, "render_drop_table_if_exists"):
+    is_raw = (getattr(getattr(td, "target_schema", None), "short_name", None) or "").lower() == "raw"
+    drop_sql = target_dialect.render_drop_table_if_exists(
+      schema=td.target_schema.schema_name,
+      table=td.target_dataset_name,
+      cascade=is_raw,
     )
+    if drop_sql:
+      target_engine.execute(drop_sql)
 
-  insert_sql = render_param_insert_sql(
-    dialect=target_dialect,
-    schema_name=td.target_schema.schema_name,
-    table_name=td.target_dataset_name,
-    target_columns=insert_cols,
+  target_engine.execute(target_dialect.render_create_table_if_not_exists(td))
+
+  target_engine.execute(
+    target_dialect.render_truncate_table(
+      schema=td.target_schema.schema_name,
+      table=td.target_dataset_name,
+    )
   )
 
-  rows_inserted = 0
-  chunk: list[tuple] = []
 
-  for rec in records:
-    # If runtime ingestion provided an explicit original payload (e.g. file headers),
-    # persist that verbatim in the payload column, but use normalized keys for flattening.
-    payload_obj = rec.get("__payload__") if isinstance(rec, dict) else None
-    if isinstance(payload_obj, dict):
-      payload_json = json.dumps(payload_obj, ensure_ascii=False, default=str)
-      extract_rec = {k: v for k, v in rec.items() if k != "__payload__"}
-    else:
-      payload_json = json.dumps(rec, ensure_ascii=False, default=str)
-      extract_rec = rec
-
-    values: list[Any] = []
-
-    # Business columns from SourceColumns.json_path
-    for col in business_cols:
-      sc = src_by_name.get(col)
-      jp = getattr(sc, "json_path", None)
-      try:
-        v = extract_json_path(extract_rec, str(jp))
-
-      except Exception:
-        if strict:
-          raise
-        v = None
-      values.append(normalize_param_value(v))
-
-    # Technical columns
-    for tech in tech_cols:
-      if tech == "payload":
-        values.append(payload_json)
-      elif tech == "load_run_id":
-        values.append(load_run_id)
-      elif tech == "loaded_at":
-        values.append(normalize_param_value(loaded_at))
-      else:
-        values.append(None)
-    chunk.append(tuple(values))
+def land_raw_json_records(
+  *,
+  target_engine,
+  target_dialect,
+  td,
+  records: list[dict[str, Any]],
+  batch_run_id: str,
+  load_run_id: str,
+  target_system,
+  profile,
+  meta_schema: str = "meta",
+  source_system_short_name: str | None = None,
+  source_dataset_name: str | None = None,
+  source_object: str | None = None,
+  ingest_mode: str | None = None,
+  chunk_size: int = 10_000,
+  source_dataset=None,
+  strict: bool = False,
+  rebuild: bool = True,
+  write_run_log: bool = True,
+  bulk_session=None,
+) -> dict[str, Any]:
+  """
+  Land JSON records into a RAW target dataset.
 
-    if len(chunk) >= chunk_size:
-      target_engine.execute_many(insert_sql, chunk)
+  RAW is treated as a transient landing zone:
+    - ensure schema/table exist
+    - truncate
+    - insert payload rows (+ technical columns)
 
-      rows_inserted += len(chunk)
-      chunk = []
+  Chunked callers pass rebuild only for the first chunk and share one
+  bulk_session across chunks (see insert_raw_rows).
+  """
+  started_at = _now_utc()
+  loaded_at = started_at
 
-  if chunk:
-    target_engine.execute_many(insert_sql, chunk)
+  if source_dataset is None:
+    raise ValueError("source_dataset is required for RAW landing.")
 
-    rows_inserted += len(chunk)
+  business_cols, tech_cols, insert_cols, src_by_name = _resolve_raw_landing_columns(
+    td=td,
+    source_dataset=source_dataset,
+    strict=strict,
+  )
+
+  if rebuild:
+    _rebuild_raw_target(
+      target_engine=target_engine,
+      target_dialect=target_dialect,
+      td=td,
+      meta_schema=meta_schema,
+    )
+
+  def _rows():
+    for rec in records:
+      # If runtime ingestion provided an explicit original payload (e.g. file headers),
+      # persist that verbatim in the payload column, but use normalized keys for flattening.
+      payload_obj = rec.get("__payload__") if isinstance(rec, dict) else None
+      if isinstance(payload_obj, dict):
+        payload_json = json.dumps(payload_obj, ensure_ascii=False, default=str)
+        extract_rec = {k: v for k, v in rec.items() if k != "__payload__"}
+      else:
+        payload_json = json.dumps(rec, ensure_ascii=False, default=str)
+        extract_rec = rec
+
+      values: list[Any] = []
+
+      # Business columns from SourceColumns.json_path
+      for col in business_cols:
+        sc = src_by_name.get(col)
+        jp = getattr(sc, "json_path", None)
+        try:
+          v = extract_json_path(extract_rec, str(jp))
+
+        except Exception:
+          if strict:
+            raise
+          v = None
+        values.append(normalize_param_value(v))
+
+      # Technical columns
+      for tech in tech_cols:
+        if tech == "payload":
+          values.append(payload_json)
+        elif tech == "load_run_id":
+          values.append(load_run_id)
+        elif tech == "loaded_at":
+          values.append(normalize_param_value(loaded_at))
+        else:
+          values.append(None)
+      yield tuple(values)
+
+  rows_inserted = insert_raw_rows(
+    target_engine=target_engine,
+    target_dialect=target_dialect,
+    schema_name=td.target_schema.schema_name,
+    table_name=td.target_dataset_name,
+    columns=insert_cols,
+    rows=_rows(),
+    chunk_size=chunk_size,
+    column_types=raw_column_types(td),
+    bulk_session=bulk_session,
+  )
 
   finished_at = _now_utc()
 
@@ -282,3 +396,190 @@ def land_raw_json_records(
       pass
 
   return {"rows_inserted": rows_inserted}
+
+
+# -----------------------------------------------------------------------------
+# Columnar (Arrow) landing
+# -----------------------------------------------------------------------------
+_TOP_LEVEL_JSON_PATH = re.compile(r"^\$\.([^.\[\]]+)$")
+
+
+def resolve_raw_arrow_column_map(
+  *,
+  td,
+  source_dataset,
+  arrow_names: list[str],
+) -> dict[str, str | None] | None:
+  """
+  Map RAW business columns to Arrow columns for columnar landing.
+
+  Only top-level json_paths ($.col) can be served from Arrow columns directly;
+  returns None if any business column needs nested extraction (caller falls
+  back to record landing). Columns missing in the file map to None (NULL).
+  """
+  business_cols, _, _, src_by_name = _resolve_raw_landing_columns(
+    td=td,
+    source_dataset=source_dataset,
+  )
+
+  by_name = {n: n for n in arrow_names}
+  by_normalized: dict[str, str] = {}
+  for n in arrow_names:
+    by_normalized.setdefault(normalize_column_name(str(n)), n)
+
+  out: dict[str, str | None] = {}
+  for col in business_cols:
+    m = _TOP_LEVEL_JSON_PATH.match(str(getattr(src_by_name[col], "json_path", "") or "").strip())
+    if not m:
+      return None
+    key = m.group(1)
+    out[col] = by_name.get(key) or by_normalized.get(key)
+  return out
+
+
+def arrow_payload_json(batch):
+  """
+  Serialize each row of an Arrow record batch to a JSON object string.
+
+  Each column is encoded once into '"key": value' fragments, which are then
+  joined per row (no per-row dicts). The result is byte-identical to the
+  record-based landing (json.dumps with default=str), so the payload does not
+  depend on the landing path or on optional libraries: DECIMAL stays an exact
+  string, bytes and timestamps use their str() form.
+  """
+  import pyarrow as pa
+
+  encode = json.JSONEncoder(ensure_ascii=False, default=str).encode
+  if batch.num_columns == 0:
+    return pa.array(["{}"] * batch.num_rows, type=pa.string())
+
+  fragments = []
+  for name, column in zip(batch.schema.names, batch.columns):
+    key = encode(name) + ": "
+    fragments.append([key + encode(v) for v in column.to_pylist()])
+  return pa.array(
+    ["{" + ", ".join(parts) + "}" for parts in zip(*fragments)],
+    type=pa.string(),
+  )
+
+
+def _arrow_utc_naive(arr):
+  """
+  Cast a timezone-aware Arrow timestamp column to UTC-naive (same as record
+  landing); other columns are returned unchanged.
+  """
+  import pyarrow as pa
+
+  if pa.types.is_timestamp(arr.type) and arr.type.tz is not None:
+    # Arrow stores UTC instants; dropping the zone keeps the UTC wall time.
+    return arr.cast(pa.timestamp(arr.type.unit))
+  return arr
+
+
+def _arrow_column_values(arr) -> list[Any]:
+  import pyarrow as pa
+
+  values = arr.to_pylist()
+  if pa.types.is_timestamp(arr.type) and arr.type.tz is not None:
+    # Drivers expect UTC-naive datetimes (same as record landing).
+    values = [normalize_param_value(v) for v in values]
+  return values
+
+
+def iter_arrow_row_chunks(data, chunk_size: int):
+  """
+  Yield lists of parameter tuples from an Arrow table / record batch,
+  converting column-wise (no per-row dicts).
+  """
+  size = max(1, int(chunk_size or 1))
+  for offset in range(0, data.num_rows, size):
+    part = data.slice(offset, size)
+    columns = [_arrow_column_values(part.column(i)) for i in range(part.num_columns)]
+    rows = list(zip(*columns))
+    if rows:
+      yield rows
+
+
+def land_raw_arrow_batch(
+  *,
+  target_engine,
+  target_dialect,
+  td,
+  batch,
+  column_map: dict[str, str | None],
+  load_run_id: str,
+  source_dataset,
+  meta_schema: str = "meta",
+  chunk_size: int = 10_000,
+  include_payload: bool = True,
+  rebuild: bool = True,
+  bulk_session=None,
+) -> dict[str, Any]:
+  """
+  Land an Arrow record batch into a RAW target dataset (columnar path).
+
+  Business columns are projected from Arrow columns via column_map (see
+  resolve_raw_arrow_column_map). Dialects with supports_arrow_load receive
+  the Arrow data directly; others get parameter tuples built column-wise
+  (appended to bulk_session if given). The run log row is written by the caller.
+  """
+  import pyarrow as pa
+
+  business_cols, _, insert_cols, _ = _resolve_raw_landing_columns(
+    td=td,
+    source_dataset=source_dataset,
+  )
+
+  if rebuild:
+    _rebuild_raw_target(
+      target_engine=target_engine,
+      target_dialect=target_dialect,
+      td=td,
+      meta_schema=meta_schema,
+    )
+
+  n = int(batch.num_rows)
+  if n == 0:
+    return {"rows_inserted": 0}
+
+  business_set = set(business_cols)
+  loaded_at = normalize_param_value(_now_utc())
+  arrays = []
+  for col in insert_cols:
+    if col in business_set:
+      src = column_map.get(col)
+      # UTC-naive timestamps: Arrow loaders would otherwise convert in the session time zone.
+      arrays.append(_arrow_utc_naive(batch.column(src)) if src is not None else pa.nulls(n))
+    elif col == "payload":
+      arrays.append(arrow_payload_json(batch) if include_payload else pa.nulls(n, pa.string()))
+    elif col == "load_run_id":
+      arrays.append(pa.repeat(str(load_run_id), n))
+    elif col == "loaded_at":
+      arrays.append(pa.repeat(pa.scalar(loaded_at, type=pa.timestamp("us")), n))
+    else:
+      arrays.append(pa.nulls(n))
+  data = pa.RecordBatch.from_arrays(arrays, names=insert_cols)
+
+  load_arrow = getattr(target_engine, "load_arrow", None)
+  if getattr(target_dialect, "supports_arrow_load", False) and callable(load_arrow):
+    load_arrow(
+      schema=td.target_schema.schema_name,
+      table=td.target_dataset_name,
+      columns=insert_cols,
+      data=data,
+    )
+    return {"rows_inserted": n}
+
+  rows_inserted = insert_raw_rows(
+    target_engine=target_engine,
+    target_dialect=target_dialect,
+    schema_name=td.target_schema.schema_name,
+    table_name=td.target_dataset_name,
+    columns=insert_cols,
+    rows=(row for rows in iter_arrow_row_chunks(data, chunk_size) for row in rows),
+    chunk_size=chunk_size,
+    column_types=raw_column_types(td),
+    bulk_session=bulk_session,
+  )
+
+  return {"rows_inserted": rows_inserted}
@@ -27,7 +27,10 @@ import datetime
 import os
 import csv
 import json
-from io import BytesIO
+import shutil
+import tempfile
+from contextlib import contextmanager
+from io import BytesIO, TextIOWrapper
 import urllib.parse
 import urllib.request
 from pathlib import Path
@@ -45,7 +48,22 @@ from metadata.materialization.logging import (
   ensure_load_run_log_table,
   build_load_run_log_row,
 )
-from metadata.ingestion.landing import render_param_insert_sql, land_raw_json_records
+from metadata.ingestion.landing import (
+  land_raw_json_records,
+  land_raw_arrow_batch,
+  insert_raw_rows,
+  raw_column_types,
+  resolve_raw_arrow_column_map,
+)
+from metadata.ingestion.pipeline import DEFAULT_PIPELINE_DEPTH, BulkLoadSession, iter_prefetched
+from metadata.ingestion.streaming import iter_streamed_rows, resolve_fetch_size
+from metadata.ingestion.partitioning import (
+  iter_partitioned_rows,
+  partition_config_from_ingestion_config,
+  range_boundaries,
+  render_modulo_predicates,
+  render_range_predicates,
+)
 from metadata.ingestion.normalization import (
   normalize_column_name,
   normalize_records_keep_payload,
@@ -59,9 +77,24 @@ def _now_utc():
   return datetime.datetime.now(datetime.UTC)
 
 
-def _read_bytes(uri: str, *, max_bytes: int = 10_000_000) -> bytes:
+def _local_file_path(uri: str) -> str:
   """
-  Best-effort reader for file-like URIs.
+  Normalize file:// URIs and Windows drive letters to a local path.
+  """
+  if uri.startswith("file://"):
+    uri = uri[len("file://"):]
+    # Windows file URI fix: file:///C:/... becomes /C:/... after stripping.
+    # Convert /C:/... -> C:/... so os.path.exists works on Windows.
+    if uri and len(uri) >= 4 and uri[0] == "/" and uri[2] == ":" and uri[3] == "/":
+      # Example: /C:/temp/x.csv -> C:/temp/x.csv
+      uri = uri[1:]
+  return uri
+
+
+@contextmanager
+def _open_binary(uri: str):
+  """
+  Open a file-like URI as a binary stream (nothing is read up front).
   Supports:
     - http(s)://...
     - file://...
@@ -71,22 +104,24 @@ def _read_bytes(uri: str, *, max_bytes: int = 10_000_000) -> bytes:
   p = urllib.parse.urlparse(uri or "")
   if p.scheme in ("http", "https"):
     with urllib.request.urlopen(uri, timeout=60) as resp:
-      data = resp.read(max_bytes + 1)
-    return data[:max_bytes]
-
-  if uri.startswith("file://"):
-    uri = uri[len("file://"):]
-    # Windows file URI fix: file:///C:/... becomes /C:/... after stripping.
-    # Convert /C:/... -> C:/... so os.path.exists works on Windows.
-    if uri and len(uri) >= 4 and uri[0] == "/" and uri[2] == ":" and uri[3] == "/":
-      # Example: /C:/temp/x.csv -> C:/temp/x.csv
-      uri = uri[1:]
+      yield resp
+    return
 
+  uri = _local_file_path(uri)
   if not os.path.exists(uri):
     raise ValueError(f"File not found: {uri}")
 
   with open(uri, "rb") as f:
-    return f.read(max_bytes)
+    yield f
+
+
+def _read_bytes(uri: str, *, max_bytes: int | None = None) -> bytes:
+  """
+  Read a file-like URI into memory (optionally limited to max_bytes).
+  RAW ingestion streams instead; see _iter_file_record_chunks.
+  """
+  with _open_binary(uri) as f:
+    return f.read() if max_bytes is None else f.read(max_bytes)
 
 
 def _suffix_from_uri(uri: str) -> str:
@@ -102,6 +137,177 @@ def _suffix_from_uri(uri: str) -> str:
   return Path(path).suffix.lower()
 
 
+_JSON_READ_BLOCK = 1 << 20
+
+
+def _file_format(uri: str, file_type: str | None) -> str:
+  """
+  Resolve the streaming reader format: excel, json, jsonl or csv.
+  """
+  ft = (file_type or "").strip().lower()
+  suffix = _suffix_from_uri(uri)
+  if ft == "excel" or suffix in (".xlsx", ".xlsm"):
+    return "excel"
+  if ft == "json" or suffix == ".json":
+    return "json"
+  if ft in ("jsonl", "ndjson") or suffix in (".jsonl", ".ndjson"):
+    return "jsonl"
+  if ft == "csv" or suffix == ".csv":
+    return "csv"
+  raise ValueError(f"Unsupported file type: {suffix or ft or '<?>'}")
+
+
+def _iter_csv_records(fh, *, delimiter: str | None = None, quotechar: str | None = None, encoding: str | None = None):
+  text = TextIOWrapper(fh, encoding=(encoding or "utf-8"), errors="replace", newline="")
+  reader = csv.DictReader(
+    text,
+    delimiter=(delimiter or ","),
+    quotechar=(quotechar or '"'),
+  )
+  for r in reader:
+    yield dict(r)
+
+
+def _iter_jsonl_records(fh, *, encoding: str | None = None):
+  text = TextIOWrapper(fh, encoding=(encoding or "utf-8"), errors="replace")
+  for line in text:
+    line = (line or "").strip()
+    if not line:
+      continue
+    obj = json.loads(line)
+    if isinstance(obj, dict):
+      yield obj
+
+
+def _iter_json_array_records(fh, *, block_size: int = _JSON_READ_BLOCK):
+  """
+  Incrementally decode a top-level JSON array, one element at a time.
+  Only a single element (plus one read block) is held in memory.
+  """
+  text = TextIOWrapper(fh, encoding="utf-8", errors="replace")
+  decoder = json.JSONDecoder()
+  buf = ""
+  pos = 0
+  eof = False
+  started = False
+
+  def _fill() -> bool:
+    nonlocal buf, pos, eof
+    block = text.read(block_size)
+    if not block:
+      eof = True
+      return False
+    buf = buf[pos:] + block
+    pos = 0
+    return True
+
+  while True:
+    # Skip whitespace and separators
+    while pos < len(buf) and (buf[pos].isspace() or (started and buf[pos] == ",")):
+      pos += 1
+    if pos >= len(buf):
+      if not _fill():
+        break
+      continue
+
+    if not started:
+      if buf[pos] != "[":
+        raise ValueError("JSON file must contain an array of objects.")
+      started = True
+      pos += 1
+      continue
+
+    if buf[pos] == "]":
+      return
+
+    try:
+      obj, end = decoder.raw_decode(buf, pos)
+    except ValueError:
+      if eof or not _fill():
+        raise
+      continue
+
+    # Scalars (numbers, literals) may be cut at the block end: decode them only
+    # once the following separator is buffered.
+    if end >= len(buf) and not eof:
+      if _fill():
+        continue
+
+    pos = end
+    if isinstance(obj, dict):
+      yield obj
+
+  if not started:
+    raise ValueError("JSON file must contain an array of objects.")
+  raise ValueError("Unterminated JSON array.")
+
+
+def _iter_stream_records(
+  fh,
+  fmt: str,
+  *,
+  delimiter: str | None = None,
+  quotechar: str | None = None,
+  encoding: str | None = None,
+):
+  if fmt == "json":
+    return _iter_json_array_records(fh)
+  if fmt == "jsonl":
+    return _iter_jsonl_records(fh, encoding=encoding)
+  if fmt == "csv":
+    return _iter_csv_records(fh, delimiter=delimiter, quotechar=quotechar, encoding=encoding)
+  raise ValueError(f"Unsupported stream format: {fmt}")
+
+
+def _chunked(records, chunk_size: int, *, normalize: bool = True):
+  """
+  Group an iterator of records into lists of at most chunk_size.
+  Normalization happens per chunk, so memory stays bounded.
+  """
+  size = max(1, int(chunk_size or 1))
+  chunk: list[dict] = []
+  for rec in records:
+    chunk.append(rec)
+    if len(chunk) >= size:
+      yield normalize_records_keep_payload(chunk) if normalize else chunk
+      chunk = []
+  if chunk:
+    yield normalize_records_keep_payload(chunk) if normalize else chunk
+
+
+def _iter_file_record_chunks(
+  uri: str,
+  *,
+  chunk_size: int,
+  file_type: str | None = None,
+  delimiter: str | None = None,
+  quotechar: str | None = None,
+  encoding: str | None = None,
+  excel_options: dict | None = None,
+):
+  """
+  Stream a CSV / JSONL / JSON array / Excel file as record chunks.
+  The file is read incrementally; no size limit applies.
+  """
+  fmt = _file_format(uri, file_type)
+
+  if fmt == "excel":
+    with _excel_source(uri) as source:
+      # Excel records keep their header names (no key normalization).
+      yield from _chunked(
+        _iter_excel_records(source, **(excel_options or {})),
+        chunk_size,
+        normalize=False,
+      )
+    return
+
+  with _open_binary(uri) as fh:
+    yield from _chunked(
+      _iter_stream_records(fh, fmt, delimiter=delimiter, quotechar=quotechar, encoding=encoding),
+      chunk_size,
+    )
+
+
 def _load_file_records(
   uri: str,
   *,
@@ -111,54 +317,27 @@ def _load_file_records(
   encoding: str | None = None,
 ) -> list[dict]:
   """
-  Load file content into list of dict records.
+  Load file content into list of dict records (in memory).
   Supports:
     - .json  (JSON array)
     - .jsonl (NDJSON)
     - .csv
     - .xlsx/.xlsm (Excel)
   """
-  ft = (file_type or "").strip().lower()
-  suffix = _suffix_from_uri(uri)
+  fmt = _file_format(uri, file_type)
   raw = _read_bytes(uri)
 
-  if ft == "excel" or suffix in (".xlsx", ".xlsm"):
+  if fmt == "excel":
     # Default Excel behavior: first sheet, header row 1
     return _load_excel_records_from_bytes(raw)
 
-  if ft == "json" or suffix == ".json":
-    data = json.loads(raw.decode("utf-8", errors="replace"))
-    if isinstance(data, list):
-      return normalize_records_keep_payload([r for r in data if isinstance(r, dict)])    
-    raise ValueError("JSON file must contain an array of objects.")
-
-  if ft in ("jsonl", "ndjson") or suffix in (".jsonl", ".ndjson"):
-    rows = []
-    txt = raw.decode((encoding or "utf-8"), errors="replace")
-
-    for line in txt.splitlines():
-      line = (line or "").strip()
-      if not line:
-        continue
-      obj = json.loads(line)
-      if isinstance(obj, dict):
-        rows.append(obj)
-    return normalize_records_keep_payload(rows)  
-
-  if ft == "csv" or suffix == ".csv":    
-    rows = []
-    txt = raw.decode((encoding or "utf-8"), errors="replace")
-    reader = csv.DictReader(
-      txt.splitlines(),
-      delimiter=(delimiter or ","),
-      quotechar=(quotechar or '"'),
-    )
-
-    for r in reader:
-      rows.append(dict(r))
-    return normalize_records_keep_payload(rows)
-
-  raise ValueError(f"Unsupported file type: {suffix or ft or '<?>'}")
+  return normalize_records_keep_payload(list(_iter_stream_records(
+    BytesIO(raw),
+    fmt,
+    delimiter=delimiter,
+    quotechar=quotechar,
+    encoding=encoding,
+  )))
 
 
 def _local_path_from_uri(uri: str) -> str:
@@ -202,6 +381,33 @@ def _iter_parquet_record_chunks(path: str, *, chunk_size: int) -> "list[list[dic
       yield out
 
 
+def _iter_parquet_arrow_batches(path: str, *, chunk_size: int, columns: list[str] | None = None):
+  """
+  Yield Arrow record batches from a Parquet file (columnar path, no per-row dicts).
+  If columns is given, only those columns are read.
+  """
+  import pyarrow.parquet as pq
+
+  pf = pq.ParquetFile(path)
+  for batch in pf.iter_batches(batch_size=chunk_size, columns=columns):
+    if batch.num_rows:
+      yield batch
+
+
+def _parquet_arrow_column_map(path: str, *, td, source_dataset) -> dict | None:
+  """
+  Best-effort: resolve the Arrow column mapping for columnar Parquet landing.
+  Returns None when the record path must be used.
+  """
+  try:
+    import pyarrow.parquet as pq
+
+    names = list(pq.ParquetFile(path).schema_arrow.names)
+    return resolve_raw_arrow_column_map(td=td, source_dataset=source_dataset, arrow_names=names)
+  except Exception:
+    return None
+
+
 def _excel_cell_to_jsonable(value):
   """
   Convert Excel cell values into JSON-friendly values.
@@ -211,70 +417,137 @@ def _excel_cell_to_jsonable(value):
   return value
 
 
-def _load_excel_records_from_bytes(
-  raw: bytes,
+@contextmanager
+def _excel_source(uri: str):
+  """
+  Yield something openpyxl can open lazily: the local path, or a spooled temp
+  file for HTTP sources (xlsx is a zip archive and needs random access).
+  """
+  uri_s = os.path.expandvars(uri or "")
+  if urllib.parse.urlparse(uri_s).scheme in ("http", "https"):
+    with tempfile.TemporaryFile() as tmp:
+      with _open_binary(uri_s) as resp:
+        shutil.copyfileobj(resp, tmp)
+      tmp.seek(0)
+      yield tmp
+    return
+
+  path = _local_file_path(uri_s)
+  if not os.path.exists(path):
+    raise ValueError(f"File not found: {path}")
+  yield path
+
+
+def _iter_excel_records(
+  source,
   *,
   sheet_name: str | None = None,
   sheet_index: int | None = None,
   header_row: int = 1,
   max_rows: int | None = None,
-) -> list[dict]:
+):
   """
-  Load an Excel file into list[dict].
+  Iterate an Excel sheet as dict records (openpyxl read-only mode).
   - header_row is 1-based.
   - If sheet_name and sheet_index are both None, uses the first sheet.
   """
   from openpyxl import load_workbook
 
-  wb = load_workbook(BytesIO(raw), read_only=True, data_only=True)
+  wb = load_workbook(source, read_only=True, data_only=True)
+  try:
+    if sheet_name is not None:
+      if sheet_name not in wb.sheetnames:
+        raise ValueError(f"Excel sheet not found: {sheet_name!r}. Available: {wb.sheetnames}")
+      ws = wb[sheet_name]
+    else:
+      idx = sheet_index if sheet_index is not None else 0
+      if idx < 0 or idx >= len(wb.sheetnames):
+        raise ValueError(f"Excel sheet_index out of range: {idx}. Available: {wb.sheetnames}")
+      ws = wb[wb.sheetnames[idx]]
 
-  if sheet_name is not None:
-    if sheet_name not in wb.sheetnames:
-      raise ValueError(f"Excel sheet not found: {sheet_name!r}. Available: {wb.sheetnames}")
-    ws = wb[sheet_name]
-  else:
-    idx = sheet_index if sheet_index is not None else 0
-    if idx < 0 or idx >= len(wb.sheetnames):
-      raise ValueError(f"Excel sheet_index out of range: {idx}. Available: {wb.sheetnames}")
-    ws = wb[wb.sheetnames[idx]]
-
-  if header_row < 1:
-    raise ValueError("header_row must be >= 1")
-
-  # Read header
-  header = None
-  for i, row in enumerate(ws.iter_rows(values_only=True), start=1):
-    if i == header_row:
-      header = [str(c).strip() if c is not None and str(c).strip() else f"col_{j+1}" for j, c in enumerate(row)]
-      break
-
-  if header is None:
-    return []
-
-  # Read data rows
-  records = []
-  data_start = header_row + 1
-  data_count = 0
-
-  for i, row in enumerate(ws.iter_rows(values_only=True), start=1):
-    if i < data_start:
-      continue
+    if header_row < 1:
+      raise ValueError("header_row must be >= 1")
+
+    header = None
+    data_count = 0
+
+    for i, row in enumerate(ws.iter_rows(values_only=True), start=1):
+      if i < header_row:
+        continue
+      if i == header_row:
+        header = [str(c).strip() if c is not None and str(c).strip() else f"col_{j+1}" for j, c in enumerate(row)]
+        continue
+
+      values = list(row)
+      # Stop condition is intentionally conservative: we do not auto-stop on empty rows
+      # because some sheets have blanks. max_rows is the safe limiter.
+
+      rec = {}
+      for j, col in enumerate(header):
+        v = values[j] if j < len(values) else None
+        rec[col] = _excel_cell_to_jsonable(v)
+      yield rec
+
+      data_count += 1
+      if max_rows is not None and data_count >= max_rows:
+        break
+  finally:
+    wb.close()
+
+
+def _load_excel_records_from_bytes(
+  raw: bytes,
+  *,
+  sheet_name: str | None = None,
+  sheet_index: int | None = None,
+  header_row: int = 1,
+  max_rows: int | None = None,
+) -> list[dict]:
+  """
+  Load an Excel file into list[dict].
+  """
+  return list(_iter_excel_records(
+    BytesIO(raw),
+    sheet_name=sheet_name,
+    sheet_index=sheet_index,
+    header_row=header_row,
+    max_rows=max_rows,
+  ))
 
-    values = list(row)
-    # Stop condition is intentionally conservative: we do not auto-stop on empty rows
-    # because some sheets have blanks. max_rows is the safe limiter.
 
-    rec = {}
-    for j, col in enumerate(header):
-      v = values[j] if j < len(values) else None
-      rec[col] = _excel_cell_to_jsonable(v)
-    records.append(rec)
+def _relational_partition_sqls(
+  *,
+  partition_cfg,
+  source_sa_engine,
+  source_dialect,
+  src_from: str,
+  src_select: str,
+  with_where,
+) -> list[str]:
+  """
+  One source SELECT per partition. Range partitions are derived from MIN/MAX of
+  the partition column (within the dataset filters). Returns [] when the range
+  cannot be split (empty source or a single value).
+  """
+  column_sql = f"s.{source_dialect.render_identifier(partition_cfg.column)}"
 
-    data_count += 1
-    if max_rows is not None and data_count >= max_rows:
-      break
+  if partition_cfg.strategy == "modulo":
+    predicates = render_modulo_predicates(
+      column_sql,
+      partition_cfg.partitions,
+      dialect_name=str(getattr(source_dialect, "DIALECT_NAME", "") or ""),
+    )
+  else:
+    bounds_sql = with_where(f"SELECT MIN({column_sql}), MAX({column_sql}) FROM {src_from} AS s")
+    with source_sa_engine.connect() as conn:
+      lo, hi = tuple(conn.execute(text(bounds_sql)).fetchone() or (None, None))
+    predicates = render_range_predicates(
+      column_sql,
+      range_boundaries(lo, hi, partition_cfg.partitions),
+      render_literal=source_dialect.render_literal,
+    )
 
-  return records
+  return [with_where(src_select, p) for p in predicates]
 
 
 def ingest_raw_relational(
@@ -295,176 +568,163 @@ def ingest_raw_relational(
   """
   target_dialect = dialect
   target_engine = target_dialect.get_execution_engine(target_system)
+  try:
+    source_sa_engine = engine_for_source_system(
+      system_type=source_dataset.source_system.type,
+      short_name=source_dataset.source_system.short_name,
+    )
+    source_dialect = get_active_dialect(source_sa_engine.dialect.name)
 
-  source_sa_engine = engine_for_source_system(
-    system_type=source_dataset.source_system.type,
-    short_name=source_dataset.source_system.short_name,
-  )
-  source_dialect = get_active_dialect(source_sa_engine.dialect.name)
+    # Determine columns to extract (integrated source columns, ordered)
+    src_cols_qs = source_dataset.source_columns.filter(integrate=True).order_by("ordinal_position")
+    src_col_names = [c.source_column_name for c in src_cols_qs]
 
-  # Determine columns to extract (integrated source columns, ordered)
-  src_cols_qs = source_dataset.source_columns.filter(integrate=True).order_by("ordinal_position")
-  src_col_names = [c.source_column_name for c in src_cols_qs]
+    if not src_col_names:
+      return {
+        "status": "skipped",
+        "reason": "no_integrated_columns",
+        "load_run_id": load_run_id,
+        "batch_run_id": batch_run_id,
+      }
 
-  if not src_col_names:
-    return {
-      "status": "skipped",
-      "reason": "no_integrated_columns",
-      "load_run_id": load_run_id,
-      "batch_run_id": batch_run_id,
-    }
+    # Build SELECT against source
+    src_schema = source_dataset.schema_name
+    src_table = source_dataset.source_dataset_name
 
-  # Build SELECT against source
-  src_schema = source_dataset.schema_name
-  src_table = source_dataset.source_dataset_name
+    src_select_cols = ", ".join(f"s.{source_dialect.render_identifier(c)}" for c in src_col_names)
+    src_from = source_dialect.render_table_identifier(src_schema, src_table)
 
-  src_select_cols = ", ".join(f"s.{source_dialect.render_identifier(c)}" for c in src_col_names)
-  src_from = source_dialect.render_table_identifier(src_schema, src_table)
+    # Use a stable alias for filtering
+    src_select = f"SELECT {src_select_cols} FROM {src_from} AS s"
 
-  # Use a stable alias for filtering
-  src_sql = f"SELECT {src_select_cols} FROM {src_from} AS s"
+    static_filter = (getattr(source_dataset, "static_filter", None) or "").strip()
+    increment_filter = (getattr(source_dataset, "increment_filter", None) or "").strip()
 
-  static_filter = (getattr(source_dataset, "static_filter", None) or "").strip()
-  increment_filter = (getattr(source_dataset, "increment_filter", None) or "").strip()
+    where_parts = []
 
-  where_parts = []
+    # Static filter applies to ingestion only (RAW extraction)
+    if static_filter:
+      where_parts.append(f"({qualify_source_filter(source_dataset, static_filter, source_alias='s')})")
 
-  # Static filter applies to ingestion only (RAW extraction)
-  if static_filter:
-    where_parts.append(f"({qualify_source_filter(source_dataset, static_filter, source_alias='s')})")
+    # Increment filter applies to ingestion only when dataset is incremental
+    apply_increment = bool(getattr(source_dataset, "incremental", False) and increment_filter)
+    if apply_increment:
+      where_parts.append(f"({qualify_source_filter(source_dataset, increment_filter, source_alias='s')})")
 
-  # Increment filter applies to ingestion only when dataset is incremental
-  apply_increment = bool(getattr(source_dataset, "incremental", False) and increment_filter)
-  if apply_increment:
-    where_parts.append(f"({qualify_source_filter(source_dataset, increment_filter, source_alias='s')})")
+    # Replace {{DELTA_CUTOFF}} for incremental extraction on the SOURCE side
+    cutoff = None
+    if apply_increment and any("{{DELTA_CUTOFF" in p for p in where_parts):
+      cutoff = resolve_delta_cutoff_for_source_dataset(
+        source_dataset=source_dataset,
+        profile=profile,
+        now_ts=_now_utc(),
+      )
+      if cutoff is None:
+        raise ValueError(
+          f"increment_filter uses {{DELTA_CUTOFF}} but no active increment policy exists "
+          f"for SourceDataset={source_dataset} in environment '{getattr(profile, 'name', None)}'."
+        )
 
-  if where_parts:
-    src_sql += " WHERE " + " AND ".join(where_parts)
+      # IMPORTANT: render literal using SOURCE dialect
+      where_parts = [
+        apply_delta_cutoff_placeholder(p, dialect=source_dialect, delta_cutoff=cutoff)
+        for p in where_parts
+      ]
 
-  src_sql += ";"
+    def _with_where(sql: str, extra: str | None = None) -> str:
+      parts = where_parts + ([extra] if extra else [])
+      if parts:
+        sql += " WHERE " + " AND ".join(parts)
+      return sql + ";"
 
-  # Replace {{DELTA_CUTOFF}} for incremental extraction on the SOURCE side
-  cutoff = None
-  if apply_increment and "{{DELTA_CUTOFF" in src_sql:
-    cutoff = resolve_delta_cutoff_for_source_dataset(
-      source_dataset=source_dataset,
-      profile=profile,
-      now_ts=_now_utc(),
-    )
-    if cutoff is None:
-      raise ValueError(
-        f"increment_filter uses {{DELTA_CUTOFF}} but no active increment policy exists "
-        f"for SourceDataset={source_dataset} in environment '{getattr(profile, 'name', None)}'."
-      )
+    src_sql = _with_where(src_select)
 
-    # IMPORTANT: render literal using SOURCE dialect
-    src_sql = apply_delta_cutoff_placeholder(
-      src_sql,
-      dialect=source_dialect,
-      delta_cutoff=cutoff,
+    ingestion_cfg = getattr(source_dataset, "ingestion_config", None) or {}
+    if not isinstance(ingestion_cfg, dict):
+      ingestion_cfg = {}
+    partition_cfg = partition_config_from_ingestion_config(ingestion_cfg)
+    try:
+      pipeline_depth = int(ingestion_cfg.get("pipeline_depth", DEFAULT_PIPELINE_DEPTH))
+    except (TypeError, ValueError) as exc:
+      raise ValueError("ingestion_config.pipeline_depth must be an integer.") from exc
+    fetch_size = resolve_fetch_size(
+      ingestion_config=ingestion_cfg,
+      profile=profile,
+      source_system_short=getattr(getattr(source_dataset, "source_system", None), "short_name", None),
+      default=chunk_size,
     )
 
-  # Build INSERT into RAW (DuckDB uses ? placeholders)
-  # Target columns are derived from generated TargetColumns in RAW dataset.
-  tgt_cols_qs = td.target_columns.filter(active=True).order_by("ordinal_position")
-  tgt_cols = list(tgt_cols_qs)
+    # Build INSERT into RAW (DuckDB uses ? placeholders)
+    # Target columns are derived from generated TargetColumns in RAW dataset.
+    tgt_cols_qs = td.target_columns.filter(active=True).order_by("ordinal_position")
+    tgt_cols = list(tgt_cols_qs)
 
-  TECH_ROLES = {"payload", "load_run_id", "loaded_at"}
-  TECH_NAMES = {"payload", "load_run_id", "loaded_at"}
+    TECH_ROLES = {"payload", "load_run_id", "loaded_at"}
+    TECH_NAMES = {"payload", "load_run_id", "loaded_at"}
 
-  def _is_tech(col) -> bool:
-    role = (col.system_role or "").strip()
-    return (role in TECH_ROLES) or (col.target_column_name in TECH_NAMES)
+    def _is_tech(col) -> bool:
+      role = (col.system_role or "").strip()
+      return (role in TECH_ROLES) or (col.target_column_name in TECH_NAMES)
 
-  business_cols = [c for c in tgt_cols if not _is_tech(c)]
-  tech_cols = [c for c in tgt_cols if _is_tech(c)]
+    business_cols = [c for c in tgt_cols if not _is_tech(c)]
+    tech_cols = [c for c in tgt_cols if _is_tech(c)]
 
-  business_col_names = [c.target_column_name for c in business_cols]
-  tech_col_names_found = [c.target_column_name for c in tech_cols]
-
-  if len(src_col_names) != len(business_col_names):
-    raise ValueError(
-      f"Column mismatch for RAW ingestion: source has {len(src_col_names)} integrated columns "
-      f"but target has {len(business_col_names)} business columns "
-      f"(plus {len(tech_col_names_found)} technical columns)."
-    )
+    business_col_names = [c.target_column_name for c in business_cols]
+    tech_col_names_found = [c.target_column_name for c in tech_cols]
 
-  tech_col_names = [n for n in ("payload", "load_run_id", "loaded_at") if n in tech_col_names_found]
+    if len(src_col_names) != len(business_col_names):
+      raise ValueError(
+        f"Column mismatch for RAW ingestion: source has {len(src_col_names)} integrated columns "
+        f"but target has {len(business_col_names)} business columns "
+        f"(plus {len(tech_col_names_found)} technical columns)."
+      )
 
-  insert_cols = business_col_names + tech_col_names
+    tech_col_names = [n for n in ("payload", "load_run_id", "loaded_at") if n in tech_col_names_found]
 
-  insert_sql = render_param_insert_sql(
-    dialect=target_dialect,
-    schema_name=td.target_schema.schema_name,
-    table_name=td.target_dataset_name,
-    target_columns=insert_cols,
-  )
+    insert_cols = business_col_names + tech_col_names
 
-  started_at = _now_utc()
-  loaded_at = started_at
-  t0 = time.time()
+    started_at = _now_utc()
+    loaded_at = started_at
+    t0 = time.time()
 
-  rows_affected = 0
+    rows_affected = 0
+    partition_sqls: list[str] = []
+    partition_stats: dict[int, dict] = {}
 
-  try:
-    # Ensure meta logging table exists
-    ensure_load_run_log_table(
-      engine=target_engine,
-      dialect=target_dialect,
-      meta_schema=META_SCHEMA,
-      auto_provision=True,
-    )
-
-    # Ensure RAW schema/table exist
-    target_engine.execute(target_dialect.render_create_schema_if_not_exists(td.target_schema.schema_name))
-    # RAW is a landing area and expected to evolve with the source schema.
-    # For full ingests we prefer DROP+CREATE to avoid stale schemas (missing new columns).
-    if hasattr(target_dialect, "render_drop_table_if_exists"):
-      is_raw = (getattr(getattr(td, "target_schema", None), "short_name", None) or "").lower() == "raw"
-      drop_sql = target_dialect.render_drop_table_if_exists(
-        schema=td.target_schema.schema_name,
-        table=td.target_dataset_name,
-        cascade=is_raw,
-      )
-      if drop_sql:
-        target_engine.execute(drop_sql)
-    target_engine.execute(target_dialect.render_create_table_if_not_exists(td))
-
-    # Truncate RAW table (RAW is always materialized as table)
-    target_engine.execute(
-      target_dialect.render_truncate_table(
-        schema=td.target_schema.schema_name,
-        table=td.target_dataset_name,
+    try:
+      # Ensure meta logging table exists
+      ensure_load_run_log_table(
+        engine=target_engine,
+        dialect=target_dialect,
+        meta_schema=META_SCHEMA,
+        auto_provision=True,
       )
-    )
 
-    # Stream source rows and insert into RAW in chunks
-    with source_sa_engine.connect() as conn:
-      result = conn.execute(text(src_sql))
-      chunk = []
+      # Ensure RAW schema/table exist
+      target_engine.execute(target_dialect.render_create_schema_if_not_exists(td.target_schema.schema_name))
+      # RAW is a landing area and expected to evolve with the source schema.
+      # For full ingests we prefer DROP+CREATE to avoid stale schemas (missing new columns).
+      if hasattr(target_dialect, "render_drop_table_if_exists"):
+        is_raw = (getattr(getattr(td, "target_schema", None), "short_name", None) or "").lower() == "raw"
+        drop_sql = target_dialect.render_drop_table_if_exists(
+          schema=td.target_schema.schema_name,
+          table=td.target_dataset_name,
+          cascade=is_raw,
+        )
+        if drop_sql:
+          target_engine.execute(drop_sql)
+      target_engine.execute(target_dialect.render_create_table_if_not_exists(td))
+
+      # Truncate RAW table (RAW is always materialized as table)
+      target_engine.execute(
+        target_dialect.render_truncate_table(
+          schema=td.target_schema.schema_name,
+          table=td.target_dataset_name,
+        )
+      )
 
-      for row in result:
-        chunk.append(row)
-        if len(chunk) >= chunk_size:
-          params = []
-          for r in chunk:
-            values = list(tuple(r))
-            for tech_name in tech_col_names:
-              if tech_name == "load_run_id":
-                values.append(load_run_id)
-              elif tech_name == "loaded_at":
-                values.append(loaded_at)
-              else:
-                values.append(None)
-            params.append(tuple(values))
-
-          target_engine.execute_many(insert_sql, params)
-          rows_affected += len(chunk)
-          chunk = []
-
-      if chunk:
-        params = []
-        for r in chunk:
+      def _rows(source_rows):
+        for r in source_rows:
           values = list(tuple(r))
           for tech_name in tech_col_names:
             if tech_name == "load_run_id":
@@ -473,81 +733,65 @@ def ingest_raw_relational(
               values.append(loaded_at)
             else:
               values.append(None)
-          params.append(tuple(values))
-
-        target_engine.execute_many(insert_sql, params)
-        rows_affected += len(chunk)
-
-    finished_at = _now_utc()
-    exec_ms = (time.time() - t0) * 1000.0
-
-    summary = {
-      "schema": td.target_schema.short_name,
-      "dataset": td.target_dataset_name,
-      "target_dataset_id": td.id,
-      "mode": ("incremental" if apply_increment else "full"),
-      "handle_deletes": False,
-      "historize": False,
-    }
-
-    values = build_load_run_log_row(
-      batch_run_id=batch_run_id,
-      load_run_id=load_run_id,
-      target_schema=td.target_schema.short_name,
-      target_dataset=td.target_dataset_name,
-      target_system=target_system.short_name,
-      profile=profile.name,
-      run_kind="ingestion",
-      source_system=str(getattr(getattr(source_dataset, "source_system", None), "short_name", None) or ""),
-      source_dataset=str(getattr(source_dataset, "source_dataset_name", None) or ""),
-      source_object=f"{src_schema}.{src_table}",
-      ingest_mode=("incremental" if apply_increment else "full"),
-      delta_cutoff=cutoff,
-      rows_extracted=rows_affected,
-      chunk_size=int(chunk_size),
-      mode=str(summary.get("mode") or "full"),
-      handle_deletes=bool(summary.get("handle_deletes") or False),
-      historize=bool(summary.get("historize") or False),
-      started_at=started_at,
-      finished_at=finished_at,
-      render_ms=0,
-      execution_ms=exec_ms,
-      sql_length=0,
-      rows_affected=rows_affected,
-      status="success",
-      error_message=None,
-      attempt_no=1,
-      status_reason=None,
-      blocked_by=None,
-    )
-    log_sql = target_dialect.render_insert_load_run_log(meta_schema=META_SCHEMA, values=values)
-    if log_sql:
-      target_engine.execute(log_sql)
+          yield tuple(values)
+
+      def _land(rows) -> int:
+        return insert_raw_rows(
+          target_engine=target_engine,
+          target_dialect=target_dialect,
+          schema_name=td.target_schema.schema_name,
+          table_name=td.target_dataset_name,
+          columns=insert_cols,
+          rows=rows,
+          chunk_size=chunk_size,
+          column_types=raw_column_types(td),
+        )
 
-    return {
-      "status": "success",
-      "rows_affected": rows_affected,
-      "load_run_id": load_run_id,
-      "batch_run_id": batch_run_id,
-      "target_dataset": td.target_dataset_name,
-      "source_sql": src_sql,
-    }
+      if partition_cfg is not None:
+        partition_sqls = _relational_partition_sqls(
+          partition_cfg=partition_cfg,
+          source_sa_engine=source_sa_engine,
+          source_dialect=source_dialect,
+          src_from=src_from,
+          src_select=src_select,
+          with_where=_with_where,
+        )
 
-  except Exception as e:
-    err = str(e)
-    finished_at = _now_utc()
-    exec_ms = (time.time() - t0) * 1000.0
-
-    summary = {
-      "schema": td.target_schema.short_name,
-      "dataset": td.target_dataset_name,
-      "target_dataset_id": td.id,
-      "mode": ("incremental" if apply_increment else "full"),
-      "handle_deletes": False,
-      "historize": False,
-    }
+      # Stream source rows into RAW (bulk load where the dialect supports it,
+      # otherwise chunked execute_many)
+      if partition_sqls:
+        # Partitions are extracted concurrently and merged into one landing stream.
+        rows_affected = _land(_rows(iter_partitioned_rows(
+          connect=source_sa_engine.connect,
+          partition_sqls=partition_sqls,
+          workers=partition_cfg.max_workers,
+          fetch_size=fetch_size,
+          stats=partition_stats,
+        )))
+      else:
+        def _source_rows():
+          with source_sa_engine.connect() as conn:
+            yield from iter_streamed_rows(conn, src_sql, fetch_size=fetch_size)
+
+        # A reader thread fetches and builds parameter tuples while the target loads.
+        rows_affected = _land(iter_prefetched(
+          _rows(_source_rows()),
+          chunk_size=chunk_size,
+          depth=pipeline_depth,
+        ))
+
+      finished_at = _now_utc()
+      exec_ms = (time.time() - t0) * 1000.0
+
+      summary = {
+        "schema": td.target_schema.short_name,
+        "dataset": td.target_dataset_name,
+        "target_dataset_id": td.id,
+        "mode": ("incremental" if apply_increment else "full"),
+        "handle_deletes": False,
+        "historize": False,
+      }
 
-    try:
       values = build_load_run_log_row(
         batch_run_id=batch_run_id,
         load_run_id=load_run_id,
@@ -572,8 +816,8 @@ def ingest_raw_relational(
         execution_ms=exec_ms,
         sql_length=0,
         rows_affected=rows_affected,
-        status="error",
-        error_message=(err or "")[:1000],
+        status="success",
+        error_message=None,
         attempt_no=1,
         status_reason=None,
         blocked_by=None,
@@ -581,11 +825,98 @@ def ingest_raw_relational(
       log_sql = target_dialect.render_insert_load_run_log(meta_schema=META_SCHEMA, values=values)
       if log_sql:
         target_engine.execute(log_sql)
-    except Exception:
-      # Logging must never mask the original failure
-      pass
 
-    raise
+      # Per-partition row counts (best-effort, same load_run_id as the dataset row).
+      for i, stats in sorted(partition_stats.items()):
+        try:
+          part_sql = target_dialect.render_insert_load_run_log(
+            meta_schema=META_SCHEMA,
+            values={
+              **values,
+              "run_kind": "ingestion_partition",
+              "rows_extracted": int(stats["rows"]),
+              "rows_affected": int(stats["rows"]),
+              "execution_ms": int(stats["execution_ms"]),
+              "status_reason": f"partition {i + 1}/{len(partition_sqls)}",
+            },
+          )
+          if part_sql:
+            target_engine.execute(part_sql)
+        except Exception:
+          pass
+
+      out = {
+        "status": "success",
+        "rows_affected": rows_affected,
+        "load_run_id": load_run_id,
+        "batch_run_id": batch_run_id,
+        "target_dataset": td.target_dataset_name,
+        "source_sql": src_sql,
+      }
+      if partition_sqls:
+        out["partitions"] = [
+          {"partition": i + 1, "rows": int(partition_stats.get(i, {}).get("rows", 0))}
+          for i in range(len(partition_sqls))
+        ]
+      return out
+
+    except Exception as e:
+      err = str(e)
+      finished_at = _now_utc()
+      exec_ms = (time.time() - t0) * 1000.0
+
+      summary = {
+        "schema": td.target_schema.short_name,
+        "dataset": td.target_dataset_name,
+        "target_dataset_id": td.id,
+        "mode": ("incremental" if apply_increment else "full"),
+        "handle_deletes": False,
+        "historize": False,
+      }
+
+      try:
+        values = build_load_run_log_row(
+          batch_run_id=batch_run_id,
+          load_run_id=load_run_id,
+          target_schema=td.target_schema.short_name,
+          target_dataset=td.target_dataset_name,
+          target_system=target_system.short_name,
+          profile=profile.name,
+          run_kind="ingestion",
+          source_system=str(getattr(getattr(source_dataset, "source_system", None), "short_name", None) or ""),
+          source_dataset=str(getattr(source_dataset, "source_dataset_name", None) or ""),
+          source_object=f"{src_schema}.{src_table}",
+          ingest_mode=("incremental" if apply_increment else "full"),
+          delta_cutoff=cutoff,
+          rows_extracted=rows_affected,
+          chunk_size=int(chunk_size),
+          mode=str(summary.get("mode") or "full"),
+          handle_deletes=bool(summary.get("handle_deletes") or False),
+          historize=bool(summary.get("historize") or False),
+          started_at=started_at,
+          finished_at=finished_at,
+          render_ms=0,
+          execution_ms=exec_ms,
+          sql_length=0,
+          rows_affected=rows_affected,
+          status="error",
+          error_message=(err or "")[:1000],
+          attempt_no=1,
+          status_reason=None,
+          blocked_by=None,
+        )
+        log_sql = target_dialect.render_insert_load_run_log(meta_schema=META_SCHEMA, values=values)
+        if log_sql:
+          target_engine.execute(log_sql)
+      except Exception:
+        # Logging must never mask the original failure
+        pass
+
+      raise
+  finally:
+    close = getattr(target_engine, "close", None)
+    if callable(close):
+      close()
 
 
 def ingest_raw_file(
@@ -602,7 +933,8 @@ def ingest_raw_file(
   file_type: str | None = None,
 ):
   """
-  File ingestion (JSON array / JSONL / CSV / Parquet).
+  File ingestion (JSON array / JSONL / CSV / Excel / Parquet).
+  Records are read and landed in chunks of chunk_size.
   """
   uri = source_dataset.ingestion_config.get("uri")
   if not uri:
@@ -624,15 +956,69 @@ def ingest_raw_file(
   # Use dialect-owned execution engine (consistent with relational ingestion).
   # This avoids relying on SQLAlchemy Engine semantics for landing.
   target_engine = dialect.get_execution_engine(target_system)
+  try:
+    rows_extracted = 0
+    landing = None
+    rows_inserted_total = 0
+    arrow_column_map = None
+    include_payload = True
 
-  rows_extracted = 0
-  landing = None
-  rows_inserted_total = 0
+    if ft == "parquet":
+      path = _local_path_from_uri(uri_s)
+      if not os.path.exists(path):
+        raise ValueError(f"File not found: {path}")
 
-  if ft == "parquet":
-    path = _local_path_from_uri(uri_s)
-    if not os.path.exists(path):
-      raise ValueError(f"File not found: {path}")
+      cfg = source_dataset.ingestion_config or {}
+      include_payload = cfg.get("payload", True) not in (False, "false", "False", 0)
+      if cfg.get("columnar", True) not in (False, "false", "False", 0):
+        arrow_column_map = _parquet_arrow_column_map(path, td=td, source_dataset=source_dataset)
+
+      if arrow_column_map is not None:
+        # Without payload only the mapped columns need to be read.
+        read_columns = None
+        if not include_payload:
+          read_columns = sorted({c for c in arrow_column_map.values() if c}) or None
+        chunks = _iter_parquet_arrow_batches(path, chunk_size=chunk_size, columns=read_columns)
+      else:
+        chunks = _iter_parquet_record_chunks(path, chunk_size=chunk_size)
+    else:
+      cfg = source_dataset.ingestion_config or {}
+      excel_options = None
+
+      # For Excel we allow extra ingestion_config options
+      if system_type == "excel" or ft == "excel" or _suffix_from_uri(uri_s) in (".xlsx", ".xlsm"):
+        sheet_name = cfg.get("sheet_name")
+        sheet_index = cfg.get("sheet_index")
+
+        # Guard: do not allow both sheet_name and sheet_index
+        if sheet_name is not None and sheet_index is not None:
+          raise ValueError("Specify either 'sheet_name' or 'sheet_index', not both.")
+
+        # Safe casts
+        header_row = int(cfg.get("header_row", 1))
+        max_rows = cfg.get("max_rows")
+        if max_rows is not None:
+          max_rows = int(max_rows)
+        if sheet_index is not None:
+          sheet_index = int(sheet_index)
+
+        excel_options = {
+          "sheet_name": sheet_name,
+          "sheet_index": sheet_index,
+          "header_row": header_row,
+          "max_rows": max_rows,
+        }
+
+      # Streamed in chunks: memory stays bounded regardless of file size.
+      chunks = _iter_file_record_chunks(
+        uri_s,
+        chunk_size=chunk_size,
+        file_type=("excel" if excel_options is not None else file_type),
+        delimiter=cfg.get("delimiter"),
+        quotechar=cfg.get("quotechar"),
+        encoding=cfg.get("encoding"),
+        excel_options=excel_options,
+      )
 
     started_at = datetime.datetime.now(datetime.timezone.utc)
 
@@ -644,33 +1030,60 @@ def ingest_raw_file(
       auto_provision=True,
     )
 
+    # One bulk load per dataset: all chunks feed a single COPY / load job.
+    bulk_session = BulkLoadSession()
     first = True
-    for chunk in _iter_parquet_record_chunks(path, chunk_size=chunk_size):
-
-      rows_extracted += len(chunk)
-      landing_part = land_raw_json_records(
-        target_engine=target_engine,
-        target_dialect=dialect,
-        td=td,
-        records=chunk,
-        batch_run_id=batch_run_id,
-        load_run_id=load_run_id,
-        target_system=target_system,
-        profile=profile,
-        meta_schema=meta_schema,
-        source_system_short_name=str(source_dataset.source_system.short_name),
-        source_dataset_name=str(source_dataset.source_dataset_name),
-        source_object=uri_s,
-        ingest_mode=(file_type or "file"),
-        chunk_size=chunk_size,
-        source_dataset=source_dataset,
-        strict=False,
-        rebuild=first,
-        write_run_log=False,
-      )
-      rows_inserted_total += int((landing_part or {}).get("rows_inserted") or 0)
-      landing = landing_part
-      first = False
+    try:
+      for chunk in chunks:
+        rows_extracted += len(chunk)
+        if arrow_column_map is not None:
+          landing_part = land_raw_arrow_batch(
+            target_engine=target_engine,
+            target_dialect=dialect,
+            td=td,
+            batch=chunk,
+            column_map=arrow_column_map,
+            load_run_id=load_run_id,
+            source_dataset=source_dataset,
+            meta_schema=meta_schema,
+            chunk_size=chunk_size,
+            include_payload=include_payload,
+            rebuild=first,
+            bulk_session=bulk_session,
+          )
+          rows_inserted_total += int((landing_part or {}).get("rows_inserted") or 0)
+          landing = landing_part
+          first = False
+          continue
+
+        landing_part = land_raw_json_records(
+          target_engine=target_engine,
+          target_dialect=dialect,
+          td=td,
+          records=chunk,
+          batch_run_id=batch_run_id,
+          load_run_id=load_run_id,
+          target_system=target_system,
+          profile=profile,
+          meta_schema=meta_schema,
+          source_system_short_name=str(source_dataset.source_system.short_name),
+          source_dataset_name=str(source_dataset.source_dataset_name),
+          source_object=uri_s,
+          ingest_mode=(file_type or "file"),
+          chunk_size=chunk_size,
+          source_dataset=source_dataset,
+          strict=False,
+          rebuild=first,
+          write_run_log=False,
+          bulk_session=bulk_session,
+        )
+        rows_inserted_total += int((landing_part or {}).get("rows_inserted") or 0)
+        landing = landing_part
+        first = False
+      bulk_session.commit()
+    except BaseException:
+      bulk_session.abort()
+      raise
 
     # Ensure returned landing reflects total inserted rows across chunks
     if rows_inserted_total > 0:
@@ -719,70 +1132,13 @@ def ingest_raw_file(
         target_engine.execute(sql)
     except Exception:
       pass
-  else:
-    # For Excel we allow extra ingestion_config options
-    if system_type == "excel" or ft == "excel" or Path(_suffix_from_uri(uri_s)).suffix.lower() in (".xlsx", ".xlsm"):
-      cfg = source_dataset.ingestion_config or {}
-
-      sheet_name = cfg.get("sheet_name")
-      sheet_index = cfg.get("sheet_index")
-
-      # Guard: do not allow both sheet_name and sheet_index
-      if sheet_name is not None and sheet_index is not None:
-        raise ValueError("Specify either 'sheet_name' or 'sheet_index', not both.")
-
-      # Safe casts
-      header_row = int(cfg.get("header_row", 1))
-      max_rows = cfg.get("max_rows")
-      if max_rows is not None:
-        max_rows = int(max_rows)
-      if sheet_index is not None:
-        sheet_index = int(sheet_index)
-
-      records = _load_excel_records_from_bytes(
-        _read_bytes(uri_s),
-        sheet_name=sheet_name,
-        sheet_index=sheet_index,
-        header_row=header_row,
-        max_rows=max_rows,
-      )
-    else:
-      cfg = source_dataset.ingestion_config or {}
-      delimiter = cfg.get("delimiter")
-      quotechar = cfg.get("quotechar")
-      encoding = cfg.get("encoding")
-      records = _load_file_records(
-        uri_s,
-        file_type=file_type,
-        delimiter=delimiter,
-        quotechar=quotechar,
-        encoding=encoding,
-      )
 
-    if not records:
-      return {"rows_extracted": 0, "landing": None}
-    rows_extracted = len(records)
-    landing = land_raw_json_records(
-      target_engine=target_engine,
-      target_dialect=dialect,
-      td=td,
-      records=records,
-      batch_run_id=batch_run_id,
-      load_run_id=load_run_id,
-      target_system=target_system,
-      profile=profile,
-      meta_schema=meta_schema,
-      source_system_short_name=str(source_dataset.source_system.short_name),
-      source_dataset_name=str(source_dataset.source_dataset_name),
-      source_object=uri_s,
-      ingest_mode=(file_type or "file"),
-      chunk_size=chunk_size,
-      source_dataset=source_dataset,
-      strict=False,
-    )
-
-  return {
-    "rows_extracted": rows_extracted,
-    # If chunked ingestion accumulated totals, prefer the total in the returned landing dict.
-    "landing": ({**(landing or {}), "rows_inserted": rows_inserted_total} if rows_inserted_total > 0 else landing),
-  }
+    return {
+      "rows_extracted": rows_extracted,
+      # If chunked ingestion accumulated totals, prefer the total in the returned landing dict.
+      "landing": ({**(landing or {}), "rows_inserted": rows_inserted_total} if rows_inserted_total > 0 else landing),
+    }
+  finally:
+    close = getattr(target_engine, "close", None)
+    if callable(close):
+      close()
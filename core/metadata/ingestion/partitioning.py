@@ -0,0 +1,220 @@
+"""
+elevata - Metadata-driven Data Platform Framework
+Copyright © 2026 Ilona Tag
+
+This file is part of elevata.
+
+elevata is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as
+published by the Free Software Foundation, either version 3 of
+the License, or (at your option) any later version.
+
+elevata is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with elevata. If not, see <https://www.gnu.org/licenses/>.
+
+Contact: <https://github.com/elevata-labs/elevata>.
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+import datetime
+from decimal import Decimal
+import math
+import queue
+import threading
+import time
+
+from metadata.ingestion.streaming import iter_streamed_chunks
+
+
+# Partitioned extraction for relational RAW ingestion.
+# SourceDataset.ingestion_config:
+#   {"partition_column": "order_id", "partitions": 8,
+#    "partition_strategy": "range" | "modulo", "partition_workers": 8}
+# Partition queries run concurrently; their rows are merged into one stream,
+# so RAW landing (bulk_load / execute_many) stays a single load per dataset.
+
+PARTITION_STRATEGIES = ("range", "modulo")
+
+
+@dataclass(frozen=True)
+class PartitionConfig:
+  column: str
+  partitions: int
+  strategy: str = "range"
+  workers: int = 0
+
+  @property
+  def max_workers(self) -> int:
+    return max(1, min(self.workers or self.partitions, self.partitions))
+
+
+def partition_config_from_ingestion_config(cfg: dict | None) -> PartitionConfig | None:
+  """
+  Read the partitioning options from ingestion_config.
+  Returns None unless partition_column is set and partitions > 1.
+  """
+  if not isinstance(cfg, dict):
+    return None
+
+  column = str(cfg.get("partition_column") or "").strip()
+  if not column:
+    return None
+
+  try:
+    partitions = int(cfg.get("partitions") or 0)
+    workers = int(cfg.get("partition_workers") or 0)
+  except (TypeError, ValueError) as exc:
+    raise ValueError("ingestion_config.partitions / partition_workers must be integers.") from exc
+  if partitions <= 1:
+    return None
+
+  strategy = str(cfg.get("partition_strategy") or "range").strip().lower()
+  if strategy not in PARTITION_STRATEGIES:
+    raise ValueError(
+      f"Unsupported ingestion_config.partition_strategy {strategy!r} "
+      f"(expected one of: {', '.join(PARTITION_STRATEGIES)})."
+    )
+
+  return PartitionConfig(column=column, partitions=partitions, strategy=strategy, workers=workers)
+
+
+def range_boundaries(lo, hi, partitions: int) -> list:
+  """
+  Inner boundaries splitting [lo, hi] into at most `partitions` contiguous ranges.
+  Supports integers, floats/decimals, dates and timestamps.
+  """
+  if lo is None or hi is None or partitions <= 1 or lo >= hi:
+    return []
+
+  if isinstance(lo, bool) or isinstance(hi, bool):
+    raise ValueError("Range partitioning does not support boolean partition columns.")
+
+  if isinstance(lo, int) and isinstance(hi, int):
+    step = max(1, math.ceil((hi - lo + 1) / partitions))
+    bounds = [lo + step * k for k in range(1, partitions)]
+  elif isinstance(lo, (int, float, Decimal)) and isinstance(hi, (int, float, Decimal)):
+    step = (hi - lo) / partitions
+    bounds = [lo + step * k for k in range(1, partitions)]
+  elif isinstance(lo, datetime.datetime) and isinstance(hi, datetime.datetime):
+    step = (hi - lo) / partitions
+    bounds = [lo + step * k for k in range(1, partitions)]
+  elif isinstance(lo, datetime.date) and isinstance(hi, datetime.date):
+    step = max(1, math.ceil(((hi - lo).days + 1) / partitions))
+    bounds = [lo + datetime.timedelta(days=step * k) for k in range(1, partitions)]
+  else:
+    raise ValueError(
+      "Range partitioning requires a numeric, date or timestamp partition_column "
+      f"(got {type(lo).__name__})."
+    )
+
+  out = []
+  for b in bounds:
+    if lo < b <= hi and (not out or b > out[-1]):
+      out.append(b)
+  return out
+
+
+def render_range_predicates(column_sql: str, boundaries: list, *, render_literal) -> list[str]:
+  """
+  One predicate per range; the first range also takes NULLs, the outer ranges
+  are open-ended so rows outside the sampled min/max are never lost.
+  """
+  if not boundaries:
+    return []
+
+  lits = [render_literal(b) for b in boundaries]
+  preds = [f"({column_sql} < {lits[0]} OR {column_sql} IS NULL)"]
+  for lo, hi in zip(lits, lits[1:]):
+    preds.append(f"({column_sql} >= {lo} AND {column_sql} < {hi})")
+  preds.append(f"({column_sql} >= {lits[-1]})")
+  return preds
+
+
+def render_modulo_predicates(column_sql: str, partitions: int, *, dialect_name: str = "") -> list[str]:
+  """
+  One predicate per remainder of an integer column; remainder 0 also takes NULLs.
+  """
+  if (dialect_name or "").lower() in ("mssql", "fabric_warehouse"):
+    mod = f"ABS({column_sql} % {int(partitions)})"
+  else:
+    mod = f"ABS(MOD({column_sql}, {int(partitions)}))"
+
+  preds = []
+  for i in range(int(partitions)):
+    if i == 0:
+      preds.append(f"({mod} = 0 OR {column_sql} IS NULL)")
+    else:
+      preds.append(f"({mod} = {i})")
+  return preds
+
+
+def iter_partitioned_rows(
+  *,
+  connect,
+  partition_sqls: list[str],
+  workers: int,
+  fetch_size: int,
+  stats: dict,
+  max_queued_chunks: int | None = None,
+):
+  """
+  Run the partition queries concurrently (one connection each, at most workers
+  at a time) and yield their rows through one bounded queue.
+
+  stats[i] receives {"rows", "execution_ms"} of partition i once it finished.
+  If the consumer stops early, extraction threads stop at the next chunk.
+  """
+  q: queue.Queue = queue.Queue(maxsize=max_queued_chunks or max(2, 2 * int(workers)))
+  stop = threading.Event()
+  done = object()
+
+  def _put(item) -> bool:
+    while not stop.is_set():
+      try:
+        q.put(item, timeout=0.1)
+        return True
+      except queue.Full:
+        continue
+    return False
+
+  def _extract(i: int, sql: str) -> None:
+    t0 = time.time()
+    try:
+      n = 0
+      with connect() as conn:
+        for chunk in iter_streamed_chunks(conn, sql, fetch_size=fetch_size):
+          if stop.is_set():
+            return
+          n += len(chunk)
+          if not _put((i, chunk)):
+            return
+      stats[i] = {"rows": n, "execution_ms": (time.time() - t0) * 1000.0}
+      _put((i, done))
+    except BaseException as exc:
+      _put((i, exc))
+
+  pool = ThreadPoolExecutor(max_workers=max(1, int(workers)), thread_name_prefix="elevata_partition")
+  try:
+    for i, sql in enumerate(partition_sqls):
+      pool.submit(_extract, i, sql)
+
+    remaining = len(partition_sqls)
+    while remaining:
+      _, item = q.get()
+      if item is done:
+        remaining -= 1
+        continue
+      if isinstance(item, BaseException):
+        raise item
+      yield from item
+  finally:
+    stop.set()
+    pool.shutdown(wait=True, cancel_futures=True)
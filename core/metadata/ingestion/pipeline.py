@@ -0,0 +1,221 @@
+"""
+elevata - Metadata-driven Data Platform Framework
+Copyright © 2026 Ilona Tag
+
+This file is part of elevata.
+
+elevata is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as
+published by the Free Software Foundation, either version 3 of
+the License, or (at your option) any later version.
+
+elevata is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with elevata. If not, see <https://www.gnu.org/licenses/>.
+
+Contact: <https://github.com/elevata-labs/elevata>.
+"""
+
+from __future__ import annotations
+
+import itertools
+import queue
+import threading
+from typing import Iterable
+
+
+# Overlapping extract and load for RAW ingestion: a reader thread fetches
+# ahead into a bounded queue while the caller loads (one bulk load per
+# dataset, see BulkLoadSession). The queue depth caps memory.
+
+DEFAULT_PIPELINE_DEPTH = 4
+
+
+def _iter_chunks(rows: Iterable, size: int):
+  it = iter(rows)
+  while True:
+    chunk = list(itertools.islice(it, size))
+    if not chunk:
+      return
+    yield chunk
+
+
+def iter_prefetched(rows: Iterable, *, chunk_size: int, depth: int = DEFAULT_PIPELINE_DEPTH):
+  """
+  Iterate rows while a reader thread consumes `rows` ahead in chunks of
+  chunk_size, keeping at most `depth` chunks queued (backpressure).
+
+  The source iterable is advanced (and closed) only on the reader thread, so a
+  generator that opens a DB connection keeps it on one thread. Errors raised
+  by the source are re-raised to the caller; if the caller stops early the
+  reader stops at the next chunk. depth <= 0 disables prefetching.
+  """
+  if int(depth or 0) <= 0:
+    yield from rows
+    return
+
+  q: queue.Queue = queue.Queue(maxsize=int(depth))
+  stop = threading.Event()
+  done = object()
+
+  def _put(item) -> bool:
+    while not stop.is_set():
+      try:
+        q.put(item, timeout=0.1)
+        return True
+      except queue.Full:
+        continue
+    return False
+
+  def _read() -> None:
+    try:
+      for chunk in _iter_chunks(rows, max(1, int(chunk_size or 1))):
+        if not _put(chunk):
+          return
+      _put(done)
+    except BaseException as exc:
+      _put(exc)
+    finally:
+      close = getattr(rows, "close", None)
+      if callable(close):
+        try:
+          close()
+        except Exception:
+          pass
+
+  reader = threading.Thread(target=_read, name="elevata_extract", daemon=True)
+  reader.start()
+  try:
+    while True:
+      item = q.get()
+      if item is done:
+        return
+      if isinstance(item, BaseException):
+        raise item
+      yield from item
+  finally:
+    stop.set()
+    reader.join()
+
+
+class BulkLoadSession:
+  """
+  Feed the rows of several landing calls into a single engine.bulk_load call.
+
+  Chunked ingestion (files, REST pages) lands one chunk at a time; dialects
+  that stage and COPY per bulk_load call (Snowflake, Databricks, BigQuery load
+  jobs) would otherwise load a dataset once per chunk. The first append()
+  starts bulk_load on a loader thread that consumes appended chunks from a
+  bounded queue; commit() ends the stream and returns the loaded row count,
+  abort() makes the stream fail so nothing is loaded. The caller must not use
+  the target engine between the first append() and commit() / abort().
+  """
+
+  def __init__(self, *, depth: int = DEFAULT_PIPELINE_DEPTH):
+    self._queue: queue.Queue = queue.Queue(maxsize=max(1, int(depth or 1)))
+    self._aborted = threading.Event()
+    self._done = object()
+    self._target = None
+    self._loader = None
+    self._result = 0
+    self._error = None
+
+  @property
+  def started(self) -> bool:
+    return self._loader is not None
+
+  def _rows(self):
+    while True:
+      try:
+        item = self._queue.get(timeout=0.1)
+      except queue.Empty:
+        item = None
+      if self._aborted.is_set():
+        raise RuntimeError("Bulk load aborted.")
+      if item is None:
+        continue
+      if item is self._done:
+        return
+      yield from item
+
+  def _start(self, target_engine, target, column_types) -> None:
+    schema, table, columns = target
+
+    def _load() -> None:
+      try:
+        self._result = int(target_engine.bulk_load(
+          schema=schema,
+          table=table,
+          columns=list(columns),
+          rows=self._rows(),
+          column_types=column_types,
+        ) or 0)
+      except BaseException as exc:
+        self._error = exc
+
+    self._target = target
+    self._loader = threading.Thread(target=_load, name="elevata_bulk_load", daemon=True)
+    self._loader.start()
+
+  def _put(self, item) -> None:
+    while True:
+      if self._error is not None:
+        raise self._error
+      if not self._loader.is_alive():
+        raise RuntimeError("Bulk load ended before all rows were appended.")
+      try:
+        self._queue.put(item, timeout=0.1)
+        return
+      except queue.Full:
+        continue
+
+  def append(
+    self,
+    *,
+    target_engine,
+    schema: str,
+    table: str,
+    columns: list[str],
+    rows: Iterable,
+    column_types=None,
+  ) -> int:
+    """
+    Queue rows for the shared bulk load. All appends must target the same
+    table and columns. Returns the number of rows queued.
+    """
+    target = (schema, table, tuple(columns))
+    if self._loader is None:
+      self._start(target_engine, target, column_types)
+    elif target != self._target:
+      raise ValueError(f"Bulk load session is bound to {self._target[0]}.{self._target[1]}.")
+
+    chunk = list(rows)
+    if chunk:
+      self._put(chunk)
+    return len(chunk)
+
+  def commit(self) -> int:
+    """
+    End the stream and wait for the load. Returns the rows loaded (0 if
+    nothing was appended); a load error is raised here.
+    """
+    if self._loader is None:
+      return 0
+    self._put(self._done)
+    self._loader.join()
+    if self._error is not None:
+      raise self._error
+    return self._result
+
+  def abort(self) -> None:
+    """
+    Stop the stream without completing the load (best-effort, never raises).
+    """
+    if self._loader is None:
+      return
+    self._aborted.set()
+    self._loader.join()
@@ -25,13 +25,11 @@ from __future__ import annotations
 import os
 import json
 import urllib.parse
-import urllib.request
-import urllib.error
-import time
 from datetime import datetime, timezone
 from typing import Any
 
 from metadata.execution.load_run_snapshot_store import (
+  INGESTION_SNAPSHOT_KEY_PREFIX,
   build_load_run_snapshot_row,
   ensure_load_run_snapshot_table,
   fetch_one_value,
@@ -39,53 +37,26 @@ from metadata.execution.load_run_snapshot_store import (
 )
 from metadata.ingestion.connectors import rest_config_for_source_system
 from metadata.ingestion.landing import land_raw_json_records
+from metadata.ingestion.pipeline import BulkLoadSession
+from metadata.ingestion.rest_transport import RestTransport, TokenBucket, iter_ordered_concurrently
 from metadata.ingestion.validation import (
   parse_rest_validation_config,
   parse_rest_retry_config,
+  parse_rest_transport_config,
   validate_required_keys,
   validate_schema_drift,
+  validate_max_rows,
   validate_row_count,
   schema_signature,
 )
 from metadata.ingestion.normalization import normalize_records_keep_payload
+from metadata.materialization.logging import build_load_run_log_row
 
 
 def _utc_now():
   return datetime.now(timezone.utc)
 
 
-def _json_get_with_retry(url: str, headers: dict[str, str], rcfg) -> Any:
-  """
-  GET JSON with retry/backoff for transient HTTP errors.
-  """
-  attempts = 0
-  last_exc: Exception | None = None
-  retry_on = set(int(x) for x in (rcfg.retry_on_status or []))
-
-  while attempts < int(rcfg.max_attempts or 1):
-    attempts += 1
-    try:
-      req = urllib.request.Request(url, headers=headers or {})
-      with urllib.request.urlopen(req, timeout=60) as resp:
-        raw = resp.read()
-      return json.loads(raw.decode("utf-8"))
-    except urllib.error.HTTPError as exc:
-      last_exc = exc
-      status = int(getattr(exc, "code", 0) or 0)
-      if status not in retry_on or attempts >= int(rcfg.max_attempts or 1):
-        raise
-      time.sleep(float(rcfg.backoff_seconds or 0) * attempts)
-    except Exception as exc:
-      last_exc = exc
-      if attempts >= int(rcfg.max_attempts or 1):
-        raise
-      time.sleep(float(rcfg.backoff_seconds or 0) * attempts)
-
-  if last_exc:
-    raise last_exc
-  raise RuntimeError("REST request failed without exception")
-
-
 def _extract_records(payload: Any, record_path: str | None) -> list[dict[str, Any]]:
   """
   Extract record list from JSON payload.
@@ -158,6 +129,7 @@ def ingest_raw_rest(
   
   vcfg = parse_rest_validation_config(cfg)
   rcfg = parse_rest_retry_config(cfg)
+  tcfg = parse_rest_transport_config(cfg)
 
   # RAW landing uses SourceColumns.json_path as the single source of truth.
   # Any mapping configuration is handled via imported SourceColumns, not ingestion_config.  
@@ -188,167 +160,366 @@ def ingest_raw_rest(
     raise ValueError(f"REST system secret must provide base_url for {sys.short_name}")
 
   # Cursor snapshot key
-  root_key = f"ingestion:{sys.short_name}:{source_dataset.source_dataset_name}"
+  root_key = f"{INGESTION_SNAPSHOT_KEY_PREFIX}{sys.short_name}:{source_dataset.source_dataset_name}"
 
   # Warehouse engine (target) for snapshot/log writes + RAW landing
   # Use dialect execution engine (works consistently across supported warehouses).
   target_engine = dialect.get_execution_engine(target_system)
-
-  # Ensure snapshot table exists (best-effort)
-  ensure_load_run_snapshot_table(engine=target_engine, dialect=dialect, meta_schema=meta_schema, auto_provision=True)
-
-  # Load last cursor (best-effort)
-  cursor_state: dict[str, Any] = {}
   try:
-    sel = render_select_latest_load_run_snapshot_json_by_root_key(
-      dialect=dialect,
-      meta_schema=meta_schema,
-      root_dataset_key=root_key,
-    )
-    raw = fetch_one_value(target_engine, sel)
-    if raw:
-      cursor_state = json.loads(raw) if isinstance(raw, str) else {}
-  except Exception:
-    cursor_state = {}
-
-  next_cursor = cursor_state.get("cursor")
-  pages = 0
-  all_rows: list[dict[str, Any]] = []
-  empty_pages = 0
-  schema_sigs: set[tuple[str, ...]] = set()
-
-  while pages < max_pages:
-    pages += 1
-
-    q = {}
-    q.update(fixed_query)
-    q.update({k: v for k, v in query_tpl.items()})
-
-    # Substitute cursor placeholder in query template
-    for k, v in list(q.items()):
-      if isinstance(v, str) and "{{CURSOR}}" in v:
-        q[k] = v.replace("{{CURSOR}}", "" if next_cursor is None else str(next_cursor))
-
-    # Pagination cursor parameter
-    if cursor_type == "page_token":
-      req_param = str(cursor_cfg.get("request_param") or "pageToken")
-      if next_cursor:
-        q[req_param] = str(next_cursor)
-    elif cursor_type == "offset":
-      req_param = str(cursor_cfg.get("request_param") or "offset")
-      q[req_param] = int(next_cursor or 0)
-
-    url = f"{base_url.rstrip('/')}/{path.lstrip('/')}"
-    if q:
-      url = f"{url}?{urllib.parse.urlencode(q, doseq=True)}"
-
-    payload = _json_get_with_retry(url, headers, rcfg)
-
-    rows = _extract_records(payload, record_path)
-    if len(rows) == 0:
-      empty_pages += 1
-      if empty_pages > int(vcfg.max_empty_pages or 3):
-        msg = f"REST ingestion aborted: too many empty pages (>{vcfg.max_empty_pages})"
-        if vcfg.strict:
-          raise ValueError(msg)
-        break
-    else:
-      empty_pages = 0
+    # Ensure snapshot table exists (best-effort)
+    ensure_load_run_snapshot_table(engine=target_engine, dialect=dialect, meta_schema=meta_schema, auto_provision=True)
 
-    # Validation on batch level
-    validate_required_keys(rows, vcfg.required_keys, strict=vcfg.strict)
-    sig = schema_signature(rows)
-    validate_schema_drift(signatures_seen=schema_sigs, sig=sig, cfg=vcfg)
-
-    all_rows.extend(rows)
-
-    # Cursor update
-    if cursor_type == "page_token":
-      resp_field = str(cursor_cfg.get("response_field") or "nextPageToken")
-      next_cursor = payload.get(resp_field) if isinstance(payload, dict) else None
-      if not next_cursor:
-        break
-    elif cursor_type == "offset":
-      step = int(cursor_cfg.get("step") or len(rows) or 0)
-      next_cursor = int(next_cursor or 0) + int(step)
-      if len(rows) == 0:
-        break
-    else:
-      break
+    # Load last cursor (best-effort)
+    cursor_state: dict[str, Any] = {}
+    try:
+      sel = render_select_latest_load_run_snapshot_json_by_root_key(
+        dialect=dialect,
+        meta_schema=meta_schema,
+        root_dataset_key=root_key,
+      )
+      raw = fetch_one_value(target_engine, sel)
+      if raw:
+        cursor_state = json.loads(raw) if isinstance(raw, str) else {}
+    except Exception:
+      cursor_state = {}
+
+    # Ensure RAW landing can deterministically extract the integrated columns.
+    # SourceColumns (integrate=True) and their json_path values are the contract
+    # for semi-structured ingestion (REST/files). Target generation relies on this.
+    # Checked before the first request: pages are landed while paging.
+    integrated_cols = list(source_dataset.source_columns.filter(integrate=True))
+    if not integrated_cols:
+      raise ValueError(
+        f"No integrated SourceColumns found for REST dataset "
+        f"'{sys.short_name}:{source_dataset.source_dataset_name}'. "
+        "Run 'Import Metadata', then mark columns as integrated, then run 'Generate Target'."
+      )
+
+    missing_paths = [
+      c.source_column_name
+      for c in integrated_cols
+      if not getattr(c, "json_path", None)
+    ]
+    if missing_paths:
+      raise ValueError(
+        f"Missing json_path for integrated SourceColumns on REST dataset "
+        f"'{sys.short_name}:{source_dataset.source_dataset_name}': "
+        f"{', '.join(sorted(missing_paths))}. "
+        "Run 'Import Metadata' to refresh column definitions."
+      )
+
+    # Conditional requests: ETag / Last-Modified per page URL from the last run.
+    # Stored validators only apply while the landed column contract is the same.
+    conditional = cfg.get("conditional", True) not in (False, "false", "False", 0)
+    columns_sig = sorted(f"{c.source_column_name}={c.json_path}" for c in integrated_cols)
+    prev_pages: dict[str, Any] = {}
+    if conditional and cursor_state.get("columns") == columns_sig:
+      prev_pages = cursor_state.get("pages") or {}
+      if not isinstance(prev_pages, dict):
+        prev_pages = {}
+
+    started_at = _utc_now()
+    source_object = f"{base_url}{path}"
+    flush_rows = max(1, int(chunk_size or 1))
+
+    next_cursor = cursor_state.get("cursor")
+    pages = 0
+    rows_extracted = 0
+    rows_inserted = 0
+    landed = False
+    buffer: list[dict[str, Any]] = []
+    empty_pages = 0
+    schema_sigs: set[tuple[str, ...]] = set()
+    pages_out: dict[str, dict[str, Any]] = {}
+    # True while every page so far answered 304; their URLs wait in unchanged_urls.
+    all_unchanged = True
+    unchanged_urls: list[str] = []
+
+    # One bulk load per dataset: all flushes feed a single COPY / load job.
+    bulk_session = BulkLoadSession()
+
+    def _flush() -> None:
+      """
+      Land the buffered pages. The first flush rebuilds RAW, later ones append.
+      """
+      nonlocal buffer, landed, rows_inserted
+      # Normalize keys to match imported SourceColumns.json_path (e.g. userId -> userid),
+      # while preserving the original record in __payload__ for the payload system column.
+      records = normalize_records_keep_payload(buffer)
+      buffer = []
+      part = land_raw_json_records(
+        target_engine=target_engine,
+        target_dialect=dialect,
+        td=td,
+        records=records,
+        batch_run_id=batch_run_id,
+        load_run_id=load_run_id,
+        target_system=target_system,
+        profile=profile,
+        meta_schema=meta_schema,
+        source_system_short_name=str(sys.short_name),
+        source_dataset_name=str(source_dataset.source_dataset_name),
+        source_object=source_object,
+        ingest_mode="rest",
+        chunk_size=chunk_size,
+        source_dataset=source_dataset,
+        strict=vcfg.strict,
+        rebuild=not landed,
+        write_run_log=False,
+        bulk_session=bulk_session,
+      )
+      rows_inserted += int((part or {}).get("rows_inserted") or 0)
+      landed = True
+
+    def _page_url(cursor) -> str:
+      q = {}
+      q.update(fixed_query)
+      q.update({k: v for k, v in query_tpl.items()})
+
+      # Substitute cursor placeholder in query template
+      for k, v in list(q.items()):
+        if isinstance(v, str) and "{{CURSOR}}" in v:
+          q[k] = v.replace("{{CURSOR}}", "" if cursor is None else str(cursor))
+
+      # Pagination cursor parameter
+      if cursor_type == "page_token":
+        req_param = str(cursor_cfg.get("request_param") or "pageToken")
+        if cursor:
+          q[req_param] = str(cursor)
+      elif cursor_type == "offset":
+        req_param = str(cursor_cfg.get("request_param") or "offset")
+        q[req_param] = int(cursor or 0)
+
+      url = f"{base_url.rstrip('/')}/{path.lstrip('/')}"
+      if q:
+        url = f"{url}?{urllib.parse.urlencode(q, doseq=True)}"
+      return url
+
+    def _fetch_page(url: str, conditional: bool = True):
+      """
+      GET a page, conditional if validators are known. Returns (url, payload, state);
+      payload is None for 304 Not Modified, state then is the stored page state.
+      """
+      prev = prev_pages.get(url) if conditional else None
+      cond: dict[str, str] = {}
+      if isinstance(prev, dict):
+        if prev.get("etag"):
+          cond["If-None-Match"] = str(prev["etag"])
+        if prev.get("last_modified"):
+          cond["If-Modified-Since"] = str(prev["last_modified"])
+      resp = transport.get(url, headers=cond)
+      if resp.status == 304 and cond:
+        return url, None, prev
+      return url, resp.json(), {
+        "etag": resp.headers.get("etag"),
+        "last_modified": resp.headers.get("last-modified"),
+      }
 
-  # Persist cursor state snapshot (best-effort)
-  try:
-    cursor_state_out = {"cursor": next_cursor, "updated_at": _utc_now().isoformat()}
-    row = build_load_run_snapshot_row(
-      batch_run_id=batch_run_id,
-      created_at=_utc_now(),
-      root_dataset_key=root_key,
-      is_execute=True,
-      continue_on_error=True,
-      max_retries=0,
-      had_error=False,
-      step_count=1,
-      snapshot_json=json.dumps(cursor_state_out),
-    )
-    sql = dialect.render_insert_load_run_snapshot(meta_schema=meta_schema, values=row)
-    if sql:
-      target_engine.execute(sql)
-  except Exception:
-    pass
-
-  # Land into RAW (transient landing zone)
-  validate_row_count(len(all_rows), vcfg)
-
-  # Ensure RAW landing can deterministically extract the integrated columns.
-  # SourceColumns (integrate=True) and their json_path values are the contract
-  # for semi-structured ingestion (REST/files). Target generation relies on this.
-  integrated_cols = list(source_dataset.source_columns.filter(integrate=True))
-  if not integrated_cols:
-    raise ValueError(
-      f"No integrated SourceColumns found for REST dataset "
-      f"'{sys.short_name}:{source_dataset.source_dataset_name}'. "
-      "Run 'Import Metadata', then mark columns as integrated, then run 'Generate Target'."
+    def _process(rows: list[dict[str, Any]]) -> None:
+      nonlocal rows_extracted
+      # Validation on batch level
+      validate_required_keys(rows, vcfg.required_keys, strict=vcfg.strict)
+      sig = schema_signature(rows)
+      validate_schema_drift(signatures_seen=schema_sigs, sig=sig, cfg=vcfg)
+
+      rows_extracted += len(rows)
+      # Fail before landing rows beyond max_rows; min_rows is checked at the end.
+      validate_max_rows(rows_extracted, vcfg)
+
+      buffer.extend(rows)
+      if len(buffer) >= flush_rows:
+        _flush()
+
+    transport = RestTransport(
+      headers=headers,
+      retry=rcfg,
+      rate_limiter=(
+        TokenBucket(tcfg.requests_per_second, tcfg.burst)
+        if tcfg.requests_per_second else None
+      ),
+      timeout_seconds=tcfg.timeout_seconds,
     )
 
-  missing_paths = [
-    c.source_column_name
-    for c in integrated_cols
-    if not getattr(c, "json_path", None)
-  ]
-  if missing_paths:
-    raise ValueError(
-      f"Missing json_path for integrated SourceColumns on REST dataset "
-      f"'{sys.short_name}:{source_dataset.source_dataset_name}': "
-      f"{', '.join(sorted(missing_paths))}. "
-      "Run 'Import Metadata' to refresh column definitions."
-    )
+    # Offset pages are predictable when the step is configured: fetch ahead
+    # concurrently, results still arrive in page order.
+    prefetched = None
+    if cursor_type == "offset" and tcfg.concurrency > 1 and cursor_cfg.get("step"):
+      start = int(next_cursor or 0)
+      step = int(cursor_cfg.get("step"))
+      prefetched = iter_ordered_concurrently(
+        _fetch_page,
+        (_page_url(start + k * step) for k in range(max_pages)),
+        concurrency=tcfg.concurrency,
+      )
 
-  # Normalize keys to match imported SourceColumns.json_path (e.g. userId -> userid),
-  # while preserving the original record in __payload__ for the payload system column.
-  all_rows = normalize_records_keep_payload(all_rows)
-
-  landing = land_raw_json_records(
-    target_engine=target_engine,
-    target_dialect=dialect,
-    td=td,
-    records=all_rows,
-    batch_run_id=batch_run_id,
-    load_run_id=load_run_id,
-    target_system=target_system,
-    profile=profile,
-    meta_schema=meta_schema,
-    source_system_short_name=str(sys.short_name),
-    source_dataset_name=str(source_dataset.source_dataset_name),
-    source_object=f"{base_url}{path}",
-    ingest_mode="rest",
-    chunk_size=chunk_size,
-    source_dataset=source_dataset,
-    strict=vcfg.strict,
-  )
-
-  return {
-    "rows_extracted": len(all_rows),
-    "pages": pages,
-    "cursor_after": next_cursor,
-    "landing": landing,
-  }
+    try:
+      while pages < max_pages:
+        pages += 1
+
+        if prefetched is not None:
+          url, payload, page_state = next(prefetched)
+        else:
+          url, payload, page_state = _fetch_page(_page_url(next_cursor))
+
+        rows: list[dict[str, Any]] = []
+        if payload is None:
+          # 304: the page is unchanged since the last run.
+          row_count = int(page_state.get("rows") or 0)
+          page_next = page_state.get("next")
+          if all_unchanged:
+            unchanged_urls.append(url)
+          else:
+            # RAW is being rebuilt, so the unchanged page has to be landed again.
+            _, payload, page_state = _fetch_page(url, conditional=False)
+        if payload is not None:
+          rows = _extract_records(payload, record_path)
+          row_count = len(rows)
+          resp_field = str(cursor_cfg.get("response_field") or "nextPageToken")
+          page_next = payload.get(resp_field) if isinstance(payload, dict) else None
+
+        pages_out[url] = {
+          "etag": page_state.get("etag"),
+          "last_modified": page_state.get("last_modified"),
+          "rows": row_count,
+          "next": page_next,
+        }
+
+        if row_count == 0:
+          empty_pages += 1
+          if empty_pages > int(vcfg.max_empty_pages or 3):
+            msg = f"REST ingestion aborted: too many empty pages (>{vcfg.max_empty_pages})"
+            if vcfg.strict:
+              raise ValueError(msg)
+            break
+        else:
+          empty_pages = 0
+
+        if payload is not None:
+          if all_unchanged:
+            # First changed page: land the pages skipped as unchanged so far, in order.
+            all_unchanged = False
+            for prev_url in unchanged_urls:
+              _, prev_payload, prev_state = _fetch_page(prev_url, conditional=False)
+              prev_rows = _extract_records(prev_payload, record_path)
+              pages_out[prev_url].update(prev_state, rows=len(prev_rows))
+              _process(prev_rows)
+            unchanged_urls = []
+          _process(rows)
+
+        # Cursor update
+        if cursor_type == "page_token":
+          next_cursor = page_next
+          if not next_cursor:
+            break
+        elif cursor_type == "offset":
+          step = int(cursor_cfg.get("step") or row_count or 0)
+          next_cursor = int(next_cursor or 0) + int(step)
+          if row_count == 0:
+            break
+        else:
+          break
+
+      # Every page answered 304: RAW still holds the last landed data.
+      unchanged = all_unchanged and bool(unchanged_urls)
+
+      if not unchanged:
+        validate_row_count(rows_extracted, vcfg)
+
+        # Land the remaining pages (an empty pull still rebuilds RAW)
+        if buffer or not landed:
+          _flush()
+      bulk_session.commit()
+    except BaseException:
+      bulk_session.abort()
+      raise
+    finally:
+      if prefetched is not None:
+        prefetched.close()
+      transport.close()
+
+    finished_at = _utc_now()
+
+    # Write exactly one run log row (best-effort)
+    try:
+      values = build_load_run_log_row(
+        batch_run_id=batch_run_id,
+        load_run_id=load_run_id,
+        target_schema=td.target_schema.short_name,
+        target_dataset=td.target_dataset_name,
+        target_system=target_system.short_name,
+        profile=profile.name,
+        run_kind="ingestion",
+        source_system=str(sys.short_name),
+        source_dataset=str(source_dataset.source_dataset_name),
+        source_object=source_object,
+        ingest_mode="rest",
+        delta_cutoff=None,
+        rows_extracted=rows_extracted,
+        chunk_size=int(chunk_size),
+        mode="full",
+        handle_deletes=False,
+        historize=False,
+        started_at=started_at,
+        finished_at=finished_at,
+        render_ms=0.0,
+        execution_ms=0.0,
+        sql_length=0,
+        rows_affected=rows_inserted,
+        status=("skipped" if unchanged else "ok"),
+        error_message=None,
+        attempt_no=1,
+        status_reason=("unchanged" if unchanged else None),
+      )
+      sql = dialect.render_insert_load_run_log(meta_schema=meta_schema, values=values)
+      if sql:
+        target_engine.execute(sql)
+    except Exception:
+      pass
+
+    # Persist cursor state snapshot (best-effort), only after RAW was landed
+    try:
+      cursor_state_out = {
+        "cursor": next_cursor,
+        "updated_at": _utc_now().isoformat(),
+        "columns": columns_sig,
+        # Only pages with validators can be requested conditionally.
+        "pages": {u: st for u, st in pages_out.items() if st.get("etag") or st.get("last_modified")},
+      }
+      row = build_load_run_snapshot_row(
+        batch_run_id=batch_run_id,
+        created_at=_utc_now(),
+        root_dataset_key=root_key,
+        is_execute=True,
+        continue_on_error=True,
+        max_retries=0,
+        had_error=False,
+        step_count=1,
+        snapshot_json=json.dumps(cursor_state_out),
+      )
+      sql = dialect.render_insert_load_run_snapshot(meta_schema=meta_schema, values=row)
+      if sql:
+        target_engine.execute(sql)
+    except Exception:
+      pass
+
+    if unchanged:
+      return {
+        "status": "skipped",
+        "reason": "unchanged",
+        "rows_extracted": 0,
+        "rows_affected": 0,
+        "pages": pages,
+        "cursor_after": next_cursor,
+        "landing": None,
+      }
+
+    return {
+      "rows_extracted": rows_extracted,
+      "pages": pages,
+      "cursor_after": next_cursor,
+      "landing": {"rows_inserted": rows_inserted},
+    }
+  finally:
+    close = getattr(target_engine, "close", None)
+    if callable(close):
+      close()
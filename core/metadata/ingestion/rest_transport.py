@@ -0,0 +1,306 @@
+"""
+elevata - Metadata-driven Data Platform Framework
+Copyright © 2026 Ilona Tag
+
+This file is part of elevata.
+
+elevata is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as
+published by the Free Software Foundation, either version 3 of
+the License, or (at your option) any later version.
+
+elevata is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with elevata. If not, see <https://www.gnu.org/licenses/>.
+
+Contact: <https://github.com/elevata-labs/elevata>.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+import base64
+import gzip
+import http.client
+import json
+import threading
+import time
+from typing import Any, Callable, Iterable
+import urllib.error
+import urllib.parse
+import urllib.request
+import zlib
+
+
+# HTTP transport for REST ingestion: persistent HTTP/1.1 connections (one per
+# thread and host), gzip/deflate responses, a shared token-bucket rate limit
+# and the retry/backoff settings of ingestion_config.retry. Proxies come from
+# the environment (HTTP_PROXY / HTTPS_PROXY / NO_PROXY), as with urllib.
+
+_MAX_REDIRECTS = 5
+
+# Errors of a request on a kept-alive connection the server has closed meanwhile.
+_STALE_CONNECTION_ERRORS = (ConnectionResetError, ConnectionAbortedError, BrokenPipeError)
+
+
+class TokenBucket:
+  """
+  Thread-safe token bucket: `rate` requests per second with bursts of up to
+  `capacity` requests.
+  """
+
+  def __init__(
+    self,
+    rate: float,
+    capacity: float | None = None,
+    *,
+    clock: Callable[[], float] = time.monotonic,
+    sleep: Callable[[float], None] = time.sleep,
+  ):
+    if float(rate) <= 0:
+      raise ValueError("TokenBucket rate must be > 0")
+    self.rate = float(rate)
+    self.capacity = max(1.0, float(capacity or rate))
+    self._clock = clock
+    self._sleep = sleep
+    self._tokens = self.capacity
+    self._updated = clock()
+    self._lock = threading.Lock()
+
+  def acquire(self) -> None:
+    while True:
+      with self._lock:
+        now = self._clock()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+        if self._tokens >= 1.0:
+          self._tokens -= 1.0
+          return
+        wait = (1.0 - self._tokens) / self.rate
+      self._sleep(wait)
+
+
+@dataclass(frozen=True)
+class RestResponse:
+  status: int
+  headers: dict[str, str]
+  body: bytes
+
+  def json(self) -> Any:
+    return json.loads(self.body.decode("utf-8"))
+
+
+def _decode_body(body: bytes, encoding: str | None) -> bytes:
+  enc = (encoding or "").strip().lower()
+  if enc == "gzip":
+    return gzip.decompress(body)
+  if enc == "deflate":
+    try:
+      return zlib.decompress(body)
+    except zlib.error:
+      # Raw deflate stream without zlib header
+      return zlib.decompress(body, -zlib.MAX_WBITS)
+  return body
+
+
+def _proxy_authorization(proxy: urllib.parse.SplitResult) -> dict[str, str]:
+  if proxy.username is None:
+    return {}
+  user = urllib.parse.unquote(proxy.username)
+  password = urllib.parse.unquote(proxy.password or "")
+  token = base64.b64encode(f"{user}:{password}".encode("utf-8")).decode("ascii")
+  return {"Proxy-Authorization": f"Basic {token}"}
+
+
+class RestTransport:
+  """
+  GET requests over kept-alive connections. Safe to share between threads:
+  every thread uses its own connections, the rate limiter is shared.
+
+  https requests through a proxy are tunneled (CONNECT); http requests are sent
+  to the proxy with the absolute URL.
+  """
+
+  def __init__(
+    self,
+    *,
+    headers: dict[str, str] | None = None,
+    retry=None,
+    rate_limiter: TokenBucket | None = None,
+    timeout_seconds: float = 60.0,
+  ):
+    self.headers = dict(headers or {})
+    self.headers.setdefault("Accept-Encoding", "gzip, deflate")
+    self.headers.setdefault("Connection", "keep-alive")
+    self.retry = retry
+    self.rate_limiter = rate_limiter
+    self.timeout_seconds = float(timeout_seconds)
+    self._proxies = urllib.request.getproxies()
+    self._local = threading.local()
+    self._all_connections: list[http.client.HTTPConnection] = []
+    self._lock = threading.Lock()
+
+  def _proxy_for(self, scheme: str, host: str) -> urllib.parse.SplitResult | None:
+    proxy_url = self._proxies.get(scheme)
+    if not proxy_url or urllib.request.proxy_bypass(host):
+      return None
+    if "://" not in proxy_url:
+      proxy_url = f"http://{proxy_url}"
+    return urllib.parse.urlsplit(proxy_url)
+
+  def _open_connection(self, scheme: str, netloc: str):
+    """
+    Returns (connection, proxy_headers); proxy_headers is None unless requests
+    go to an http proxy in absolute-URI form.
+    """
+    host = urllib.parse.urlsplit(f"//{netloc}").hostname or netloc
+    proxy = self._proxy_for(scheme, host)
+    cls = http.client.HTTPSConnection if scheme == "https" else http.client.HTTPConnection
+    if proxy is None:
+      return cls(netloc, timeout=self.timeout_seconds), None
+
+    proxy_netloc = proxy.netloc.rsplit("@", 1)[-1]
+    auth = _proxy_authorization(proxy)
+    conn = cls(proxy_netloc, timeout=self.timeout_seconds)
+    if scheme == "https":
+      conn.set_tunnel(netloc, headers=auth)
+      return conn, None
+    return conn, auth
+
+  def _connection(self, scheme: str, netloc: str):
+    """
+    Returns (connection, proxy_headers, reused); reused is True if the
+    connection already served a request on this thread.
+    """
+    conns = getattr(self._local, "connections", None)
+    if conns is None:
+      conns = self._local.connections = {}
+    key = (scheme, netloc)
+    entry = conns.get(key)
+    if entry is not None:
+      return entry[0], entry[1], True
+    entry = self._open_connection(scheme, netloc)
+    conns[key] = entry
+    with self._lock:
+      self._all_connections.append(entry[0])
+    return entry[0], entry[1], False
+
+  def _drop_connection(self, scheme: str, netloc: str) -> None:
+    conns = getattr(self._local, "connections", None) or {}
+    entry = conns.pop((scheme, netloc), None)
+    if entry is not None:
+      entry[0].close()
+
+  def _request_once(self, url: str, headers: dict[str, str]) -> RestResponse:
+    for _ in range(_MAX_REDIRECTS + 1):
+      parts = urllib.parse.urlsplit(url)
+      scheme = (parts.scheme or "http").lower()
+      target = urllib.parse.urlunsplit(("", "", parts.path or "/", parts.query, ""))
+      conn, proxy_headers, reused = self._connection(scheme, parts.netloc)
+      req_headers = headers
+      if proxy_headers is not None:
+        target = urllib.parse.urlunsplit((scheme, parts.netloc, parts.path or "/", parts.query, ""))
+        req_headers = {**headers, **proxy_headers}
+      try:
+        try:
+          conn.request("GET", target, headers=req_headers)
+          resp = conn.getresponse()
+        except _STALE_CONNECTION_ERRORS:
+          if not reused:
+            raise
+          # The server closed the idle keep-alive connection before answering:
+          # resend once on a fresh connection (not a retry attempt, no backoff).
+          self._drop_connection(scheme, parts.netloc)
+          conn, _, _ = self._connection(scheme, parts.netloc)
+          conn.request("GET", target, headers=req_headers)
+          resp = conn.getresponse()
+        body = resp.read()
+      except (http.client.HTTPException, OSError):
+        # Stale keep-alive connection or network error: reconnect on the next attempt.
+        self._drop_connection(scheme, parts.netloc)
+        raise
+
+      resp_headers = {k.lower(): v for k, v in resp.getheaders()}
+      if resp.will_close:
+        self._drop_connection(scheme, parts.netloc)
+
+      if resp.status in (301, 302, 303, 307, 308) and resp_headers.get("location"):
+        url = urllib.parse.urljoin(url, resp_headers["location"])
+        continue
+
+      if resp.status >= 400:
+        raise urllib.error.HTTPError(url, resp.status, resp.reason, resp.msg, None)
+
+      return RestResponse(
+        status=int(resp.status),
+        headers=resp_headers,
+        body=_decode_body(body, resp_headers.get("content-encoding")),
+      )
+    raise urllib.error.URLError(f"Too many redirects: {url}")
+
+  def get(self, url: str, *, headers: dict[str, str] | None = None) -> RestResponse:
+    """
+    GET with retry/backoff for transient HTTP errors and connection failures.
+    """
+    req_headers = {**self.headers, **(headers or {})}
+    max_attempts = max(1, int(getattr(self.retry, "max_attempts", 1) or 1))
+    backoff = float(getattr(self.retry, "backoff_seconds", 0) or 0)
+    retry_on = set(int(x) for x in (getattr(self.retry, "retry_on_status", None) or []))
+
+    attempts = 0
+    while True:
+      attempts += 1
+      if self.rate_limiter is not None:
+        self.rate_limiter.acquire()
+      try:
+        return self._request_once(url, req_headers)
+      except urllib.error.HTTPError as exc:
+        if int(getattr(exc, "code", 0) or 0) not in retry_on or attempts >= max_attempts:
+          raise
+      except Exception:
+        if attempts >= max_attempts:
+          raise
+      time.sleep(backoff * attempts)
+
+  def get_json(self, url: str) -> Any:
+    return self.get(url).json()
+
+  def close(self) -> None:
+    with self._lock:
+      conns, self._all_connections = self._all_connections, []
+    for conn in conns:
+      try:
+        conn.close()
+      except Exception:
+        pass
+
+
+def iter_ordered_concurrently(fetch: Callable[[str], Any], urls: Iterable[str], *, concurrency: int):
+  """
+  Fetch urls with up to `concurrency` requests in flight and yield the results
+  in input order. urls may be unbounded; when the consumer stops, queued
+  requests are cancelled and running ones are awaited.
+  """
+  it = iter(urls)
+  pending: deque = deque()
+  pool = ThreadPoolExecutor(max_workers=max(1, int(concurrency)), thread_name_prefix="elevata_rest")
+  try:
+    while True:
+      while len(pending) < max(1, int(concurrency)):
+        url = next(it, None)
+        if url is None:
+          break
+        pending.append(pool.submit(fetch, url))
+      if not pending:
+        return
+      yield pending.popleft().result()
+  finally:
+    for fut in pending:
+      fut.cancel()
+    pool.shutdown(wait=True, cancel_futures=True)
@@ -0,0 +1,109 @@
+"""
+elevata - Metadata-driven Data Platform Framework
+Copyright © 2026 Ilona Tag
+
+This file is part of elevata.
+
+elevata is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as
+published by the Free Software Foundation, either version 3 of
+the License, or (at your option) any later version.
+
+elevata is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with elevata. If not, see <https://www.gnu.org/licenses/>.
+
+Contact: <https://github.com/elevata-labs/elevata>.
+"""
+
+from __future__ import annotations
+
+from sqlalchemy import text
+
+
+# Streaming extraction for relational RAW ingestion.
+# Source queries run with yield_per (stream_results + fetchmany batches), so
+# drivers with server-side cursors (psycopg2 named cursors, MySQL SSCursor,
+# ...) do not buffer the full result client-side. Drivers without server-side
+# cursor support (pyodbc, sqlite) fetch lazily via fetchmany anyway.
+#
+# Fetch size resolution (first match wins):
+#   SourceDataset.ingestion_config: {"fetch_size": 50000}
+#   profile ingestion.source_systems.<short_name>.fetch_size
+#   profile ingestion.fetch_size
+#   the ingestion chunk size
+
+
+def _positive_int(value, *, label: str) -> int | None:
+  if value is None or value == "":
+    return None
+  try:
+    n = int(value)
+  except (TypeError, ValueError) as exc:
+    raise ValueError(f"{label} must be a positive integer, got {value!r}.") from exc
+  if n < 1:
+    raise ValueError(f"{label} must be a positive integer, got {value!r}.")
+  return n
+
+
+def resolve_fetch_size(
+  *,
+  ingestion_config: dict | None,
+  profile,
+  source_system_short: str | None,
+  default: int,
+) -> int:
+  """
+  Return the number of rows fetched per round trip for a source dataset.
+  """
+  cfg = ingestion_config if isinstance(ingestion_config, dict) else {}
+  n = _positive_int(cfg.get("fetch_size"), label="ingestion_config.fetch_size")
+  if n is not None:
+    return n
+
+  profile_cfg = getattr(profile, "ingestion", None)
+  if isinstance(profile_cfg, dict):
+    systems = profile_cfg.get("source_systems") or {}
+    system_cfg = systems.get(source_system_short) if isinstance(systems, dict) else None
+    if isinstance(system_cfg, dict):
+      n = _positive_int(
+        system_cfg.get("fetch_size"),
+        label=f"profile ingestion.source_systems.{source_system_short}.fetch_size",
+      )
+      if n is not None:
+        return n
+    n = _positive_int(profile_cfg.get("fetch_size"), label="profile ingestion.fetch_size")
+    if n is not None:
+      return n
+
+  return max(1, int(default or 1))
+
+
+def iter_streamed_chunks(conn, sql: str, *, fetch_size: int):
+  """
+  Execute sql on conn as a streamed result and yield lists of row tuples of at
+  most fetch_size rows. The result (server-side cursor) is closed when the
+  consumer stops, also on early exit.
+  """
+  size = max(1, int(fetch_size))
+  result = conn.execution_options(yield_per=size).execute(text(sql))
+  try:
+    while True:
+      chunk = result.fetchmany(size)
+      if not chunk:
+        return
+      yield [tuple(r) for r in chunk]
+  finally:
+    result.close()
+
+
+def iter_streamed_rows(conn, sql: str, *, fetch_size: int):
+  """
+  Row-wise variant of iter_streamed_chunks.
+  """
+  for chunk in iter_streamed_chunks(conn, sql, fetch_size=fetch_size):
+    yield from chunk
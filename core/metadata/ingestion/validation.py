@@ -46,6 +46,28 @@ class RestRetryConfig:
   retry_on_status: list[int] | None = None
 
 
+@dataclass
+class RestTransportConfig:
+  concurrency: int = 1
+  requests_per_second: float | None = None
+  burst: int | None = None
+  timeout_seconds: float = 60.0
+
+
+def parse_rest_transport_config(cfg: dict[str, Any]) -> RestTransportConfig:
+  rl = cfg.get("rate_limit") or {}
+  if not isinstance(rl, dict):
+    rl = {}
+  rps = rl.get("requests_per_second")
+  burst = rl.get("burst")
+  return RestTransportConfig(
+    concurrency=max(1, int(cfg.get("concurrency") or 1)),
+    requests_per_second=(float(rps) if rps else None),
+    burst=(int(burst) if burst else None),
+    timeout_seconds=float(cfg.get("timeout_seconds") or 60.0),
+  )
+
+
 def parse_rest_retry_config(cfg: dict[str, Any]) -> RestRetryConfig:
   r = cfg.get("retry") or {}
   if not isinstance(r, dict):
@@ -98,13 +120,25 @@ def validate_schema_drift(
   sig: tuple[str, ...],
   cfg: RestValidationConfig,
 ) -> None:
+  limit = int(cfg.max_schema_signatures or 3)
+  # Once the limit is exceeded further signatures add nothing; keeps the set bounded while paging.
+  if sig in signatures_seen or len(signatures_seen) > limit:
+    return
   signatures_seen.add(sig)
-  if len(signatures_seen) > int(cfg.max_schema_signatures or 3):
+  if len(signatures_seen) > limit:
     msg = f"REST ingestion schema drift exceeded max_schema_signatures={cfg.max_schema_signatures}"
     if cfg.strict:
       raise ValueError(msg)
 
 
+def validate_max_rows(total_rows: int, cfg: RestValidationConfig) -> None:
+  """
+  Running check while paging: fail as soon as max_rows is exceeded.
+  """
+  if cfg.max_rows is not None and total_rows > int(cfg.max_rows):
+    raise ValueError(f"REST ingestion validation failed: total_rows={total_rows} > max_rows={cfg.max_rows}")
+
+
 def validate_row_count(total_rows: int, cfg: RestValidationConfig) -> None:
   if cfg.min_rows is not None and total_rows < int(cfg.min_rows):
     raise ValueError(f"REST ingestion validation failed: total_rows={total_rows} < min_rows={cfg.min_rows}")
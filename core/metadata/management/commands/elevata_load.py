@@ -28,10 +28,13 @@ import time
 import logging
 import os
 import re
+import socket
 import uuid
 import hashlib
+import threading
 from pathlib import Path
 from collections import defaultdict
+from django.db import connections
 from django.utils.timezone import now
 from django.core.management.base import BaseCommand, CommandError
 from dataclasses import replace
@@ -40,6 +43,7 @@ from metadata.architecture.scope import (
   dataset_keys_from_execution_items,
   split_dataset_key,
 )
+from metadata.architecture.migration_plan import MigrationPlan
 from metadata.architecture.migration_planner import MigrationPlanner
 from metadata.architecture.service import ArchitectureStateService
 from metadata.architecture.shadow_compare import (
@@ -61,11 +65,25 @@ from metadata.rendering.load_sql import (
   format_load_run_summary,
 )
 from metadata.rendering.load_planner import build_load_plan
+from metadata.rendering.render_cache import render_sql_cached
 from metadata.rendering.placeholders import resolve_delta_cutoff_for_source_dataset
 from metadata.intent.ingestion import resolve_ingest_mode
 from metadata.ingestion.connectors import ingest_raw_for_source_dataset
-from metadata.execution.load_graph import resolve_execution_order, resolve_execution_order_all
-from metadata.execution.executor import build_execution_plan, execute_plan, ExecutionPolicy
+from metadata.execution.load_graph import (
+  build_load_graph_index,
+  resolve_execution_order,
+  resolve_execution_order_all,
+)
+from metadata.execution.executor import build_execution_plan, execute_plan, ExecutionPlan, ExecutionPolicy
+from metadata.execution.plan_guard import PlanGuard, plan_guard_token_for_execution_ids
+from metadata.execution.prerender import attach_prerendered_sql, prerender_plan
+from metadata.execution.scheduling import compute_critical_path_weights, load_runtime_stats
+from metadata.execution.watermark import (
+  InputWatermarkTracker,
+  build_load_watermark_row,
+  compute_definition_fingerprint,
+  ensure_load_watermark_table,
+)
 from metadata.execution.snapshot import (
   build_execution_snapshot,
   render_execution_snapshot_json,
@@ -77,6 +95,14 @@ from metadata.execution.load_run_snapshot_store import (
   render_select_load_run_snapshot_json,
   fetch_one_value,
 )
+from metadata.execution.resume import (
+  build_resume_plan,
+  compute_resume_keys,
+  load_batch_succeeded_keys,
+  load_resume_state,
+  merge_resume_results,
+)
+from metadata.execution.work_queue import enqueue_plan, run_queued_step, run_worker, wait_for_batch
 from metadata.execution.snapshot_diff import (
   diff_execution_snapshots,
   render_execution_snapshot_diff_text,
@@ -88,7 +114,7 @@ from metadata.materialization.logging import LOAD_RUN_SNAPSHOT_REGISTRY, build_l
 from metadata.materialization.schema import ensure_target_schema
 from metadata.materialization.migration_executor import build_materialization_from_migration_plan
 
-from metadata.ingestion.connectors import engine_for_target
+from metadata.ingestion.connectors import dispose_all_engines, engine_for_target
 
 logger = logging.getLogger(__name__)
 
@@ -255,6 +281,20 @@ def _looks_like_cross_system_sql(sql: str, target_schema: str) -> bool:
 
   return False
 
+def _is_comment_only_sql(stmt: str) -> bool:
+  s = (stmt or "").strip()
+  if not s:
+    return True
+  for line in s.splitlines():
+    t = line.strip()
+    if not t:
+      continue
+    if t.startswith("--"):
+      continue
+    return False
+  return True
+
+
 def _render_literal_for_dialect(dialect, value):
   # prefer dialect.render_literal if available
   fn = getattr(dialect, "render_literal", None)
@@ -381,6 +421,8 @@ def run_single_target_dataset(
   fail_on_type_drift: bool = False,
   allow_type_alter: bool = False,
   migration_plan=None,
+  prerendered_sql: str | None = None,
+  prerender_ms: float | None = None,
 ) -> dict[str, object]:
   """
   Execute or render exactly one dataset.
@@ -581,7 +623,6 @@ def run_single_target_dataset(
         keep_ops = {"ENSURE_SCHEMA", "RENAME_DATASET"}
         plan.steps = [s for s in plan.steps if getattr(s, "op", None) in keep_ops]
 
-      # do NOT dispose yet - hist_plan uses the same engine below
 
       # ------------------------------------------------------------------
       # Preflight: deterministic drift findings before applying DDL
@@ -822,18 +863,21 @@ def run_single_target_dataset(
         # Never break the load because of best-effort hist sync
         logger.warning("Hist materialization sync failed: %s", exc)
 
-      # dispose AFTER both plans
-      dispose = getattr(target_sa_engine, "dispose", None)
-      if callable(dispose):
-        dispose()
+      # target_sa_engine is the shared registry engine: never dispose it here,
+      # dispose_all_engines() releases the pools at batch end.
 
   # ------------------------------------------------------------------
   # 1) Render SQL (now schema is correct)
   # ------------------------------------------------------------------
   render_started_at = now()
   render_start_ts = time.perf_counter()
-  sql = render_load_sql_for_target(td, dialect)
-  render_ms = (time.perf_counter() - render_start_ts) * 1000.0
+  if prerendered_sql is not None:
+    # Rendered in the batch pre-render phase; report the original render time.
+    sql = prerendered_sql
+    render_ms = float(prerender_ms or 0.0)
+  else:
+    sql = render_sql_cached(td, dialect, kind="load", render_fn=render_load_sql_for_target)
+    render_ms = (time.perf_counter() - render_start_ts) * 1000.0
   render_finished_at = now()
   sql_length = len(sql or "")
 
@@ -982,19 +1026,6 @@ def run_single_target_dataset(
           f"SQL contains {{DELTA_CUTOFF}} but no active increment policy exists "
           f"for incremental_source in environment '{profile.name}'."
         )
-      
-    def _is_comment_only_sql(stmt: str) -> bool:
-      s = (stmt or "").strip()
-      if not s:
-        return True
-      for line in s.splitlines():
-        t = line.strip()
-        if not t:
-          continue
-        if t.startswith("--"):
-          continue
-        return False
-      return True
 
     if _is_comment_only_sql(sql):
       raise CommandError(
@@ -1304,6 +1335,36 @@ class Command(BaseCommand):
       ),
     )
     
+    parser.add_argument(
+      "--prerender",
+      dest="prerender",
+      action="store_true",
+      help=(
+        "Render and validate SQL for all datasets before the first execution. "
+        "Rendering errors surface before any dataset runs; runtime placeholders "
+        "(load_run_id, DELTA_CUTOFF, ...) are still bound at execution time."
+      ),
+    )
+
+    parser.add_argument(
+      "--prerender-workers",
+      dest="prerender_workers",
+      type=int,
+      default=4,
+      help="Number of threads used by --prerender (default: 4).",
+    )
+
+    parser.add_argument(
+      "--skip-unchanged",
+      dest="skip_unchanged",
+      action="store_true",
+      help=(
+        "Skip datasets whose definition and upstream inputs are unchanged since their "
+        "last successful run (execute-mode only). Upstream runs with zero affected rows "
+        "count as unchanged; RAW and source-fed datasets always run."
+      ),
+    )
+
     parser.add_argument(
       "--no-plan-guard",
       action="store_true",
@@ -1355,6 +1416,106 @@ class Command(BaseCommand):
       ),
     )
 
+    parser.add_argument(
+      "--max-workers",
+      dest="max_workers",
+      type=int,
+      default=1,
+      help=(
+        "Execute independent datasets in parallel with up to N workers. "
+        "A dataset starts as soon as all of its upstream datasets have finished. "
+        "Each worker uses its own execution engine connection. 1 means: sequential."
+      ),
+    )
+
+    parser.add_argument(
+      "--coordinator",
+      dest="coordinator",
+      action="store_true",
+      help=(
+        "Distribute the batch: persist the plan into the load queue in the metadata database "
+        "and wait until `elevata_load --worker` processes have run all steps."
+      ),
+    )
+
+    parser.add_argument(
+      "--worker",
+      dest="worker",
+      action="store_true",
+      help="Run as queue worker: claim ready steps of coordinated batches and execute them.",
+    )
+
+    parser.add_argument(
+      "--worker-id",
+      dest="worker_id",
+      type=str,
+      default=None,
+      help="Worker identity stored with claimed steps (default: <host>:<pid>).",
+    )
+
+    parser.add_argument(
+      "--lease-seconds",
+      dest="lease_seconds",
+      type=int,
+      default=60,
+      help="Lease of a claimed queue step; steps without heartbeat for this long are re-queued (default: 60).",
+    )
+
+    parser.add_argument(
+      "--poll-seconds",
+      dest="poll_seconds",
+      type=float,
+      default=1.0,
+      help="Queue polling interval of coordinator and workers (default: 1.0).",
+    )
+
+    parser.add_argument(
+      "--queue-timeout",
+      dest="queue_timeout",
+      type=float,
+      default=None,
+      help=(
+        "Coordinator only: fail if the queued batch has not finished after this many seconds "
+        "(default: wait indefinitely)."
+      ),
+    )
+
+    parser.add_argument(
+      "--chunk-size",
+      dest="chunk_size",
+      type=int,
+      default=5000,
+      help="Rows per chunk for RAW ingestion (default: 5000). Coordinated batches pass it to workers.",
+    )
+
+    parser.add_argument(
+      "--exit-when-idle",
+      dest="exit_when_idle",
+      action="store_true",
+      help="Worker only: exit once no coordinated batch has pending or running steps.",
+    )
+
+    parser.add_argument(
+      "--schedule",
+      dest="schedule",
+      choices=("critical-path", "plan"),
+      default="critical-path",
+      help=(
+        "Dispatch order for ready datasets when --max-workers > 1. "
+        "'critical-path' starts the longest dependency chains first, based on historical "
+        "runtimes from meta.load_run_log (falls back to plan order without history). "
+        "'plan' always uses the deterministic plan order."
+      ),
+    )
+
+    parser.add_argument(
+      "--schedule-percentile",
+      dest="schedule_percentile",
+      choices=("p50", "p95"),
+      default="p50",
+      help="Historical runtime percentile used as step cost for --schedule critical-path.",
+    )
+
     parser.add_argument(
       "--debug-execution",
       dest="debug_execution",
@@ -1403,6 +1564,19 @@ class Command(BaseCommand):
       help="Baseline batch_run_id to diff against (loaded from meta.load_run_snapshot).",
     )
 
+    parser.add_argument(
+      "--resume",
+      dest="resume_batch_run_id",
+      type=str,
+      default=None,
+      metavar="BATCH_RUN_ID",
+      help=(
+        "Resume an executed batch: reload its plan and outcomes from meta.load_run_snapshot "
+        "and run only failed, blocked and aborted datasets plus their downstream. "
+        "Requires --execute; new log rows are written under the original batch_run_id."
+      ),
+    )
+
     parser.add_argument(
       "--debug-migration",
       action="store_true",
@@ -1436,6 +1610,139 @@ class Command(BaseCommand):
         "Please specify --schema to disambiguate."
       ) from exc
 
+  def _run_queue_worker(self, options: dict[str, Any]) -> None:
+    """
+    Worker mode: claim ready steps of coordinated batches and run them with
+    run_single_target_dataset(). Each batch carries the target system / dialect.
+    """
+    worker_id = str(options.get("worker_id") or f"{socket.gethostname()}:{os.getpid()}")
+    no_print = bool(options.get("no_print"))
+    profile = load_profile(None)
+    contexts: dict[tuple[str, str], tuple[Any, Any, Any]] = {}
+
+    batch_state: dict[str, tuple[Any, Any]] = {}
+
+    def _context(batch):
+      opts = batch.options or {}
+      key = (str(opts.get("target_system") or ""), str(opts.get("dialect") or ""))
+      if key not in contexts:
+        try:
+          system = get_target_system(key[0] or None)
+        except RuntimeError as exc:
+          raise CommandError(str(exc))
+        dialect = get_active_dialect(key[1] or None)
+        engine = dialect.get_execution_engine(system) if batch.execute else None
+        contexts[key] = (system, dialect, engine)
+      return contexts[key]
+
+    def _batch_state(batch):
+      """
+      MigrationPlan and plan guard computed by the coordinator, per batch.
+      """
+      if batch.batch_run_id not in batch_state:
+        opts = batch.options or {}
+        migration_plan = None
+        if opts.get("migration_plan") is not None:
+          migration_plan = MigrationPlan.from_dicts(opts["migration_plan"])
+        plan_guard = None
+        execution_ids = [int(x) for x in (opts.get("execution_ids") or [])]
+        if opts.get("plan_fingerprint") and execution_ids:
+          plan_guard = PlanGuard(
+            fingerprint_fn=lambda: _fingerprint_for_execution_ids(execution_ids),
+            token_fn=lambda: plan_guard_token_for_execution_ids(execution_ids),
+          )
+        batch_state[batch.batch_run_id] = (migration_plan, plan_guard)
+      return batch_state[batch.batch_run_id]
+
+    def _run_step_fn(step):
+      batch = step.batch
+      opts = batch.options or {}
+      system, dialect, engine = _context(batch)
+      migration_plan, plan_guard = _batch_state(batch)
+      td = TargetDataset.objects.select_related("target_schema").get(pk=step.target_dataset_id)
+
+      if not no_print:
+        self.stdout.write(f"[{worker_id}] {batch.batch_run_id} {step.dataset_key} (claim #{step.claim_no})")
+
+      def _run_dataset_fn(*, target_dataset, batch_run_id, load_run_id, load_plan_override, attempt_no):
+        # Same predictability guard as in-process execution, against the coordinator's fingerprint.
+        if plan_guard is not None:
+          current_fingerprint = plan_guard.current_fingerprint()
+          if current_fingerprint != opts.get("plan_fingerprint"):
+            ds = f"{target_dataset.target_schema.short_name}.{target_dataset.target_dataset_name}"
+            raise CommandError(
+              "Execution plan is stale: metadata/contract changed after plan creation. "
+              f"dataset={ds} expected_fingerprint={opts.get('plan_fingerprint')} "
+              f"current_fingerprint={current_fingerprint}"
+            )
+
+        return run_single_target_dataset(
+          stdout=self.stdout,
+          style=self.style,
+          target_dataset=target_dataset,
+          target_system=system,
+          target_system_engine=engine,
+          profile=profile,
+          dialect=dialect,
+          execute=batch.execute,
+          no_print=no_print,
+          debug_plan=False,
+          batch_run_id=batch_run_id,
+          load_run_id=load_run_id,
+          load_plan_override=load_plan_override,
+          chunk_size=int(opts.get("chunk_size") or 5000),
+          attempt_no=attempt_no,
+          no_type_changes=bool(opts.get("no_type_changes")),
+          fail_on_type_drift=bool(opts.get("fail_on_type_drift")),
+          allow_type_alter=bool(opts.get("allow_type_alter")),
+          migration_plan=migration_plan,
+        )
+
+      return run_queued_step(step, td=td, run_dataset_fn=_run_dataset_fn)
+
+    if not no_print:
+      self.stdout.write(self.style.NOTICE(f"Queue worker {worker_id} started."))
+    try:
+      processed = run_worker(
+        worker_id=worker_id,
+        run_step_fn=_run_step_fn,
+        lease_seconds=int(options.get("lease_seconds") or 60),
+        poll_seconds=float(options.get("poll_seconds") or 1.0),
+        exit_when_idle=bool(options.get("exit_when_idle")),
+      )
+    finally:
+      for _, _, engine in contexts.values():
+        close = getattr(engine, "close", None)
+        if callable(close):
+          close()
+      dispose_all_engines()
+
+    if not no_print:
+      self.stdout.write(self.style.NOTICE(f"Queue worker {worker_id} finished: {processed} step(s)."))
+
+  def _resolve_resume_datasets(self, state) -> list[TargetDataset]:
+    """
+    Resolve the TargetDatasets of a resumed batch plan, in plan order.
+    Every step must still exist under the same dataset key.
+    """
+    ids = [s.dataset_id for s in state.steps]
+    by_id = {
+      td.pk: td
+      for td in TargetDataset.objects.select_related("target_schema").filter(pk__in=ids)
+    }
+
+    out: list[TargetDataset] = []
+    for s in state.steps:
+      td = by_id.get(s.dataset_id)
+      key = f"{td.target_schema.short_name}.{td.target_dataset_name}" if td is not None else None
+      if key != s.dataset_key:
+        raise CommandError(
+          f"Cannot resume batch_run_id={state.batch_run_id}: dataset {s.dataset_key} "
+          "no longer exists or was renamed."
+        )
+      out.append(td)
+    return out
+
   def _validate_root_selection(
     self,
     *,
@@ -1523,6 +1830,12 @@ class Command(BaseCommand):
     no_deps: bool = bool(options.get("no_deps", False))
     continue_on_error: bool = bool(options.get("continue_on_error", False))
     max_retries: int = int(options.get("max_retries") or 0)
+    max_workers: int = int(options.get("max_workers") or 1)
+    schedule: str = str(options.get("schedule") or "critical-path")
+    schedule_percentile: str = str(options.get("schedule_percentile") or "p50")
+    prerender = bool(options.get("prerender"))
+    prerender_workers: int = int(options.get("prerender_workers") or 4)
+    skip_unchanged = bool(options.get("skip_unchanged"))
     no_plan_guard = bool(options.get("no_plan_guard"))
     no_type_changes = bool(options.get("no_type_changes"))
     fail_on_type_drift = bool(options.get("fail_on_type_drift"))
@@ -1533,6 +1846,11 @@ class Command(BaseCommand):
     diff_against_snapshot: str | None = options.get("diff_against_snapshot")
     diff_print: bool = bool(options.get("diff_print", False))
     diff_against_batch_run_id: str | None = options.get("diff_against_batch_run_id")
+    resume_batch_run_id: str | None = options.get("resume_batch_run_id")
+    coordinator = bool(options.get("coordinator"))
+    poll_seconds = float(options.get("poll_seconds") or 1.0)
+    queue_timeout = options.get("queue_timeout")
+    chunk_size: int = int(options.get("chunk_size") or 5000)
     debug_migration = bool(options.get("debug_migration", False))
 
     arch_mode = _get_arch_mode_env(default="off")
@@ -1544,18 +1862,44 @@ class Command(BaseCommand):
     batch_run_id = str(uuid.uuid4())
     created_at = now()
 
+    if options.get("worker"):
+      if target_name or all_datasets or coordinator:
+        raise CommandError("Invalid arguments: --worker takes no target_name, --all or --coordinator.")
+      self._run_queue_worker(options)
+      return
+
+    if coordinator:
+      for flag, value in (("--resume", resume_batch_run_id), ("--prerender", prerender), ("--skip-unchanged", skip_unchanged)):
+        if value:
+          raise CommandError(f"Invalid arguments: {flag} is not supported with --coordinator.")
+
     # 0) Validate selection
-    self._validate_root_selection(
-      target_name=target_name,
-      all_datasets=all_datasets,
-    )    
+    if resume_batch_run_id:
+      # The datasets of a resumed batch come from its snapshot.
+      if target_name or all_datasets:
+        raise CommandError("Invalid arguments: do not pass target_name or --all together with --resume.")
+      if not execute:
+        raise CommandError("Invalid arguments: --resume requires --execute.")
+    else:
+      self._validate_root_selection(
+        target_name=target_name,
+        all_datasets=all_datasets,
+      )
+
+    if max_workers < 1:
+      raise CommandError("Invalid arguments: --max-workers must be >= 1.")
+    if prerender_workers < 1:
+      raise CommandError("Invalid arguments: --prerender-workers must be >= 1.")
 
     # 1) Resolve root dataset(s)
     root_td = None
     roots: list[TargetDataset] = []
 
-    if all_datasets:
-      qs = TargetDataset.objects.all()
+    if resume_batch_run_id:
+      # Resolved from the batch snapshot once the engine is available.
+      pass
+    elif all_datasets:
+      qs = TargetDataset.objects.select_related("target_schema")
       # In --all mode, --schema scopes the root set (dependencies are still included).
       if schema_short:
         qs = qs.filter(target_schema__short_name=schema_short)
@@ -1590,13 +1934,62 @@ class Command(BaseCommand):
       engine = dialect.get_execution_engine(system)
 
     try:
+      # 4.1) Resume: reload plan + outcomes of the original batch.
+      resume_state = None
+      resume_succeeded_keys: set[str] = set()
+      resume_plan_tds: list[TargetDataset] = []
+      if resume_batch_run_id:
+        try:
+          resume_state = load_resume_state(
+            engine=engine,
+            dialect=dialect,
+            meta_schema=META_SCHEMA_NAME,
+            batch_run_id=str(resume_batch_run_id),
+          )
+        except ValueError as exc:
+          raise CommandError(f"Cannot resume batch_run_id={resume_batch_run_id}: {exc}") from exc
+        if resume_state is None:
+          raise CommandError(
+            f"Cannot resume: batch_run_id={resume_batch_run_id} not found in "
+            f"{META_SCHEMA_NAME}.load_run_snapshot."
+          )
+        # New log rows and the new snapshot belong to the original batch.
+        batch_run_id = resume_state.batch_run_id
+        resume_succeeded_keys = load_batch_succeeded_keys(
+          engine=engine,
+          dialect=dialect,
+          meta_schema=META_SCHEMA_NAME,
+          batch_run_id=batch_run_id,
+        )
+        resume_plan_tds = self._resolve_resume_datasets(resume_state)
+
       # 5) Resolve execution order
-      if all_datasets:
+      # --all planning uses a bulk-loaded graph index (constant number of queries)
+      # for both ordering and the execution plan's upstream keys.
+      graph_index = None
+      resume_keys: list[str] = []
+      if resume_state is not None:
+        resume_keys = compute_resume_keys(resume_state, resume_succeeded_keys)
+        keep = set(resume_keys)
+        execution_order = [
+          td for td in resume_plan_tds
+          if f"{td.target_schema.short_name}.{td.target_dataset_name}" in keep
+        ]
+        root_td = next(
+          (
+            td for td in resume_plan_tds
+            if f"{td.target_schema.short_name}.{td.target_dataset_name}" == resume_state.root_dataset_key
+          ),
+          resume_plan_tds[0],
+        )
+        roots = [root_td]
+      elif all_datasets:
+        graph_index = build_load_graph_index()
         if no_deps:
           # no_deps in --all means: run only the selected roots (no upstream expansion)
           execution_order = sorted(roots, key=lambda d: (d.target_schema.short_name, d.target_dataset_name))
         else:
-          execution_order = resolve_execution_order_all(roots)
+          execution_order = resolve_execution_order_all(roots, index=graph_index)
       else:
         if no_deps:
           execution_order = [root_td]
@@ -1608,9 +2001,10 @@ class Command(BaseCommand):
       # Predictability guard baseline:
       # If we have real DB-backed TargetDataset objects (pk present), re-check against DB.
       # If not (e.g. unit tests with DummyTD), fall back to an in-memory fingerprint.
+      # A resumed batch is fingerprinted over its full original plan.
       execution_ids = []
       missing_pk = False
-      for td in execution_order:
+      for td in (resume_plan_tds if resume_state is not None else execution_order):
         pk = getattr(td, "pk", None)
         if pk is None:
           missing_pk = True
@@ -1618,20 +2012,49 @@ class Command(BaseCommand):
         execution_ids.append(int(pk))
 
       plan_fingerprint = None
+      plan_guard = None
       use_db_fingerprint = (not missing_pk)
 
       if not no_plan_guard:
+        # Per-step checks only evaluate a cheap change token (one aggregate query);
+        # the full fingerprint is recomputed only when the token has moved.
         if use_db_fingerprint:
-          plan_fingerprint = _fingerprint_for_execution_ids(execution_ids)
+          plan_guard = PlanGuard(
+            fingerprint_fn=lambda: _fingerprint_for_execution_ids(execution_ids),
+            token_fn=lambda: plan_guard_token_for_execution_ids(execution_ids),
+          )
         else:
-          plan_fingerprint = _compute_execution_plan_fingerprint(execution_order)
+          plan_guard = PlanGuard(
+            fingerprint_fn=lambda: _compute_execution_plan_fingerprint(execution_order),
+          )
+        plan_fingerprint = plan_guard.fingerprint
+
+      if resume_state is not None and not no_plan_guard:
+        if not resume_state.plan_fingerprint:
+          raise CommandError(
+            f"Cannot resume batch_run_id={batch_run_id}: its snapshot has no plan fingerprint. "
+            "Use --no-plan-guard to resume without verification."
+          )
+        if resume_state.plan_fingerprint != plan_fingerprint:
+          raise CommandError(
+            f"Cannot resume batch_run_id={batch_run_id}: metadata/contract changed since the batch ran. "
+            f"expected_fingerprint={resume_state.plan_fingerprint} current_fingerprint={plan_fingerprint}"
+          )
 
       policy = ExecutionPolicy(
         continue_on_error=continue_on_error,
         max_retries=max_retries,
+        max_workers=max_workers,
       )      
 
-      plan = build_execution_plan(batch_run_id=batch_run_id, execution_order=execution_order)
+      if resume_state is not None:
+        plan = build_resume_plan(resume_state, resume_keys)
+      else:
+        plan = build_execution_plan(
+          batch_run_id=batch_run_id,
+          execution_order=execution_order,
+          graph_index=graph_index,
+        )
 
       # 6) Print plan
       self._print_execution_plan(
@@ -1642,6 +2065,18 @@ class Command(BaseCommand):
         no_print=no_print,
       )
 
+      if resume_state is not None and not no_print:
+        done_count = len(resume_state.steps) - len(resume_keys)
+        self.stdout.write(self.style.NOTICE(
+          f"Resuming batch_run_id={batch_run_id} (resume #{resume_state.resume_no + 1}): "
+          f"{len(resume_keys)} of {len(resume_state.steps)} dataset(s) to run, {done_count} already done."
+        ))
+
+      if resume_state is not None and not resume_keys:
+        if not no_print:
+          self.stdout.write(self.style.SUCCESS("Nothing to resume: all datasets of the batch succeeded."))
+        return
+
       if not no_print:
         if no_plan_guard:
           self.stdout.write(self.style.WARNING("Execution plan guard DISABLED (--no-plan-guard)."))
@@ -1696,14 +2131,34 @@ class Command(BaseCommand):
       )
 
       # 8) Execute datasets in order and collect summary
+      # Parallel workers must not share one driver connection: each worker thread
+      # lazily opens its own execution engine and closes it when the worker exits.
+      worker_state = threading.local()
+
+      def _engine_for_current_worker():
+        if engine is None or max_workers <= 1:
+          return engine
+        worker_engine = getattr(worker_state, "engine", None)
+        if worker_engine is None:
+          worker_engine = dialect.get_execution_engine(system)
+          worker_state.engine = worker_engine
+        return worker_engine
+
+      def _worker_teardown_fn() -> None:
+        worker_engine = getattr(worker_state, "engine", None)
+        worker_state.engine = None
+        if worker_engine is not None:
+          close = getattr(worker_engine, "close", None)
+          if callable(close):
+            close()
+        # Worker threads get their own Django DB connections; release them as well.
+        connections.close_all()
+
       def _run_dataset_fn(*, target_dataset, batch_run_id, load_run_id, load_plan_override, attempt_no):
 
         # Predictability guard: detect metadata/contract drift after plan creation.
-        if not no_plan_guard:
-          if use_db_fingerprint:
-            current_fingerprint = _fingerprint_for_execution_ids(execution_ids)
-          else:
-            current_fingerprint = _compute_execution_plan_fingerprint(execution_order)
+        if plan_guard is not None:
+          current_fingerprint = plan_guard.current_fingerprint()
 
           if current_fingerprint != plan_fingerprint:
             ds = f"{target_dataset.target_schema.short_name}.{target_dataset.target_dataset_name}"
@@ -1712,12 +2167,41 @@ class Command(BaseCommand):
               f"dataset={ds} expected_fingerprint={plan_fingerprint} current_fingerprint={current_fingerprint}"
             )
 
-        return run_single_target_dataset(
+        dataset_key = f"{target_dataset.target_schema.short_name}.{target_dataset.target_dataset_name}"
+        step = step_by_key.get(dataset_key)
+        prerendered_sql = getattr(step, "rendered_sql", None)
+        watermark_check = None
+        if watermark_tracker is not None:
+          try:
+            watermark_check = watermark_tracker.evaluate(
+              dataset_key=dataset_key,
+              upstream_keys=upstream_keys_by_key.get(dataset_key, ()),
+              definition_fingerprint_fn=lambda: compute_definition_fingerprint(
+                prerendered_sql if prerendered_sql is not None
+                else render_sql_cached(target_dataset, dialect, kind="load", render_fn=render_load_sql_for_target)
+              ),
+            )
+          except Exception:
+            # Rendering problems surface in the regular run below.
+            watermark_check = None
+
+          if watermark_check is not None and watermark_check.unchanged:
+            return {
+              "status": "skipped",
+              "kind": "unchanged",
+              "dataset": dataset_key,
+              "message": "inputs_unchanged",
+              "status_reason": "inputs_unchanged",
+              "load_run_id": load_run_id or str(uuid.uuid4()),
+              "attempt_no": attempt_no,
+            }
+
+        result = run_single_target_dataset(
           stdout=self.stdout,
           style=self.style,
           target_dataset=target_dataset,
           target_system=system,
-          target_system_engine=engine,
+          target_system_engine=_engine_for_current_worker(),
           profile=profile,
           dialect=dialect,
           execute=execute,
@@ -1727,13 +2211,45 @@ class Command(BaseCommand):
           batch_run_id=batch_run_id,
           load_run_id=load_run_id,
           load_plan_override=load_plan_override,
-          chunk_size=5000,
+          chunk_size=chunk_size,
           attempt_no=attempt_no,
           no_type_changes=no_type_changes,
           fail_on_type_drift=fail_on_type_drift,
           allow_type_alter=allow_type_alter,
           migration_plan=migration_plan,
+          prerendered_sql=prerendered_sql,
+          prerender_ms=getattr(step, "render_ms", None),
         )
+
+        if watermark_tracker is not None and (result or {}).get("status") == "success":
+          watermark_tracker.record_run(
+            dataset_key=dataset_key,
+            rows_affected=result.get("rows_affected"),
+            load_run_id=result.get("load_run_id"),
+            mode=(result.get("summary") or {}).get("mode"),
+          )
+          if watermark_check is not None and watermark_check.watermark:
+            # Best-effort: a missing watermark only means the dataset runs next time.
+            try:
+              row = build_load_watermark_row(
+                dataset_key=dataset_key,
+                check=watermark_check,
+                batch_run_id=batch_run_id,
+                load_run_id=str(result.get("load_run_id") or load_run_id or ""),
+                created_at=now(),
+              )
+              sql = dialect.render_insert_load_watermark(meta_schema=META_SCHEMA_NAME, values=row)
+              if sql:
+                _engine_for_current_worker().execute(sql)
+              watermark_tracker.record_watermark(dataset_key=dataset_key, watermark=watermark_check.watermark)
+            except Exception as exc:
+              logger.warning(
+                "Could not record load watermark for %s (it will run again next time): %s",
+                dataset_key,
+                exc,
+              )
+
+        return result
  
       # --- Architecture State (best effort, scope-aware) ---
       arch_service = None
@@ -2144,10 +2660,6 @@ class Command(BaseCommand):
                   "Set ELEVATA_ARCH_MODE=compare to inspect details without blocking."
                 )
 
-              dispose = getattr(target_sa_engine, "dispose", None)
-              if callable(dispose):
-                dispose()
-
             else:
               self.stdout.write(self.style.NOTICE("-- SHADOW compare (schema ops): (no actions to compare)"))
 
@@ -2162,17 +2674,154 @@ class Command(BaseCommand):
 
       # -----------------------------------------------------
 
-      results, had_error = execute_plan(
-        plan=plan,
-        execution_order=execution_order,
-        policy=policy,
-        execute=bool(execute),
-        root_td=root_td,
-        root_load_run_id=root_load_run_id,
-        root_load_plan=root_load_plan,
-        run_dataset_fn=_run_dataset_fn,
-        logger=logger,
-      )
+      # Cost-aware scheduling only matters when several steps can be ready at once.
+      priority_by_key = None
+      if max_workers > 1 and schedule == "critical-path" and engine is not None:
+        runtime_stats = load_runtime_stats(
+          engine=engine,
+          dialect=dialect,
+          meta_schema=META_SCHEMA_NAME,
+        )
+        priority_by_key = compute_critical_path_weights(
+          plan=plan,
+          runtime_stats=runtime_stats,
+          percentile=schedule_percentile,
+        ) or None
+
+        if not no_print:
+          if priority_by_key:
+            covered = sum(1 for st in plan.steps if st.dataset_key in runtime_stats)
+            self.stdout.write(self.style.NOTICE(
+              f"Schedule: critical-path ({schedule_percentile}, history for {covered}/{len(plan.steps)} datasets)"
+            ))
+          else:
+            self.stdout.write(self.style.NOTICE("Schedule: plan order (no runtime history)"))
+
+      # Data-aware skipping: one read of change markers + stored watermarks per batch.
+      watermark_tracker = None
+      upstream_keys_by_key = {st.dataset_key: st.upstream_keys for st in plan.steps}
+      if skip_unchanged:
+        if execute and engine is not None:
+          ensure_load_watermark_table(
+            engine=engine,
+            dialect=dialect,
+            meta_schema=META_SCHEMA_NAME,
+            auto_provision=AUTO_PROVISION_META_LOG,
+          )
+          watermark_keys = set(upstream_keys_by_key)
+          for ups in upstream_keys_by_key.values():
+            watermark_keys.update(ups)
+          watermark_tracker = InputWatermarkTracker.load(
+            engine=engine,
+            dialect=dialect,
+            meta_schema=META_SCHEMA_NAME,
+            dataset_keys=sorted(watermark_keys),
+          )
+          if watermark_tracker is None and not no_print:
+            self.stdout.write(self.style.WARNING(
+              f"--skip-unchanged: load history not readable from {META_SCHEMA_NAME}.load_run_log; running all datasets."
+            ))
+        elif not no_print:
+          self.stdout.write(self.style.WARNING("--skip-unchanged has no effect without --execute."))
+
+      # Pre-render phase: render + validate all SQL steps before the first execution.
+      if prerender:
+        def _should_prerender(td) -> bool:
+          return td.target_schema.short_name != "raw"
+
+        def _validate_prerendered(td, sql: str) -> None:
+          # Same execute-mode guards as run_single_target_dataset, applied up front.
+          if not execute:
+            return
+          ds = f"{td.target_schema.short_name}.{td.target_dataset_name}"
+          if _is_comment_only_sql(sql):
+            raise CommandError(f"Non-executable SQL was rendered for {ds}.")
+          if _looks_like_cross_system_sql(sql, td.target_schema.schema_name):
+            raise CommandError(f"SQL for {ds} references objects outside the allowed target schemas.")
+
+        prerender_started_ts = time.perf_counter()
+        prerendered = prerender_plan(
+          plan=plan,
+          execution_order=execution_order,
+          render_fn=lambda td: render_sql_cached(td, dialect, kind="load", render_fn=render_load_sql_for_target),
+          should_render_fn=_should_prerender,
+          validate_fn=_validate_prerendered,
+          max_workers=prerender_workers,
+          worker_teardown_fn=connections.close_all,
+        )
+        attach_prerendered_sql(plan, prerendered)
+        prerender_errors = sorted(
+          (r for r in prerendered.values() if r.error is not None),
+          key=lambda r: r.dataset_key,
+        )
+
+        if not no_print:
+          self.stdout.write(self.style.NOTICE(
+            f"Pre-render: {len(prerendered)} dataset(s) in "
+            f"{(time.perf_counter() - prerender_started_ts) * 1000.0:.1f} ms "
+            f"({len(prerender_errors)} failed, workers={prerender_workers})"
+          ))
+          for r in prerender_errors:
+            self.stdout.write(self.style.WARNING(f"   ! {r.dataset_key}: {r.error}"))
+
+        # Fail-fast: stop before anything runs. With --continue-on-error the failed
+        # steps re-render at their turn and fail with regular error semantics.
+        if prerender_errors and not continue_on_error:
+          first = prerender_errors[0]
+          raise CommandError(
+            f"Pre-render failed for {len(prerender_errors)} dataset(s); nothing was executed. "
+            f"First failure: {first.dataset_key}: {first.error}"
+          )
+
+      step_by_key = {st.dataset_key: st for st in plan.steps}
+
+      if coordinator:
+        # Workers rebuild their runner context from these options.
+        queue_batch = enqueue_plan(
+          plan=plan,
+          policy=policy,
+          execute=bool(execute),
+          options={
+            "target_system": system.short_name,
+            "dialect": dialect_name,
+            "no_type_changes": no_type_changes,
+            "fail_on_type_drift": fail_on_type_drift,
+            "allow_type_alter": allow_type_alter,
+            "chunk_size": chunk_size,
+            # Workers cannot re-derive these: the architecture state is persisted
+            # only after the batch, and the guard must compare against plan time.
+            "migration_plan": (migration_plan.to_dicts() if migration_plan is not None else None),
+            "plan_fingerprint": (plan_fingerprint if plan_guard is not None and use_db_fingerprint else None),
+            "execution_ids": (list(execution_ids) if plan_guard is not None and use_db_fingerprint else []),
+          },
+        )
+        if not no_print:
+          self.stdout.write(self.style.NOTICE(
+            f"Coordinator: queued {len(plan.steps)} step(s) for batch_run_id={batch_run_id}; "
+            "waiting for elevata_load --worker processes."
+          ))
+        try:
+          results, had_error = wait_for_batch(
+            queue_batch,
+            poll_seconds=poll_seconds,
+            timeout_seconds=(float(queue_timeout) if queue_timeout else None),
+          )
+        except TimeoutError as exc:
+          raise CommandError(f"{exc}. Are elevata_load --worker processes running?")
+      else:
+        results, had_error = execute_plan(
+          plan=plan,
+          execution_order=execution_order,
+          policy=policy,
+          execute=bool(execute),
+          root_td=root_td,
+          root_load_run_id=root_load_run_id,
+          root_load_plan=root_load_plan,
+          run_dataset_fn=_run_dataset_fn,
+          logger=logger,
+          worker_teardown_fn=_worker_teardown_fn,
+          priority_by_key=priority_by_key,
+        )
 
       # --- persist architecture state (best effort) ---
       # Default: persist only after a successful execute-run.
@@ -2194,10 +2843,18 @@ class Command(BaseCommand):
       # 8.0) Build + persist load_run_snapshot (best-effort)
       root_dataset_key = f"{root_td.target_schema.short_name}.{root_td.target_dataset_name}"
 
+      # A resumed batch snapshot covers the full original plan, so a later
+      # --resume sees the merged outcomes.
+      snapshot_plan = plan
+      snapshot_results = results
+      if resume_state is not None:
+        snapshot_plan = ExecutionPlan(batch_run_id=batch_run_id, steps=list(resume_state.steps))
+        snapshot_results = merge_resume_results(resume_state, results, resume_succeeded_keys)
+
       snapshot = build_execution_snapshot(
         batch_run_id=batch_run_id,
         policy=policy,
-        plan=plan,
+        plan=snapshot_plan,
         execute=bool(execute),
         no_deps=bool(no_deps),
         continue_on_error=bool(continue_on_error),
@@ -2208,8 +2865,10 @@ class Command(BaseCommand):
         dialect_name=dialect.__class__.__name__,
         root_dataset_key=root_dataset_key,
         created_at=created_at,
-        results=results,
+        results=snapshot_results,
         had_error=had_error,
+        plan_fingerprint=plan_fingerprint,
+        resume_no=(resume_state.resume_no + 1) if resume_state is not None else 0,
       )
 
       if debug_execution and not no_print:
@@ -2251,7 +2910,7 @@ class Command(BaseCommand):
             continue_on_error=bool(continue_on_error),
             max_retries=int(max_retries),
             had_error=bool(had_error),
-            step_count=len(plan.steps),
+            step_count=len(snapshot_plan.steps),
             snapshot_json=snapshot_json,
           )
 
@@ -2320,7 +2979,7 @@ class Command(BaseCommand):
         except Exception:
           pass
 
-      # 8.1) Persist orchestration-only outcomes (blocked/aborted) to meta.load_run_log
+      # 8.1) Persist orchestration-only outcomes (blocked/aborted/unchanged) to meta.load_run_log
       # Best-effort: must never block the load runner.
       if execute and engine is not None and hasattr(dialect, "render_insert_load_run_log"):
         try:
@@ -2334,7 +2993,7 @@ class Command(BaseCommand):
           for r in results:
             if r.get("status") != "skipped":
               continue
-            if r.get("kind") not in ("blocked", "aborted"):
+            if r.get("kind") not in ("blocked", "aborted", "unchanged"):
               continue
 
             ds = str(r.get("dataset") or "")
@@ -2529,3 +3188,5 @@ class Command(BaseCommand):
         close = getattr(engine, "close", None)
         if callable(close):
           close()
+      # Release pooled SQLAlchemy engines (source extraction, introspection).
+      dispose_all_engines()
@@ -78,7 +78,7 @@ LOAD_RUN_LOG_REGISTRY = {
   "run_kind": {
     "datatype": "string",
     "nullable": False,
-    "description": "Run category (sql / ingestion / orchestration)",
+    "description": "Run category (sql / ingestion / ingestion_partition / orchestration)",
   },
   "source_system": {
     "datatype": "string",
@@ -247,6 +247,44 @@ LOAD_RUN_SNAPSHOT_REGISTRY = {
   },
 }
 
+LOAD_WATERMARK_REGISTRY = {
+  "dataset_key": {
+    "datatype": "string",
+    "nullable": False,
+    "description": "Dataset this watermark belongs to (schema.dataset)",
+  },
+  "watermark": {
+    "datatype": "string",
+    "nullable": False,
+    "description": "Hash over the dataset definition and its upstream input state",
+  },
+  "definition_fingerprint": {
+    "datatype": "string",
+    "nullable": False,
+    "description": "Fingerprint of the rendered load SQL at the time of the run",
+  },
+  "inputs_json": {
+    "datatype": "string",
+    "nullable": False,
+    "description": "Upstream dataset_key -> last data-changing load_run_id (JSON)",
+  },
+  "batch_run_id": {
+    "datatype": "string",
+    "nullable": False,
+    "description": "Batch that recorded this watermark",
+  },
+  "load_run_id": {
+    "datatype": "string",
+    "nullable": False,
+    "description": "Successful dataset run that recorded this watermark",
+  },
+  "created_at": {
+    "datatype": "timestamp",
+    "nullable": False,
+    "description": "Watermark creation timestamp",
+  },
+}
+
 # Stable column order for CREATE/INSERT.
 LOAD_RUN_LOG_COLUMNS = list(LOAD_RUN_LOG_REGISTRY.keys())
 
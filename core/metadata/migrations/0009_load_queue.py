@@ -0,0 +1,58 @@
+# Generated by Django 5.2.18 on 2026-10-16 20:18
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('metadata', '0008_alter_sourcedatasetownership_table_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='LoadQueueBatch',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('batch_run_id', models.CharField(help_text='Batch run id of the coordinating elevata_load invocation.', max_length=64, unique=True)),
+                ('execute', models.BooleanField(default=False, help_text='Whether workers execute the SQL (False: dry run).')),
+                ('continue_on_error', models.BooleanField(default=False)),
+                ('max_retries', models.PositiveIntegerField(default=0)),
+                ('options', models.JSONField(blank=True, default=dict, help_text='Runner options workers need to run a step (target system, dialect, drift flags).')),
+                ('finished_at', models.DateTimeField(blank=True, db_index=True, help_text='Set by the coordinator once every step reached a terminal status.', null=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True, db_index=True)),
+            ],
+            options={
+                'verbose_name_plural': 'Load Queue Batches',
+                'db_table': 'load_queue_batch',
+                'ordering': ['created_at'],
+            },
+        ),
+        migrations.CreateModel(
+            name='LoadQueueStep',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('dataset_key', models.CharField(max_length=200)),
+                ('seq', models.PositiveIntegerField(help_text='Position in the execution plan; workers claim ready steps in this order.')),
+                ('upstream_keys', models.JSONField(blank=True, default=list)),
+                ('status', models.CharField(choices=[('pending', 'Pending'), ('running', 'Running'), ('success', 'Success'), ('dry_run', 'Dry run'), ('error', 'Error'), ('blocked', 'Blocked'), ('skipped', 'Skipped')], db_index=True, default='pending', max_length=20)),
+                ('is_error', models.BooleanField(default=False)),
+                ('claim_no', models.PositiveIntegerField(default=0, help_text='Number of times the step was claimed (lost leases are claimed again).')),
+                ('worker_id', models.CharField(blank=True, max_length=200, null=True)),
+                ('lease_expires_at', models.DateTimeField(blank=True, db_index=True, null=True)),
+                ('heartbeat_at', models.DateTimeField(blank=True, null=True)),
+                ('started_at', models.DateTimeField(blank=True, null=True)),
+                ('finished_at', models.DateTimeField(blank=True, null=True)),
+                ('result', models.JSONField(blank=True, null=True)),
+                ('batch', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='steps', to='metadata.loadqueuebatch')),
+                ('target_dataset', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='metadata.targetdataset')),
+            ],
+            options={
+                'verbose_name_plural': 'Load Queue Steps',
+                'db_table': 'load_queue_step',
+                'ordering': ['batch', 'seq'],
+                'constraints': [models.UniqueConstraint(fields=('batch', 'dataset_key'), name='unique_load_queue_step_dataset')],
+            },
+        ),
+    ]
@@ -2655,3 +2655,75 @@ class TargetDatasetReferenceComponent(AuditFields):
         ref.sync_child_fk_column()
     except Exception:
       pass
+
+# -------------------------------------------------------------------
+# LoadQueueBatch / LoadQueueStep (distributed elevata_load)
+# -------------------------------------------------------------------
+class LoadQueueStatus(models.TextChoices):
+  PENDING = "pending", "Pending"
+  RUNNING = "running", "Running"
+  SUCCESS = "success", "Success"
+  DRY_RUN = "dry_run", "Dry run"
+  ERROR = "error", "Error"
+  BLOCKED = "blocked", "Blocked"
+  SKIPPED = "skipped", "Skipped"
+
+
+class LoadQueueBatch(models.Model):
+  batch_run_id = models.CharField(max_length=64, unique=True,
+    help_text="Batch run id of the coordinating elevata_load invocation."
+  )
+  execute = models.BooleanField(default=False,
+    help_text="Whether workers execute the SQL (False: dry run)."
+  )
+  continue_on_error = models.BooleanField(default=False)
+  max_retries = models.PositiveIntegerField(default=0)
+  options = models.JSONField(default=dict, blank=True,
+    help_text="Runner options workers need to run a step (target system, dialect, drift flags)."
+  )
+  finished_at = models.DateTimeField(null=True, blank=True, db_index=True,
+    help_text="Set by the coordinator once every step reached a terminal status."
+  )
+  created_at = models.DateTimeField(auto_now_add=True, db_index=True)
+
+  class Meta:
+    db_table = "load_queue_batch"
+    ordering = ["created_at"]
+    verbose_name_plural = "Load Queue Batches"
+
+  def __str__(self):
+    return self.batch_run_id
+
+
+class LoadQueueStep(models.Model):
+  batch = models.ForeignKey(LoadQueueBatch, on_delete=models.CASCADE, related_name="steps")
+  target_dataset = models.ForeignKey(TargetDataset, on_delete=models.CASCADE, related_name="+")
+  dataset_key = models.CharField(max_length=200)
+  seq = models.PositiveIntegerField(
+    help_text="Position in the execution plan; workers claim ready steps in this order."
+  )
+  upstream_keys = models.JSONField(default=list, blank=True)
+  status = models.CharField(max_length=20, choices=LoadQueueStatus.choices,
+    default=LoadQueueStatus.PENDING, db_index=True
+  )
+  is_error = models.BooleanField(default=False)
+  claim_no = models.PositiveIntegerField(default=0,
+    help_text="Number of times the step was claimed (lost leases are claimed again)."
+  )
+  worker_id = models.CharField(max_length=200, blank=True, null=True)
+  lease_expires_at = models.DateTimeField(null=True, blank=True, db_index=True)
+  heartbeat_at = models.DateTimeField(null=True, blank=True)
+  started_at = models.DateTimeField(null=True, blank=True)
+  finished_at = models.DateTimeField(null=True, blank=True)
+  result = models.JSONField(null=True, blank=True)
+
+  class Meta:
+    db_table = "load_queue_step"
+    constraints = [
+      models.UniqueConstraint(fields=["batch", "dataset_key"], name="unique_load_queue_step_dataset")
+    ]
+    ordering = ["batch", "seq"]
+    verbose_name_plural = "Load Queue Steps"
+
+  def __str__(self):
+    return f"{self.batch.batch_run_id}:{self.dataset_key} ({self.status})"
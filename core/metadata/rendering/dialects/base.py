@@ -23,6 +23,7 @@ Contact: <https://github.com/elevata-labs/elevata>.
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from contextlib import contextmanager
 from dataclasses import dataclass
 from typing import Sequence, Any, Dict, Optional
 
@@ -47,7 +48,7 @@ from ..expr import (
 from ..logical_plan import Join, LogicalSelect, LogicalUnion, SelectItem, SourceTable, SubquerySource
 
 from metadata.system.introspection import read_table_metadata
-from metadata.materialization.logging import LOAD_RUN_SNAPSHOT_REGISTRY
+from metadata.materialization.logging import LOAD_RUN_SNAPSHOT_REGISTRY, LOAD_WATERMARK_REGISTRY
 
 
 class BaseExecutionEngine:
@@ -74,6 +75,57 @@ class BaseExecutionEngine:
     Engines should override if they support fetching results.
     """
     raise NotImplementedError
+
+  def bulk_load(
+    self,
+    *,
+    schema: str,
+    table: str,
+    columns: list[str],
+    rows,
+    column_types: dict | None = None,
+  ) -> int:
+    """
+    Optional: load an iterable of parameter tuples (target column order) through the
+    platform's native bulk path and return the number of rows loaded.
+    column_types optionally maps column name -> TargetColumn type info
+    (datatype, max_length, decimal_precision, decimal_scale).
+    Engines should override if their dialect advertises supports_bulk_load.
+    """
+    raise NotImplementedError
+
+  def load_arrow(self, *, schema: str, table: str, columns: list[str], data) -> int | None:
+    """
+    Optional: append an Arrow table / record batch (column names = columns) to a table.
+    Engines should override if their dialect advertises supports_arrow_load.
+    """
+    raise NotImplementedError
+
+  @contextmanager
+  def _transaction(self):
+    """
+    Check out a pooled connection (self._pool) and commit on success or roll
+    back on error.
+    """
+    with self._pool.connection() as conn:
+      try:
+        yield conn
+        conn.commit()
+      except Exception:
+        try:
+          conn.rollback()
+        except Exception:
+          # Broken session: the pool health check discards it.
+          pass
+        raise
+
+  def close(self) -> None:
+    """
+    Release pooled connections. Safe to call repeatedly; the engine stays usable.
+    """
+    pool = getattr(self, "_pool", None)
+    if pool is not None:
+      pool.close()
   
 
 class SqlDialect(ABC):
@@ -135,6 +187,23 @@ class SqlDialect(ABC):
     # Dialects must explicitly opt in by overriding this property.
     return False
 
+  @property
+  def supports_bulk_load(self) -> bool:
+    """
+    Whether the execution engine provides a native bulk path (engine.bulk_load)
+    for RAW landing instead of execute_many().
+    """
+    # Dialects must explicitly opt in by overriding this property.
+    return False
+
+  @property
+  def supports_arrow_load(self) -> bool:
+    """
+    Whether the execution engine accepts Arrow data natively (engine.load_arrow).
+    """
+    # Dialects must explicitly opt in by overriding this property.
+    return False
+
   def get_execution_engine(self, system) -> "BaseExecutionEngine":
     raise NotImplementedError(
       f"{self.__class__.__name__} does not provide an execution engine."
@@ -1051,6 +1120,30 @@ class SqlDialect(ABC):
 
     return sql
 
+  def render_insert_load_watermark(self, *, meta_schema: str, values: dict[str, object]) -> str:
+    """
+    Generic INSERT for meta.load_watermark using registry-order columns.
+    """
+    tbl = self.render_table_identifier(meta_schema, "load_watermark")
+    cols = list(LOAD_WATERMARK_REGISTRY.keys())
+
+    col_sql = ",\n        ".join(self.render_identifier(c) for c in cols)
+    val_sql = ",\n        ".join(
+      self._literal_for_meta_insert(table="load_watermark", column=c, value=values.get(c))
+      for c in cols
+    )
+
+    sql = f"""
+      INSERT INTO {tbl} (
+        {col_sql}
+      )
+      VALUES (
+        {val_sql}
+      );
+    """.strip()
+
+    return sql
+
   def param_placeholder(self) -> str:
     """
     Placeholder for parameterized SQL statements used by the dialect's execution engine.
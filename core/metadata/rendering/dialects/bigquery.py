@@ -22,6 +22,10 @@ Contact: <https://github.com/elevata-labs/elevata>.
 
 from __future__ import annotations
 
+import base64
+from concurrent.futures import ThreadPoolExecutor
+import io
+import json
 import os
 import time
 from typing import Any
@@ -36,6 +40,7 @@ except ImportError as exc:
   bigquery = None
 
 from .base import SqlDialect
+from .bulk_load import arrow_column_types, iter_row_batches, rows_to_arrow
 
 from metadata.rendering.expr import Expr, FuncCall
 from metadata.rendering.logical_plan import LogicalUnion
@@ -53,13 +58,27 @@ class BigQueryExecutionEngine:
   Exposes:
     - execute(sql: str) -> rows_affected | None
     - execute_many(insert_sql: str, params: list[tuple]) -> int
+    - bulk_load(...) -> int (load jobs, used for RAW landing)
   """
 
-  def __init__(self, client: bigquery.Client, *, location: str = "EU"):
+  # Rows per load job in bulk_load.
+  bulk_load_batch_rows = 100_000
+
+  def __init__(
+    self,
+    client: bigquery.Client,
+    *,
+    location: str = "EU",
+    load_format: str = "ndjson",
+    load_parallelism: int = 1,
+  ):
     self.client = client
     self.location = location
     # Default project used by insert_rows_json when table_id is not fully qualified.
     self.project_id = getattr(client, "project", None)
+    # bulk_load: "ndjson" or "parquet", and how many load jobs may run at once.
+    self.load_format = (load_format or "ndjson").strip().lower()
+    self.load_parallelism = max(1, int(load_parallelism or 1))
 
   def execute(self, sql: str) -> int | None:
     job = self.client.query(sql, location=self.location)
@@ -209,6 +228,114 @@ class BigQueryExecutionEngine:
 
     return len(rows)
 
+  def bulk_load(
+    self,
+    *,
+    schema: str,
+    table: str,
+    columns: list[str],
+    rows,
+    column_types: dict | None = None,
+  ) -> int:
+    """
+    Append rows with load jobs (load_table_from_file) instead of streaming inserts.
+
+    Rows are serialized in chunks of bulk_load_batch_rows to newline-delimited
+    JSON (or Parquet) in memory; up to load_parallelism jobs run at once.
+    Chunked landing feeds one call per dataset through a BulkLoadSession, so a
+    dataset costs ceil(rows / bulk_load_batch_rows) load jobs of the table quota.
+    Column names come from the caller (dataset metadata), not from SQL text.
+    Parquet chunks are typed from column_types (TIMESTAMP as UTC, DECIMAL as NUMERIC).
+    """
+    table_id = self._qualify_table_id(f"{schema}.{table}")
+    columns = list(columns)
+    types = None
+    if self.load_format == "parquet":
+      import pyarrow as pa
+
+      types = arrow_column_types(columns, column_types, timestamp_tz="UTC")
+      if types:
+        # DECIMAL is always rendered as NUMERIC (38 digits, 9 decimal places).
+        types = [pa.decimal128(38, 9) if t is not None and pa.types.is_decimal(t) else t for t in types]
+
+    total = 0
+    with ThreadPoolExecutor(max_workers=self.load_parallelism) as pool:
+      pending = []
+      for batch in iter_row_batches(rows, self.bulk_load_batch_rows):
+        pending.append(pool.submit(self._run_load_job, table_id, columns, batch, types))
+        # Bound memory: at most load_parallelism serialized chunks in flight.
+        if len(pending) >= self.load_parallelism:
+          total += pending.pop(0).result()
+      for fut in pending:
+        total += fut.result()
+    return total
+
+  def _load_json_value(self, v: Any) -> Any:
+    if isinstance(v, (bytes, bytearray, memoryview)):
+      # BYTES columns expect base64 in JSON loads
+      return base64.b64encode(bytes(v)).decode("ascii")
+    if isinstance(v, (dict, list)):
+      return json.dumps(v, ensure_ascii=False, default=str)
+    return self._jsonify_value(v)
+
+  def _serialize_load_chunk(
+    self,
+    columns: list[str],
+    batch: list[tuple],
+    types: list | None = None,
+  ) -> tuple[io.BytesIO, str]:
+    """
+    Serialize one chunk for a load job. Returns (buffer, BigQuery source format).
+    Parquet uses the given Arrow types (see arrow_column_types) and infers the
+    rest; it falls back to NDJSON when Arrow cannot convert a column.
+    """
+    if self.load_format == "parquet":
+      import pyarrow as pa
+      import pyarrow.parquet as pq
+
+      try:
+        data = rows_to_arrow(batch, columns, types=types)
+      except (pa.ArrowInvalid, pa.ArrowTypeError):
+        data = None
+
+      if data is not None:
+        # All-NULL columns have no Parquet type; omitted columns load as NULL.
+        keep = [f.name for f in data.schema if not pa.types.is_null(f.type)]
+        buf = io.BytesIO()
+        pq.write_table(data.select(keep), buf)
+        buf.seek(0)
+        return buf, "PARQUET"
+
+    buf = io.BytesIO()
+    for row in batch:
+      rec = {c: self._load_json_value(v) for c, v in zip(columns, row)}
+      buf.write(json.dumps(rec, ensure_ascii=False, default=str).encode("utf-8"))
+      buf.write(b"\n")
+    buf.seek(0)
+    return buf, "NEWLINE_DELIMITED_JSON"
+
+  def _run_load_job(
+    self,
+    table_id: str,
+    columns: list[str],
+    batch: list[tuple],
+    types: list | None = None,
+  ) -> int:
+    buf, source_format = self._serialize_load_chunk(columns, batch, types)
+    job_config = bigquery.LoadJobConfig(
+      source_format=source_format,
+      write_disposition="WRITE_APPEND",
+    )
+    job = self.client.load_table_from_file(
+      buf,
+      table_id,
+      job_config=job_config,
+      location=self.location,
+    )
+    job.result()
+    output_rows = getattr(job, "output_rows", None)
+    return int(output_rows) if output_rows is not None else len(batch)
+
   def execute_scalar(self, sql: str):
     """
     Execute a SELECT returning a single value (first column of first row).
@@ -268,6 +395,11 @@ class BigQueryDialect(SqlDialect):
     """BigQuery supports delete detection via DELETE + NOT EXISTS."""
     return True
 
+  @property
+  def supports_bulk_load(self) -> bool:
+    """RAW landing uses load jobs instead of streaming inserts."""
+    return True
+
   def get_execution_engine(self, system) -> BigQueryExecutionEngine:
     """
     Create a BigQuery execution engine.
@@ -293,8 +425,18 @@ class BigQueryDialect(SqlDialect):
       )
       
     location = os.getenv("GOOGLE_BIGQUERY_LOCATION", "EU").strip() or "EU"
+    load_format = os.getenv("ELEVATA_BIGQUERY_LOAD_FORMAT", "ndjson").strip() or "ndjson"
+    try:
+      load_parallelism = int(os.getenv("ELEVATA_BIGQUERY_LOAD_PARALLELISM", "1"))
+    except ValueError:
+      load_parallelism = 1
     client = bigquery.Client(project=project)
-    return BigQueryExecutionEngine(client, location=location)
+    return BigQueryExecutionEngine(
+      client,
+      location=location,
+      load_format=load_format,
+      load_parallelism=load_parallelism,
+    )
 
   # ---------------------------------------------------------------------------
   # 2. Identifier & quoting
@@ -0,0 +1,312 @@
+"""
+elevata - Metadata-driven Data Platform Framework
+Copyright © 2026 Ilona Tag
+
+This file is part of elevata.
+
+elevata is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as
+published by the Free Software Foundation, either version 3 of
+the License, or (at your option) any later version.
+
+elevata is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with elevata. If not, see <https://www.gnu.org/licenses/>.
+
+Contact: <https://github.com/elevata-labs/elevata>.
+"""
+
+from __future__ import annotations
+
+from datetime import date, datetime, time
+from decimal import Decimal
+import json
+import uuid
+from typing import Any, Iterable
+
+
+# Shared helpers for engine bulk-load paths (engine.bulk_load).
+# Rows arrive as parameter tuples in target column order (same shape as
+# execute_many); engines stream them to the platform's native loader.
+
+def iter_row_batches(rows: Iterable, size: int):
+  """
+  Group an iterable of rows into lists of at most size rows.
+  """
+  size = max(1, int(size or 1))
+  batch: list = []
+  for row in rows:
+    batch.append(tuple(row))
+    if len(batch) >= size:
+      yield batch
+      batch = []
+  if batch:
+    yield batch
+
+
+def rows_to_arrow(rows: list, columns: list[str], types: list | None = None):
+  """
+  Build an Arrow table from parameter tuples. Column types are inferred unless
+  given in types (one Arrow type or None per column, see arrow_column_types).
+  Raises pyarrow.ArrowInvalid / ArrowTypeError if a column mixes incompatible types.
+  """
+  import pyarrow as pa
+
+  types = list(types) if types else [None] * len(columns)
+  if not rows:
+    return pa.table({c: pa.nulls(0, t) for c, t in zip(columns, types)})
+  arrays = [pa.array(list(values), type=t) for values, t in zip(zip(*rows), types)]
+  return pa.Table.from_arrays(arrays, names=list(columns))
+
+
+def arrow_column_types(
+  columns: list[str],
+  column_types: dict | None,
+  *,
+  decimal_default: tuple[int, int] = (38, 10),
+  timestamp_tz: str | None = None,
+) -> list | None:
+  """
+  Fixed Arrow types per column from canonical TargetColumn types, so every file
+  of a staged load has the same schema. Columns without (or with unmappable)
+  type info get None (inferred). Returns None if no column has type info.
+  timestamp_tz makes TIMESTAMP columns timezone-aware (naive values are taken as
+  that zone), for loaders that read naive Parquet timestamps as DATETIME.
+  """
+  if not column_types:
+    return None
+
+  import pyarrow as pa
+
+  simple = {
+    "STRING": pa.string(),
+    "JSON": pa.string(),
+    "UUID": pa.string(),
+    "INTEGER": pa.int64(),
+    "BIGINT": pa.int64(),
+    "FLOAT": pa.float64(),
+    "BOOLEAN": pa.bool_(),
+    "DATE": pa.date32(),
+    "TIMESTAMP": pa.timestamp("us", tz=timestamp_tz),
+    "BINARY": pa.binary(),
+  }
+
+  out = []
+  for name in columns:
+    info = column_types.get(name) or {}
+    t = str(info.get("datatype") or "").upper()
+    if t == "DECIMAL":
+      precision = int(info.get("decimal_precision") or decimal_default[0])
+      scale = info.get("decimal_scale")
+      scale = int(scale) if scale is not None else (0 if info.get("decimal_precision") else decimal_default[1])
+      out.append(pa.decimal128(precision, scale))
+    else:
+      out.append(simple.get(t))
+  return out if any(t is not None for t in out) else None
+
+
+def csv_field(value: Any, *, bytes_prefix: str = "") -> str:
+  """
+  Render one value as a CSV field for COPY-style loaders.
+
+  NULL is an unquoted empty field; every other value is quoted, so an empty
+  string stays distinguishable from NULL.
+  """
+  if value is None:
+    return ""
+  if isinstance(value, bool):
+    text = "true" if value else "false"
+  elif isinstance(value, datetime):
+    text = value.isoformat(sep=" ")
+  elif isinstance(value, (date, time)):
+    text = value.isoformat()
+  elif isinstance(value, (bytes, bytearray, memoryview)):
+    text = bytes_prefix + bytes(value).hex()
+  elif isinstance(value, (dict, list)):
+    text = json.dumps(value, ensure_ascii=False, default=str)
+  elif isinstance(value, (int, float, Decimal)):
+    text = str(value)
+  else:
+    text = str(value)
+  return '"' + text.replace('"', '""') + '"'
+
+
+def csv_line(row, *, bytes_prefix: str = "") -> str:
+  return ",".join(csv_field(v, bytes_prefix=bytes_prefix) for v in row) + "\n"
+
+
+class CsvRowStream:
+  """
+  Read-only file-like object producing CSV bytes from an iterable of rows on demand.
+
+  Only what the loader requests (plus one row) is buffered, so arbitrarily
+  large row streams can be passed to COPY ... FROM STDIN.
+  """
+
+  def __init__(self, rows: Iterable, *, bytes_prefix: str = "", encoding: str = "utf-8"):
+    self._rows = iter(rows)
+    self._bytes_prefix = bytes_prefix
+    self._encoding = encoding
+    self._buf = bytearray()
+    self._done = False
+    self.rows = 0
+
+  def _fill(self, size: int) -> None:
+    while not self._done and (size < 0 or len(self._buf) < size):
+      try:
+        row = next(self._rows)
+      except StopIteration:
+        self._done = True
+        break
+      self._buf.extend(csv_line(row, bytes_prefix=self._bytes_prefix).encode(self._encoding))
+      self.rows += 1
+
+  def read(self, size: int = -1) -> bytes:
+    self._fill(size)
+    if size < 0 or size >= len(self._buf):
+      out = bytes(self._buf)
+      self._buf.clear()
+      return out
+    out = bytes(self._buf[:size])
+    del self._buf[:size]
+    return out
+
+
+def iter_csv_gzip_files(rows: Iterable, directory: str, *, rows_per_file: int, bytes_prefix: str = ""):
+  """
+  Write rows as gzip-compressed CSV files (csv_line encoding) of at most
+  rows_per_file rows into directory. Yields (path, row_count) per finished file,
+  so the caller can upload and delete it before the next one is written.
+  """
+  import gzip
+  import os
+
+  for i, batch in enumerate(iter_row_batches(rows, rows_per_file)):
+    path = os.path.join(directory, f"part_{i:05d}.csv.gz")
+    with gzip.open(path, "wb", compresslevel=6) as fh:
+      for row in batch:
+        fh.write(csv_line(row, bytes_prefix=bytes_prefix).encode("utf-8"))
+    yield path, len(batch)
+
+
+# T-SQL (SQL Server / Fabric Warehouse) via pyodbc
+
+_ODBC_TYPES = {
+  # canonical -> (pyodbc constant, default size, default decimal digits)
+  "INTEGER": ("SQL_INTEGER", 0, 0),
+  "BIGINT": ("SQL_BIGINT", 0, 0),
+  "FLOAT": ("SQL_DOUBLE", 0, 0),
+  "BOOLEAN": ("SQL_BIT", 0, 0),
+  "DATE": ("SQL_TYPE_DATE", 10, 0),
+  "TIME": ("SQL_SS_TIME2", 16, 7),
+  "TIMESTAMP": ("SQL_TYPE_TIMESTAMP", 27, 7),
+  "BINARY": ("SQL_VARBINARY", 0, 0),
+}
+
+
+def odbc_input_sizes(pyodbc, columns: list[str], column_types: dict | None, *, unicode: bool = True):
+  """
+  Derive pyodbc setinputsizes() entries from canonical TargetColumn types.
+
+  column_types maps column name -> {"datatype", "max_length", "decimal_precision",
+  "decimal_scale"}. Columns without type info (or types the driver module does
+  not know) get None, i.e. the driver describes them itself. Returns None if no
+  column has type info.
+  """
+  if not column_types:
+    return None
+
+  def _const(name):
+    return getattr(pyodbc, name, None)
+
+  sizes = []
+  for name in columns:
+    info = column_types.get(name) or {}
+    t = str(info.get("datatype") or "").upper()
+    max_length = info.get("max_length") or 0
+    char_type = "SQL_WVARCHAR" if unicode else "SQL_VARCHAR"
+
+    if t == "STRING":
+      # Size 0 makes fast_executemany send the column as data-at-execution;
+      # without a length the driver describes the column itself.
+      spec = (_const(char_type), int(max_length), 0) if max_length else None
+    elif t == "JSON":
+      spec = (_const(char_type), 0, 0)
+    elif t == "UUID":
+      spec = (_const("SQL_GUID"), 16, 0) if unicode else (_const("SQL_VARCHAR"), 36, 0)
+    elif t == "DECIMAL":
+      precision = info.get("decimal_precision")
+      scale = info.get("decimal_scale")
+      if precision:
+        spec = (_const("SQL_DECIMAL"), int(precision), int(scale or 0))
+      else:
+        spec = (_const("SQL_DECIMAL"), 38, 10)
+    elif t == "BINARY":
+      spec = (_const("SQL_VARBINARY"), int(max_length), 0) if max_length else None
+    elif t in _ODBC_TYPES:
+      const_name, size, digits = _ODBC_TYPES[t]
+      spec = (_const(const_name), size, digits)
+    else:
+      spec = None
+
+    sizes.append(spec if spec is not None and spec[0] is not None else None)
+
+  return sizes if any(s is not None for s in sizes) else None
+
+
+def tsql_bulk_insert(
+  conn,
+  *,
+  target: str,
+  columns: list[str],
+  rows: Iterable,
+  render_identifier,
+  input_sizes=None,
+  batch_rows: int = 10_000,
+  tablock: bool = False,
+) -> int:
+  """
+  Insert rows on a pyodbc connection with fast_executemany in batches of batch_rows.
+
+  With tablock, batches go to a session temp heap (#table, same columns as the
+  target) first; one INSERT ... WITH (TABLOCK) SELECT then moves them into the
+  target, which SQL Server can log minimally. The caller owns the transaction.
+  Returns the number of rows sent.
+  """
+  cols = ", ".join(render_identifier(c) for c in columns)
+  placeholders = ", ".join(["?"] * len(columns))
+
+  cursor = conn.cursor()
+  cursor.fast_executemany = True
+
+  heap = None
+  insert_into = target
+  if tablock:
+    heap = f"#elevata_bulk_{uuid.uuid4().hex[:12]}"
+    cursor.execute(f"SELECT TOP 0 {cols} INTO {heap} FROM {target}")
+    insert_into = heap
+
+  total = 0
+  try:
+    if input_sizes:
+      cursor.setinputsizes(input_sizes)
+    insert_sql = f"INSERT INTO {insert_into} ({cols}) VALUES ({placeholders})"
+    for batch in iter_row_batches(rows, batch_rows):
+      cursor.executemany(insert_sql, batch)
+      total += len(batch)
+
+    if heap:
+      cursor.execute(f"INSERT INTO {target} WITH (TABLOCK) ({cols}) SELECT {cols} FROM {heap}")
+  finally:
+    if heap:
+      try:
+        cursor.execute(f"DROP TABLE {heap}")
+      except Exception:
+        # Session temp tables also disappear when the connection closes.
+        pass
+
+  return total
@@ -0,0 +1,250 @@
+"""
+elevata - Metadata-driven Data Platform Framework
+Copyright © 2026 Ilona Tag
+
+This file is part of elevata.
+
+elevata is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as
+published by the Free Software Foundation, either version 3 of
+the License, or (at your option) any later version.
+
+elevata is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with elevata. If not, see <https://www.gnu.org/licenses/>.
+
+Contact: <https://github.com/elevata-labs/elevata>.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass
+import threading
+import time
+from typing import Any, Callable, Iterator
+
+
+# Pooled driver sessions for dialect execution engines.
+# One dataset load issues dozens of small statements (schema ensure, introspection,
+# log inserts, DDL, load SQL); reusing connections keeps connection setup and
+# authentication (Snowflake, Databricks) out of that path.
+#
+# A thread checks out one connection and keeps it for nested calls (e.g.
+# execute_scalar -> fetch_all); different threads never share a connection.
+
+DEFAULT_POOL_SIZE = 4
+DEFAULT_HEALTH_CHECK_SECONDS = 30.0
+DEFAULT_MAX_IDLE_SECONDS = 300.0
+DEFAULT_CHECKOUT_TIMEOUT_SECONDS = 300.0
+
+
+@dataclass
+class PoolConfig:
+  max_size: int = DEFAULT_POOL_SIZE
+  health_check_seconds: float = DEFAULT_HEALTH_CHECK_SECONDS
+  max_idle_seconds: float = DEFAULT_MAX_IDLE_SECONDS
+  checkout_timeout_seconds: float = DEFAULT_CHECKOUT_TIMEOUT_SECONDS
+
+
+def pool_config_from_settings(security: dict | None = None) -> PoolConfig:
+  """
+  Pool configuration from Django settings (ELEVATA_ENGINE_POOL_*), optionally
+  overridden per target system via security["pool_size"].
+  """
+  try:
+    from django.conf import settings
+    size = int(getattr(settings, "ELEVATA_ENGINE_POOL_SIZE", DEFAULT_POOL_SIZE))
+    health = float(getattr(settings, "ELEVATA_ENGINE_POOL_HEALTH_CHECK_SECONDS", DEFAULT_HEALTH_CHECK_SECONDS))
+    idle = float(getattr(settings, "ELEVATA_ENGINE_POOL_MAX_IDLE_SECONDS", DEFAULT_MAX_IDLE_SECONDS))
+  except Exception:
+    # Settings not configured (plain library use): keep defaults.
+    size, health, idle = DEFAULT_POOL_SIZE, DEFAULT_HEALTH_CHECK_SECONDS, DEFAULT_MAX_IDLE_SECONDS
+
+  if isinstance(security, dict) and security.get("pool_size"):
+    try:
+      size = int(security["pool_size"])
+    except (TypeError, ValueError):
+      pass
+
+  return PoolConfig(max_size=max(1, size), health_check_seconds=health, max_idle_seconds=idle)
+
+
+def select_one_health_check(conn) -> None:
+  """
+  Default health check for DB-API connections. Raises if the session is unusable.
+  """
+  cur = conn.cursor()
+  try:
+    cur.execute("SELECT 1")
+    cur.fetchall()
+  finally:
+    try:
+      cur.close()
+    except Exception:
+      pass
+  # Without autocommit the probe opened a transaction: end it, so the idle
+  # connection is not "idle in transaction" until its next checkout.
+  # Drivers without transactions (e.g. Databricks) may reject rollback().
+  rollback = getattr(conn, "rollback", None)
+  if callable(rollback):
+    try:
+      rollback()
+    except Exception:
+      pass
+
+
+def _close_quietly(conn) -> None:
+  try:
+    conn.close()
+  except Exception:
+    pass
+
+
+@dataclass
+class _PooledConnection:
+  conn: Any
+  last_used_at: float
+  last_checked_at: float
+
+
+class ConnectionPool:
+  """
+  Thread-safe pool of driver connections with per-thread checkout.
+
+  - At most max_size connections are open at a time; checkout blocks when all are in use.
+  - Idle connections older than max_idle_seconds are closed instead of reused.
+  - Idle connections are health-checked before reuse every health_check_seconds,
+    and always after a checkout ended with an exception.
+  """
+
+  def __init__(
+    self,
+    connect_fn: Callable[[], Any],
+    *,
+    config: PoolConfig | None = None,
+    health_check_fn: Callable[[Any], None] | None = select_one_health_check,
+  ):
+    self._connect_fn = connect_fn
+    self.config = config or PoolConfig()
+    self._health_check_fn = health_check_fn
+    self._idle: deque[_PooledConnection] = deque()
+    self._open = 0
+    self._cond = threading.Condition()
+    self._local = threading.local()
+
+  @property
+  def open_count(self) -> int:
+    return self._open
+
+  @property
+  def idle_count(self) -> int:
+    return len(self._idle)
+
+  def _is_healthy(self, pooled: _PooledConnection) -> bool:
+    if self._health_check_fn is None:
+      return True
+    try:
+      self._health_check_fn(pooled.conn)
+      pooled.last_checked_at = time.monotonic()
+      return True
+    except Exception:
+      return False
+
+  def _discard(self, pooled: _PooledConnection) -> None:
+    _close_quietly(pooled.conn)
+    with self._cond:
+      self._open -= 1
+      self._cond.notify()
+
+  def _acquire(self) -> _PooledConnection:
+    deadline = time.monotonic() + float(self.config.checkout_timeout_seconds)
+    while True:
+      reuse = None
+      with self._cond:
+        if self._idle:
+          reuse = self._idle.pop()
+        elif self._open < self.config.max_size:
+          self._open += 1
+        else:
+          remaining = deadline - time.monotonic()
+          if remaining <= 0:
+            raise TimeoutError(f"no pooled connection available within {self.config.checkout_timeout_seconds}s")
+          self._cond.wait(remaining)
+          continue
+
+      if reuse is None:
+        try:
+          conn = self._connect_fn()
+        except Exception:
+          with self._cond:
+            self._open -= 1
+            self._cond.notify()
+          raise
+        now_ts = time.monotonic()
+        return _PooledConnection(conn=conn, last_used_at=now_ts, last_checked_at=now_ts)
+
+      now_ts = time.monotonic()
+      if now_ts - reuse.last_used_at > float(self.config.max_idle_seconds):
+        self._discard(reuse)
+        continue
+      if now_ts - reuse.last_checked_at > float(self.config.health_check_seconds) and not self._is_healthy(reuse):
+        self._discard(reuse)
+        continue
+      return reuse
+
+  def _release(self, pooled: _PooledConnection, *, failed: bool) -> None:
+    if failed and not self._is_healthy(pooled):
+      self._discard(pooled)
+      return
+    pooled.last_used_at = time.monotonic()
+    with self._cond:
+      self._idle.append(pooled)
+      self._cond.notify()
+
+  @contextmanager
+  def connection(self) -> Iterator[Any]:
+    """
+    Check out a connection for the current thread. Nested checkouts in the same
+    thread reuse the outer connection.
+    """
+    held = getattr(self._local, "held", None)
+    if held is not None:
+      self._local.depth += 1
+      try:
+        yield held.conn
+      finally:
+        self._local.depth -= 1
+      return
+
+    pooled = self._acquire()
+    self._local.held = pooled
+    self._local.depth = 1
+    failed = False
+    try:
+      yield pooled.conn
+    except BaseException:
+      failed = True
+      raise
+    finally:
+      self._local.held = None
+      self._local.depth = 0
+      self._release(pooled, failed=failed)
+
+  def close(self) -> None:
+    """
+    Close all idle connections (batch end). Connections still checked out return
+    to the pool as usual; a later checkout simply opens a new connection.
+    """
+    with self._cond:
+      idle = list(self._idle)
+      self._idle.clear()
+      self._open -= len(idle)
+      self._cond.notify_all()
+    for pooled in idle:
+      _close_quietly(pooled.conn)
@@ -25,11 +25,20 @@ from __future__ import annotations
 from datetime import date, datetime
 from decimal import Decimal
 from typing import Sequence
+import functools
+import itertools
 import json
+import os
+from pathlib import Path
 import re
+import tempfile
 import unicodedata
+import uuid
+import weakref
 
 from .base import BaseExecutionEngine, SqlDialect
+from .bulk_load import arrow_column_types, iter_row_batches, rows_to_arrow
+from .connection_pool import ConnectionPool, pool_config_from_settings
 from metadata.ingestion.types_map import (
   STRING, INTEGER, BIGINT, DECIMAL, FLOAT, BOOLEAN, DATE, TIME, TIMESTAMP, BINARY, UUID, JSON,
   canonicalize_type,
@@ -54,8 +63,16 @@ class DatabricksExecutionEngine(BaseExecutionEngine):
     - "hostname" (alias for server_hostname)
     - "token" (alias for access_token)
   Additionally, elevata generic secret fields are supported (host/database/password/extra/schema).
+
+  Optional "bulk_stage_path" (a Unity Catalog Volume directory, e.g.
+  "/Volumes/main/landing/elevata") enables Parquet staging + COPY INTO in bulk_load.
   """
 
+  # Rows per staged Parquet file in bulk_load.
+  bulk_load_file_rows = 100_000
+  # Loads with fewer rows (or without a stage path) use the multi-row INSERT rewrite.
+  bulk_load_min_rows = 1_000
+
   def __init__(self, system):
     security = getattr(system, "security", None) or {}
     if not isinstance(security, dict):
@@ -130,6 +147,50 @@ class DatabricksExecutionEngine(BaseExecutionEngine):
       raise ValueError(
         "Databricks system.security must contain server_hostname/hostname, http_path, access_token/token."
       )
+
+    bulk_stage_path = security.get("bulk_stage_path")
+    if not bulk_stage_path and isinstance(security.get("extra"), dict):
+      bulk_stage_path = security["extra"].get("bulk_stage_path")
+    self.bulk_stage_path = str(bulk_stage_path or "").rstrip("/") or None
+
+    # The connect callable must not reference the engine, or the finalizer never runs.
+    connect = functools.partial(
+      self._connect,
+      server_hostname=self.server_hostname,
+      http_path=self.http_path,
+      access_token=self.access_token,
+      catalog=self.catalog,
+      staging=bool(self.bulk_stage_path),
+    )
+    self._pool = ConnectionPool(connect, config=pool_config_from_settings(security))
+    weakref.finalize(self, self._pool.close)
+
+  @staticmethod
+  def _connect(*, server_hostname, http_path, access_token, catalog=None, staging=False):
+    try:
+      from databricks import sql as dbsql
+    except Exception as exc:
+      raise ImportError(
+        "Missing dependency for Databricks execution. Install 'databricks-sql-connector'."
+      ) from exc
+
+    kwargs = {}
+    if staging:
+      # PUT into a Volume may only read local files below this path.
+      kwargs["staging_allowed_local_path"] = tempfile.gettempdir()
+
+    conn = dbsql.connect(
+      server_hostname=server_hostname,
+      http_path=http_path,
+      access_token=access_token,
+      **kwargs,
+    )
+    # Unity Catalog: set the catalog context once per pooled session.
+    # Do NOT set schema (elevata switches schemas).
+    if catalog:
+      with conn.cursor() as cur:
+        cur.execute(f"USE CATALOG {catalog}")
+    return conn
     
     
   def _sanitize_sql(self, sql: str) -> str:
@@ -240,23 +301,8 @@ class DatabricksExecutionEngine(BaseExecutionEngine):
 
 
   def execute(self, sql: str) -> int | None:
-    try:
-      from databricks import sql as dbsql
-    except Exception as exc:
-      raise ImportError(
-        "Missing dependency for Databricks execution. Install 'databricks-sql-connector'."
-      ) from exc
-
-    with dbsql.connect(
-      server_hostname=self.server_hostname,
-      http_path=self.http_path,
-      access_token=self.access_token,
-    ) as conn:
+    with self._pool.connection() as conn:
       with conn.cursor() as cur:
-        # Unity Catalog: ensure correct catalog context. Do NOT set schema (elevata switches schemas).
-        if self.catalog:
-          cur.execute(f"USE CATALOG {self.catalog}")
-
         # Normalize Databricks-specific quirks (e.g. ';' inside multi-row VALUES lists)
         sql = self._sanitize_sql(sql)
 
@@ -279,13 +325,6 @@ class DatabricksExecutionEngine(BaseExecutionEngine):
 
 
   def execute_many(self, sql: str, params_seq) -> int | None:
-    try:
-      from databricks import sql as dbsql
-    except Exception as exc:
-      raise ImportError(
-        "Missing dependency for Databricks execution. Install 'databricks-sql-connector'."
-      ) from exc
-    
     # ------------------------------------------------------------------
     # Databricks optimization:
     # The SQL connector's executemany() often results in one INSERT per row.
@@ -328,15 +367,8 @@ class DatabricksExecutionEngine(BaseExecutionEngine):
         # Fallback to default behavior if rewrite fails for any reason.
         pass
 
-    with dbsql.connect(
-      server_hostname=self.server_hostname,
-      http_path=self.http_path,
-      access_token=self.access_token,
-    ) as conn:
+    with self._pool.connection() as conn:
       with conn.cursor() as cur:
-        # Unity Catalog: ensure correct catalog context. Do NOT set schema (elevata switches schemas).
-        if self.catalog:
-          cur.execute(f"USE CATALOG {self.catalog}")
         sql = self._sanitize_sql(sql)
         if len(params_seq) == 1:
           cur.execute(sql, params_seq[0])
@@ -348,23 +380,87 @@ class DatabricksExecutionEngine(BaseExecutionEngine):
           return None
 
 
-  def fetch_all(self, sql: str) -> list[tuple]:
-    try:
-      from databricks import sql as dbsql
-    except Exception as exc:
-      raise ImportError(
-        "Missing dependency for Databricks execution. Install 'databricks-sql-connector'."
-      ) from exc
+  def bulk_load(
+    self,
+    *,
+    schema: str,
+    table: str,
+    columns: list[str],
+    rows,
+    column_types: dict | None = None,
+  ) -> int:
+    """
+    Stage rows as Parquet files in the configured Volume (PUT) and load them with
+    one COPY INTO per call, selecting the target columns explicitly.
 
-    with dbsql.connect(
-      server_hostname=self.server_hostname,
-      http_path=self.http_path,
-      access_token=self.access_token,
-    ) as conn:
+    Without bulk_stage_path, for fewer than bulk_load_min_rows rows, and for
+    batches Arrow cannot type, rows go through the multi-row INSERT rewrite of
+    execute_many in chunks of bulk_load_min_rows. Chunked landing feeds one call
+    per dataset through a BulkLoadSession, so the threshold applies per dataset.
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    dialect = DatabricksDialect()
+    target = dialect.render_table_identifier(schema, table)
+    cols = ", ".join(dialect.render_identifier(c) for c in columns)
+    placeholders = ", ".join([dialect.param_placeholder()] * len(columns))
+    insert_sql = f"INSERT INTO {target} ({cols}) VALUES ({placeholders})"
+
+    def _insert(batch) -> int:
+      n = 0
+      for chunk in iter_row_batches(batch, self.bulk_load_min_rows):
+        self.execute_many(insert_sql, chunk)
+        n += len(chunk)
+      return n
+
+    it = iter(rows)
+    head = list(itertools.islice(it, self.bulk_load_min_rows))
+    if not self.bulk_stage_path or len(head) < self.bulk_load_min_rows:
+      return _insert(itertools.chain(head, it))
+
+    load_dir = f"{self.bulk_stage_path}/elevata_{uuid.uuid4().hex}"
+    types = arrow_column_types(columns, column_types, decimal_default=(38, 0))
+    staged: list[str] = []
+    total = 0
+
+    # One checkout for the whole load: nested execute() calls reuse the session.
+    with self._pool.connection():
+      try:
+        with tempfile.TemporaryDirectory(prefix="elevata_dbx_") as tmp:
+          batches = iter_row_batches(itertools.chain(head, it), self.bulk_load_file_rows)
+          for i, batch in enumerate(batches):
+            try:
+              data = rows_to_arrow(batch, columns, types=types)
+            except (pa.ArrowInvalid, pa.ArrowTypeError):
+              total += _insert(batch)
+              continue
+
+            local_path = os.path.join(tmp, f"part_{i:05d}.parquet")
+            pq.write_table(data, local_path)
+            remote_path = f"{load_dir}/part_{i:05d}.parquet"
+            # Forward slashes: backslashes in the SQL literal would be read as escapes (Windows).
+            self.execute(f"PUT '{Path(local_path).as_posix()}' INTO '{remote_path}' OVERWRITE")
+            os.remove(local_path)
+            staged.append(remote_path)
+            total += len(batch)
+
+        if staged:
+          self.execute(
+            f"COPY INTO {target} FROM (SELECT {cols} FROM '{load_dir}') FILEFORMAT = PARQUET"
+          )
+      finally:
+        for remote_path in staged:
+          try:
+            self.execute(f"REMOVE '{remote_path}'")
+          except Exception:
+            pass
+
+    return total
+
+  def fetch_all(self, sql: str) -> list[tuple]:
+    with self._pool.connection() as conn:
       with conn.cursor() as cur:
-        # Unity Catalog: ensure correct catalog context (same as execute/execute_many).
-        if self.catalog:
-          cur.execute(f"USE CATALOG {self.catalog}")
         cur.execute(sql)
         rows = cur.fetchall()
         return [tuple(r) for r in (rows or [])]
@@ -402,6 +498,11 @@ class DatabricksDialect(SqlDialect):
   def supports_delete_detection(self) -> bool:
     return True
 
+  @property
+  def supports_bulk_load(self) -> bool:
+    """RAW landing stages Parquet in a Volume and loads it with COPY INTO."""
+    return True
+
   def get_execution_engine(self, system) -> BaseExecutionEngine:
     return DatabricksExecutionEngine(system)
 
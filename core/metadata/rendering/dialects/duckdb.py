@@ -24,12 +24,15 @@ from __future__ import annotations
 
 from typing import Any, Dict, Optional
 import re
+import threading
+import uuid
 try:
   import duckdb
 except ModuleNotFoundError as e:
   duckdb = None
 
 from .base import SqlDialect, BaseExecutionEngine
+from .bulk_load import iter_row_batches, rows_to_arrow
 from metadata.ingestion.types_map import (
   STRING, INTEGER, BIGINT, DECIMAL, FLOAT, BOOLEAN, DATE, TIME, TIMESTAMP, BINARY, UUID, JSON
 )
@@ -37,6 +40,10 @@ from metadata.materialization.logging import LOAD_RUN_LOG_REGISTRY
 from metadata.rendering.dialects.keywords.duckdb import RESERVED_KEYWORDS as DUCKDB_RESERVED_KEYWORDS
 
 
+def _quote(name: str) -> str:
+  return '"' + str(name).replace('"', '""') + '"'
+
+
 class DuckDbExecutionEngine(BaseExecutionEngine):
   """
   Execution engine for DuckDB based on the target system's security configuration.
@@ -56,6 +63,9 @@ class DuckDbExecutionEngine(BaseExecutionEngine):
   The engine extracts the database path and connects via duckdb.connect(path).
   """
 
+  # Rows per Arrow batch registered by bulk_load.
+  bulk_load_batch_rows = 100_000
+
   def __init__(self, system):
     self.system = system
     security = getattr(system, "security", None)
@@ -97,16 +107,40 @@ class DuckDbExecutionEngine(BaseExecutionEngine):
 
     self._database = db_path
     self._conn = None
+    self._conn_lock = threading.Lock()
+    # Per-thread read cursors on the shared connection (DuckDB connections are not thread-safe).
+    self._read_local = threading.local()
+    self._read_cursors: list = []
 
   def _get_conn(self):
     # Reuse one connection per engine instance to avoid DuckDB "different configuration"
     # errors when multiple connects happen against the same database file in one run.
     if self._conn is None:
-      self._conn = duckdb.connect(self._database)
+      with self._conn_lock:
+        if self._conn is None:
+          self._conn = duckdb.connect(self._database)
     return self._conn
 
+  def _read_cursor(self):
+    conn = self._get_conn()
+    cur = getattr(self._read_local, "cursor", None)
+    if cur is None or getattr(self._read_local, "conn", None) is not conn:
+      cur = conn.cursor()
+      self._read_local.cursor = cur
+      self._read_local.conn = conn
+      with self._conn_lock:
+        self._read_cursors.append(cur)
+    return cur
+
   def close(self) -> None:
     # Allow callers to close the underlying connection deterministically.
+    with self._conn_lock:
+      cursors, self._read_cursors = self._read_cursors, []
+    for cur in cursors:
+      try:
+        cur.close()
+      except Exception:
+        pass
     if self._conn is not None:
       try:
         self._conn.close()
@@ -151,14 +185,63 @@ class DuckDbExecutionEngine(BaseExecutionEngine):
     # DuckDB doesn't always provide rowcount reliably; return None is OK
     return None
 
-  def fetch_all(self, sql: str, params=None):
-    conn = duckdb.connect(self._database)
+  def bulk_load(
+    self,
+    *,
+    schema: str,
+    table: str,
+    columns: list[str],
+    rows,
+    column_types: dict | None = None,
+  ) -> int:
+    """
+    Load rows as Arrow batches: each batch is registered and appended with one
+    INSERT ... SELECT. Batches Arrow cannot type (a column mixing incompatible
+    Python types) fall back to executemany.
+    """
+    import pyarrow as pa
+
+    total = 0
+    for batch in iter_row_batches(rows, self.bulk_load_batch_rows):
+      try:
+        data = rows_to_arrow(batch, columns)
+      except (pa.ArrowInvalid, pa.ArrowTypeError):
+        data = None
+
+      if data is not None:
+        self.load_arrow(schema=schema, table=table, columns=columns, data=data)
+      else:
+        cols = ", ".join(_quote(c) for c in columns)
+        placeholders = ", ".join(["?"] * len(columns))
+        self.execute_many(f"INSERT INTO {_quote(schema)}.{_quote(table)} ({cols}) VALUES ({placeholders})", batch)
+      total += len(batch)
+    return total
+
+  def load_arrow(self, *, schema: str, table: str, columns: list[str], data) -> int | None:
+    """
+    Append Arrow data by registering it as a view and running one INSERT ... SELECT.
+    """
+    con = self._get_conn()
+    view = f"elevata_arrow_{uuid.uuid4().hex}"
+    cols = ", ".join(_quote(c) for c in columns)
+    con.register(view, data)
     try:
-      if params:
-        return conn.execute(sql, params).fetchall()
-      return conn.execute(sql).fetchall()
+      con.execute(f"INSERT INTO {_quote(schema)}.{_quote(table)} ({cols}) SELECT {cols} FROM {_quote(view)}")
+      try:
+        con.commit()
+      except Exception:
+        pass
     finally:
-      conn.close()
+      con.unregister(view)
+    return int(getattr(data, "num_rows", 0) or 0)
+
+  def fetch_all(self, sql: str, params=None):
+    # Reads share the engine's database instance (no reconnect per query; also
+    # works for :memory: databases) through a cursor owned by the calling thread.
+    cur = self._read_cursor()
+    if params:
+      return cur.execute(sql, params).fetchall()
+    return cur.execute(sql).fetchall()
 
   def execute_scalar(self, sql: str, params=None):
     rows = self.fetch_all(sql, params)
@@ -199,6 +282,15 @@ class DuckDBDialect(SqlDialect):
     """DuckDB supports delete detection via DELETE + NOT EXISTS."""
     return True
 
+  @property
+  def supports_arrow_load(self) -> bool:
+    return True
+
+  @property
+  def supports_bulk_load(self) -> bool:
+    """RAW landing registers Arrow batches instead of executemany."""
+    return True
+
   def get_execution_engine(self, system):
     return DuckDbExecutionEngine(system)
 
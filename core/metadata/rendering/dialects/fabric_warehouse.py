@@ -24,10 +24,13 @@ from __future__ import annotations
 
 import datetime
 import re
+import weakref
 from decimal import Decimal
 from typing import Sequence
 
 from .base import BaseExecutionEngine, SqlDialect
+from .bulk_load import odbc_input_sizes, tsql_bulk_insert
+from .connection_pool import ConnectionPool, pool_config_from_settings
 from metadata.ingestion.types_map import (
   STRING, INTEGER, BIGINT, DECIMAL, FLOAT, BOOLEAN, DATE, TIME, TIMESTAMP, BINARY, UUID, JSON
 )
@@ -43,6 +46,9 @@ class FabricWarehouseExecutionEngine(BaseExecutionEngine):
     {"connection_string": "..."}
   """
 
+  # Rows per fast_executemany batch in bulk_load (security["bulk_batch_rows"] overrides).
+  bulk_load_batch_rows = 10_000
+
   def __init__(self, system):
     try:
       import pyodbc  # local import to avoid hard dependency at import time
@@ -61,60 +67,84 @@ class FabricWarehouseExecutionEngine(BaseExecutionEngine):
         f"Fabric Warehouse system '{system.short_name}' has no usable connection string in security."
       )
     self.conn_str = conn_str
+    self._pool = ConnectionPool(
+      lambda: pyodbc.connect(conn_str, autocommit=False),
+      config=pool_config_from_settings(system.security),
+    )
+    weakref.finalize(self, self._pool.close)
 
-  def execute(self, sql: str) -> int | None:
-    conn = self._pyodbc.connect(self.conn_str, autocommit=False)
+    security = system.security if isinstance(system.security, dict) else {}
     try:
+      self.bulk_load_batch_rows = int(security.get("bulk_batch_rows") or self.bulk_load_batch_rows)
+    except (TypeError, ValueError):
+      pass
+
+  def execute(self, sql: str) -> int | None:
+    with self._transaction() as conn:
       cursor = conn.cursor()
       cursor.execute(sql)
-      conn.commit()
       try:
         return cursor.rowcount
       except Exception:
         return None
-    except Exception:
-      conn.rollback()
-      raise
-    finally:
-      conn.close()
 
   def execute_many(self, sql: str, params_seq) -> int | None:
-    conn = self._pyodbc.connect(self.conn_str, autocommit=False)
-    try:
+    with self._transaction() as conn:
       cursor = conn.cursor()
       cursor.executemany(sql, params_seq)
-      conn.commit()
       try:
         return cursor.rowcount
       except Exception:
         return None
-    except Exception:
-      conn.rollback()
-      raise
-    finally:
-      conn.close()
+
+  def bulk_load(
+    self,
+    *,
+    schema: str,
+    table: str,
+    columns: list[str],
+    rows,
+    column_types: dict | None = None,
+  ) -> int:
+    """
+    Insert rows with fast_executemany in batches, binding explicit input sizes
+    derived from the TargetColumn types (VARCHAR, DECIMAL(p,s), DATETIME2, ...).
+    """
+    dialect = FabricWarehouseDialect()
+    with self._transaction() as conn:
+      return tsql_bulk_insert(
+        conn,
+        target=dialect.render_table_identifier(schema, table),
+        columns=columns,
+        rows=rows,
+        render_identifier=dialect.render_identifier,
+        input_sizes=odbc_input_sizes(self._pyodbc, columns, column_types, unicode=False),
+        batch_rows=self.bulk_load_batch_rows,
+      )
 
   def execute_scalar(self, sql: str):
-    conn = self._pyodbc.connect(self.conn_str, autocommit=False)
-    try:
+    """
+    Execute a SELECT returning a single value (first column of first row).
+    Returns None if no row is returned.
+    """
+    with self._transaction() as conn:
       cursor = conn.cursor()
       cursor.execute(sql)
       row = cursor.fetchone()
       if not row:
         return None
+      # pyodbc rows are tuple-like
       return row[0]
-    finally:
-      conn.close()
 
   def fetch_all(self, sql: str) -> list[tuple]:
-    conn = self._pyodbc.connect(self.conn_str, autocommit=False)
-    try:
+    """
+    Execute a SELECT and return all rows as tuples.
+    """
+    with self._transaction() as conn:
       cursor = conn.cursor()
       cursor.execute(sql)
       rows = cursor.fetchall()
       return [tuple(r) for r in (rows or [])]
-    finally:
-      conn.close()
 
 
 class FabricWarehouseDialect(SqlDialect):
@@ -176,6 +206,11 @@ class FabricWarehouseDialect(SqlDialect):
   def supports_delete_detection(self) -> bool:
     return True
 
+  @property
+  def supports_bulk_load(self) -> bool:
+    """RAW landing uses fast_executemany with typed input sizes."""
+    return True
+
   def get_execution_engine(self, system) -> BaseExecutionEngine:
     return FabricWarehouseExecutionEngine(system)
 
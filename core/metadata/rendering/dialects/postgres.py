@@ -30,8 +30,11 @@ except ModuleNotFoundError as e:
 from datetime import date, datetime
 from decimal import Decimal
 from typing import Sequence
+import weakref
 
 from .base import BaseExecutionEngine, SqlDialect
+from .bulk_load import CsvRowStream
+from .connection_pool import ConnectionPool, pool_config_from_settings
 from metadata.ingestion.types_map import (
   STRING, INTEGER, BIGINT, DECIMAL, FLOAT, BOOLEAN, DATE, TIME, TIMESTAMP, BINARY, UUID, JSON
 )
@@ -39,6 +42,10 @@ from metadata.materialization.logging import LOAD_RUN_LOG_REGISTRY
 from metadata.rendering.dialects.keywords.postgres import RESERVED_KEYWORDS as POSTGRES_RESERVED_KEYWORDS
 
 
+# Bytes requested per read from the COPY stream.
+COPY_BUFFER_SIZE = 1 << 16
+
+
 class PostgresExecutionEngine(BaseExecutionEngine):
   def __init__(self, system):
     conn_str = None
@@ -51,9 +58,14 @@ class PostgresExecutionEngine(BaseExecutionEngine):
       )
 
     self.conn_str = conn_str
+    self._pool = ConnectionPool(
+      lambda: psycopg2.connect(conn_str),
+      config=pool_config_from_settings(system.security),
+    )
+    weakref.finalize(self, self._pool.close)
 
   def execute(self, sql: str) -> int | None:
-    with psycopg2.connect(self.conn_str) as conn:
+    with self._transaction() as conn:
       with conn.cursor() as cur:
         cur.execute(sql)
 
@@ -64,7 +76,7 @@ class PostgresExecutionEngine(BaseExecutionEngine):
           return None
 
   def execute_many(self, sql: str, params_seq) -> int | None:
-    with psycopg2.connect(self.conn_str) as conn:
+    with self._transaction() as conn:
       with conn.cursor() as cur:
         cur.executemany(sql, params_seq)
         try:
@@ -72,12 +84,37 @@ class PostgresExecutionEngine(BaseExecutionEngine):
         except Exception:
           return None
 
+  def bulk_load(
+    self,
+    *,
+    schema: str,
+    table: str,
+    columns: list[str],
+    rows,
+    column_types: dict | None = None,
+  ) -> int:
+    """
+    Stream rows through COPY ... FROM STDIN (CSV) in one transaction.
+    Rows are encoded on demand while psycopg2 reads the stream.
+    """
+    dialect = PostgresDialect()
+    cols = ", ".join(dialect.render_identifier(c) for c in columns)
+    sql = (
+      f"COPY {dialect.render_table_identifier(schema, table)} ({cols}) "
+      "FROM STDIN WITH (FORMAT csv)"
+    )
+    stream = CsvRowStream(rows, bytes_prefix="\\x")
+    with self._transaction() as conn:
+      with conn.cursor() as cur:
+        cur.copy_expert(sql, stream, size=COPY_BUFFER_SIZE)
+    return stream.rows
+
   def execute_scalar(self, sql: str):
     """
     Execute a SELECT returning a single value (first column of first row).
     Returns None if no row is returned.
     """
-    with psycopg2.connect(self.conn_str) as conn:
+    with self._transaction() as conn:
       with conn.cursor() as cur:
         cur.execute(sql)
         row = cur.fetchone()
@@ -89,7 +126,7 @@ class PostgresExecutionEngine(BaseExecutionEngine):
     """
     Execute a SELECT and return all rows as tuples.
     """
-    with psycopg2.connect(self.conn_str) as conn:
+    with self._transaction() as conn:
       with conn.cursor() as cur:
         cur.execute(sql)
         rows = cur.fetchall()
@@ -116,6 +153,11 @@ class PostgresDialect(SqlDialect):
   def supports_merge(self) -> bool:
     """PostgreSQL supports merge via INSERT ... ON CONFLICT."""
     return True
+
+  @property
+  def supports_bulk_load(self) -> bool:
+    """RAW landing streams rows via COPY ... FROM STDIN."""
+    return True
   
   @property
   def supports_alter_column_type(self) -> bool:
@@ -24,11 +24,18 @@ from __future__ import annotations
 
 from datetime import date, datetime
 from decimal import Decimal
+import functools
+from pathlib import Path
+import tempfile
 from typing import Sequence
+import uuid
+import weakref
 
 from urllib.parse import urlparse, parse_qs, unquote
 
 from .base import BaseExecutionEngine, SqlDialect
+from .bulk_load import iter_csv_gzip_files
+from .connection_pool import ConnectionPool, pool_config_from_settings
 from metadata.ingestion.types_map import (
   STRING, INTEGER, BIGINT, DECIMAL, FLOAT, BOOLEAN, DATE, TIME, TIMESTAMP, BINARY, UUID, JSON
 )
@@ -49,9 +56,13 @@ class SnowflakeExecutionEngine(BaseExecutionEngine):
       "database": "...",
       "schema": "...",
       "role": "..."          # optional
+      "bulk_stage": "user"   # optional: "user" (@~) or "table" (@%table) for bulk_load
     }
   """
 
+  # Rows per staged file in bulk_load.
+  bulk_load_file_rows = 100_000
+
   def __init__(self, system):
     security = getattr(system, "security", None) or {}
     if not isinstance(security, dict):
@@ -91,6 +102,7 @@ class SnowflakeExecutionEngine(BaseExecutionEngine):
           "Snowflake connection_string must include user, password, account, database, warehouse "
           "(and optionally schema, role)."
         )
+      self._init_pool(security)
       return
 
     self.account = security.get("account")
@@ -105,8 +117,27 @@ class SnowflakeExecutionEngine(BaseExecutionEngine):
       raise ValueError(
         "Snowflake system.security must contain account, user, password, warehouse, database."
       )
+    self._init_pool(security)
+
+  def _init_pool(self, security: dict) -> None:
+    self.bulk_stage = str(security.get("bulk_stage") or "user").strip().lower()
+    # Snowflake authentication is expensive: keep sessions for the engine's lifetime.
+    # The connect callable must not reference the engine, or the finalizer never runs.
+    connect = functools.partial(
+      self._connect,
+      account=self.account,
+      user=self.user,
+      password=self.password,
+      warehouse=self.warehouse,
+      database=self.database,
+      schema=self.schema,
+      role=self.role,
+    )
+    self._pool = ConnectionPool(connect, config=pool_config_from_settings(security))
+    weakref.finalize(self, self._pool.close)
 
-  def _sf(self):
+  @staticmethod
+  def _sf():
     try:
       import snowflake.connector as sf
       return sf
@@ -115,16 +146,11 @@ class SnowflakeExecutionEngine(BaseExecutionEngine):
         "Missing dependency for Snowflake execution. Install 'snowflake-connector-python'."
       ) from exc
 
-  def _connect(self):
-    sf = self._sf()
+  @staticmethod
+  def _connect(**connect_args):
+    sf = SnowflakeExecutionEngine._sf()
     return sf.connect(
-      account=self.account,
-      user=self.user,
-      password=self.password,
-      warehouse=self.warehouse,
-      database=self.database,
-      schema=self.schema,
-      role=self.role,
+      **connect_args,
       autocommit=False,   # since you call commit()
     )
 
@@ -148,8 +174,7 @@ class SnowflakeExecutionEngine(BaseExecutionEngine):
 
 
   def execute(self, sql: str) -> int | None:
-    conn = self._connect()
-    try:
+    with self._transaction() as conn:
       cur = conn.cursor()
       try:
         rowcount = None
@@ -157,12 +182,9 @@ class SnowflakeExecutionEngine(BaseExecutionEngine):
           cur.execute(stmt)
           # best-effort: keep the last rowcount (MERGE is usually last)
           rowcount = getattr(cur, "rowcount", None)
-        conn.commit()
         return rowcount
       finally:
         cur.close()
-    finally:
-      conn.close()
 
   def execute_many(self, sql: str, params):
     """
@@ -171,22 +193,85 @@ class SnowflakeExecutionEngine(BaseExecutionEngine):
     """
     if not params:
       return 0
-    conn = self._connect()
-    try:
+    with self._transaction() as conn:
       cur = conn.cursor()
       try:
         cur.executemany(sql, params)
-        conn.commit()
         return getattr(cur, "rowcount", None)
       finally:
         cur.close()
-    finally:
-      conn.close()
 
 
+  def bulk_load(
+    self,
+    *,
+    schema: str,
+    table: str,
+    columns: list[str],
+    rows,
+    column_types: dict | None = None,
+  ) -> int:
+    """
+    Stage rows as gzip-compressed CSV files (PUT) and load them with one COPY INTO
+    and an explicit column mapping. JSON columns are parsed with PARSE_JSON.
+    Staged files are purged by the COPY, or removed if the load fails.
+    Chunked landing feeds one call per dataset through a BulkLoadSession.
+    """
+    dialect = SnowflakeDialect()
+    target = dialect.render_table_identifier(schema, table)
+    cols = ", ".join(dialect.render_identifier(c) for c in columns)
+
+    load_id = uuid.uuid4().hex
+    if self.bulk_stage == "table":
+      stage = (
+        f"@{dialect.render_identifier(schema)}.%{dialect.render_identifier(table)}"
+        f"/elevata_{load_id}/"
+      )
+    else:
+      stage = f"@~/elevata/{load_id}/"
+
+    select_items = []
+    for i, c in enumerate(columns, start=1):
+      info = (column_types or {}).get(c) or {}
+      if str(info.get("datatype") or "").upper() == JSON:
+        select_items.append(f"PARSE_JSON(${i})")
+      else:
+        select_items.append(f"${i}")
+
+    copy_sql = (
+      f"COPY INTO {target} ({cols}) "
+      f"FROM (SELECT {', '.join(select_items)} FROM {stage}) "
+      "FILE_FORMAT = (TYPE = CSV FIELD_OPTIONALLY_ENCLOSED_BY = '\"' "
+      "EMPTY_FIELD_AS_NULL = TRUE COMPRESSION = GZIP) "
+      "ON_ERROR = ABORT_STATEMENT PURGE = TRUE"
+    )
+
+    total = 0
+    with self._transaction() as conn:
+      cur = conn.cursor()
+      try:
+        with tempfile.TemporaryDirectory(prefix="elevata_sf_") as tmp:
+          for path, n in iter_csv_gzip_files(rows, tmp, rows_per_file=self.bulk_load_file_rows):
+            cur.execute(
+              f"PUT 'file://{Path(path).as_posix()}' {stage} AUTO_COMPRESS = FALSE OVERWRITE = TRUE"
+            )
+            Path(path).unlink()
+            total += n
+
+        if total:
+          cur.execute(copy_sql)
+      except Exception:
+        try:
+          cur.execute(f"REMOVE {stage}")
+        except Exception:
+          pass
+        raise
+      finally:
+        cur.close()
+    return total
+
   def fetch_all(self, sql: str) -> list[tuple]:
-    conn = self._connect()
-    try:
+    with self._pool.connection() as conn:
       cur = conn.cursor()
       try:
         cur.execute(sql)
@@ -194,8 +279,6 @@ class SnowflakeExecutionEngine(BaseExecutionEngine):
         return [tuple(r) for r in (rows or [])]
       finally:
         cur.close()
-    finally:
-      conn.close()
       
 
   def execute_scalar(self, sql: str):
@@ -228,6 +311,11 @@ class SnowflakeDialect(SqlDialect):
   def supports_delete_detection(self) -> bool:
     return True
 
+  @property
+  def supports_bulk_load(self) -> bool:
+    """RAW landing stages CSV files and loads them with COPY INTO."""
+    return True
+
   def get_execution_engine(self, system) -> BaseExecutionEngine:
     return SnowflakeExecutionEngine(system)
 
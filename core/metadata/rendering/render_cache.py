@@ -0,0 +1,325 @@
+"""
+elevata - Metadata-driven Data Platform Framework
+Copyright © 2026 Ilona Tag
+
+This file is part of elevata.
+
+elevata is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as
+published by the Free Software Foundation, either version 3 of
+the License, or (at your option) any later version.
+
+elevata is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with elevata. If not, see <https://www.gnu.org/licenses/>.
+
+Contact: <https://github.com/elevata-labs/elevata>.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Callable
+
+from django.conf import settings
+
+from metadata import models as m
+
+
+# Persistent, content-addressed cache for rendered SQL.
+# The key hashes the metadata rows that rendering reads (dataset, columns, inputs,
+# joins, query tree, references and directly related datasets), the dialect and
+# the renderer source code. A changed definition therefore never hits a stale
+# entry; signal-driven invalidation only removes entries that can no longer match.
+
+_AUDIT_FIELDS = {"created_at", "updated_at", "created_by", "updated_by"}
+
+# (model, lookup from the model to its owning TargetDataset id)
+_DATASET_SCOPED_MODELS = (
+  ("TargetColumn", "target_dataset_id"),
+  ("TargetColumnInput", "target_column__target_dataset_id"),
+  ("TargetDatasetInput", "target_dataset_id"),
+  ("TargetDatasetJoin", "target_dataset_id"),
+  ("TargetDatasetJoinPredicate", "join__target_dataset_id"),
+  ("TargetDatasetReference", "referencing_dataset_id"),
+  ("TargetDatasetReferenceComponent", "reference__referencing_dataset_id"),
+  ("QueryNode", "target_dataset_id"),
+  ("QuerySelectNode", "node__target_dataset_id"),
+  ("QueryAggregateNode", "node__target_dataset_id"),
+  ("QueryAggregateGroupKey", "aggregate_node__node__target_dataset_id"),
+  ("QueryAggregateMeasure", "aggregate_node__node__target_dataset_id"),
+  ("QueryUnionNode", "node__target_dataset_id"),
+  ("QueryUnionOutputColumn", "union_node__node__target_dataset_id"),
+  ("QueryUnionBranch", "union_node__node__target_dataset_id"),
+  ("QueryUnionBranchMapping", "branch__union_node__node__target_dataset_id"),
+  ("QueryWindowNode", "node__target_dataset_id"),
+  ("QueryWindowColumn", "window_node__node__target_dataset_id"),
+  ("QueryWindowColumnArg", "window_column__window_node__node__target_dataset_id"),
+  ("OrderByExpression", "target_dataset_id"),
+  ("OrderByItem", "order_by__target_dataset_id"),
+  ("PartitionByExpression", "target_dataset_id"),
+  ("PartitionByItem", "partition_by__target_dataset_id"),
+)
+
+# Modules outside metadata/rendering whose code shapes the rendered SQL
+# (relative to the metadata package).
+_RENDER_DEPENDENCY_MODULES = (
+  "generation/naming.py",
+  "ingestion/types_map.py",
+  "materialization/logging.py",
+  "models.py",
+  "config/profiles.py",
+)
+
+_code_fingerprint: str | None = None
+_code_fingerprint_lock = threading.Lock()
+
+
+def _rows(model, **filters) -> list[list[object]]:
+  """
+  Content rows (without audit fields) in primary-key order.
+  """
+  fields = [f.attname for f in model._meta.concrete_fields if f.name not in _AUDIT_FIELDS]
+  return [list(r) for r in model.objects.filter(**filters).order_by("pk").values_list(*fields)]
+
+
+def renderer_code_fingerprint() -> str:
+  """
+  Hash of the rendering package sources (incl. dialects), the modules rendering
+  imports from elsewhere in metadata and the elevata version, computed once per
+  process. Deploying a renderer change invalidates all cached SQL.
+  """
+  global _code_fingerprint
+  with _code_fingerprint_lock:
+    if _code_fingerprint is None:
+      h = hashlib.sha256()
+      h.update(str(getattr(settings, "ELEVATA_VERSION", "")).encode("utf-8"))
+      root = Path(__file__).resolve().parent
+      metadata_root = root.parent
+      paths = sorted(root.rglob("*.py")) + [metadata_root / rel for rel in _RENDER_DEPENDENCY_MODULES]
+      for path in paths:
+        if not path.exists():
+          continue
+        h.update(str(path.relative_to(metadata_root)).encode("utf-8"))
+        h.update(path.read_bytes())
+      _code_fingerprint = h.hexdigest()
+    return _code_fingerprint
+
+
+def compute_dataset_render_fingerprint(td) -> str:
+  """
+  Fingerprint of all metadata a dataset's SQL rendering depends on.
+  """
+  td_id = td.pk
+  parts: dict[str, object] = {
+    "dataset": _rows(m.TargetDataset, pk=td_id),
+  }
+  for model_name, lookup in _DATASET_SCOPED_MODELS:
+    parts[model_name] = _rows(getattr(m, model_name), **{lookup: td_id})
+
+  # Directly related datasets: upstream inputs, referenced datasets and
+  # base/hist companions sharing the lineage key.
+  related_ids: set[int] = set()
+  source_ids: set[int] = set()
+  for upstream_id, source_id in (
+    m.TargetDatasetInput.objects
+    .filter(target_dataset_id=td_id)
+    .values_list("upstream_target_dataset_id", "source_dataset_id")
+  ):
+    if upstream_id:
+      related_ids.add(int(upstream_id))
+    if source_id:
+      source_ids.add(int(source_id))
+
+  related_ids.update(
+    m.TargetDatasetReference.objects
+    .filter(referencing_dataset_id=td_id)
+    .values_list("referenced_dataset_id", flat=True)
+  )
+  lineage_key = getattr(td, "lineage_key", None)
+  if lineage_key:
+    related_ids.update(
+      m.TargetDataset.objects
+      .filter(target_schema_id=td.target_schema_id, lineage_key=lineage_key)
+      .values_list("pk", flat=True)
+    )
+  related_ids.discard(td_id)
+
+  incremental_source_id = getattr(td, "incremental_source_id", None)
+  if incremental_source_id:
+    source_ids.add(int(incremental_source_id))
+
+  parts["related_datasets"] = _rows(m.TargetDataset, pk__in=related_ids)
+  parts["related_columns"] = _rows(m.TargetColumn, target_dataset_id__in=related_ids)
+  parts["schemas"] = _rows(
+    m.TargetSchema,
+    pk__in=m.TargetDataset.objects.filter(pk__in=related_ids | {td_id}).values("target_schema_id"),
+  )
+  parts["source_datasets"] = _rows(m.SourceDataset, pk__in=source_ids)
+  parts["source_columns"] = _rows(m.SourceColumn, source_dataset_id__in=source_ids)
+  parts["systems"] = _rows(
+    m.System,
+    pk__in=m.SourceDataset.objects.filter(pk__in=source_ids).values("source_system_id"),
+  )
+
+  payload = json.dumps(parts, sort_keys=True, default=str)
+  return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def render_cache_key(td, dialect, *, kind: str) -> str:
+  cls = type(dialect)
+  payload = json.dumps({
+    "elevata_version": str(getattr(settings, "ELEVATA_VERSION", "")),
+    "renderer": renderer_code_fingerprint(),
+    "dialect": str(getattr(dialect, "DIALECT_NAME", "") or ""),
+    "dialect_class": f"{cls.__module__}.{cls.__qualname__}",
+    "kind": kind,
+    "dataset": compute_dataset_render_fingerprint(td),
+  }, sort_keys=True)
+  return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class RenderCacheStore:
+  """
+  File-based store: one file per entry, named <dataset_id>-<key>.sql.
+  File mtimes serve as LRU clock (touched on every hit).
+  """
+
+  def __init__(self, base_path: str | Path, max_entries: int = 2000):
+    self.base_path = Path(base_path)
+    self.max_entries = max(1, int(max_entries))
+    self._lock = threading.Lock()
+
+  def _path(self, dataset_id: int, key: str) -> Path:
+    return self.base_path / f"{int(dataset_id)}-{key}.sql"
+
+  def get(self, dataset_id: int, key: str) -> str | None:
+    path = self._path(dataset_id, key)
+    try:
+      sql = path.read_text(encoding="utf-8")
+    except OSError:
+      return None
+    try:
+      os.utime(path, None)
+    except OSError:
+      pass
+    return sql
+
+  def put(self, dataset_id: int, key: str, sql: str) -> None:
+    path = self._path(dataset_id, key)
+    with self._lock:
+      self.base_path.mkdir(parents=True, exist_ok=True)
+      tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+      tmp_path.write_text(sql, encoding="utf-8")
+      tmp_path.replace(path)
+      self._evict()
+
+  def invalidate_dataset(self, dataset_id: int) -> int:
+    removed = 0
+    with self._lock:
+      for path in self.base_path.glob(f"{int(dataset_id)}-*.sql"):
+        try:
+          path.unlink()
+          removed += 1
+        except OSError:
+          pass
+    return removed
+
+  def clear(self) -> None:
+    with self._lock:
+      for path in self.base_path.glob("*.sql"):
+        try:
+          path.unlink()
+        except OSError:
+          pass
+
+  def _evict(self) -> None:
+    """
+    Drop least recently used entries beyond max_entries.
+    """
+    entries = []
+    try:
+      with os.scandir(self.base_path) as it:
+        for e in it:
+          if e.name.endswith(".sql"):
+            try:
+              entries.append((e.stat().st_mtime, e.path))
+            except OSError:
+              pass
+    except OSError:
+      return
+
+    overflow = len(entries) - self.max_entries
+    if overflow <= 0:
+      return
+    entries.sort()
+    for _, path in entries[:overflow]:
+      try:
+        os.unlink(path)
+      except OSError:
+        pass
+
+
+_store: RenderCacheStore | None = None
+_store_lock = threading.Lock()
+
+
+def get_render_cache() -> RenderCacheStore | None:
+  """
+  Process-wide store configured via settings; None when disabled.
+  """
+  global _store
+  if not bool(getattr(settings, "ELEVATA_RENDER_CACHE_ENABLED", False)):
+    return None
+  base_path = Path(str(getattr(settings, "ELEVATA_RENDER_CACHE_DIR", None) or ".elevata/render_cache"))
+  if not base_path.is_absolute():
+    base_path = Path(str(getattr(settings, "BASE_DIR", ""))) / base_path
+  max_entries = int(getattr(settings, "ELEVATA_RENDER_CACHE_MAX_ENTRIES", 2000) or 2000)
+  with _store_lock:
+    if _store is None or _store.base_path != base_path or _store.max_entries != max_entries:
+      _store = RenderCacheStore(base_path, max_entries=max_entries)
+    return _store
+
+
+def render_sql_cached(td, dialect, *, kind: str, render_fn: Callable[[object, object], str]) -> str:
+  """
+  Serve rendered SQL from the cache or render and store it.
+  Objects that are not persisted TargetDatasets always render directly.
+  """
+  cache = get_render_cache()
+  if cache is None or not isinstance(td, m.TargetDataset) or td.pk is None:
+    return render_fn(td, dialect)
+
+  try:
+    key = render_cache_key(td, dialect, kind=kind)
+  except Exception:
+    # Never let cache bookkeeping break rendering.
+    return render_fn(td, dialect)
+
+  cached = cache.get(td.pk, key)
+  if cached is not None:
+    return cached
+
+  sql = render_fn(td, dialect)
+  if isinstance(sql, str):
+    try:
+      cache.put(td.pk, key, sql)
+    except OSError:
+      pass
+  return sql
+
+
+def invalidate_render_cache_for_dataset(dataset_id: int | None) -> None:
+  if dataset_id is None:
+    return
+  cache = get_render_cache()
+  if cache is not None:
+    cache.invalidate_dataset(int(dataset_id))
@@ -28,6 +28,7 @@ from dataclasses import dataclass
 from metadata.models import TargetDataset
 from metadata.rendering.dialects.base import SqlDialect
 from metadata.rendering.renderer import render_select_for_target
+from metadata.rendering.render_cache import render_sql_cached
 from metadata.rendering.load_sql import (
   render_merge_sql as _render_merge_sql,
   render_delete_missing_rows_sql as _render_delete_missing_rows_sql,
@@ -150,7 +151,9 @@ def render_preview_sql(
     )
     return beautify_sql(raw_sql)
 
-  raw_sql = render_select_sql(dataset, dialect, presentation=True)
+  # Previews are re-rendered on every UI request; serve unchanged datasets from the render cache.
+  canonical = render_sql_cached(dataset, dialect, kind="select", render_fn=render_select_for_target)
+  raw_sql = _to_presentation(canonical, policy=DEFAULT_PRESENTATION_POLICY)
   return beautify_sql(raw_sql)
 
 
@@ -21,14 +21,25 @@ Contact: <https://github.com/elevata-labs/elevata>.
 """
 
 from django.db import transaction
-from django.db.models.signals import post_save, pre_delete, pre_save
+from django.db.models.signals import post_delete, post_save, pre_delete, pre_save
 from django.dispatch import receiver
 from crum import get_current_user
 from typing import Iterable
 
 from metadata.models import (
+  TargetSchema,
   TargetDataset,
   TargetColumn,
+  TargetColumnInput,
+  TargetDatasetInput,
+  TargetDatasetJoin,
+  TargetDatasetJoinPredicate,
+  TargetDatasetReference,
+  TargetDatasetReferenceComponent,
+  OrderByExpression,
+  OrderByItem,
+  PartitionByExpression,
+  PartitionByItem,
   QueryNode,
   QueryUnionNode,
   QueryUnionBranch,
@@ -44,6 +55,8 @@ from metadata.models import (
 
 from metadata.generation.target_generation_service import TargetGenerationService
 from metadata.services.query_contract_sync_trigger import trigger_query_contract_column_sync
+from metadata.execution.plan_guard import bump_metadata_revision
+from metadata.rendering.render_cache import invalidate_render_cache_for_dataset
 
 
 def _merge_former_names(a, b):
@@ -383,3 +396,85 @@ for _Model in _SYNC_MODELS:
     sender=_Model,
     dispatch_uid=f"qb_contract_sync_pre_delete::{_Model.__name__}",
   )
+
+
+def _bump_metadata_revision(sender, instance, **kwargs):  # type: ignore
+  """
+  Plan guard change token: any saved/deleted dataset or schema moves the revision.
+  """
+  bump_metadata_revision()
+
+for _Model in (TargetSchema, TargetDataset):
+  post_save.connect(
+    _bump_metadata_revision,
+    sender=_Model,
+    dispatch_uid=f"metadata_revision_post_save::{_Model.__name__}",
+  )
+  post_delete.connect(
+    _bump_metadata_revision,
+    sender=_Model,
+    dispatch_uid=f"metadata_revision_post_delete::{_Model.__name__}",
+  )
+
+
+def _render_cache_td_from_instance(obj):
+  """
+  Resolve the owning TargetDataset for render-relevant metadata rows.
+  """
+  if isinstance(obj, TargetDataset):
+    return obj
+  for parent_attr, td_attr in (
+    ("target_column", "target_dataset"),
+    ("join", "target_dataset"),
+    ("reference", "referencing_dataset"),
+    ("order_by", "target_dataset"),
+    ("partition_by", "target_dataset"),
+  ):
+    parent = getattr(obj, parent_attr, None)
+    td = getattr(parent, td_attr, None) if parent is not None else None
+    if isinstance(td, TargetDataset):
+      return td
+  td = getattr(obj, "referencing_dataset", None)
+  if isinstance(td, TargetDataset):
+    return td
+  return _td_from_instance(obj)
+
+
+def _invalidate_render_cache(sender, instance, **kwargs):  # type: ignore
+  """
+  Drop cached SQL of the affected dataset. Cache keys are content-addressed,
+  so this only frees entries that can no longer be hit.
+  """
+  try:
+    td = _render_cache_td_from_instance(instance)
+    invalidate_render_cache_for_dataset(getattr(td, "pk", None))
+  except Exception:
+    pass
+
+_RENDER_CACHE_MODELS = (
+  TargetDataset,
+  TargetColumn,
+  TargetColumnInput,
+  TargetDatasetInput,
+  TargetDatasetJoin,
+  TargetDatasetJoinPredicate,
+  TargetDatasetReference,
+  TargetDatasetReferenceComponent,
+  OrderByExpression,
+  OrderByItem,
+  PartitionByExpression,
+  PartitionByItem,
+) + _SYNC_MODELS
+
+for _Model in _RENDER_CACHE_MODELS:
+  post_save.connect(
+    _invalidate_render_cache,
+    sender=_Model,
+    dispatch_uid=f"render_cache_post_save::{_Model.__name__}",
+  )
+  # Same as the contract sync: resolve the dataset before cascades remove it.
+  pre_delete.connect(
+    _invalidate_render_cache,
+    sender=_Model,
+    dispatch_uid=f"render_cache_pre_delete::{_Model.__name__}",
+  )
@@ -0,0 +1,185 @@
+"""
+elevata - Metadata-driven Data Platform Framework
+Copyright © 2026 Ilona Tag
+
+This file is part of elevata.
+
+elevata is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as
+published by the Free Software Foundation, either version 3 of
+the License, or (at your option) any later version.
+
+elevata is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with elevata. If not, see <https://www.gnu.org/licenses/>.
+
+Contact: <https://github.com/elevata-labs/elevata>.
+"""
+
+import datetime
+import io
+import json
+import threading
+import types
+from decimal import Decimal
+
+import pyarrow.parquet as pq
+import pytest
+
+import metadata.rendering.dialects.bigquery as bq_mod
+from metadata.ingestion.landing import insert_raw_rows
+from metadata.ingestion.pipeline import BulkLoadSession
+from metadata.rendering.dialects.bigquery import BigQueryDialect, BigQueryExecutionEngine
+
+
+class LoadJobClient:
+  """Stand-in for bigquery.Client recording load_table_from_file jobs."""
+
+  def __init__(self, project="proj"):
+    self.project = project
+    self.jobs = []
+    self._lock = threading.Lock()
+
+  def load_table_from_file(self, file_obj, table_id, *, job_config, location):
+    data = file_obj.read()
+    with self._lock:
+      self.jobs.append((table_id, job_config.source_format, data))
+    if job_config.source_format == "PARQUET":
+      rows = pq.read_table(io.BytesIO(data)).num_rows
+    else:
+      rows = len(data.splitlines())
+    return types.SimpleNamespace(result=lambda: None, output_rows=rows)
+
+  def insert_rows_json(self, table_id, rows):
+    raise AssertionError("streaming inserts must not be used")
+
+
+@pytest.fixture(autouse=True)
+def fake_load_job_config(monkeypatch):
+  monkeypatch.setattr(bq_mod, "bigquery", types.SimpleNamespace(
+    LoadJobConfig=lambda **kw: types.SimpleNamespace(**kw),
+  ))
+
+
+def test_insert_raw_rows_submits_ndjson_load_jobs_per_chunk():
+  client = LoadJobClient()
+  engine = BigQueryExecutionEngine(client, load_parallelism=2)
+  engine.bulk_load_batch_rows = 2
+
+  rows = [
+    (1, Decimal("1.50"), datetime.datetime(2024, 1, 2, 3, 4, 5), b"\x01"),
+    (2, None, None, None),
+    (3, Decimal("2"), None, None),
+  ]
+  n = insert_raw_rows(
+    target_engine=engine,
+    target_dialect=BigQueryDialect(),
+    schema_name="raw",
+    table_name="raw_orders",
+    columns=["id", "amount", "loaded_at", "blob"],
+    rows=iter(rows),
+  )
+
+  assert n == 3
+  assert len(client.jobs) == 2
+  assert {job[0] for job in client.jobs} == {"proj.raw.raw_orders"}
+  assert {job[1] for job in client.jobs} == {"NEWLINE_DELIMITED_JSON"}
+  records = [json.loads(line) for job in client.jobs for line in job[2].splitlines()]
+  first = next(r for r in records if r["id"] == 1)
+  assert first == {
+    "id": 1,
+    "amount": "1.50",
+    "loaded_at": "2024-01-02T03:04:05+00:00",
+    "blob": "AQ==",
+  }
+
+
+def test_bulk_load_writes_parquet_and_omits_all_null_columns():
+  client = LoadJobClient()
+  engine = BigQueryExecutionEngine(client, load_format="parquet")
+
+  n = engine.bulk_load(
+    schema="raw",
+    table="t",
+    columns=["a", "b"],
+    rows=[(1, None), (2, None)],
+  )
+
+  assert n == 2
+  _, source_format, data = client.jobs[0]
+  assert source_format == "PARQUET"
+  assert pq.read_table(io.BytesIO(data)).column_names == ["a"]
+
+
+def test_chunked_landing_with_bulk_session_submits_one_load_job_per_dataset():
+  client = LoadJobClient()
+  engine = BigQueryExecutionEngine(client)
+  session = BulkLoadSession()
+
+  for start in (0, 2, 4):
+    insert_raw_rows(
+      target_engine=engine,
+      target_dialect=BigQueryDialect(),
+      schema_name="raw",
+      table_name="raw_orders",
+      columns=["id"],
+      rows=((i,) for i in range(start, start + 2)),
+      bulk_session=session,
+    )
+
+  assert session.commit() == 6
+  assert len(client.jobs) == 1
+  assert len(client.jobs[0][2].splitlines()) == 6
+
+
+PARQUET_COLUMN_TYPES = {
+  "id": {"datatype": "BIGINT"},
+  "code": {"datatype": "STRING"},
+  "amount": {"datatype": "DECIMAL", "decimal_precision": 18, "decimal_scale": 2},
+  "loaded_at": {"datatype": "TIMESTAMP"},
+}
+
+
+def test_parquet_schema_follows_column_types():
+  client = LoadJobClient()
+  engine = BigQueryExecutionEngine(client, load_format="parquet")
+
+  engine.bulk_load(
+    schema="raw",
+    table="t",
+    columns=["id", "code", "amount", "loaded_at"],
+    rows=[(7, None, Decimal("1.5"), datetime.datetime(2024, 1, 2, 3, 4, 5))],
+    column_types=PARQUET_COLUMN_TYPES,
+  )
+
+  _, source_format, data = client.jobs[0]
+  assert source_format == "PARQUET"
+  schema = pq.read_schema(io.BytesIO(data))
+  assert str(schema.field("id").type) == "int64"
+  assert str(schema.field("code").type) == "string"
+  assert str(schema.field("amount").type) == "decimal128(38, 9)"
+  # Naive datetimes are written UTC-adjusted so BigQuery reads them as TIMESTAMP.
+  assert str(schema.field("loaded_at").type) == "timestamp[us, tz=UTC]"
+  loaded_at = pq.read_table(io.BytesIO(data)).column("loaded_at")[0].as_py()
+  assert loaded_at == datetime.datetime(2024, 1, 2, 3, 4, 5, tzinfo=datetime.timezone.utc)
+
+
+def test_parquet_chunk_with_values_not_matching_column_types_falls_back_to_ndjson():
+  client = LoadJobClient()
+  engine = BigQueryExecutionEngine(client, load_format="parquet")
+
+  engine.bulk_load(
+    schema="raw",
+    table="t",
+    columns=["id", "code", "amount", "loaded_at"],
+    rows=[("7", 42, None, None)],
+    column_types=PARQUET_COLUMN_TYPES,
+  )
+
+  _, source_format, data = client.jobs[0]
+  assert source_format == "NEWLINE_DELIMITED_JSON"
+  assert json.loads(data) == {"id": "7", "code": 42, "amount": None, "loaded_at": None}
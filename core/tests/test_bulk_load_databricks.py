@@ -0,0 +1,178 @@
+"""
+elevata - Metadata-driven Data Platform Framework
+Copyright © 2026 Ilona Tag
+
+This file is part of elevata.
+
+elevata is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as
+published by the Free Software Foundation, either version 3 of
+the License, or (at your option) any later version.
+
+elevata is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with elevata. If not, see <https://www.gnu.org/licenses/>.
+
+Contact: <https://github.com/elevata-labs/elevata>.
+"""
+
+import datetime
+import types
+
+import pyarrow.parquet as pq
+
+from metadata.ingestion.landing import insert_raw_rows
+from metadata.ingestion.pipeline import BulkLoadSession
+from metadata.rendering.dialects.connection_pool import ConnectionPool, PoolConfig
+from metadata.rendering.dialects.databricks import DatabricksDialect, DatabricksExecutionEngine
+
+
+class VolumeRecordingCursor:
+  """Stand-in for a Databricks SQL cursor: records statements, reads PUT files."""
+
+  def __init__(self, conn):
+    self.conn = conn
+    self.rowcount = -1
+
+  def __enter__(self):
+    return self
+
+  def __exit__(self, *exc):
+    return False
+
+  def execute(self, sql, params=None):
+    self.conn.statements.append((sql, params))
+    if sql.startswith("PUT "):
+      self.conn.staged.append(pq.read_table(sql.split("'")[1]))
+
+  def executemany(self, sql, params_seq):
+    self.conn.statements.append((sql, list(params_seq)))
+
+
+class VolumeRecordingConnection:
+  def __init__(self):
+    self.statements = []
+    self.staged = []
+
+  def cursor(self):
+    return VolumeRecordingCursor(self)
+
+  def close(self):
+    pass
+
+
+def _engine(conn, **security):
+  engine = DatabricksExecutionEngine(types.SimpleNamespace(
+    short_name="dbx",
+    security={"server_hostname": "h", "http_path": "/sql/1", "access_token": "t", **security},
+  ))
+  engine._pool = ConnectionPool(lambda: conn, config=PoolConfig(max_size=1))
+  return engine
+
+
+COLUMNS = ["order_id", "payload", "load_run_id", "loaded_at"]
+COLUMN_TYPES = {
+  "order_id": {"datatype": "BIGINT"},
+  "payload": {"datatype": "STRING"},
+  "load_run_id": {"datatype": "STRING"},
+  "loaded_at": {"datatype": "TIMESTAMP"},
+}
+
+
+def _rows(n):
+  loaded_at = datetime.datetime(2024, 5, 1, 12, 0, 0)
+  for i in range(n):
+    yield (None if i == 0 else i, '{"id": %d}' % i, "run-1", loaded_at)
+
+
+def test_insert_raw_rows_stages_parquet_and_runs_one_copy_into():
+  conn = VolumeRecordingConnection()
+  engine = _engine(conn, bulk_stage_path="/Volumes/main/landing/elevata/")
+  engine.bulk_load_min_rows = 2
+  engine.bulk_load_file_rows = 2
+
+  n = insert_raw_rows(
+    target_engine=engine,
+    target_dialect=DatabricksDialect(),
+    schema_name="raw",
+    table_name="raw_orders",
+    columns=COLUMNS,
+    rows=_rows(3),
+    column_types=COLUMN_TYPES,
+  )
+
+  assert n == 3
+  statements = [sql for sql, _ in conn.statements]
+  puts = [s for s in statements if s.startswith("PUT ")]
+  copies = [s for s in statements if s.startswith("COPY INTO")]
+  removes = [s for s in statements if s.startswith("REMOVE ")]
+  assert len(puts) == 2
+  assert len(removes) == 2
+  assert len(copies) == 1
+
+  load_dir = puts[0].split("'")[3].rsplit("/", 1)[0]
+  assert load_dir.startswith("/Volumes/main/landing/elevata/elevata_")
+  assert copies[0] == (
+    "COPY INTO raw.raw_orders FROM (SELECT order_id, payload, load_run_id, loaded_at "
+    f"FROM '{load_dir}') FILEFORMAT = PARQUET"
+  )
+
+  # Technical columns are staged; typed columns keep one schema across files.
+  first = conn.staged[0]
+  assert first.column_names == COLUMNS
+  assert str(first.schema.field("order_id").type) == "int64"
+  assert first.column("load_run_id").to_pylist() == ["run-1", "run-1"]
+  assert conn.staged[1].schema == first.schema
+
+
+def test_small_loads_use_multi_row_insert_fallback():
+  conn = VolumeRecordingConnection()
+  engine = _engine(conn, bulk_stage_path="/Volumes/main/landing/elevata")
+
+  n = engine.bulk_load(
+    schema="raw",
+    table="raw_orders",
+    columns=COLUMNS,
+    rows=_rows(3),
+    column_types=COLUMN_TYPES,
+  )
+
+  assert n == 3
+  assert len(conn.statements) == 1
+  sql, params = conn.statements[0]
+  assert sql.startswith("INSERT INTO raw.raw_orders (order_id, payload, load_run_id, loaded_at) VALUES ")
+  assert sql.count("(%s, %s, %s, %s)") == 3
+  assert len(params) == 12
+
+
+def test_chunked_landing_with_bulk_session_runs_one_copy_into_per_dataset():
+  conn = VolumeRecordingConnection()
+  engine = _engine(conn, bulk_stage_path="/Volumes/main/landing/elevata")
+  engine.bulk_load_min_rows = 3
+  engine.bulk_load_file_rows = 4
+  session = BulkLoadSession()
+  rows = list(_rows(6))
+
+  # Each chunk alone is below bulk_load_min_rows; together they are staged.
+  for start in (0, 2, 4):
+    insert_raw_rows(
+      target_engine=engine,
+      target_dialect=DatabricksDialect(),
+      schema_name="raw",
+      table_name="raw_orders",
+      columns=COLUMNS,
+      rows=iter(rows[start:start + 2]),
+      column_types=COLUMN_TYPES,
+      bulk_session=session,
+    )
+
+  assert session.commit() == 6
+  statements = [sql for sql, _ in conn.statements]
+  assert len([s for s in statements if s.startswith("PUT ")]) == 2
+  assert len([s for s in statements if s.startswith("COPY INTO")]) == 1
+  assert not [s for s in statements if s.startswith("INSERT ")]
+  assert sum(t.num_rows for t in conn.staged) == 6
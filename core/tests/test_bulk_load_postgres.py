@@ -0,0 +1,147 @@
+"""
+elevata - Metadata-driven Data Platform Framework
+Copyright © 2026 Ilona Tag
+
+This file is part of elevata.
+
+elevata is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as
+published by the Free Software Foundation, either version 3 of
+the License, or (at your option) any later version.
+
+elevata is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with elevata. If not, see <https://www.gnu.org/licenses/>.
+
+Contact: <https://github.com/elevata-labs/elevata>.
+"""
+
+import csv
+import datetime
+import io
+import types
+from decimal import Decimal
+
+from metadata.ingestion.landing import insert_raw_rows
+from metadata.rendering.dialects.bulk_load import CsvRowStream
+from metadata.rendering.dialects.connection_pool import ConnectionPool, PoolConfig
+from metadata.rendering.dialects.postgres import PostgresDialect, PostgresExecutionEngine
+
+
+class FakeCursor:
+  def __init__(self, conn):
+    self.conn = conn
+
+  def __enter__(self):
+    return self
+
+  def __exit__(self, *exc):
+    return False
+
+  def copy_expert(self, sql, file, size=8192):
+    chunks = []
+    while True:
+      data = file.read(size)
+      if not data:
+        break
+      chunks.append(data)
+    self.conn.copies.append((sql, b"".join(chunks).decode("utf-8")))
+
+
+class FakeConnection:
+  def __init__(self):
+    self.copies = []
+    self.commits = 0
+
+  def cursor(self):
+    return FakeCursor(self)
+
+  def commit(self):
+    self.commits += 1
+
+  def rollback(self):
+    pass
+
+  def close(self):
+    pass
+
+
+def test_csv_row_stream_encodes_nulls_json_and_timestamps_in_small_reads():
+  rows = [
+    (1, None, "", 'say "hi"\nbye', {"a": [1, 2]}),
+    (2, True, Decimal("1.50"), datetime.datetime(2024, 1, 2, 3, 4, 5), b"\x01\xff"),
+  ]
+  stream = CsvRowStream(rows, bytes_prefix="\\x")
+
+  out = b""
+  while True:
+    part = stream.read(5)
+    if not part:
+      break
+    out += part
+
+  assert stream.rows == 2
+  lines = out.decode("utf-8").split("\n", 2)
+  # NULL is an unquoted empty field, empty string is quoted
+  assert lines[0].startswith('"1",,"",')
+  parsed = list(csv.reader(io.StringIO(out.decode("utf-8"))))
+  assert parsed[0][3] == 'say "hi"\nbye'
+  assert parsed[0][4] == '{"a": [1, 2]}'
+  assert parsed[1] == ["2", "true", "1.50", "2024-01-02 03:04:05", "\\x01ff"]
+
+
+def test_insert_raw_rows_uses_postgres_copy_when_bulk_load_is_supported():
+  engine = PostgresExecutionEngine(types.SimpleNamespace(
+    short_name="pg",
+    security={"connection_string": "postgresql://unused"},
+  ))
+  conn = FakeConnection()
+  engine._pool = ConnectionPool(lambda: conn, config=PoolConfig(max_size=1))
+
+  def _rows():
+    for i in range(3):
+      yield (i, f"Kunde {i}", None)
+
+  n = insert_raw_rows(
+    target_engine=engine,
+    target_dialect=PostgresDialect(),
+    schema_name="raw",
+    table_name="raw_orders",
+    columns=["order_id", "Customer", "payload"],
+    rows=_rows(),
+    chunk_size=2,
+  )
+
+  assert n == 3
+  assert conn.commits == 1
+  sql, data = conn.copies[0]
+  assert sql == 'COPY raw.raw_orders (order_id, Customer, payload) FROM STDIN WITH (FORMAT csv)'
+  assert data.splitlines() == ['"0","Kunde 0",', '"1","Kunde 1",', '"2","Kunde 2",']
+
+
+def test_insert_raw_rows_falls_back_to_chunked_execute_many():
+  calls = []
+  engine = types.SimpleNamespace(execute_many=lambda sql, rows: calls.append((sql, list(rows))))
+  dialect = types.SimpleNamespace(
+    param_placeholder=lambda: "?",
+    render_insert_values_statement=lambda schema, table, target_columns, values_sql:
+      f"INSERT INTO {schema}.{table} ({', '.join(target_columns)}) VALUES {values_sql}",
+  )
+
+  n = insert_raw_rows(
+    target_engine=engine,
+    target_dialect=dialect,
+    schema_name="raw",
+    table_name="t",
+    columns=["a", "b"],
+    rows=iter([(1, 2), (3, 4), (5, 6)]),
+    chunk_size=2,
+  )
+
+  assert n == 3
+  assert [len(rows) for _, rows in calls] == [2, 1]
+  assert calls[0][0] == "INSERT INTO raw.t (a, b) VALUES (?, ?)"
@@ -0,0 +1,151 @@
+"""
+elevata - Metadata-driven Data Platform Framework
+Copyright © 2026 Ilona Tag
+
+This file is part of elevata.
+
+elevata is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as
+published by the Free Software Foundation, either version 3 of
+the License, or (at your option) any later version.
+
+elevata is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with elevata. If not, see <https://www.gnu.org/licenses/>.
+
+Contact: <https://github.com/elevata-labs/elevata>.
+"""
+
+import csv
+import gzip
+import io
+import types
+
+import pytest
+
+from metadata.ingestion.landing import insert_raw_rows
+from metadata.ingestion.pipeline import BulkLoadSession
+from metadata.rendering.dialects.connection_pool import ConnectionPool, PoolConfig
+from metadata.rendering.dialects.snowflake import SnowflakeDialect, SnowflakeExecutionEngine
+
+
+class StageRecordingCursor:
+  """Stand-in for a Snowflake cursor: records PUT/COPY and reads staged files."""
+
+  def __init__(self, conn):
+    self.conn = conn
+
+  def execute(self, sql):
+    self.conn.statements.append(sql)
+    if sql.startswith("PUT "):
+      path = sql.split("'")[1][len("file://"):]
+      with gzip.open(path, "rt", encoding="utf-8") as fh:
+        self.conn.staged.append(list(csv.reader(io.StringIO(fh.read()))))
+    if sql.startswith("COPY INTO") and self.conn.fail_copy:
+      raise RuntimeError("copy failed")
+
+  def close(self):
+    pass
+
+
+class StageRecordingConnection:
+  def __init__(self, fail_copy=False):
+    self.statements = []
+    self.staged = []
+    self.fail_copy = fail_copy
+    self.commits = 0
+    self.rollbacks = 0
+
+  def cursor(self):
+    return StageRecordingCursor(self)
+
+  def commit(self):
+    self.commits += 1
+
+  def rollback(self):
+    self.rollbacks += 1
+
+  def close(self):
+    pass
+
+
+def _engine(conn, **security):
+  engine = SnowflakeExecutionEngine(types.SimpleNamespace(
+    short_name="sf",
+    security={
+      "account": "acc", "user": "u", "password": "p", "warehouse": "wh", "database": "db",
+      **security,
+    },
+  ))
+  engine._pool = ConnectionPool(lambda: conn, config=PoolConfig(max_size=1))
+  return engine
+
+
+def test_insert_raw_rows_stages_files_and_runs_one_copy_into():
+  conn = StageRecordingConnection()
+  engine = _engine(conn)
+  engine.bulk_load_file_rows = 2
+
+  n = insert_raw_rows(
+    target_engine=engine,
+    target_dialect=SnowflakeDialect(),
+    schema_name="raw",
+    table_name="raw_orders",
+    columns=["order_id", "note", "payload"],
+    rows=((i, None if i == 1 else f"n{i}", '{"id": %d}' % i) for i in range(3)),
+    column_types={"payload": {"datatype": "JSON"}},
+  )
+
+  assert n == 3
+  assert conn.commits == 1
+  puts = [s for s in conn.statements if s.startswith("PUT ")]
+  copies = [s for s in conn.statements if s.startswith("COPY INTO")]
+  assert len(puts) == 2
+  assert len(copies) == 1
+  assert conn.staged[0] == [["0", "n0", '{"id": 0}'], ["1", "", '{"id": 1}']]
+
+  stage = puts[0].split(" ")[2]
+  assert stage.startswith("@~/elevata/")
+  assert copies[0].startswith(
+    f"COPY INTO raw.raw_orders (order_id, note, payload) FROM (SELECT $1, $2, PARSE_JSON($3) FROM {stage})"
+  )
+  assert "PURGE = TRUE" in copies[0]
+
+
+def test_bulk_load_uses_table_stage_and_removes_files_on_failure():
+  conn = StageRecordingConnection(fail_copy=True)
+  engine = _engine(conn, bulk_stage="table")
+
+  with pytest.raises(RuntimeError):
+    engine.bulk_load(schema="raw", table="t", columns=["a"], rows=[(1,)])
+
+  assert conn.statements[0].split(" ")[2].startswith("@raw.%t/elevata_")
+  assert [s for s in conn.statements if s.startswith("REMOVE ")][0].startswith("REMOVE @raw.%t/elevata_")
+  assert conn.rollbacks == 1
+
+
+def test_chunked_landing_with_bulk_session_runs_one_copy_per_dataset():
+  conn = StageRecordingConnection()
+  engine = _engine(conn)
+  engine.bulk_load_file_rows = 2
+  session = BulkLoadSession()
+
+  for start in (0, 2, 4):
+    insert_raw_rows(
+      target_engine=engine,
+      target_dialect=SnowflakeDialect(),
+      schema_name="raw",
+      table_name="raw_orders",
+      columns=["order_id"],
+      rows=((i,) for i in range(start, start + 2)),
+      bulk_session=session,
+    )
+
+  assert session.commit() == 6
+  assert conn.commits == 1
+  assert len([s for s in conn.statements if s.startswith("PUT ")]) == 3
+  assert len([s for s in conn.statements if s.startswith("COPY INTO")]) == 1
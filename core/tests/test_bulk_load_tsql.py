@@ -0,0 +1,171 @@
+"""
+elevata - Metadata-driven Data Platform Framework
+Copyright © 2026 Ilona Tag
+
+This file is part of elevata.
+
+elevata is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as
+published by the Free Software Foundation, either version 3 of
+the License, or (at your option) any later version.
+
+elevata is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with elevata. If not, see <https://www.gnu.org/licenses/>.
+
+Contact: <https://github.com/elevata-labs/elevata>.
+"""
+
+import types
+from decimal import Decimal
+
+from metadata.ingestion.landing import insert_raw_rows, raw_column_types
+from metadata.rendering.dialects.bulk_load import odbc_input_sizes, tsql_bulk_insert
+
+
+FAKE_PYODBC = types.SimpleNamespace(
+  SQL_WVARCHAR=-9,
+  SQL_VARCHAR=12,
+  SQL_INTEGER=4,
+  SQL_BIGINT=-5,
+  SQL_DECIMAL=3,
+  SQL_TYPE_TIMESTAMP=93,
+  SQL_VARBINARY=-3,
+)
+
+
+class FakeCursor:
+  def __init__(self, conn):
+    self.conn = conn
+    self.fast_executemany = False
+
+  def setinputsizes(self, sizes):
+    self.conn.log.append(("setinputsizes", sizes))
+
+  def execute(self, sql):
+    self.conn.log.append(("execute", sql))
+
+  def executemany(self, sql, params):
+    self.conn.log.append(("executemany", sql, list(params), self.fast_executemany))
+
+
+class FakeConnection:
+  def __init__(self):
+    self.log = []
+
+  def cursor(self):
+    return FakeCursor(self)
+
+
+def _quote(name):
+  return f"[{name}]"
+
+
+def test_odbc_input_sizes_follow_target_column_types():
+  column_types = {
+    "name": {"datatype": "STRING", "max_length": 80},
+    "amount": {"datatype": "DECIMAL", "decimal_precision": 18, "decimal_scale": 2},
+    "qty": {"datatype": "BIGINT"},
+    "payload": {"datatype": "JSON"},
+    "loaded_at": {"datatype": "TIMESTAMP"},
+  }
+  cols = ["name", "amount", "qty", "payload", "loaded_at", "unknown"]
+
+  assert odbc_input_sizes(FAKE_PYODBC, cols, column_types) == [
+    (-9, 80, 0),
+    (3, 18, 2),
+    (-5, 0, 0),
+    (-9, 0, 0),
+    (93, 27, 7),
+    None,
+  ]
+  # Fabric Warehouse has no NVARCHAR
+  assert odbc_input_sizes(FAKE_PYODBC, ["name"], column_types, unicode=False) == [(12, 80, 0)]
+  assert odbc_input_sizes(FAKE_PYODBC, cols, None) is None
+
+
+def test_odbc_input_sizes_leave_unbounded_strings_and_binaries_to_the_driver():
+  column_types = {
+    "note": {"datatype": "STRING"},
+    "blob": {"datatype": "BINARY"},
+    "hash": {"datatype": "BINARY", "max_length": 32},
+  }
+
+  assert odbc_input_sizes(FAKE_PYODBC, ["note", "blob", "hash"], column_types) == [None, None, (-3, 32, 0)]
+
+
+def test_tsql_bulk_insert_batches_with_fast_executemany():
+  conn = FakeConnection()
+  rows = ((i, Decimal("1.50")) for i in range(5))
+
+  n = tsql_bulk_insert(
+    conn,
+    target="[raw].[raw_orders]",
+    columns=["id", "amount"],
+    rows=rows,
+    render_identifier=_quote,
+    input_sizes=[(4, 0, 0), (3, 18, 2)],
+    batch_rows=2,
+  )
+
+  assert n == 5
+  assert conn.log[0] == ("setinputsizes", [(4, 0, 0), (3, 18, 2)])
+  batches = [entry for entry in conn.log if entry[0] == "executemany"]
+  assert [len(b[2]) for b in batches] == [2, 2, 1]
+  assert all(b[3] for b in batches)
+  assert batches[0][1] == "INSERT INTO [raw].[raw_orders] ([id], [amount]) VALUES (?, ?)"
+
+
+def test_tsql_bulk_insert_stages_through_temp_heap_with_tablock():
+  conn = FakeConnection()
+
+  tsql_bulk_insert(
+    conn,
+    target="[raw].[t]",
+    columns=["a"],
+    rows=[(1,), (2,)],
+    render_identifier=_quote,
+    tablock=True,
+  )
+
+  statements = [entry[1] for entry in conn.log]
+  heap = statements[0].split(" INTO ")[1].split(" ")[0]
+  assert heap.startswith("#elevata_bulk_")
+  assert statements[0] == f"SELECT TOP 0 [a] INTO {heap} FROM [raw].[t]"
+  assert statements[1] == f"INSERT INTO {heap} ([a]) VALUES (?)"
+  assert statements[2] == f"INSERT INTO [raw].[t] WITH (TABLOCK) ([a]) SELECT [a] FROM {heap}"
+  assert statements[3] == f"DROP TABLE {heap}"
+
+
+def test_insert_raw_rows_passes_target_column_types_to_bulk_load():
+  calls = []
+
+  def bulk_load(*, schema, table, columns, rows, column_types=None):
+    calls.append(column_types)
+    return len(list(rows))
+
+  col = types.SimpleNamespace(
+    target_column_name="amount",
+    datatype="DECIMAL",
+    max_length=None,
+    decimal_precision=10,
+    decimal_scale=2,
+  )
+  td = types.SimpleNamespace(target_columns=types.SimpleNamespace(all=lambda: [col]))
+
+  n = insert_raw_rows(
+    target_engine=types.SimpleNamespace(bulk_load=bulk_load),
+    target_dialect=types.SimpleNamespace(supports_bulk_load=True),
+    schema_name="raw",
+    table_name="t",
+    columns=["amount"],
+    rows=[(Decimal("1.00"),)],
+    column_types=raw_column_types(td),
+  )
+
+  assert n == 1
+  assert calls[0]["amount"]["decimal_precision"] == 10
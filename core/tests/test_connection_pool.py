@@ -0,0 +1,197 @@
+"""
+elevata - Metadata-driven Data Platform Framework
+Copyright © 2026 Ilona Tag
+
+This file is part of elevata.
+
+elevata is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as
+published by the Free Software Foundation, either version 3 of
+the License, or (at your option) any later version.
+
+elevata is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with elevata. If not, see <https://www.gnu.org/licenses/>.
+
+Contact: <https://github.com/elevata-labs/elevata>.
+"""
+
+import gc
+import sys
+import threading
+import types
+import weakref
+
+import pytest
+
+from metadata.rendering.dialects.connection_pool import ConnectionPool, PoolConfig, select_one_health_check
+from metadata.rendering.dialects.databricks import DatabricksExecutionEngine
+from metadata.rendering.dialects.duckdb import DuckDbExecutionEngine
+from metadata.rendering.dialects.snowflake import SnowflakeExecutionEngine
+
+
+class FakeConnection:
+  def __init__(self, n: int):
+    self.n = n
+    self.healthy = True
+    self.closed = False
+
+  def close(self):
+    self.closed = True
+
+
+def _pool(**config):
+  opened: list[FakeConnection] = []
+
+  def connect():
+    conn = FakeConnection(len(opened) + 1)
+    opened.append(conn)
+    return conn
+
+  def health_check(conn):
+    if not conn.healthy:
+      raise RuntimeError("dead")
+
+  return ConnectionPool(connect, config=PoolConfig(**config), health_check_fn=health_check), opened
+
+
+def test_pool_reuses_connections_and_nests_per_thread():
+  pool, opened = _pool(max_size=2)
+
+  with pool.connection() as outer:
+    with pool.connection() as inner:
+      assert inner is outer
+  with pool.connection() as again:
+    assert again is outer
+  assert len(opened) == 1
+
+  # Concurrent threads never share a connection.
+  barrier = threading.Barrier(2, timeout=5)
+  seen: list[int] = []
+
+  def _use():
+    with pool.connection() as conn:
+      barrier.wait()
+      seen.append(conn.n)
+
+  threads = [threading.Thread(target=_use) for _ in range(2)]
+  for t in threads:
+    t.start()
+  for t in threads:
+    t.join()
+  assert sorted(seen) == [1, 2]
+
+  pool.close()
+  assert all(c.closed for c in opened)
+  assert pool.open_count == 0
+
+
+def test_pool_discards_broken_and_stale_connections():
+  pool, opened = _pool(max_size=1, health_check_seconds=0, max_idle_seconds=3600, checkout_timeout_seconds=0.05)
+
+  with pytest.raises(RuntimeError):
+    with pool.connection() as conn:
+      conn.healthy = False
+      raise RuntimeError("statement failed")
+  assert opened[0].closed is True
+
+  with pool.connection() as conn:
+    assert conn.n == 2
+    # max_size=1: another thread cannot check out while this one holds the connection.
+    errors: list[BaseException] = []
+
+    def _blocked():
+      try:
+        with pool.connection():
+          pass
+      except BaseException as exc:
+        errors.append(exc)
+
+    t = threading.Thread(target=_blocked)
+    t.start()
+    t.join()
+    assert isinstance(errors[0], TimeoutError)
+
+  pool.config.max_idle_seconds = -1
+  with pool.connection() as conn:
+    assert conn.n == 3
+  assert opened[1].closed is True
+
+
+def test_select_one_health_check_ends_the_probe_transaction():
+  calls: list[str] = []
+
+  class Cursor:
+    def execute(self, sql):
+      calls.append(sql)
+
+    def fetchall(self):
+      return [(1,)]
+
+    def close(self):
+      calls.append("close")
+
+  conn = types.SimpleNamespace(cursor=Cursor, rollback=lambda: calls.append("rollback"))
+
+  select_one_health_check(conn)
+
+  assert calls == ["SELECT 1", "close", "rollback"]
+
+
+def test_duckdb_reads_share_the_engine_database():
+  engine = DuckDbExecutionEngine(types.SimpleNamespace(short_name="wh", security={"connection_string": ":memory:"}))
+  try:
+    engine.execute("CREATE TABLE t (x INTEGER); INSERT INTO t VALUES (1), (2)")
+    assert engine.fetch_all("SELECT COUNT(*) FROM t") == [(2,)]
+
+    rows: list = []
+    t = threading.Thread(target=lambda: rows.extend(engine.fetch_all("SELECT MAX(x) FROM t")))
+    t.start()
+    t.join()
+    assert rows == [(2,)]
+  finally:
+    engine.close()
+
+
+def _patch_snowflake_driver(monkeypatch, connect):
+  driver = types.SimpleNamespace(connect=connect)
+  monkeypatch.setattr(SnowflakeExecutionEngine, "_sf", staticmethod(lambda: driver))
+
+
+def _patch_databricks_driver(monkeypatch, connect):
+  package = types.ModuleType("databricks")
+  package.sql = types.SimpleNamespace(connect=connect)
+  monkeypatch.setitem(sys.modules, "databricks", package)
+
+
+@pytest.mark.parametrize("engine_cls, patch_driver, security", [
+  (SnowflakeExecutionEngine, _patch_snowflake_driver, {
+    "account": "acc", "user": "u", "password": "p", "warehouse": "wh", "database": "db",
+  }),
+  (DatabricksExecutionEngine, _patch_databricks_driver, {
+    "server_hostname": "host", "http_path": "/sql/1.0/warehouses/x", "access_token": "t",
+  }),
+])
+def test_unreferenced_engine_is_collected_and_closes_its_pool(monkeypatch, engine_cls, patch_driver, security):
+  opened: list[FakeConnection] = []
+
+  def connect(**_connect_args):
+    opened.append(FakeConnection(len(opened) + 1))
+    return opened[-1]
+
+  patch_driver(monkeypatch, connect)
+  engine = engine_cls(types.SimpleNamespace(short_name="wh", security=security))
+  with engine._pool.connection():
+    pass
+  ref = weakref.ref(engine)
+
+  del engine
+  gc.collect()
+
+  # The pool's connect callable must not keep the engine alive (finalizer closes the pool).
+  assert ref() is None
+  assert opened[0].closed is True
@@ -0,0 +1,116 @@
+"""
+elevata - Metadata-driven Data Platform Framework
+Copyright © 2026 Ilona Tag
+
+This file is part of elevata.
+
+elevata is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as
+published by the Free Software Foundation, either version 3 of
+the License, or (at your option) any later version.
+
+elevata is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with elevata. If not, see <https://www.gnu.org/licenses/>.
+
+Contact: <https://github.com/elevata-labs/elevata>.
+"""
+
+import threading
+
+from metadata.ingestion.connectors import EngineRegistry
+
+
+class FakeEngine:
+  def __init__(self, url: str):
+    self.url = url
+    self.disposed = 0
+
+  def dispose(self):
+    self.disposed += 1
+
+
+class Clock:
+  def __init__(self):
+    self.now = 0.0
+
+  def __call__(self):
+    return self.now
+
+
+def _registry(urls: dict, resolved: list, created: list, clock: Clock) -> EngineRegistry:
+  def resolve(ref):
+    resolved.append(ref)
+    return urls[ref]
+
+  def create(url, **kwargs):
+    eng = FakeEngine(url)
+    eng.kwargs = kwargs
+    created.append(eng)
+    return eng
+
+  return EngineRegistry(
+    secret_ttl_seconds=60,
+    pool_size=3,
+    resolve_url_fn=resolve,
+    create_engine_fn=create,
+    clock=clock,
+  )
+
+
+def test_engine_registry_reuses_engine_and_refreshes_secret_after_ttl():
+  urls = {"sec/dev/conn/postgres/src": "postgresql://u:p1@h/db"}
+  resolved: list = []
+  created: list = []
+  clock = Clock()
+  registry = _registry(urls, resolved, created, clock)
+  ref = "sec/dev/conn/postgres/src"
+
+  first = registry.get(ref)
+  assert registry.get(ref) is first
+  assert resolved == [ref]
+  assert first.kwargs["pool_size"] == 3
+
+  # TTL expired, secret unchanged -> same engine
+  clock.now = 61
+  assert registry.get(ref) is first
+  assert len(resolved) == 2
+
+  # Rotated secret -> new engine, old one disposed
+  clock.now = 200
+  urls[ref] = "postgresql://u:p2@h/db"
+  second = registry.get(ref)
+  assert second is not first
+  assert first.disposed == 1
+  assert second.url.endswith("p2@h/db")
+
+  registry.dispose_all()
+  assert second.disposed == 1
+  assert len(registry) == 0
+
+
+def test_engine_registry_builds_one_engine_under_concurrency():
+  urls = {"ref": "sqlite:///x.db"}
+  resolved: list = []
+  created: list = []
+  registry = _registry(urls, resolved, created, Clock())
+
+  barrier = threading.Barrier(8)
+  engines: list = []
+
+  def _worker():
+    barrier.wait()
+    engines.append(registry.get("ref"))
+
+  threads = [threading.Thread(target=_worker) for _ in range(8)]
+  for t in threads:
+    t.start()
+  for t in threads:
+    t.join()
+
+  assert len(created) == 1
+  assert all(e is created[0] for e in engines)
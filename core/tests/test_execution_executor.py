@@ -21,6 +21,7 @@ Contact: <https://github.com/elevata-labs/elevata>.
 """
 
 import logging
+import threading
 
 import pytest
 
@@ -237,3 +238,105 @@ def test_execute_plan_fail_fast_marks_remaining_as_aborted():
   assert results[1]["kind"] == "aborted"
   assert results[1]["dataset"] == "core.b"
   assert results[1]["status_reason"] == "fail_fast_abort"
+
+
+def test_execute_plan_parallel_runs_independent_steps_concurrently():
+  td1 = FakeTargetDataset(1, "raw", "a")
+  td2 = FakeTargetDataset(2, "raw", "b")
+  td3 = FakeTargetDataset(3, "core", "c")
+
+  plan = ExecutionPlan(
+    batch_run_id="batch-1",
+    steps=[
+      ExecutionStep(dataset_id=1, dataset_key="raw.a", upstream_keys=()),
+      ExecutionStep(dataset_id=2, dataset_key="raw.b", upstream_keys=()),
+      ExecutionStep(dataset_id=3, dataset_key="core.c", upstream_keys=("raw.a", "raw.b")),
+    ],
+  )
+
+  # Both RAW steps must be running at the same time to pass the barrier.
+  barrier = threading.Barrier(2, timeout=5)
+  calls: list[str] = []
+  teardowns: list[str] = []
+
+  def run_dataset_fn(**kwargs):
+    td = kwargs["target_dataset"]
+    if td.target_schema.short_name == "raw":
+      barrier.wait()
+    calls.append(td.target_dataset_name)
+    return {
+      "status": "success",
+      "kind": "ok",
+      "dataset": f"{td.target_schema.short_name}.{td.target_dataset_name}",
+    }
+
+  results, had_error = execute_plan(
+    plan=plan,
+    execution_order=[td1, td2, td3],
+    policy=ExecutionPolicy(continue_on_error=False, max_retries=0, max_workers=4),
+    execute=True,
+    root_td=td1,
+    root_load_run_id="root",
+    root_load_plan=None,
+    run_dataset_fn=run_dataset_fn,
+    logger=logging.getLogger(__name__),
+    worker_teardown_fn=lambda: teardowns.append(threading.current_thread().name),
+  )
+
+  assert had_error is False
+  assert calls[-1] == "c"
+  assert [r["dataset"] for r in results] == ["raw.a", "raw.b", "core.c"]
+  assert len(teardowns) == 3
+
+
+def test_execute_plan_parallel_keeps_blocked_and_fail_fast_semantics():
+  td1 = FakeTargetDataset(1, "raw", "a")
+  td2 = FakeTargetDataset(2, "core", "b")
+  td3 = FakeTargetDataset(3, "core", "c")
+
+  plan = ExecutionPlan(
+    batch_run_id="batch-1",
+    steps=[
+      ExecutionStep(dataset_id=1, dataset_key="raw.a", upstream_keys=()),
+      ExecutionStep(dataset_id=2, dataset_key="core.b", upstream_keys=("raw.a",)),
+      ExecutionStep(dataset_id=3, dataset_key="core.c", upstream_keys=("core.b", "raw.a")),
+    ],
+  )
+
+  def run_dataset_fn(**kwargs):
+    td = kwargs["target_dataset"]
+    if td.target_dataset_name == "a":
+      raise RuntimeError("boom")
+    pytest.fail("downstream should not run")
+
+  results, had_error = execute_plan(
+    plan=plan,
+    execution_order=[td1, td2, td3],
+    policy=ExecutionPolicy(continue_on_error=True, max_retries=0, max_workers=2),
+    execute=True,
+    root_td=td1,
+    root_load_run_id="root",
+    root_load_plan=None,
+    run_dataset_fn=run_dataset_fn,
+    logger=logging.getLogger(__name__),
+  )
+
+  assert had_error is True
+  assert [r["status"] for r in results] == ["error", "skipped", "skipped"]
+  assert results[1]["kind"] == "blocked"
+  assert results[1]["blocked_by"] == "raw.a"
+
+  results, had_error = execute_plan(
+    plan=plan,
+    execution_order=[td1, td2, td3],
+    policy=ExecutionPolicy(continue_on_error=False, max_retries=0, max_workers=2),
+    execute=True,
+    root_td=td1,
+    root_load_run_id="root",
+    root_load_plan=None,
+    run_dataset_fn=run_dataset_fn,
+    logger=logging.getLogger(__name__),
+  )
+
+  assert had_error is True
+  assert [r["kind"] for r in results] == ["exception", "aborted", "aborted"]
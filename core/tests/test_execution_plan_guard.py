@@ -0,0 +1,82 @@
+"""
+elevata - Metadata-driven Data Platform Framework
+Copyright © 2026 Ilona Tag
+
+This file is part of elevata.
+
+elevata is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as
+published by the Free Software Foundation, either version 3 of
+the License, or (at your option) any later version.
+
+elevata is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with elevata. If not, see <https://www.gnu.org/licenses/>.
+
+Contact: <https://github.com/elevata-labs/elevata>.
+"""
+
+import pytest
+
+from metadata.execution.plan_guard import (
+  PlanGuard,
+  current_metadata_revision,
+  plan_guard_token_for_execution_ids,
+)
+
+
+def test_plan_guard_recomputes_fingerprint_only_when_token_moves():
+  token = {"value": 1}
+  fingerprint = {"value": "fp-1"}
+  calls = {"fingerprint": 0}
+
+  def fingerprint_fn():
+    calls["fingerprint"] += 1
+    return fingerprint["value"]
+
+  guard = PlanGuard(fingerprint_fn=fingerprint_fn, token_fn=lambda: token["value"])
+  assert guard.fingerprint == "fp-1"
+
+  for _ in range(5):
+    assert guard.current_fingerprint() == "fp-1"
+  assert calls["fingerprint"] == 1
+
+  token["value"] = 2
+  fingerprint["value"] = "fp-2"
+  assert guard.current_fingerprint() == "fp-2"
+  assert guard.current_fingerprint() == "fp-2"
+  assert calls["fingerprint"] == 2
+
+
+def test_plan_guard_without_token_always_recomputes():
+  calls = {"fingerprint": 0}
+
+  def fingerprint_fn():
+    calls["fingerprint"] += 1
+    return "fp"
+
+  guard = PlanGuard(fingerprint_fn=fingerprint_fn)
+  guard.current_fingerprint()
+  guard.current_fingerprint()
+
+  assert calls["fingerprint"] == 3
+
+
+@pytest.mark.django_db
+def test_plan_guard_token_moves_on_dataset_save(raw_stage_rawcore_datasets):
+  raw_ds, stage_ds, rawcore_ds = raw_stage_rawcore_datasets
+  ids = [raw_ds.pk, stage_ds.pk, rawcore_ds.pk]
+
+  token = plan_guard_token_for_execution_ids(ids)
+  assert plan_guard_token_for_execution_ids(ids) == token
+
+  revision = current_metadata_revision()
+  stage_ds.description = "changed"
+  stage_ds.save()
+
+  assert current_metadata_revision() > revision
+  assert plan_guard_token_for_execution_ids(ids) != token
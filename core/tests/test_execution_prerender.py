@@ -0,0 +1,111 @@
+"""
+elevata - Metadata-driven Data Platform Framework
+Copyright © 2026 Ilona Tag
+
+This file is part of elevata.
+
+elevata is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as
+published by the Free Software Foundation, either version 3 of
+the License, or (at your option) any later version.
+
+elevata is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with elevata. If not, see <https://www.gnu.org/licenses/>.
+
+Contact: <https://github.com/elevata-labs/elevata>.
+"""
+
+import threading
+
+from metadata.execution.executor import ExecutionPlan, ExecutionStep
+from metadata.execution.prerender import attach_prerendered_sql, prerender_plan
+
+
+class FakeSchema:
+  def __init__(self, short_name: str):
+    self.short_name = short_name
+
+
+class FakeTargetDataset:
+  def __init__(self, id: int, schema_short: str, dataset_name: str):
+    self.id = id
+    self.target_schema = FakeSchema(schema_short)
+    self.target_dataset_name = dataset_name
+
+
+def _plan_and_order():
+  order = [
+    FakeTargetDataset(1, "raw", "a"),
+    FakeTargetDataset(2, "stage", "a"),
+    FakeTargetDataset(3, "rawcore", "a"),
+    FakeTargetDataset(4, "stage", "broken"),
+  ]
+  plan = ExecutionPlan(
+    batch_run_id="batch-1",
+    steps=[
+      ExecutionStep(dataset_id=1, dataset_key="raw.a", upstream_keys=()),
+      ExecutionStep(dataset_id=2, dataset_key="stage.a", upstream_keys=("raw.a",)),
+      ExecutionStep(dataset_id=3, dataset_key="rawcore.a", upstream_keys=("stage.a",)),
+      ExecutionStep(dataset_id=4, dataset_key="stage.broken", upstream_keys=("raw.a",)),
+    ],
+  )
+  return plan, order
+
+
+def test_prerender_renders_eligible_steps_concurrently_and_collects_errors():
+  plan, order = _plan_and_order()
+  # Both healthy SQL steps must render at the same time to pass the barrier.
+  barrier = threading.Barrier(2, timeout=5)
+  teardowns: list[str] = []
+
+  def render_fn(td):
+    if td.target_dataset_name == "broken":
+      raise ValueError("missing mapping")
+    barrier.wait()
+    return f"INSERT INTO {td.target_schema.short_name}.{td.target_dataset_name} SELECT {{{{load_run_id}}}}"
+
+  rendered = prerender_plan(
+    plan=plan,
+    execution_order=order,
+    render_fn=render_fn,
+    should_render_fn=lambda td: td.target_schema.short_name != "raw",
+    max_workers=3,
+    worker_teardown_fn=lambda: teardowns.append(threading.current_thread().name),
+  )
+
+  assert sorted(rendered) == ["rawcore.a", "stage.a", "stage.broken"]
+  assert rendered["stage.broken"].error == "missing mapping"
+  assert rendered["stage.a"].error is None
+  assert len(teardowns) == 3
+
+  attach_prerendered_sql(plan, rendered)
+  by_key = {s.dataset_key: s for s in plan.steps}
+  assert by_key["raw.a"].rendered_sql is None
+  assert by_key["stage.broken"].rendered_sql is None
+  # Runtime placeholders stay unbound in the plan.
+  assert by_key["stage.a"].rendered_sql == "INSERT INTO stage.a SELECT {{load_run_id}}"
+  assert by_key["rawcore.a"].upstream_keys == ("stage.a",)
+
+
+def test_prerender_validation_failures_are_reported_per_step():
+  plan, order = _plan_and_order()
+
+  def validate_fn(td, sql):
+    if not sql.strip():
+      raise RuntimeError("Non-executable SQL")
+
+  rendered = prerender_plan(
+    plan=plan,
+    execution_order=order,
+    render_fn=lambda td: "" if td.target_schema.short_name == "rawcore" else "SELECT 1",
+    validate_fn=validate_fn,
+    max_workers=1,
+  )
+
+  assert rendered["rawcore.a"].error == "Non-executable SQL"
+  assert rendered["raw.a"].sql == "SELECT 1"
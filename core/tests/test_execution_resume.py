@@ -0,0 +1,198 @@
+"""
+elevata - Metadata-driven Data Platform Framework
+Copyright © 2026 Ilona Tag
+
+This file is part of elevata.
+
+elevata is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as
+published by the Free Software Foundation, either version 3 of
+the License, or (at your option) any later version.
+
+elevata is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with elevata. If not, see <https://www.gnu.org/licenses/>.
+
+Contact: <https://github.com/elevata-labs/elevata>.
+"""
+
+import json
+import types
+from datetime import datetime, timezone
+
+from metadata.execution.load_run_snapshot_store import (
+  build_load_run_snapshot_row,
+  ensure_load_run_snapshot_table,
+)
+from metadata.execution.resume import (
+  build_resume_plan,
+  compute_resume_keys,
+  load_batch_succeeded_keys,
+  load_resume_state,
+  merge_resume_results,
+  parse_resume_state,
+)
+from metadata.materialization.logging import build_load_run_log_row, ensure_load_run_log_table
+from metadata.rendering.dialects.duckdb import DuckDBDialect, DuckDbExecutionEngine
+
+
+def _snapshot(results, *, resume_no: int = 0) -> dict:
+  return {
+    "batch_run_id": "batch-1",
+    "context": {"execute": True, "root_dataset": "core.d", "plan_fingerprint": "fp", "resume_no": resume_no},
+    "plan": {"steps": [
+      {"dataset_id": 1, "dataset_key": "raw.a", "upstream_keys": []},
+      {"dataset_id": 2, "dataset_key": "raw.b", "upstream_keys": []},
+      {"dataset_id": 3, "dataset_key": "stage.c", "upstream_keys": ["raw.a"]},
+      {"dataset_id": 4, "dataset_key": "core.d", "upstream_keys": ["raw.b", "stage.c"]},
+      {"dataset_id": 5, "dataset_key": "core.e", "upstream_keys": ["raw.a"]},
+    ]},
+    "outcome": {"results": results},
+  }
+
+
+_FAIL_FAST_RESULTS = [
+  {"dataset": "raw.a", "status": "success", "kind": "ingestion"},
+  {"dataset": "raw.b", "status": "error", "kind": "exception", "message": "boom"},
+  {"dataset": "stage.c", "status": "skipped", "kind": "aborted", "status_reason": "fail_fast_abort"},
+  {"dataset": "core.d", "status": "skipped", "kind": "aborted", "status_reason": "fail_fast_abort"},
+  {"dataset": "core.e", "status": "skipped", "kind": "unchanged", "status_reason": "inputs_unchanged"},
+]
+
+
+def test_resume_reruns_unfinished_steps_and_their_downstream():
+  state = parse_resume_state(_snapshot(_FAIL_FAST_RESULTS))
+  assert state.plan_fingerprint == "fp"
+
+  keys = compute_resume_keys(state)
+  assert keys == ["raw.b", "stage.c", "core.d"]
+
+  plan = build_resume_plan(state, keys)
+  assert plan.batch_run_id == "batch-1"
+  assert [s.dataset_key for s in plan.steps] == keys
+
+  # A success logged by an interrupted resume is not repeated.
+  assert compute_resume_keys(state, {"raw.b"}) == ["stage.c", "core.d"]
+
+  merged = merge_resume_results(state, [
+    {"dataset": "raw.b", "status": "success"},
+    {"dataset": "stage.c", "status": "success"},
+    {"dataset": "core.d", "status": "error"},
+  ])
+  assert [r["status"] for r in merged] == ["success", "success", "success", "error", "skipped"]
+
+  # The merged snapshot resumes only what is still open.
+  again = parse_resume_state(_snapshot(merged, resume_no=1))
+  assert again.resume_no == 1
+  assert compute_resume_keys(again) == ["core.d"]
+
+
+def test_resume_state_loads_latest_snapshot_and_logged_successes(tmp_path):
+  dialect = DuckDBDialect()
+  engine = DuckDbExecutionEngine(types.SimpleNamespace(
+    short_name="wh",
+    security={"connection_string": str(tmp_path / "wh.duckdb")},
+  ))
+  try:
+    ensure_load_run_snapshot_table(engine=engine, dialect=dialect, meta_schema="meta", auto_provision=True)
+    ensure_load_run_log_table(engine=engine, dialect=dialect, meta_schema="meta", auto_provision=True)
+
+    original = _snapshot(_FAIL_FAST_RESULTS)
+    resumed = _snapshot(
+      [{**r, "status": "success"} if r["dataset"] == "raw.b" else r for r in _FAIL_FAST_RESULTS],
+      resume_no=1,
+    )
+    for hour, snap in ((1, original), (2, resumed)):
+      row = build_load_run_snapshot_row(
+        batch_run_id="batch-1",
+        created_at=datetime(2026, 1, 1, hour, tzinfo=timezone.utc),
+        root_dataset_key="core.d",
+        is_execute=True,
+        continue_on_error=False,
+        max_retries=0,
+        had_error=True,
+        step_count=5,
+        snapshot_json=json.dumps(snap),
+      )
+      engine.execute(dialect.render_insert_load_run_snapshot(meta_schema="meta", values=row))
+
+    ts = datetime(2026, 1, 1, 3, tzinfo=timezone.utc)
+    values = build_load_run_log_row(
+      batch_run_id="batch-1",
+      load_run_id="run-c",
+      target_schema="stage",
+      target_dataset="c",
+      target_system="wh",
+      profile="test",
+      mode="full",
+      handle_deletes=False,
+      historize=False,
+      started_at=ts,
+      finished_at=ts,
+      render_ms=0.0,
+      execution_ms=1.0,
+      sql_length=0,
+      rows_affected=1,
+      status="success",
+      error_message=None,
+    )
+    engine.execute(dialect.render_insert_load_run_log(meta_schema="meta", values=values))
+    # A partition row alone does not mark its dataset as succeeded.
+    engine.execute(dialect.render_insert_load_run_log(meta_schema="meta", values={
+      **values,
+      "load_run_id": "run-e",
+      "target_schema": "raw",
+      "target_dataset": "e",
+      "run_kind": "ingestion_partition",
+    }))
+
+    state = load_resume_state(engine=engine, dialect=dialect, meta_schema="meta", batch_run_id="batch-1")
+    succeeded = load_batch_succeeded_keys(engine=engine, dialect=dialect, meta_schema="meta", batch_run_id="batch-1")
+    missing = load_resume_state(engine=engine, dialect=dialect, meta_schema="meta", batch_run_id="other")
+  finally:
+    engine.close()
+
+  assert missing is None
+  assert state is not None and state.resume_no == 1
+  assert succeeded == {"stage.c"}
+  assert compute_resume_keys(state, succeeded) == ["core.d"]
+
+
+def test_resume_state_ignores_newer_rest_cursor_snapshots_of_the_batch(tmp_path):
+  dialect = DuckDBDialect()
+  engine = DuckDbExecutionEngine(types.SimpleNamespace(
+    short_name="wh",
+    security={"connection_string": str(tmp_path / "wh.duckdb")},
+  ))
+  try:
+    ensure_load_run_snapshot_table(engine=engine, dialect=dialect, meta_schema="meta", auto_provision=True)
+
+    # The batch snapshot is stamped at batch start, the REST cursor during the run.
+    for hour, root_key, snap in (
+      (1, "core.d", _snapshot(_FAIL_FAST_RESULTS)),
+      (2, "ingestion:api:items", {"cursor": "p2", "pages": {}}),
+    ):
+      row = build_load_run_snapshot_row(
+        batch_run_id="batch-1",
+        created_at=datetime(2026, 1, 1, hour, tzinfo=timezone.utc),
+        root_dataset_key=root_key,
+        is_execute=True,
+        continue_on_error=True,
+        max_retries=0,
+        had_error=False,
+        step_count=1,
+        snapshot_json=json.dumps(snap),
+      )
+      engine.execute(dialect.render_insert_load_run_snapshot(meta_schema="meta", values=row))
+
+    state = load_resume_state(engine=engine, dialect=dialect, meta_schema="meta", batch_run_id="batch-1")
+  finally:
+    engine.close()
+
+  assert state is not None
+  assert state.root_dataset_key == "core.d"
+  assert len(state.steps) == 5
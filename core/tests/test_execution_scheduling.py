@@ -0,0 +1,125 @@
+"""
+elevata - Metadata-driven Data Platform Framework
+Copyright © 2026 Ilona Tag
+
+This file is part of elevata.
+
+elevata is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as
+published by the Free Software Foundation, either version 3 of
+the License, or (at your option) any later version.
+
+elevata is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with elevata. If not, see <https://www.gnu.org/licenses/>.
+
+Contact: <https://github.com/elevata-labs/elevata>.
+"""
+
+import logging
+import threading
+from datetime import datetime, timedelta
+
+from metadata.execution.executor import (
+  ExecutionPlan,
+  ExecutionPolicy,
+  ExecutionStep,
+  execute_plan,
+)
+from metadata.execution.scheduling import (
+  RuntimeStats,
+  compute_critical_path_weights,
+  summarize_runtime_rows,
+)
+
+
+class FakeSchema:
+  def __init__(self, short_name: str):
+    self.short_name = short_name
+
+
+class FakeTargetDataset:
+  def __init__(self, id: int, schema_short: str, dataset_name: str):
+    self.id = id
+    self.target_schema = FakeSchema(schema_short)
+    self.target_dataset_name = dataset_name
+
+
+def test_summarize_runtime_rows_computes_percentiles_and_duration_fallback():
+  t0 = datetime(2026, 1, 1, 12, 0, 0)
+  rows = [
+    ("raw", "a", 100, t0, t0),
+    ("raw", "a", 300, t0, t0),
+    ("raw", "a", 200, t0, t0),
+    # execution_ms=0 (file landing): duration derived from timestamps
+    ("raw", "f", 0, t0, t0 + timedelta(seconds=2)),
+  ]
+
+  stats = summarize_runtime_rows(rows)
+
+  assert stats["raw.a"] == RuntimeStats(p50_ms=200.0, p95_ms=300.0, samples=3)
+  assert stats["raw.f"].p50_ms == 2000.0
+
+
+def test_critical_path_weights_prefer_long_chains():
+  plan = ExecutionPlan(
+    batch_run_id="b",
+    steps=[
+      ExecutionStep(dataset_id=1, dataset_key="raw.short", upstream_keys=()),
+      ExecutionStep(dataset_id=2, dataset_key="raw.long", upstream_keys=()),
+      ExecutionStep(dataset_id=3, dataset_key="stage.long", upstream_keys=("raw.long",)),
+    ],
+  )
+  stats = {
+    "raw.short": RuntimeStats(p50_ms=50.0, p95_ms=60.0, samples=1),
+    "raw.long": RuntimeStats(p50_ms=10.0, p95_ms=20.0, samples=1),
+    "stage.long": RuntimeStats(p50_ms=100.0, p95_ms=500.0, samples=1),
+  }
+
+  weights = compute_critical_path_weights(plan=plan, runtime_stats=stats)
+
+  assert weights == {"raw.short": 50.0, "raw.long": 110.0, "stage.long": 100.0}
+  assert compute_critical_path_weights(plan=plan, runtime_stats={}) == {}
+
+
+def test_execute_plan_dispatches_highest_priority_first():
+  tds = [FakeTargetDataset(i, "raw", name) for i, name in enumerate(("a", "b", "c"), start=1)]
+  plan = ExecutionPlan(
+    batch_run_id="b",
+    steps=[
+      ExecutionStep(dataset_id=td.id, dataset_key=f"raw.{td.target_dataset_name}", upstream_keys=())
+      for td in tds
+    ],
+  )
+
+  barrier = threading.Barrier(2, timeout=5)
+  started: list[str] = []
+
+  def run_dataset_fn(**kwargs):
+    name = kwargs["target_dataset"].target_dataset_name
+    started.append(name)
+    if len(started) <= 2:
+      barrier.wait()
+    return {"status": "success", "kind": "ok", "dataset": f"raw.{name}"}
+
+  results, had_error = execute_plan(
+    plan=plan,
+    execution_order=tds,
+    policy=ExecutionPolicy(continue_on_error=False, max_retries=0, max_workers=2),
+    execute=True,
+    root_td=tds[0],
+    root_load_run_id="root",
+    root_load_plan=None,
+    run_dataset_fn=run_dataset_fn,
+    logger=logging.getLogger(__name__),
+    priority_by_key={"raw.a": 1.0, "raw.b": 5.0, "raw.c": 10.0},
+  )
+
+  assert had_error is False
+  assert set(started[:2]) == {"b", "c"}
+  assert started[2] == "a"
+  assert [r["dataset"] for r in results] == ["raw.a", "raw.b", "raw.c"]
@@ -0,0 +1,243 @@
+"""
+elevata - Metadata-driven Data Platform Framework
+Copyright © 2026 Ilona Tag
+
+This file is part of elevata.
+
+elevata is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as
+published by the Free Software Foundation, either version 3 of
+the License, or (at your option) any later version.
+
+elevata is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with elevata. If not, see <https://www.gnu.org/licenses/>.
+
+Contact: <https://github.com/elevata-labs/elevata>.
+"""
+
+import types
+from datetime import datetime, timezone
+
+from metadata.execution.watermark import (
+  InputWatermarkTracker,
+  build_load_watermark_row,
+  ensure_load_watermark_table,
+)
+from metadata.materialization.logging import build_load_run_log_row, ensure_load_run_log_table
+from metadata.rendering.dialects.duckdb import DuckDBDialect, DuckDbExecutionEngine
+
+
+def test_zero_row_upstream_runs_keep_watermark_stable():
+  tracker = InputWatermarkTracker(change_run_ids={"raw.a": "run-1"}, watermarks={})
+
+  first = tracker.evaluate(
+    dataset_key="stage.a",
+    upstream_keys=("raw.a",),
+    definition_fingerprint_fn=lambda: "fp",
+  )
+  assert first.unchanged is False
+  assert first.reason == "no_watermark"
+  tracker.record_watermark(dataset_key="stage.a", watermark=first.watermark)
+
+  # Incremental upstream re-ran but changed nothing: downstream stays unchanged.
+  tracker.record_run(dataset_key="raw.a", rows_affected=0, load_run_id="run-2", mode="incremental")
+  assert tracker.evaluate(
+    dataset_key="stage.a",
+    upstream_keys=("raw.a",),
+    definition_fingerprint_fn=lambda: "fp",
+  ).unchanged is True
+
+  # A changed definition invalidates the watermark.
+  assert tracker.evaluate(
+    dataset_key="stage.a",
+    upstream_keys=("raw.a",),
+    definition_fingerprint_fn=lambda: "fp-new",
+  ).unchanged is False
+
+  # Upstream changed data.
+  tracker.record_run(dataset_key="raw.a", rows_affected=5, load_run_id="run-3")
+  changed = tracker.evaluate(
+    dataset_key="stage.a",
+    upstream_keys=("raw.a",),
+    definition_fingerprint_fn=lambda: "fp",
+  )
+  assert changed.unchanged is False
+  assert changed.reason == "inputs_changed"
+  assert changed.inputs == {"raw.a": "run-3"}
+
+
+def test_datasets_without_upstream_datasets_are_never_skipped():
+  tracker = InputWatermarkTracker(change_run_ids={}, watermarks={})
+
+  def _fail():
+    raise AssertionError("definition must not be rendered for source-fed datasets")
+
+  # RAW datasets resolve to themselves as upstream.
+  check = tracker.evaluate(dataset_key="raw.a", upstream_keys=("raw.a",), definition_fingerprint_fn=_fail)
+  assert check.unchanged is False
+  assert check.watermark is None
+
+
+def test_tracker_loads_latest_markers_and_watermarks_from_meta_tables(tmp_path):
+  dialect = DuckDBDialect()
+  engine = DuckDbExecutionEngine(types.SimpleNamespace(
+    short_name="wh",
+    security={"connection_string": str(tmp_path / "wh.duckdb")},
+  ))
+  try:
+    ensure_load_run_log_table(engine=engine, dialect=dialect, meta_schema="meta", auto_provision=True)
+    ensure_load_watermark_table(engine=engine, dialect=dialect, meta_schema="meta", auto_provision=True)
+
+    def _log(load_run_id: str, rows: int, hour: int, mode: str = "incremental", status: str = "success"):
+      ts = datetime(2026, 1, 1, hour, tzinfo=timezone.utc)
+      values = build_load_run_log_row(
+        batch_run_id="b",
+        load_run_id=load_run_id,
+        target_schema="raw",
+        target_dataset="a",
+        target_system="wh",
+        profile="test",
+        mode=mode,
+        handle_deletes=False,
+        historize=False,
+        started_at=ts,
+        finished_at=ts,
+        render_ms=0.0,
+        execution_ms=1.0,
+        sql_length=0,
+        rows_affected=rows,
+        status=status,
+        error_message=None,
+      )
+      engine.execute(dialect.render_insert_load_run_log(meta_schema="meta", values=values))
+
+    _log("run-1", 10, 1)
+    _log("run-2", 0, 2)
+
+    seeded = InputWatermarkTracker(change_run_ids={"raw.a": "run-1"}, watermarks={})
+    check = seeded.evaluate(dataset_key="stage.a", upstream_keys=("raw.a",), definition_fingerprint_fn=lambda: "fp")
+    row = build_load_watermark_row(
+      dataset_key="stage.a",
+      check=check,
+      batch_run_id="b",
+      load_run_id="run-s",
+      created_at=datetime(2026, 1, 1, 3, tzinfo=timezone.utc),
+    )
+    engine.execute(dialect.render_insert_load_watermark(meta_schema="meta", values=row))
+
+    tracker = InputWatermarkTracker.load(
+      engine=engine,
+      dialect=dialect,
+      meta_schema="meta",
+      dataset_keys=["raw.a", "stage.a"],
+      lookback_days=0,
+    )
+  finally:
+    engine.close()
+
+  assert tracker is not None
+  # run-2 affected zero rows, so run-1 is still the last change of raw.a.
+  again = tracker.evaluate(dataset_key="stage.a", upstream_keys=("raw.a",), definition_fingerprint_fn=lambda: "fp")
+  assert again.inputs == {"raw.a": "run-1"}
+  assert again.unchanged is True
+
+
+def test_zero_row_full_refresh_counts_as_change():
+  tracker = InputWatermarkTracker(change_run_ids={"raw.a": "run-1"}, watermarks={})
+
+  tracker.record_run(dataset_key="raw.a", rows_affected=0, load_run_id="run-2", mode="merge")
+  tracker.record_run(dataset_key="raw.b", rows_affected=0, load_run_id="run-3", mode="full")
+  tracker.record_run(dataset_key="raw.c", rows_affected=0, load_run_id="run-4")
+
+  check = tracker.evaluate(
+    dataset_key="stage.a",
+    upstream_keys=("raw.a", "raw.b", "raw.c"),
+    definition_fingerprint_fn=lambda: "fp",
+  )
+  assert check.inputs == {"raw.a": "run-1", "raw.b": "run-3", "raw.c": "run-4"}
+
+
+def test_change_runs_include_rest_status_and_full_refreshes_within_lookback(tmp_path):
+  dialect = DuckDBDialect()
+  engine = DuckDbExecutionEngine(types.SimpleNamespace(
+    short_name="wh",
+    security={"connection_string": str(tmp_path / "wh.duckdb")},
+  ))
+  try:
+    ensure_load_run_log_table(engine=engine, dialect=dialect, meta_schema="meta", auto_provision=True)
+
+    def _log(dataset: str, load_run_id: str, rows: int, day: int, mode: str, status: str = "success"):
+      ts = datetime(2026, 1, day, tzinfo=timezone.utc)
+      values = build_load_run_log_row(
+        batch_run_id="b",
+        load_run_id=load_run_id,
+        target_schema="raw",
+        target_dataset=dataset,
+        target_system="wh",
+        profile="test",
+        mode=mode,
+        handle_deletes=False,
+        historize=False,
+        started_at=ts,
+        finished_at=ts,
+        render_ms=0.0,
+        execution_ms=1.0,
+        sql_length=0,
+        rows_affected=rows,
+        status=status,
+        error_message=None,
+      )
+      engine.execute(dialect.render_insert_load_run_log(meta_schema="meta", values=values))
+
+    _log("a", "a-1", 5, 20, "full", status="ok")
+    _log("b", "b-1", 5, 20, "full")
+    _log("b", "b-2", 0, 21, "full")
+    _log("c", "c-1", 5, 1, "full")
+    # Partition rows are slices of a dataset run, not change markers of their own.
+    engine.execute(dialect.render_insert_load_run_log(meta_schema="meta", values={
+      **build_load_run_log_row(
+        batch_run_id="b",
+        load_run_id="d-1",
+        target_schema="raw",
+        target_dataset="d",
+        target_system="wh",
+        profile="test",
+        mode="full",
+        handle_deletes=False,
+        historize=False,
+        started_at=datetime(2026, 1, 21, tzinfo=timezone.utc),
+        finished_at=datetime(2026, 1, 21, tzinfo=timezone.utc),
+        render_ms=0.0,
+        execution_ms=1.0,
+        sql_length=0,
+        rows_affected=5,
+        status="success",
+        error_message=None,
+      ),
+      "run_kind": "ingestion_partition",
+    }))
+
+    tracker = InputWatermarkTracker.load(
+      engine=engine,
+      dialect=dialect,
+      meta_schema="meta",
+      dataset_keys=["raw.a", "raw.b", "raw.c", "raw.d"],
+      lookback_days=7,
+      now_ts=datetime(2026, 1, 22),
+    )
+  finally:
+    engine.close()
+
+  assert tracker is not None
+  check = tracker.evaluate(
+    dataset_key="stage.x",
+    upstream_keys=("raw.a", "raw.b", "raw.c", "raw.d"),
+    definition_fingerprint_fn=lambda: "fp",
+  )
+  # c-1 is older than the lookback window.
+  assert check.inputs == {"raw.a": "a-1", "raw.b": "b-2", "raw.c": "", "raw.d": ""}
@@ -0,0 +1,164 @@
+"""
+elevata - Metadata-driven Data Platform Framework
+Copyright © 2026 Ilona Tag
+
+This file is part of elevata.
+
+elevata is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as
+published by the Free Software Foundation, either version 3 of
+the License, or (at your option) any later version.
+
+elevata is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with elevata. If not, see <https://www.gnu.org/licenses/>.
+
+Contact: <https://github.com/elevata-labs/elevata>.
+"""
+
+import threading
+from datetime import timedelta
+
+import pytest
+from django.db import connections
+from django.utils import timezone
+
+from metadata.execution.executor import ExecutionPlan, ExecutionPolicy, ExecutionStep
+from metadata.execution.work_queue import (
+  claim_next_step,
+  complete_step,
+  enqueue_plan,
+  heartbeat,
+  run_worker,
+  wait_for_batch,
+)
+from metadata.models import LoadQueueStep
+
+
+def _chain_plan(batch_run_id: str, datasets) -> ExecutionPlan:
+  raw_ds, stage_ds, rawcore_ds = datasets
+  return ExecutionPlan(
+    batch_run_id=batch_run_id,
+    steps=[
+      ExecutionStep(dataset_id=raw_ds.pk, dataset_key="raw.a", upstream_keys=()),
+      ExecutionStep(dataset_id=stage_ds.pk, dataset_key="stage.b", upstream_keys=("raw.a",)),
+      ExecutionStep(dataset_id=rawcore_ds.pk, dataset_key="rawcore.c", upstream_keys=("stage.b",)),
+    ],
+  )
+
+
+@pytest.mark.django_db
+def test_queue_claims_ready_steps_and_blocks_downstream_of_errors(raw_stage_rawcore_datasets):
+  batch = enqueue_plan(
+    plan=_chain_plan("batch-q1", raw_stage_rawcore_datasets),
+    policy=ExecutionPolicy(continue_on_error=True, max_retries=0),
+    execute=True,
+  )
+
+  first = claim_next_step(worker_id="w1")
+  assert first.dataset_key == "raw.a"
+  # stage.b waits for raw.a
+  assert claim_next_step(worker_id="w2") is None
+
+  assert complete_step(step=first, worker_id="w1", result={"status": "success", "dataset": "raw.a"}, is_error=False)
+  second = claim_next_step(worker_id="w2")
+  assert second.dataset_key == "stage.b"
+  assert complete_step(step=second, worker_id="w2", result={"status": "error", "dataset": "stage.b"}, is_error=True)
+
+  assert claim_next_step(worker_id="w1") is None
+  results, had_error = wait_for_batch(batch, poll_seconds=0.01, timeout_seconds=5)
+
+  assert had_error is True
+  assert [r["status"] for r in results] == ["success", "error", "skipped"]
+  assert results[2]["kind"] == "blocked"
+  assert results[2]["blocked_by"] == "stage.b"
+
+
+@pytest.mark.django_db
+def test_expired_lease_is_requeued_and_stale_result_discarded(raw_stage_rawcore_datasets):
+  enqueue_plan(
+    plan=_chain_plan("batch-q2", raw_stage_rawcore_datasets),
+    policy=ExecutionPolicy(continue_on_error=False, max_retries=0),
+    execute=True,
+  )
+
+  lost = claim_next_step(worker_id="w1", lease_seconds=60)
+  LoadQueueStep.objects.filter(pk=lost.pk).update(lease_expires_at=timezone.now() - timedelta(seconds=1))
+
+  again = claim_next_step(worker_id="w2", lease_seconds=60)
+  assert again.pk == lost.pk
+  assert again.claim_no == 2
+
+  assert heartbeat(step=lost, worker_id="w1") is False
+  assert complete_step(step=lost, worker_id="w1", result={"status": "success"}, is_error=False) is False
+  assert heartbeat(step=again, worker_id="w2") is True
+
+  # Fail-fast: an error aborts everything that has not started.
+  assert complete_step(step=again, worker_id="w2", result={"status": "error"}, is_error=True) is True
+  kinds = list(
+    LoadQueueStep.objects.filter(batch__batch_run_id="batch-q2").order_by("seq").values_list("status", "result__kind")
+  )
+  assert kinds[1:] == [("skipped", "aborted"), ("skipped", "aborted")]
+
+
+@pytest.mark.django_db(transaction=True)
+def test_concurrent_workers_drain_a_batch_once(raw_stage_rawcore_datasets):
+  batch = enqueue_plan(
+    plan=_chain_plan("batch-q3", raw_stage_rawcore_datasets),
+    policy=ExecutionPolicy(continue_on_error=False, max_retries=0),
+    execute=True,
+  )
+
+  runs: list[str] = []
+  lock = threading.Lock()
+
+  def run_step_fn(step):
+    with lock:
+      runs.append(step.dataset_key)
+    return {"status": "success", "dataset": step.dataset_key}, False
+
+  def _worker(name: str):
+    try:
+      run_worker(worker_id=name, run_step_fn=run_step_fn, poll_seconds=0.01, exit_when_idle=True)
+    finally:
+      connections.close_all()
+
+  threads = [threading.Thread(target=_worker, args=(f"w{i}",)) for i in range(3)]
+  for t in threads:
+    t.start()
+  for t in threads:
+    t.join(timeout=30)
+
+  results, had_error = wait_for_batch(batch, poll_seconds=0.01, timeout_seconds=5)
+  assert had_error is False
+  assert runs == ["raw.a", "stage.b", "rawcore.c"]
+  assert [r["status"] for r in results] == ["success", "success", "success"]
+
+
+@pytest.mark.django_db
+def test_migration_plan_survives_batch_options_round_trip(raw_stage_rawcore_datasets):
+  from metadata.architecture.migration_plan import MigrationAction, MigrationPlan
+
+  plan = MigrationPlan(actions=(
+    MigrationAction(action_type="ADD_COLUMN", strategy="ALTER_TABLE", dataset_key="rawcore.c", column_name="x"),
+    MigrationAction(
+      action_type="RENAME_DATASET", strategy="RENAME_TABLE", dataset_key="rawcore.c", previous_dataset_key="rawcore.old",
+    ),
+  ))
+  batch = enqueue_plan(
+    plan=_chain_plan("batch-q4", raw_stage_rawcore_datasets),
+    policy=ExecutionPolicy(continue_on_error=True, max_retries=0),
+    execute=True,
+    options={"migration_plan": plan.to_dicts(), "chunk_size": 2000},
+  )
+
+  step = claim_next_step(worker_id="w1")
+  opts = step.batch.options
+
+  assert step.batch == batch
+  assert MigrationPlan.from_dicts(opts["migration_plan"]) == plan
+  assert opts["chunk_size"] == 2000
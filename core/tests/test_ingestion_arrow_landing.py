@@ -0,0 +1,211 @@
+"""
+elevata - Metadata-driven Data Platform Framework
+Copyright © 2026 Ilona Tag
+
+This file is part of elevata.
+
+elevata is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as
+published by the Free Software Foundation, either version 3 of
+the License, or (at your option) any later version.
+
+elevata is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with elevata. If not, see <https://www.gnu.org/licenses/>.
+
+Contact: <https://github.com/elevata-labs/elevata>.
+"""
+
+import datetime
+import json
+import types
+from decimal import Decimal
+
+import pyarrow as pa
+
+from metadata.ingestion.landing import (
+  arrow_payload_json,
+  land_raw_arrow_batch,
+  land_raw_json_records,
+  resolve_raw_arrow_column_map,
+)
+from metadata.rendering.dialects.duckdb import DuckDBDialect, DuckDbExecutionEngine
+
+
+class FakeQuerySet(list):
+  def all(self):
+    return self
+
+  def filter(self, **kwargs):
+    return self
+
+  def order_by(self, *args):
+    return self
+
+
+def _raw_dataset(json_paths: dict[str, str]):
+  cols = [types.SimpleNamespace(target_column_name=n, system_role=None) for n in json_paths]
+  cols += [
+    types.SimpleNamespace(target_column_name="payload", system_role="payload"),
+    types.SimpleNamespace(target_column_name="load_run_id", system_role="load_run_id"),
+    types.SimpleNamespace(target_column_name="loaded_at", system_role="loaded_at"),
+  ]
+  td = types.SimpleNamespace(
+    target_schema=types.SimpleNamespace(short_name="raw", schema_name="raw"),
+    target_dataset_name="raw_orders",
+    target_columns=FakeQuerySet(cols),
+  )
+  source_dataset = types.SimpleNamespace(source_columns=FakeQuerySet(
+    types.SimpleNamespace(source_column_name=n, json_path=p) for n, p in json_paths.items()
+  ))
+  return td, source_dataset
+
+
+def test_arrow_column_map_matches_normalized_names_and_rejects_nested_paths():
+  td, sd = _raw_dataset({"order_id": "$.order_id", "amount": "$.amount"})
+  assert resolve_raw_arrow_column_map(td=td, source_dataset=sd, arrow_names=["Order ID", "amount"]) == {
+    "order_id": "Order ID",
+    "amount": "amount",
+  }
+
+  td, sd = _raw_dataset({"city": "$.address.city"})
+  assert resolve_raw_arrow_column_map(td=td, source_dataset=sd, arrow_names=["address"]) is None
+
+
+def test_land_raw_arrow_batch_loads_duckdb_natively():
+  td, sd = _raw_dataset({"order_id": "$.order_id", "amount": "$.amount", "note": "$.note", "ts": "$.ts"})
+  engine = DuckDbExecutionEngine(types.SimpleNamespace(short_name="wh", security={"connection_string": ":memory:"}))
+  # A non-UTC session time zone must not shift tz-aware source timestamps.
+  engine.execute("SET TimeZone = 'Europe/Berlin'")
+  engine.execute("CREATE SCHEMA raw")
+  engine.execute(
+    "CREATE TABLE raw.raw_orders (order_id BIGINT, amount DOUBLE, note VARCHAR, ts TIMESTAMP, "
+    "payload VARCHAR, load_run_id VARCHAR, loaded_at TIMESTAMP)"
+  )
+  ts = datetime.datetime(2024, 1, 1, 12, tzinfo=datetime.timezone.utc)
+  batch = pa.record_batch({
+    "order_id": [1, 2],
+    "amount": [9.5, None],
+    "ts": pa.array([ts, None], pa.timestamp("us", tz="UTC")),
+  })
+  column_map = resolve_raw_arrow_column_map(td=td, source_dataset=sd, arrow_names=batch.schema.names)
+
+  res = land_raw_arrow_batch(
+    target_engine=engine,
+    target_dialect=DuckDBDialect(),
+    td=td,
+    batch=batch,
+    column_map=column_map,
+    load_run_id="lr1",
+    source_dataset=sd,
+    rebuild=False,
+  )
+
+  assert res == {"rows_inserted": 2}
+  rows = engine.fetch_all(
+    "SELECT order_id, amount, note, ts, payload, load_run_id FROM raw.raw_orders ORDER BY order_id"
+  )
+  assert [r[:4] for r in rows] == [
+    (1, 9.5, None, datetime.datetime(2024, 1, 1, 12)),
+    (2, None, None, None),
+  ]
+  assert json.loads(rows[0][4])["order_id"] == 1
+  assert {r[5] for r in rows} == {"lr1"}
+  engine.close()
+
+
+def test_land_raw_arrow_batch_builds_tuples_column_wise_for_other_dialects():
+  td, sd = _raw_dataset({"order_id": "$.order_id", "ts": "$.ts"})
+  calls = []
+  engine = types.SimpleNamespace(execute_many=lambda sql, rows: calls.append((sql, rows)))
+  dialect = types.SimpleNamespace(
+    supports_arrow_load=False,
+    param_placeholder=lambda: "%s",
+    render_insert_values_statement=lambda schema, table, target_columns, values_sql:
+      f"INSERT INTO {schema}.{table} ({', '.join(target_columns)}) VALUES {values_sql}",
+  )
+  ts = datetime.datetime(2024, 1, 1, 12, tzinfo=datetime.timezone(datetime.timedelta(hours=2)))
+  batch = pa.record_batch({"order_id": [1, 2, 3], "ts": pa.array([ts, None, ts], pa.timestamp("us", tz="+02:00"))})
+
+  res = land_raw_arrow_batch(
+    target_engine=engine,
+    target_dialect=dialect,
+    td=td,
+    batch=batch,
+    column_map={"order_id": "order_id", "ts": "ts"},
+    load_run_id="lr1",
+    source_dataset=sd,
+    chunk_size=2,
+    include_payload=False,
+    rebuild=False,
+  )
+
+  assert res == {"rows_inserted": 3}
+  assert [len(rows) for _, rows in calls] == [2, 1]
+  first = calls[0][1][0]
+  assert first[0] == 1
+  assert first[1] == datetime.datetime(2024, 1, 1, 10)
+  assert first[2] is None
+  assert first[3] == "lr1"
+
+
+def test_duckdb_bulk_load_lands_json_records_and_falls_back_on_mixed_types(monkeypatch):
+  td, sd = _raw_dataset({"order_id": "$.order_id", "note": "$.note"})
+  engine = DuckDbExecutionEngine(types.SimpleNamespace(short_name="wh", security={"connection_string": ":memory:"}))
+  engine.bulk_load_batch_rows = 2
+  engine.execute("CREATE SCHEMA raw")
+  engine.execute(
+    "CREATE TABLE raw.raw_orders (order_id BIGINT, note VARCHAR, "
+    "payload VARCHAR, load_run_id VARCHAR, loaded_at TIMESTAMP)"
+  )
+  executemany_calls = []
+  original = engine.execute_many
+  monkeypatch.setattr(engine, "execute_many", lambda sql, rows: (executemany_calls.append(sql), original(sql, rows)))
+
+  records = [
+    {"order_id": 1, "note": "a"},
+    {"order_id": 2, "note": None},
+    # Second batch mixes int and str in "note": Arrow cannot type it.
+    {"order_id": 3, "note": 7},
+    {"order_id": 4, "note": "d"},
+    {"order_id": 5},
+  ]
+  res = land_raw_json_records(
+    target_engine=engine,
+    target_dialect=DuckDBDialect(),
+    td=td,
+    records=records,
+    batch_run_id="b1",
+    load_run_id="lr1",
+    target_system=types.SimpleNamespace(short_name="wh"),
+    profile=types.SimpleNamespace(name="dev"),
+    source_dataset=sd,
+    rebuild=False,
+    write_run_log=False,
+  )
+
+  assert res == {"rows_inserted": 5}
+  assert len(executemany_calls) == 1
+  rows = engine.fetch_all("SELECT order_id, note, load_run_id FROM raw.raw_orders ORDER BY order_id")
+  assert rows == [(1, "a", "lr1"), (2, None, "lr1"), (3, "7", "lr1"), (4, "d", "lr1"), (5, None, "lr1")]
+  engine.close()
+
+
+def test_arrow_payload_json_matches_record_landing_serialization():
+  row = {
+    "amount": Decimal("1.50"),
+    "blob": b"\x01",
+    "ts": datetime.datetime(2024, 1, 2, 3, 4, 5),
+    "note": "é",
+  }
+  batch = pa.RecordBatch.from_pylist([row, {k: None for k in row}])
+
+  payloads = arrow_payload_json(batch).to_pylist()
+
+  assert payloads[0] == json.dumps(row, ensure_ascii=False, default=str)
+  assert json.loads(payloads[0])["amount"] == "1.50"
+  assert json.loads(payloads[1]) == {k: None for k in row}
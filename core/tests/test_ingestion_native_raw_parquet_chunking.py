@@ -105,4 +105,42 @@ def test_ingest_raw_file_parquet_rebuild_only_on_first_chunk(monkeypatch):
   # If the implementation suppresses per-chunk run log writes, enforce it.
   if calls[0]["write_run_log"] is not None:
     assert calls[0]["write_run_log"] is False
-    assert calls[1]["write_run_log"] is False
\ No newline at end of file
+    assert calls[1]["write_run_log"] is False
+
+def test_ingest_raw_file_shares_one_bulk_session_across_chunks(monkeypatch):
+  chunks = [[{"id": 1}, {"id": 2}], [{"id": 3}]]
+
+  monkeypatch.setattr(native_raw, "_iter_parquet_record_chunks", lambda path, chunk_size: iter(chunks))
+  monkeypatch.setattr(native_raw, "_local_path_from_uri", lambda uri: "/tmp/test.parquet")
+  monkeypatch.setattr(native_raw.os.path, "exists", lambda p: True)
+
+  sessions = []
+
+  def fake_land_raw_json_records(**kwargs):
+    sessions.append(kwargs.get("bulk_session"))
+    return {"rows_inserted": len(kwargs.get("records") or [])}
+
+  monkeypatch.setattr(native_raw, "land_raw_json_records", fake_land_raw_json_records)
+
+  native_raw.ingest_raw_file(
+    source_dataset=SimpleNamespace(
+      source_system=SimpleNamespace(type="parquet", short_name="parq"),
+      source_dataset_name="test_parquet",
+      ingestion_config={"uri": "file:///tmp/test.parquet"},
+    ),
+    td=SimpleNamespace(
+      target_schema=SimpleNamespace(schema_name="raw", short_name="raw"),
+      target_dataset_name="test_parquet",
+    ),
+    target_system=SimpleNamespace(short_name="duckdb", type="duckdb"),
+    dialect=DummyDialect(),
+    profile=SimpleNamespace(name="dev"),
+    batch_run_id="batch-1",
+    load_run_id="load-1",
+    chunk_size=2,
+    file_type="parquet",
+  )
+
+  # Dialects that COPY per bulk_load call load the whole file once.
+  assert len(sessions) == 2
+  assert sessions[0] is not None and sessions[0] is sessions[1]
@@ -0,0 +1,102 @@
+"""
+elevata - Metadata-driven Data Platform Framework
+Copyright © 2026 Ilona Tag
+
+This file is part of elevata.
+
+elevata is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as
+published by the Free Software Foundation, either version 3 of
+the License, or (at your option) any later version.
+
+elevata is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with elevata. If not, see <https://www.gnu.org/licenses/>.
+
+Contact: <https://github.com/elevata-labs/elevata>.
+"""
+
+from io import BytesIO
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from metadata.ingestion import native_raw
+
+
+def test_json_array_is_decoded_incrementally_across_block_boundaries():
+  records = [{"id": i, "name": f"n{i}", "amount": 12345.5 + i, "flag": i % 2 == 0} for i in range(50)]
+  raw = json.dumps(records, indent=1).encode("utf-8")
+
+  # Tiny blocks force elements and numbers to straddle read boundaries.
+  out = list(native_raw._iter_json_array_records(BytesIO(raw), block_size=7))
+
+  assert out == records
+
+
+def test_json_array_rejects_non_array_and_truncated_input():
+  with pytest.raises(ValueError, match="array of objects"):
+    list(native_raw._iter_json_array_records(BytesIO(b'{"a": 1}')))
+  with pytest.raises(ValueError):
+    list(native_raw._iter_json_array_records(BytesIO(b'[{"a": 1}, {"a": '), block_size=4))
+
+
+def test_ingest_raw_file_streams_csv_in_chunks_without_truncation(monkeypatch, tmp_path):
+  path = tmp_path / "orders.csv"
+  with open(path, "w", encoding="utf-8", newline="") as f:
+    f.write("Order ID;Customer\n")
+    for i in range(2_500):
+      f.write(f"{i};\"Kunde; {i}\"\n")
+
+  calls = []
+
+  def fake_land_raw_json_records(**kwargs):
+    calls.append(kwargs)
+    return {"rows_inserted": len(kwargs["records"])}
+
+  monkeypatch.setattr(native_raw, "land_raw_json_records", fake_land_raw_json_records)
+  monkeypatch.setattr(native_raw, "ensure_load_run_log_table", lambda **kwargs: None)
+
+  executed = []
+  dialect = SimpleNamespace(
+    get_execution_engine=lambda ts: SimpleNamespace(execute=executed.append),
+    render_insert_load_run_log=lambda **kwargs: "INSERT run log",
+  )
+  source_dataset = SimpleNamespace(
+    ingestion_config={"uri": f"file://{path}", "delimiter": ";"},
+    source_system=SimpleNamespace(type="csv", short_name="files"),
+    source_dataset_name="orders",
+  )
+  td = SimpleNamespace(
+    target_schema=SimpleNamespace(short_name="raw", schema_name="raw"),
+    target_dataset_name="raw_files_orders",
+  )
+
+  res = native_raw.ingest_raw_file(
+    source_dataset=source_dataset,
+    td=td,
+    target_system=SimpleNamespace(short_name="duckdb", type="duckdb"),
+    dialect=dialect,
+    profile=SimpleNamespace(name="dev"),
+    batch_run_id="b1",
+    load_run_id="lr1",
+    chunk_size=1_000,
+    file_type="csv",
+  )
+
+  assert res["rows_extracted"] == 2_500
+  assert res["landing"]["rows_inserted"] == 2_500
+  assert [len(c["records"]) for c in calls] == [1_000, 1_000, 500]
+  assert [c["rebuild"] for c in calls] == [True, False, False]
+  assert all(c["write_run_log"] is False for c in calls)
+
+  last = calls[-1]["records"][-1]
+  assert last["order_id"] == "2499"
+  assert last["customer"] == "Kunde; 2499"
+  assert last["__payload__"] == {"Order ID": "2499", "Customer": "Kunde; 2499"}
+  assert executed == ["INSERT run log"]
@@ -0,0 +1,135 @@
+"""
+elevata - Metadata-driven Data Platform Framework
+Copyright © 2026 Ilona Tag
+
+This file is part of elevata.
+
+elevata is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as
+published by the Free Software Foundation, either version 3 of
+the License, or (at your option) any later version.
+
+elevata is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with elevata. If not, see <https://www.gnu.org/licenses/>.
+
+Contact: <https://github.com/elevata-labs/elevata>.
+"""
+
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+from metadata.ingestion.landing import insert_raw_rows
+from metadata.ingestion.pipeline import BulkLoadSession, iter_prefetched
+
+
+def test_iter_prefetched_reads_on_a_separate_thread_in_order():
+  reader_threads = set()
+
+  def _source():
+    for i in range(25):
+      reader_threads.add(threading.current_thread().name)
+      yield (i,)
+
+  rows = list(iter_prefetched(_source(), chunk_size=4, depth=2))
+
+  assert rows == [(i,) for i in range(25)]
+  assert reader_threads == {"elevata_extract"}
+
+
+def test_iter_prefetched_propagates_source_errors():
+  def _source():
+    yield (1,)
+    raise RuntimeError("source failed")
+
+  with pytest.raises(RuntimeError, match="source failed"):
+    list(iter_prefetched(_source(), chunk_size=1, depth=1))
+
+
+def test_iter_prefetched_stops_and_closes_source_when_consumer_stops():
+  closed = []
+
+  def _source():
+    try:
+      for i in range(1000):
+        yield (i,)
+    finally:
+      closed.append(threading.current_thread().name)
+
+  it = iter_prefetched(_source(), chunk_size=10, depth=1)
+  assert next(it) == (0,)
+  it.close()
+
+  # The source is closed on the reader thread; the bounded queue capped read-ahead.
+  assert closed == ["elevata_extract"]
+
+
+class RecordingBulkEngine:
+  """Engine whose bulk_load records one entry per call (one COPY / load job)."""
+
+  def __init__(self):
+    self.loads = []
+
+  def bulk_load(self, *, schema, table, columns, rows, column_types=None):
+    loaded = list(rows)
+    self.loads.append((f"{schema}.{table}", list(columns), loaded))
+    return len(loaded)
+
+
+def _insert_chunk(engine, rows, session):
+  return insert_raw_rows(
+    target_engine=engine,
+    target_dialect=SimpleNamespace(supports_bulk_load=True),
+    schema_name="raw",
+    table_name="t",
+    columns=["a"],
+    rows=iter(rows),
+    bulk_session=session,
+  )
+
+
+def test_bulk_load_session_loads_all_chunks_with_one_bulk_load():
+  engine = RecordingBulkEngine()
+  session = BulkLoadSession(depth=1)
+
+  queued = [_insert_chunk(engine, [(i,) for i in range(k, k + 3)], session) for k in (0, 3, 6)]
+
+  assert queued == [3, 3, 3]
+  assert session.commit() == 9
+  assert engine.loads == [("raw.t", ["a"], [(i,) for i in range(9)])]
+
+
+def test_bulk_load_session_without_rows_does_not_load():
+  engine = RecordingBulkEngine()
+  session = BulkLoadSession()
+
+  assert session.commit() == 0
+  assert engine.loads == []
+
+
+def test_bulk_load_session_abort_leaves_target_unloaded():
+  engine = RecordingBulkEngine()
+  session = BulkLoadSession()
+
+  _insert_chunk(engine, [(1,), (2,)], session)
+  session.abort()
+
+  assert engine.loads == []
+
+
+def test_bulk_load_session_raises_load_errors():
+  def failing(*, rows, **kwargs):
+    next(iter(rows))
+    raise ValueError("copy failed")
+
+  session = BulkLoadSession()
+  _insert_chunk(SimpleNamespace(bulk_load=failing), [(1,)], session)
+
+  with pytest.raises(ValueError, match="copy failed"):
+    session.commit()
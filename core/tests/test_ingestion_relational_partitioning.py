@@ -0,0 +1,205 @@
+"""
+elevata - Metadata-driven Data Platform Framework
+Copyright © 2026 Ilona Tag
+
+This file is part of elevata.
+
+elevata is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as
+published by the Free Software Foundation, either version 3 of
+the License, or (at your option) any later version.
+
+elevata is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with elevata. If not, see <https://www.gnu.org/licenses/>.
+
+Contact: <https://github.com/elevata-labs/elevata>.
+"""
+
+import datetime
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import create_engine, text
+
+from metadata.ingestion import native_raw
+from metadata.ingestion.partitioning import (
+  iter_partitioned_rows,
+  partition_config_from_ingestion_config,
+  range_boundaries,
+  render_modulo_predicates,
+  render_range_predicates,
+)
+from core.tests._dialect_test_mixin import DialectTestMixin
+
+
+class _QS:
+  def __init__(self, items):
+    self._items = list(items)
+
+  def filter(self, **kwargs):
+    return self
+
+  def order_by(self, *args):
+    return self
+
+  def all(self):
+    return list(self._items)
+
+  def __iter__(self):
+    return iter(self._items)
+
+
+class SqliteSourceDialect:
+  DIALECT_NAME = "sqlite"
+
+  def render_identifier(self, name):
+    return name
+
+  def render_table_identifier(self, schema, table):
+    return f"{schema}.{table}"
+
+  def render_literal(self, value):
+    return str(value)
+
+
+class RecordingEngine:
+  def __init__(self):
+    self.rows = []
+
+  def execute(self, sql):
+    return None
+
+  def execute_many(self, sql, params):
+    self.rows.extend(params)
+
+
+class LogCapturingDialect(DialectTestMixin):
+  def __init__(self, *args, **kwargs):
+    super().__init__(*args, **kwargs)
+    self.log_rows = []
+
+  def render_insert_load_run_log(self, *, meta_schema, values):
+    self.log_rows.append(values)
+    return None
+
+
+@pytest.fixture
+def sqlite_source(tmp_path):
+  engine = create_engine(f"sqlite:///{tmp_path / 'src.db'}")
+  with engine.begin() as conn:
+    conn.execute(text("CREATE TABLE t (id INTEGER, name TEXT)"))
+    conn.execute(
+      text("INSERT INTO t (id, name) VALUES (:id, :name)"),
+      [{"id": i, "name": f"n{i}"} for i in range(1, 101)] + [{"id": None, "name": "null-id"}],
+    )
+  yield engine
+  engine.dispose()
+
+
+def test_partition_config_requires_column_and_several_partitions():
+  assert partition_config_from_ingestion_config({"partitions": 4}) is None
+  assert partition_config_from_ingestion_config({"partition_column": "id", "partitions": 1}) is None
+
+  cfg = partition_config_from_ingestion_config({"partition_column": "id", "partitions": "4"})
+  assert (cfg.column, cfg.partitions, cfg.strategy, cfg.max_workers) == ("id", 4, "range", 4)
+
+  with pytest.raises(ValueError):
+    partition_config_from_ingestion_config({"partition_column": "id", "partitions": 4, "partition_strategy": "hash"})
+
+
+def test_range_boundaries_and_predicates():
+  assert range_boundaries(1, 100, 4) == [26, 51, 76]
+  assert range_boundaries(5, 5, 4) == []
+  assert range_boundaries(datetime.date(2024, 1, 1), datetime.date(2024, 1, 4), 2) == [datetime.date(2024, 1, 3)]
+
+  preds = render_range_predicates("s.id", [26, 51], render_literal=str)
+  assert preds == [
+    "(s.id < 26 OR s.id IS NULL)",
+    "(s.id >= 26 AND s.id < 51)",
+    "(s.id >= 51)",
+  ]
+  assert render_modulo_predicates("s.id", 2, dialect_name="mssql") == [
+    "(ABS(s.id % 2) = 0 OR s.id IS NULL)",
+    "(ABS(s.id % 2) = 1)",
+  ]
+
+
+def test_iter_partitioned_rows_merges_all_partitions(sqlite_source):
+  sqls = [
+    f"SELECT s.id FROM main.t AS s WHERE {p}"
+    for p in render_range_predicates("s.id", range_boundaries(1, 100, 4), render_literal=str)
+  ]
+  stats = {}
+
+  rows = list(iter_partitioned_rows(
+    connect=sqlite_source.connect,
+    partition_sqls=sqls,
+    workers=4,
+    fetch_size=7,
+    stats=stats,
+  ))
+
+  assert sorted(r[0] for r in rows if r[0] is not None) == list(range(1, 101))
+  assert len(rows) == 101
+  assert [stats[i]["rows"] for i in range(4)] == [26, 25, 25, 25]
+
+
+def test_ingest_raw_relational_extracts_partitions_and_logs_row_counts(monkeypatch, sqlite_source):
+  monkeypatch.setattr(native_raw, "ensure_load_run_log_table", lambda **kwargs: None)
+  monkeypatch.setattr(native_raw, "engine_for_source_system", lambda **kwargs: sqlite_source)
+  monkeypatch.setattr(native_raw, "get_active_dialect", lambda name: SqliteSourceDialect())
+
+  source_dataset = SimpleNamespace(
+    id=1,
+    pk=1,
+    source_columns=_QS([
+      SimpleNamespace(source_column_name="id", integrate=True, ordinal_position=1),
+      SimpleNamespace(source_column_name="name", integrate=True, ordinal_position=2),
+    ]),
+    source_system=SimpleNamespace(type="sqlite", short_name="src"),
+    schema_name="main",
+    source_dataset_name="t",
+    incremental=False,
+    increment_filter=None,
+    ingestion_config={"partition_column": "id", "partitions": 3, "partition_strategy": "modulo"},
+  )
+  td = SimpleNamespace(
+    id=1,
+    pk=1,
+    target_schema=SimpleNamespace(schema_name="raw", short_name="raw"),
+    target_dataset_name="raw_t",
+    target_columns=_QS([
+      SimpleNamespace(target_column_name="id", system_role="", datatype="INTEGER", nullable=True, ordinal_position=1, active=True),
+      SimpleNamespace(target_column_name="name", system_role="", datatype="STRING", nullable=True, ordinal_position=2, active=True),
+      SimpleNamespace(target_column_name="load_run_id", system_role="load_run_id", datatype="STRING", nullable=True, ordinal_position=3, active=True),
+    ]),
+  )
+  engine = RecordingEngine()
+  dialect = LogCapturingDialect(engine=engine)
+
+  result = native_raw.ingest_raw_relational(
+    source_dataset=source_dataset,
+    td=td,
+    target_system=SimpleNamespace(short_name="dwh", type="duckdb"),
+    dialect=dialect,
+    profile=SimpleNamespace(name="dev"),
+    batch_run_id="batch-1",
+    load_run_id="load-1",
+    chunk_size=10,
+  )
+
+  assert result["status"] == "success"
+  assert result["rows_affected"] == 101
+  assert len(engine.rows) == 101
+  assert {r[2] for r in engine.rows} == {"load-1"}
+  assert [p["rows"] for p in result["partitions"]] == [34, 34, 33]
+
+  kinds = [v["run_kind"] for v in dialect.log_rows]
+  assert kinds == ["ingestion", "ingestion_partition", "ingestion_partition", "ingestion_partition"]
+  assert [v["rows_extracted"] for v in dialect.log_rows[1:]] == [34, 34, 33]
+  assert dialect.log_rows[1]["status_reason"] == "partition 1/3"
@@ -0,0 +1,195 @@
+"""
+elevata - Metadata-driven Data Platform Framework
+Copyright © 2026 Ilona Tag
+
+This file is part of elevata.
+
+elevata is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as
+published by the Free Software Foundation, either version 3 of
+the License, or (at your option) any later version.
+
+elevata is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with elevata. If not, see <https://www.gnu.org/licenses/>.
+
+Contact: <https://github.com/elevata-labs/elevata>.
+"""
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from types import SimpleNamespace
+import urllib.parse
+
+import pytest
+
+from metadata.ingestion import rest
+
+
+class _VersionedApi(BaseHTTPRequestHandler):
+  """
+  /items?pageToken=N serves page N of server.pages with ETag "v<version>-<page>"
+  and nextPageToken N+1 (none on the last page). Full responses carry the request
+  number as Last-Modified.
+  """
+  protocol_version = "HTTP/1.1"
+
+  def log_message(self, *args):
+    pass
+
+  def do_GET(self):
+    srv = self.server
+    query = urllib.parse.parse_qs(urllib.parse.urlsplit(self.path).query)
+    page_no = int(query.get("pageToken", ["0"])[0])
+    etag = f'"v{srv.versions.get(page_no, 0)}-{page_no}"'
+
+    if self.headers.get("If-None-Match") == etag:
+      srv.log.append((page_no, 304))
+      self.send_response(304)
+      self.send_header("ETag", etag)
+      self.send_header("Content-Length", "0")
+      self.end_headers()
+      return
+
+    srv.log.append((page_no, 200))
+    payload = {"data": srv.pages[page_no]}
+    if page_no + 1 < len(srv.pages):
+      payload["nextPageToken"] = str(page_no + 1)
+    body = json.dumps(payload).encode("utf-8")
+    self.send_response(200)
+    self.send_header("ETag", etag)
+    self.send_header("Last-Modified", f"request-{len(srv.log)}")
+    self.send_header("Content-Length", str(len(body)))
+    self.end_headers()
+    self.wfile.write(body)
+
+
+@pytest.fixture()
+def api():
+  srv = ThreadingHTTPServer(("127.0.0.1", 0), _VersionedApi)
+  srv.daemon_threads = True
+  srv.pages = [[{"id": 1}, {"id": 2}], [{"id": 3}, {"id": 4}], [{"id": 5}]]
+  srv.versions = {}
+  srv.log = []
+  thread = threading.Thread(target=srv.serve_forever, daemon=True)
+  thread.start()
+  try:
+    yield srv
+  finally:
+    srv.shutdown()
+    srv.server_close()
+
+
+@pytest.fixture()
+def ingest(api, monkeypatch):
+  base_url = f"http://127.0.0.1:{api.server_address[1]}"
+  state = {"snapshot": None, "landed": [], "logs": []}
+
+  def fake_land(**kw):
+    if kw["rebuild"]:
+      state["landed"] = []
+    state["landed"].extend(r["id"] for r in kw["records"])
+    return {"rows_inserted": len(kw["records"])}
+
+  def save_snapshot(meta_schema, values):
+    state["snapshot"] = values["snapshot_json"]
+
+  monkeypatch.setattr(rest, "rest_config_for_source_system", lambda **kw: {"base_url": base_url})
+  monkeypatch.setattr(rest, "land_raw_json_records", fake_land)
+  monkeypatch.setattr(rest, "ensure_load_run_snapshot_table", lambda **kw: None)
+  monkeypatch.setattr(rest, "render_select_latest_load_run_snapshot_json_by_root_key", lambda **kw: "SELECT")
+  monkeypatch.setattr(rest, "fetch_one_value", lambda engine, sql: state["snapshot"])
+  monkeypatch.setattr(rest, "build_load_run_log_row", lambda **kw: kw)
+
+  dialect = SimpleNamespace(
+    get_execution_engine=lambda ts: SimpleNamespace(execute=lambda sql: None),
+    render_insert_load_run_log=lambda meta_schema, values: state["logs"].append(values),
+    render_insert_load_run_snapshot=save_snapshot,
+  )
+
+  def _run(**config):
+    source_dataset = SimpleNamespace(
+      source_system=SimpleNamespace(type="rest", short_name="api"),
+      source_dataset_name="items",
+      ingestion_config={"path": "/items", "record_path": "data", **config},
+      source_columns=SimpleNamespace(filter=lambda **kw: [SimpleNamespace(source_column_name="id", json_path="$.id")]),
+    )
+    api.log.clear()
+    return rest.ingest_raw_rest(
+      source_dataset=source_dataset,
+      td=SimpleNamespace(target_schema=SimpleNamespace(short_name="raw"), target_dataset_name="raw_api_items"),
+      target_system=SimpleNamespace(short_name="dwh"),
+      dialect=dialect,
+      profile=SimpleNamespace(name="dev"),
+      batch_run_id="b1",
+      load_run_id="l1",
+      chunk_size=2,
+    )
+
+  return _run, state
+
+
+def test_unchanged_pages_skip_landing(api, ingest):
+  run, state = ingest
+
+  first = run()
+  assert first["rows_extracted"] == 5
+  assert state["landed"] == [1, 2, 3, 4, 5]
+  assert [code for _, code in api.log] == [200, 200, 200]
+
+  second = run()
+  assert second["status"] == "skipped"
+  assert second["reason"] == "unchanged"
+  assert [code for _, code in api.log] == [304, 304, 304]
+  # RAW keeps the data landed by the first run.
+  assert state["landed"] == [1, 2, 3, 4, 5]
+  assert state["logs"][-1]["status"] == "skipped"
+  assert state["logs"][-1]["status_reason"] == "unchanged"
+  assert state["logs"][-1]["rows_affected"] == 0
+
+
+def test_changed_page_relands_unchanged_pages_in_order(api, ingest):
+  run, state = ingest
+  run()
+
+  api.pages[1] = [{"id": 3}, {"id": 40}]
+  api.versions[1] = 1
+  result = run()
+
+  assert result["rows_extracted"] == 5
+  assert state["landed"] == [1, 2, 3, 40, 5]
+  # Page 0 answered 304 and was fetched again once page 1 turned out to be changed.
+  assert api.log == [(0, 304), (1, 200), (0, 200), (2, 304), (2, 200)]
+  assert state["logs"][-1]["status"] == "ok"
+
+
+def test_refetched_pages_store_fresh_validators(api, ingest):
+  run, state = ingest
+  run()
+
+  api.pages[1] = [{"id": 3}, {"id": 40}]
+  api.versions[1] = 1
+  run()
+
+  pages = json.loads(state["snapshot"])["pages"]
+  last_modified = {
+    int(urllib.parse.parse_qs(urllib.parse.urlsplit(url).query).get("pageToken", ["0"])[0]): st["last_modified"]
+    for url, st in pages.items()
+  }
+  # Requests of the second run: (0, 304), (1, 200), (0, 200), (2, 304), (2, 200).
+  assert last_modified == {0: "request-3", 1: "request-2", 2: "request-5"}
+
+
+def test_conditional_requests_can_be_disabled(api, ingest):
+  run, state = ingest
+  run()
+
+  result = run(conditional=False)
+
+  assert "status" not in result
+  assert [code for _, code in api.log] == [200, 200, 200]
@@ -0,0 +1,146 @@
+"""
+elevata - Metadata-driven Data Platform Framework
+Copyright © 2026 Ilona Tag
+
+This file is part of elevata.
+
+elevata is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as
+published by the Free Software Foundation, either version 3 of
+the License, or (at your option) any later version.
+
+elevata is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with elevata. If not, see <https://www.gnu.org/licenses/>.
+
+Contact: <https://github.com/elevata-labs/elevata>.
+"""
+
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from metadata.ingestion import rest
+from metadata.ingestion.rest_transport import RestResponse
+
+
+class _Columns:
+  def filter(self, **kw):
+    return [SimpleNamespace(source_column_name="id", json_path="$.id")]
+
+
+class _Engine:
+  def __init__(self):
+    self.sql = []
+
+  def execute(self, sql):
+    self.sql.append(sql)
+
+
+def _run(monkeypatch, pages, *, chunk_size, ingestion_config=None, inserted_per_batch=None):
+  landed = []
+  engine = _Engine()
+
+  class FakeTransport:
+    def __init__(self, **kw):
+      pass
+
+    def get_json(self, url):
+      offset = int(url.split("offset=")[1])
+      return pages[offset // 2] if offset // 2 < len(pages) else []
+
+    def get(self, url, headers=None):
+      return RestResponse(status=200, headers={}, body=json.dumps(self.get_json(url)).encode("utf-8"))
+
+    def close(self):
+      pass
+
+  def fake_land(**kw):
+    landed.append({"ids": [r["id"] for r in kw["records"]], "rebuild": kw["rebuild"], "log": kw["write_run_log"]})
+    n = len(kw["records"]) if inserted_per_batch is None else inserted_per_batch
+    return {"rows_inserted": n}
+
+  monkeypatch.setattr(rest, "rest_config_for_source_system", lambda **kw: {"base_url": "https://api.test"})
+  monkeypatch.setattr(rest, "RestTransport", FakeTransport)
+  monkeypatch.setattr(rest, "land_raw_json_records", fake_land)
+  monkeypatch.setattr(rest, "ensure_load_run_snapshot_table", lambda **kw: None)
+  monkeypatch.setattr(rest, "render_select_latest_load_run_snapshot_json_by_root_key", lambda **kw: "SELECT")
+  monkeypatch.setattr(rest, "fetch_one_value", lambda engine, sql: None)
+  monkeypatch.setattr(rest, "build_load_run_log_row", lambda **kw: kw)
+
+  dialect = SimpleNamespace(
+    get_execution_engine=lambda ts: engine,
+    render_insert_load_run_log=lambda meta_schema, values: f"LOG {values['rows_extracted']}/{values['rows_affected']}",
+    render_insert_load_run_snapshot=lambda meta_schema, values: "SNAPSHOT",
+  )
+  source_dataset = SimpleNamespace(
+    source_system=SimpleNamespace(type="rest", short_name="api"),
+    source_dataset_name="items",
+    ingestion_config={"path": "/items", "cursor": {"type": "offset", "step": 2}, **(ingestion_config or {})},
+    source_columns=_Columns(),
+  )
+  result = rest.ingest_raw_rest(
+    source_dataset=source_dataset,
+    td=SimpleNamespace(target_schema=SimpleNamespace(short_name="raw"), target_dataset_name="raw_api_items"),
+    target_system=SimpleNamespace(short_name="dwh"),
+    dialect=dialect,
+    profile=SimpleNamespace(name="dev"),
+    batch_run_id="b1",
+    load_run_id="l1",
+    chunk_size=chunk_size,
+  )
+  return result, landed, engine
+
+
+def test_rest_pages_are_landed_incrementally(monkeypatch):
+  pages = [[{"id": 1}, {"id": 2}], [{"id": 3}, {"id": 4}], [{"id": 5}]]
+
+  result, landed, engine = _run(monkeypatch, pages, chunk_size=3)
+
+  # Flushed once the buffer reached chunk_size; only the first batch rebuilds RAW.
+  assert landed == [
+    {"ids": [1, 2, 3, 4], "rebuild": True, "log": False},
+    {"ids": [5], "rebuild": False, "log": False},
+  ]
+  assert result["rows_extracted"] == 5
+  assert result["landing"] == {"rows_inserted": 5}
+  # One run log row for the whole pull, then the cursor snapshot.
+  assert engine.sql == ["LOG 5/5", "SNAPSHOT"]
+
+
+def test_rest_run_log_reports_extracted_and_inserted_rows_separately(monkeypatch):
+  pages = [[{"id": 1}, {"id": 2}], [{"id": 3}]]
+
+  _, _, engine = _run(monkeypatch, pages, chunk_size=10, inserted_per_batch=2)
+
+  assert engine.sql == ["LOG 3/2", "SNAPSHOT"]
+
+
+def test_rest_empty_pull_still_rebuilds_raw(monkeypatch):
+  result, landed, _ = _run(monkeypatch, [], chunk_size=10)
+
+  assert landed == [{"ids": [], "rebuild": True, "log": False}]
+  assert result["rows_extracted"] == 0
+
+
+def test_rest_max_rows_fails_before_landing_more_pages(monkeypatch):
+  pages = [[{"id": 1}, {"id": 2}], [{"id": 3}, {"id": 4}], [{"id": 5}]]
+
+  with pytest.raises(ValueError, match="max_rows=3"):
+    _run(monkeypatch, pages, chunk_size=2, ingestion_config={"validation": {"max_rows": 3}})
+
+
+def test_schema_drift_signatures_stay_bounded():
+  from metadata.ingestion.validation import RestValidationConfig, validate_schema_drift
+
+  seen: set = set()
+  cfg = RestValidationConfig(max_schema_signatures=2)
+  for i in range(100):
+    validate_schema_drift(signatures_seen=seen, sig=(f"k{i}",), cfg=cfg)
+
+  assert len(seen) == 3
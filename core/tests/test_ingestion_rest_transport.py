@@ -0,0 +1,309 @@
+"""
+elevata - Metadata-driven Data Platform Framework
+Copyright © 2026 Ilona Tag
+
+This file is part of elevata.
+
+elevata is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as
+published by the Free Software Foundation, either version 3 of
+the License, or (at your option) any later version.
+
+elevata is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with elevata. If not, see <https://www.gnu.org/licenses/>.
+
+Contact: <https://github.com/elevata-labs/elevata>.
+"""
+
+import gzip
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from types import SimpleNamespace
+import urllib.error
+import urllib.parse
+
+import pytest
+
+from metadata.ingestion import rest
+from metadata.ingestion.rest_transport import RestTransport, TokenBucket, iter_ordered_concurrently
+from metadata.ingestion.validation import RestRetryConfig
+
+
+class _StubApi(BaseHTTPRequestHandler):
+  """
+  /items?offset=N returns ids N..N+1 (20 records total); later pages answer faster,
+  so concurrent fetches complete out of order.
+  """
+  protocol_version = "HTTP/1.1"
+  total = 20
+  page = 2
+
+  def log_message(self, *args):
+    pass
+
+  def do_GET(self):
+    srv = self.server
+    with srv.lock:
+      srv.requests.append(self.path)
+      srv.client_ports.add(self.client_address[1])
+      srv.accept_encoding.add(self.headers.get("Accept-Encoding"))
+      fail = srv.fail_next > 0
+      if fail:
+        srv.fail_next -= 1
+      drop = srv.drop_next > 0
+      if drop:
+        srv.drop_next -= 1
+    if fail:
+      self.send_response(503)
+      self.send_header("Content-Length", "0")
+      self.end_headers()
+      return
+
+    query = urllib.parse.parse_qs(urllib.parse.urlsplit(self.path).query)
+    offset = int(query.get("offset", ["0"])[0])
+    ids = list(range(offset, min(offset + self.page, self.total)))
+    time.sleep(max(0.0, 0.02 - offset * 0.001))
+
+    body = gzip.compress(json.dumps({"data": [{"id": i} for i in ids]}).encode("utf-8"))
+    self.send_response(200)
+    self.send_header("Content-Type", "application/json")
+    self.send_header("Content-Encoding", "gzip")
+    self.send_header("Content-Length", str(len(body)))
+    self.end_headers()
+    self.wfile.write(body)
+    if drop:
+      # Close the kept-alive connection without announcing it (idle timeout).
+      self.close_connection = True
+
+
+@pytest.fixture()
+def stub_api():
+  srv = ThreadingHTTPServer(("127.0.0.1", 0), _StubApi)
+  srv.daemon_threads = True
+  srv.lock = threading.Lock()
+  srv.requests = []
+  srv.client_ports = set()
+  srv.accept_encoding = set()
+  srv.fail_next = 0
+  srv.drop_next = 0
+  thread = threading.Thread(target=srv.serve_forever, daemon=True)
+  thread.start()
+  try:
+    yield srv, f"http://127.0.0.1:{srv.server_address[1]}"
+  finally:
+    srv.shutdown()
+    srv.server_close()
+
+
+def test_transport_keeps_connection_alive_and_decompresses_gzip(stub_api):
+  srv, base_url = stub_api
+  transport = RestTransport()
+  try:
+    first = transport.get_json(f"{base_url}/items?offset=0")
+    second = transport.get_json(f"{base_url}/items?offset=2")
+  finally:
+    transport.close()
+
+  assert first == {"data": [{"id": 0}, {"id": 1}]}
+  assert second == {"data": [{"id": 2}, {"id": 3}]}
+  assert len(srv.client_ports) == 1
+  assert srv.accept_encoding == {"gzip, deflate"}
+
+
+def test_transport_retries_configured_status_codes(stub_api):
+  srv, base_url = stub_api
+  srv.fail_next = 2
+  retry = RestRetryConfig(max_attempts=3, backoff_seconds=0.0, retry_on_status=[503])
+  transport = RestTransport(retry=retry)
+  try:
+    assert transport.get_json(f"{base_url}/items?offset=0")["data"][0] == {"id": 0}
+    srv.fail_next = 1
+    with pytest.raises(urllib.error.HTTPError):
+      RestTransport(retry=RestRetryConfig(max_attempts=1, retry_on_status=[503])).get_json(
+        f"{base_url}/items?offset=0"
+      )
+  finally:
+    transport.close()
+
+  assert len(srv.requests) == 4
+
+
+def test_transport_resends_once_when_kept_alive_connection_was_closed(stub_api):
+  srv, base_url = stub_api
+  srv.drop_next = 1
+  # One attempt and a long backoff: the resend must neither count nor sleep.
+  transport = RestTransport(retry=RestRetryConfig(max_attempts=1, backoff_seconds=30.0))
+  try:
+    assert transport.get_json(f"{base_url}/items?offset=0")["data"][0] == {"id": 0}
+    time.sleep(0.05)
+    started = time.monotonic()
+    assert transport.get_json(f"{base_url}/items?offset=2")["data"][0] == {"id": 2}
+    assert time.monotonic() - started < 5
+  finally:
+    transport.close()
+
+  assert srv.requests == ["/items?offset=0", "/items?offset=2"]
+  assert len(srv.client_ports) == 2
+
+
+class _StubProxy(BaseHTTPRequestHandler):
+  """Records what reaches the proxy; GETs answer with a small JSON body, CONNECTs are refused."""
+  protocol_version = "HTTP/1.1"
+
+  def log_message(self, *args):
+    pass
+
+  def _record(self):
+    with self.server.lock:
+      self.server.requests.append((self.command, self.path, self.headers.get("Proxy-Authorization")))
+
+  def do_GET(self):
+    self._record()
+    body = json.dumps({"via": "proxy"}).encode("utf-8")
+    self.send_response(200)
+    self.send_header("Content-Type", "application/json")
+    self.send_header("Content-Length", str(len(body)))
+    self.end_headers()
+    self.wfile.write(body)
+
+  def do_CONNECT(self):
+    self._record()
+    self.send_response(502)
+    self.send_header("Content-Length", "0")
+    self.end_headers()
+
+
+@pytest.fixture()
+def stub_proxy(monkeypatch):
+  for name in ("http_proxy", "https_proxy", "no_proxy", "HTTP_PROXY", "HTTPS_PROXY", "NO_PROXY", "ALL_PROXY", "all_proxy"):
+    monkeypatch.delenv(name, raising=False)
+  srv = ThreadingHTTPServer(("127.0.0.1", 0), _StubProxy)
+  srv.daemon_threads = True
+  srv.lock = threading.Lock()
+  srv.requests = []
+  thread = threading.Thread(target=srv.serve_forever, daemon=True)
+  thread.start()
+  try:
+    yield srv, f"127.0.0.1:{srv.server_address[1]}"
+  finally:
+    srv.shutdown()
+    srv.server_close()
+
+
+def test_transport_sends_http_requests_through_env_proxy(stub_proxy, monkeypatch):
+  srv, proxy = stub_proxy
+  monkeypatch.setenv("http_proxy", f"http://user:p%40ss@{proxy}")
+  transport = RestTransport()
+  try:
+    assert transport.get_json("http://api.example.test/items?offset=0") == {"via": "proxy"}
+  finally:
+    transport.close()
+
+  assert srv.requests == [("GET", "http://api.example.test/items?offset=0", "Basic dXNlcjpwQHNz")]
+
+
+def test_transport_tunnels_https_requests_through_env_proxy(stub_proxy, monkeypatch):
+  srv, proxy = stub_proxy
+  monkeypatch.setenv("https_proxy", f"http://{proxy}")
+  transport = RestTransport()
+  try:
+    with pytest.raises(OSError):
+      transport.get_json("https://api.example.test/items")
+  finally:
+    transport.close()
+
+  assert srv.requests == [("CONNECT", "api.example.test:443", None)]
+
+
+def test_transport_bypasses_proxy_for_no_proxy_hosts(stub_api, stub_proxy, monkeypatch):
+  api, base_url = stub_api
+  srv, proxy = stub_proxy
+  monkeypatch.setenv("http_proxy", f"http://{proxy}")
+  monkeypatch.setenv("no_proxy", "127.0.0.1")
+  transport = RestTransport()
+  try:
+    assert transport.get_json(f"{base_url}/items?offset=0")["data"][0] == {"id": 0}
+  finally:
+    transport.close()
+
+  assert srv.requests == []
+  assert api.requests == ["/items?offset=0"]
+
+
+def test_token_bucket_limits_rate_after_burst():
+  now = [0.0]
+  sleeps = []
+
+  def sleep(seconds):
+    sleeps.append(seconds)
+    now[0] += seconds
+
+  bucket = TokenBucket(rate=2.0, capacity=2, clock=lambda: now[0], sleep=sleep)
+  for _ in range(4):
+    bucket.acquire()
+
+  # Two requests from the burst, then one every 0.5s.
+  assert sleeps == [0.5, 0.5]
+
+
+def test_iter_ordered_concurrently_keeps_input_order():
+  def fetch(i):
+    time.sleep(0.001 * (10 - i))
+    return i
+
+  assert list(iter_ordered_concurrently(fetch, range(10), concurrency=4)) == list(range(10))
+
+
+def test_rest_ingestion_fetches_offset_pages_concurrently_in_order(stub_api, monkeypatch):
+  srv, base_url = stub_api
+  landed = []
+
+  monkeypatch.setattr(rest, "rest_config_for_source_system", lambda **kw: {"base_url": base_url})
+  monkeypatch.setattr(rest, "land_raw_json_records", lambda **kw: landed.extend(r["id"] for r in kw["records"]) or {
+    "rows_inserted": len(kw["records"])
+  })
+  monkeypatch.setattr(rest, "ensure_load_run_snapshot_table", lambda **kw: None)
+  monkeypatch.setattr(rest, "render_select_latest_load_run_snapshot_json_by_root_key", lambda **kw: "SELECT")
+  monkeypatch.setattr(rest, "fetch_one_value", lambda engine, sql: None)
+  monkeypatch.setattr(rest, "build_load_run_log_row", lambda **kw: kw)
+
+  engine = SimpleNamespace(execute=lambda sql: None)
+  source_dataset = SimpleNamespace(
+    source_system=SimpleNamespace(type="rest", short_name="api"),
+    source_dataset_name="items",
+    ingestion_config={
+      "path": "/items",
+      "record_path": "data",
+      "cursor": {"type": "offset", "step": 2},
+      "concurrency": 4,
+      "rate_limit": {"requests_per_second": 1000},
+    },
+    source_columns=SimpleNamespace(filter=lambda **kw: [SimpleNamespace(source_column_name="id", json_path="$.id")]),
+  )
+  result = rest.ingest_raw_rest(
+    source_dataset=source_dataset,
+    td=SimpleNamespace(target_schema=SimpleNamespace(short_name="raw"), target_dataset_name="raw_api_items"),
+    target_system=SimpleNamespace(short_name="dwh"),
+    dialect=SimpleNamespace(
+      get_execution_engine=lambda ts: engine,
+      render_insert_load_run_log=lambda meta_schema, values: None,
+      render_insert_load_run_snapshot=lambda meta_schema, values: None,
+    ),
+    profile=SimpleNamespace(name="dev"),
+    batch_run_id="b1",
+    load_run_id="l1",
+    chunk_size=5,
+  )
+
+  assert landed == list(range(20))
+  assert result["rows_extracted"] == 20
+  assert result["cursor_after"] == 22
+  # Requests beyond the first empty page stay bounded by the concurrency.
+  assert len(srv.requests) <= 11 + 3
@@ -0,0 +1,94 @@
+"""
+elevata - Metadata-driven Data Platform Framework
+Copyright © 2026 Ilona Tag
+
+This file is part of elevata.
+
+elevata is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as
+published by the Free Software Foundation, either version 3 of
+the License, or (at your option) any later version.
+
+elevata is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with elevata. If not, see <https://www.gnu.org/licenses/>.
+
+Contact: <https://github.com/elevata-labs/elevata>.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import create_engine, text
+
+from metadata.ingestion.streaming import iter_streamed_chunks, iter_streamed_rows, resolve_fetch_size
+
+
+@pytest.fixture()
+def sqlite_source():
+  engine = create_engine("sqlite://", future=True)
+  with engine.begin() as conn:
+    conn.execute(text("CREATE TABLE t (id INTEGER)"))
+    conn.execute(text("INSERT INTO t (id) VALUES (:id)"), [{"id": i} for i in range(25)])
+  return engine
+
+
+def test_iter_streamed_chunks_fetches_in_batches_of_fetch_size(sqlite_source):
+  with sqlite_source.connect() as conn:
+    chunks = list(iter_streamed_chunks(conn, "SELECT id FROM t ORDER BY id", fetch_size=10))
+
+  assert [len(c) for c in chunks] == [10, 10, 5]
+  assert [r for c in chunks for r in c] == [(i,) for i in range(25)]
+
+
+def test_iter_streamed_rows_requests_streaming_and_closes_result_on_early_exit():
+  class _Result:
+    closed = False
+
+    def fetchmany(self, size):
+      return [(1,)] * size
+
+    def close(self):
+      self.closed = True
+
+  result = _Result()
+  seen_options = {}
+
+  class _Conn:
+    def execution_options(self, **kw):
+      seen_options.update(kw)
+      return self
+
+    def execute(self, stmt):
+      return result
+
+  it = iter_streamed_rows(_Conn(), "SELECT 1", fetch_size=3)
+  assert next(it) == (1,)
+  it.close()
+
+  assert seen_options == {"yield_per": 3}
+  assert result.closed
+
+
+def test_resolve_fetch_size_precedence():
+  profile = SimpleNamespace(ingestion={"fetch_size": 2000, "source_systems": {"erp": {"fetch_size": 50000}}})
+
+  assert resolve_fetch_size(
+    ingestion_config={"fetch_size": 7}, profile=profile, source_system_short="erp", default=5000
+  ) == 7
+  assert resolve_fetch_size(ingestion_config={}, profile=profile, source_system_short="erp", default=5000) == 50000
+  assert resolve_fetch_size(ingestion_config=None, profile=profile, source_system_short="crm", default=5000) == 2000
+  assert resolve_fetch_size(
+    ingestion_config=None, profile=SimpleNamespace(name="dev"), source_system_short="crm", default=5000
+  ) == 5000
+
+
+def test_resolve_fetch_size_rejects_invalid_values():
+  with pytest.raises(ValueError, match="fetch_size"):
+    resolve_fetch_size(ingestion_config={"fetch_size": 0}, profile=None, source_system_short=None, default=10)
+  with pytest.raises(ValueError, match="fetch_size"):
+    resolve_fetch_size(ingestion_config={"fetch_size": "many"}, profile=None, source_system_short=None, default=10)
@@ -0,0 +1,93 @@
+"""
+elevata - Metadata-driven Data Platform Framework
+Copyright © 2026 Ilona Tag
+
+This file is part of elevata.
+
+elevata is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as
+published by the Free Software Foundation, either version 3 of
+the License, or (at your option) any later version.
+
+elevata is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with elevata. If not, see <https://www.gnu.org/licenses/>.
+
+Contact: <https://github.com/elevata-labs/elevata>.
+"""
+
+import pytest
+
+from metadata.execution.executor import build_execution_plan
+from metadata.execution.load_graph import (
+  build_load_graph_index,
+  resolve_execution_order,
+  resolve_execution_order_all,
+  resolve_upstream_datasets,
+)
+from metadata.models import TargetDataset, TargetDatasetInput
+
+
+@pytest.mark.django_db
+def test_load_graph_index_matches_per_node_resolution(raw_stage_rawcore_datasets):
+  raw_ds, stage_ds, rawcore_ds = raw_stage_rawcore_datasets
+
+  index = build_load_graph_index()
+
+  for td in (raw_ds, stage_ds, rawcore_ds):
+    assert index.upstream_datasets(td) == resolve_upstream_datasets(td)
+  assert index.upstream_datasets(stage_ds) == {raw_ds}
+  assert index.upstream_datasets(rawcore_ds) == {stage_ds}
+  assert resolve_execution_order(rawcore_ds, index=index) == resolve_execution_order(rawcore_ds)
+
+
+@pytest.mark.django_db
+def test_load_graph_index_maps_source_inputs_to_raw_and_skips_inactive_links(
+  raw_stage_rawcore_datasets,
+  source_dataset_sap_customer,
+  target_schemas,
+):
+  raw_ds, stage_ds, rawcore_ds = raw_stage_rawcore_datasets
+
+  # Stage fed directly from the SourceDataset resolves to the RAW dataset of that source.
+  direct_stage = TargetDataset.objects.create(
+    target_schema=target_schemas["stage"],
+    target_dataset_name="sap_customer_direct",
+  )
+  TargetDatasetInput.objects.create(
+    target_dataset=direct_stage,
+    source_dataset=source_dataset_sap_customer,
+    role="primary",
+  )
+  TargetDatasetInput.objects.create(
+    target_dataset=direct_stage,
+    upstream_target_dataset=rawcore_ds,
+    role="enrichment",
+    active=False,
+  )
+
+  index = build_load_graph_index()
+
+  assert index.upstream_datasets(direct_stage) == {raw_ds}
+
+
+@pytest.mark.django_db
+def test_all_mode_planning_uses_constant_number_of_queries(
+  raw_stage_rawcore_datasets,
+  django_assert_max_num_queries,
+):
+  roots = list(TargetDataset.objects.select_related("target_schema"))
+
+  with django_assert_max_num_queries(3):
+    index = build_load_graph_index()
+    order = resolve_execution_order_all(roots, index=index)
+    plan = build_execution_plan(batch_run_id="b", execution_order=order, graph_index=index)
+
+  keys = [s.dataset_key for s in plan.steps]
+  raw_ds, stage_ds, rawcore_ds = raw_stage_rawcore_datasets
+  assert keys.index("raw.sap_customer_raw") < keys.index("stage.sap_customer_stage")
+  assert keys.index("stage.sap_customer_stage") < keys.index("rawcore.sap_customer_rawcore")
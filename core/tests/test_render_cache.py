@@ -0,0 +1,104 @@
+"""
+elevata - Metadata-driven Data Platform Framework
+Copyright © 2026 Ilona Tag
+
+This file is part of elevata.
+
+elevata is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as
+published by the Free Software Foundation, either version 3 of
+the License, or (at your option) any later version.
+
+elevata is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with elevata. If not, see <https://www.gnu.org/licenses/>.
+
+Contact: <https://github.com/elevata-labs/elevata>.
+"""
+
+import os
+
+import pytest
+
+from metadata.models import TargetColumn
+from metadata.rendering.render_cache import RenderCacheStore, get_render_cache, render_sql_cached
+
+
+class FakeDialect:
+  DIALECT_NAME = "fake"
+
+
+@pytest.fixture
+def render_cache_dir(settings, tmp_path):
+  settings.ELEVATA_RENDER_CACHE_ENABLED = True
+  settings.ELEVATA_RENDER_CACHE_DIR = str(tmp_path / "render_cache")
+  settings.ELEVATA_RENDER_CACHE_MAX_ENTRIES = 100
+  return tmp_path / "render_cache"
+
+
+@pytest.mark.django_db
+def test_render_cache_hits_until_upstream_metadata_changes(raw_stage_rawcore_datasets, render_cache_dir):
+  raw_ds, stage_ds, _ = raw_stage_rawcore_datasets
+  calls = {"n": 0}
+
+  def render_fn(td, dialect):
+    calls["n"] += 1
+    return f"SELECT {calls['n']}"
+
+  assert render_sql_cached(stage_ds, FakeDialect(), kind="load", render_fn=render_fn) == "SELECT 1"
+  assert render_sql_cached(stage_ds, FakeDialect(), kind="load", render_fn=render_fn) == "SELECT 1"
+  assert calls["n"] == 1
+
+  # Another kind is cached separately.
+  render_sql_cached(stage_ds, FakeDialect(), kind="select", render_fn=render_fn)
+  assert calls["n"] == 2
+
+  # A new column on the upstream dataset changes the content key.
+  TargetColumn.objects.create(
+    target_dataset=raw_ds,
+    target_column_name="customer_id",
+    datatype="STRING",
+    ordinal_position=1,
+  )
+  assert render_sql_cached(stage_ds, FakeDialect(), kind="load", render_fn=render_fn) == "SELECT 3"
+
+
+@pytest.mark.django_db
+def test_render_cache_entries_are_dropped_by_signals(raw_stage_rawcore_datasets, render_cache_dir):
+  _, stage_ds, _ = raw_stage_rawcore_datasets
+
+  render_sql_cached(stage_ds, FakeDialect(), kind="load", render_fn=lambda td, d: "SELECT 1")
+  assert len(list(render_cache_dir.glob(f"{stage_ds.pk}-*.sql"))) == 1
+
+  stage_ds.save()
+  assert list(render_cache_dir.glob(f"{stage_ds.pk}-*.sql")) == []
+
+
+def test_render_cache_store_evicts_least_recently_used(tmp_path):
+  store = RenderCacheStore(tmp_path, max_entries=2)
+  store.put(1, "a", "SELECT 'a'")
+  store.put(2, "b", "SELECT 'b'")
+  os.utime(tmp_path / "1-a.sql", (1, 1))
+  os.utime(tmp_path / "2-b.sql", (2, 2))
+
+  # Reading "a" makes it the most recently used entry.
+  assert store.get(1, "a") == "SELECT 'a'"
+  store.put(3, "c", "SELECT 'c'")
+
+  assert store.get(2, "b") is None
+  assert store.get(1, "a") == "SELECT 'a'"
+  assert store.get(3, "c") == "SELECT 'c'"
+
+
+def test_render_cache_is_opt_in_and_resolves_relative_dir_against_base_dir(settings, tmp_path):
+  settings.ELEVATA_RENDER_CACHE_ENABLED = False
+  assert get_render_cache() is None
+
+  settings.ELEVATA_RENDER_CACHE_ENABLED = True
+  settings.BASE_DIR = tmp_path
+  settings.ELEVATA_RENDER_CACHE_DIR = "cache/render"
+  assert get_render_cache().base_path == tmp_path / "cache" / "render"